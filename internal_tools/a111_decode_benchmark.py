@@ -0,0 +1,100 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+"""Measures decoding of A111 service output buffers per mode
+
+Compares the previous decoding (astype and, for IQ, reshape/view/flatten) with
+decode_output_buffer, with and without a preallocated (float32) output array.
+The best of ``--repeat`` timings of ``--frames`` frames is reported per frame.
+
+    python internal_tools/a111_decode_benchmark.py
+    python internal_tools/a111_decode_benchmark.py --frames 1000 --repeat 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from acconeer.exptool.a111._clients.output_buffer import decode_output_buffer
+from acconeer.exptool.a111._modes import Mode
+
+
+SWEEPS_PER_FRAME = 16
+
+# Number of 16 bit values of a typical frame
+CASES = [
+    (Mode.ENVELOPE, 1238),
+    (Mode.IQ, 2 * 1238),
+    (Mode.POWER_BINS, 16),
+    (Mode.SPARSE, SWEEPS_PER_FRAME * 60),
+]
+
+
+def previous_decode(buffer, mode, sweeps_per_frame):
+    if mode == Mode.IQ:
+        data = np.frombuffer(buffer, dtype="<i2").astype("float")
+        return data.reshape((-1, 2)).view(dtype="complex").flatten()
+
+    data = np.frombuffer(buffer, dtype="<u2").astype("float")
+
+    if mode == Mode.SPARSE:
+        data = data.reshape((sweeps_per_frame, -1))
+
+    return data
+
+
+def best_per_frame(repeat, num_frames, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(num_frames):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / num_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10000, help="Frames per timing.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per case.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    print(f"{'mode':12} {'previous [us]':>14} {'new [us]':>9} {'out [us]':>9} {'f32 [us]':>9}")
+
+    for mode, num_values in CASES:
+        buffer = bytearray(rng.integers(0, 2**15, num_values, dtype="<u2").tobytes())
+        out = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME)
+        out_f32 = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, dtype=np.float32)
+
+        timings = [
+            best_per_frame(
+                args.repeat, args.frames, lambda: previous_decode(buffer, mode, SWEEPS_PER_FRAME)
+            ),
+            best_per_frame(
+                args.repeat,
+                args.frames,
+                lambda: decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME),
+            ),
+            best_per_frame(
+                args.repeat,
+                args.frames,
+                lambda: decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, out=out),
+            ),
+            best_per_frame(
+                args.repeat,
+                args.frames,
+                lambda: decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, out=out_f32),
+            ),
+        ]
+
+        print(
+            f"{mode.name.lower():12} {timings[0] * 1e6:14.2f} "
+            + " ".join(f"{t * 1e6:9.2f}" for t in timings[1:])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+"""Measures opser save/load times of the processing regression test outputs
+
+Each expected output file is loaded with its result type, then saved to and loaded
+from an in-memory HDF5 file. The best of ``--repeat`` timings is reported.
+
+    python internal_tools/opser_benchmark.py
+    python internal_tools/opser_benchmark.py --repeat 10 --filter distance
+"""
+
+import argparse
+import io
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+import h5py
+
+
+TESTS_DIR = Path(__file__).parents[1] / "tests"
+EXPECTED_OUTPUT_DIR = TESTS_DIR / "processing" / "a121" / "data_files" / "expected_output"
+
+
+def get_cases():
+    sys.path.insert(0, str(TESTS_DIR / "processing"))
+
+    from a121 import (
+        breathing_test,
+        cargo_test,
+        distance_test,
+        presence_test,
+        surface_velocity_test,
+        tank_level_test,
+        touchless_button_test,
+        vibration_test,
+    )
+
+    return [
+        (t.List[breathing_test.RefAppResultSlice], "breathing-sitting-controller.h5"),
+        (t.List[cargo_test.ResultSlice], "cargo_20_feet-app.h5"),
+        (t.List[distance_test.ResultSlice], "distance-5to200_no_cr_cancel-detector.h5"),
+        (t.List[presence_test.ProcessorResultSlice], "presence-medium_range_no_timeout.h5"),
+        (t.List[surface_velocity_test.ResultSlice], "surface_velocity_default-controller.h5"),
+        (t.List[tank_level_test.RefAppResultSlice], "medium_tank_level_track-controller.h5"),
+        (t.List[touchless_button_test.ResultSlice], "touchless_button_default-processor.h5"),
+        (t.List[vibration_test.ResultSlice], "vibration-controller.h5"),
+    ]
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timings per case.")
+    parser.add_argument("--filter", default="", help="Only run cases whose file contains this.")
+    args = parser.parse_args()
+
+    from acconeer.exptool import opser
+
+    print(f"{'file':45} {'results':>8} {'save [ms]':>10} {'load [ms]':>10}")
+
+    for result_type, filename in get_cases():
+        if args.filter not in filename:
+            continue
+
+        with h5py.File(EXPECTED_OUTPUT_DIR / filename, "r") as f:
+            results = opser.deserialize(f, result_type)
+
+        buffers = []
+
+        def save():
+            buffers[:] = [io.BytesIO()]
+            with h5py.File(buffers[0], "w") as f:
+                opser.serialize(results, f, override_type=result_type)
+
+        def load():
+            with h5py.File(buffers[0], "r") as f:
+                opser.deserialize(f, result_type)
+
+        save_s = best_of(args.repeat, save)
+        load_s = best_of(args.repeat, load)
+
+        print(f"{filename:45} {len(results):8} {save_s * 1000:10.1f} {load_s * 1000:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+"""Measures how long it takes to start the Exploration Tool app
+
+Each run imports the app and lists its plugins in a fresh interpreter, i.e. everything
+that happens before the main window is created.
+
+    python internal_tools/startup_benchmark.py --runs 5 --max-seconds 3.0
+    python internal_tools/startup_benchmark.py --report --top 30
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+
+STARTUP_CODE = """\
+import acconeer.exptool.app.new.app
+from acconeer.exptool.app.new.plugin_loader import load_plugins
+load_plugins()
+"""
+
+
+def run_startup(extra_args=()):
+    start = time.perf_counter()
+    p = subprocess.run(
+        [sys.executable, *extra_args, "-c", STARTUP_CODE],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    return time.perf_counter() - start, p.stderr
+
+
+def parse_importtime(output):
+    """Parses 'python -X importtime' output into {module: (self_ms, cumulative_ms)}"""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+
+        modules[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return modules
+
+
+def print_report(modules, top):
+    rows = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:top]
+
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for name, (self_ms, cumulative_ms) in rows:
+        print(f"{cumulative_ms:16.1f} {self_ms:10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of timed startups.")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Fail if the median startup time exceeds this.",
+    )
+    parser.add_argument(
+        "--report",
+        action="store_true",
+        help="Print the per-module cumulative import times of one startup.",
+    )
+    parser.add_argument("--top", type=int, default=25, help="Number of modules in the report.")
+    args = parser.parse_args()
+
+    if args.report:
+        _, output = run_startup(["-X", "importtime"])
+        print_report(parse_importtime(output), args.top)
+        return False
+
+    run_startup()  # Warm up the file system cache, only the interpreter should be cold
+
+    durations = [run_startup()[0] for _ in range(args.runs)]
+    median = statistics.median(durations)
+    print(
+        f"Startup: median {median:.3f} s, "
+        + f"min {min(durations):.3f} s, max {max(durations):.3f} s ({args.runs} runs)"
+    )
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"Median startup time exceeds {args.max_seconds:.3f} s")
+        return True
+
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(int(main()))
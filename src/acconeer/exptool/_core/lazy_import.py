@@ -0,0 +1,36 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import importlib
+import typing as t
+
+
+def lazy_module_getattr(
+    module_globals: t.Dict[str, t.Any], attribute_modules: t.Mapping[str, str]
+) -> t.Callable[[str], t.Any]:
+    """Returns a module ``__getattr__`` (PEP 562) that imports attributes on first access
+
+    Used by packages whose attributes depend on slow or optional imports, like PySide6,
+    so that the rest of the package can be used without them::
+
+        __getattr__ = lazy_module_getattr(globals(), {"AppModel": ".app_model"})
+
+    :param module_globals: The ``globals()`` of the module. Imported attributes are
+        cached in it, so ``__getattr__`` is only called once per attribute.
+    :param attribute_modules: Maps attribute names to the modules (relative to the module,
+        or absolute) they are imported from.
+    """
+    package = module_globals["__name__"]
+
+    def __getattr__(name: str) -> t.Any:
+        if name not in attribute_modules:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = getattr(importlib.import_module(attribute_modules[name], package), name)
+        module_globals[name] = value
+        return value
+
+    return __getattr__
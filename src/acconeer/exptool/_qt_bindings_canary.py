@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2024
+# Copyright (c) Acconeer AB, 2024-2026
 # All rights reserved
 
 """
@@ -8,6 +8,8 @@ prompting them to resolve the issue.
 """
 
 import importlib.metadata
+import importlib.util
+import os
 
 
 _WARNING_FMT = """\
@@ -28,11 +30,6 @@ Resolve the issue by either:
 """
 
 
-try:
-    import PySide6  # noqa: F401
-except ImportError:
-    pass  # Did not find installed PySide6 (which is OK)
-
 for disallowed_binding in ["PyQt6", "PyQt5", "PySide2"]:
     try:
         _ = importlib.metadata.version(disallowed_binding)
@@ -40,3 +37,9 @@ for disallowed_binding in ["PyQt6", "PyQt5", "PySide2"]:
         pass
     else:
         print(_WARNING_FMT.format(binding_module_name=disallowed_binding))
+
+        # pyqtgraph would otherwise pick the conflicting binding, unless PySide6 is already
+        # imported. Importing PySide6 here would slow down the import of acconeer.exptool
+        # also where Qt is not used.
+        if importlib.util.find_spec("PySide6") is not None:
+            os.environ.setdefault("PYQTGRAPH_QT_LIB", "PySide6")
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import abc
@@ -247,6 +247,18 @@ class BaseClient(abc.ABC):
     def squeeze(self, squeeze):
         self._squeeze = squeeze
 
+    @property
+    def last_raw_data(self):
+        """
+        The integers of the output buffer of the last result from ``get_next()``, viewed
+        without copying. Unsigned for Power Bins, Envelope and Sparse and signed
+        (real, imaginary) pairs in an extra last dimension for IQ, otherwise shaped like the
+        data. `None` if the client doesn't receive output buffers, like the mock client.
+
+        :rtype: np.ndarray or None
+        """
+        return None
+
 
 class ClientError(Exception):
     pass
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -51,6 +51,12 @@ class Client:
             | **override_baudrate:** int
             |   Uses the passed baudrate instead of the default.
 
+            | **num_output_buffers:** int
+            |   If given, the data is returned in this many preallocated buffers that
+            |   are reused. Returned data is then overwritten after this many further
+            |   calls to ``get_next``. By default, every frame is returned in a new
+            |   array.
+
         :raises: ValueError if a ``Client`` could not be created from the arguments.
         """
         if mock:
@@ -169,6 +175,14 @@ class Client:
     def squeeze(self, squeeze):
         self.subclient.squeeze = squeeze
 
+    @property
+    def last_raw_data(self) -> Optional[np.ndarray]:
+        """
+        The integers of the output buffer of the last result from ``get_next()``, or
+        `None` for the mock client. Can be given to :meth:`.Recorder.sample`.
+        """
+        return self.subclient.last_raw_data
+
     @property
     def description(self) -> str:
         return self.subclient.description
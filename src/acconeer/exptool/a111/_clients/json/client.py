@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import enum
@@ -8,8 +8,6 @@ import warnings
 from copy import deepcopy
 from time import time
 
-import numpy as np
-
 from acconeer.exptool._core.communication import links
 from acconeer.exptool.a111._clients.base import (
     BaseClient,
@@ -17,6 +15,7 @@ from acconeer.exptool.a111._clients.base import (
     SessionSetupError,
     decode_version_str,
 )
+from acconeer.exptool.a111._clients.output_buffer import OutputBufferDecoder
 from acconeer.exptool.a111._modes import Mode, get_mode
 
 
@@ -30,6 +29,8 @@ class JsonProtocolBase:
         self._sweeps_per_frame = None
         self._session_cmd = None
         self._mode = None
+        self._num_output_buffers = None
+        self._output_buffer_decoder = None
 
     def _send_cmd(self, cmd_dict):
         cmd_dict["api_version"] = 3
@@ -118,11 +119,33 @@ class JsonProtocolBase:
     def decode_stream_payload(self, payload):
         pass
 
+    def _decode_output_buffer(self, payload, byteorder):
+        # Created on the first frame as a session can be set up with a raw dict config
+        if self._output_buffer_decoder is None:
+            self._output_buffer_decoder = OutputBufferDecoder(
+                self._mode,
+                self._sweeps_per_frame,
+                byteorder=byteorder,
+                num_output_buffers=self._num_output_buffers,
+            )
+
+        squeeze = self.squeeze and self._num_sensors == 1
+        num_sensors = None if squeeze else self._num_sensors
+        return self._output_buffer_decoder.decode(payload, num_sensors=num_sensors)
+
+    @property
+    def last_raw_data(self):
+        if self._output_buffer_decoder is None:
+            return None
+
+        return self._output_buffer_decoder.last_raw
+
 
 class JsonProtocolStreamingServer(JsonProtocolBase):
-    def __init__(self, link, squeeze):
+    def __init__(self, link, squeeze, num_output_buffers):
         super().__init__(link)
         self._squeeze = squeeze
+        self._num_output_buffers = num_output_buffers
         # stacklevel=5 will warn user code as deprecated.
         # (JsonPSS -> SocketClient -> ClientFactory -> Client -> <user code>)
         warnings.warn(
@@ -132,6 +155,8 @@ class JsonProtocolStreamingServer(JsonProtocolBase):
         )
 
     def setup_session(self, config):
+        self._output_buffer_decoder = None
+
         if isinstance(config, dict):
             cmd = deepcopy(config)
             log.warning("setup with raw dict config - you're on your own")
@@ -219,30 +244,7 @@ class JsonProtocolStreamingServer(JsonProtocolBase):
         if not payload:
             return None
 
-        squeeze = self.squeeze and self._num_sensors == 1
-
-        if self._mode == Mode.SPARSE:
-            data = np.frombuffer(payload, dtype=">u2").astype("float")
-
-            if squeeze:
-                shape = (self._sweeps_per_frame, -1)
-            else:
-                shape = (self._num_sensors, self._sweeps_per_frame, -1)
-
-            return data.reshape(shape)
-
-        if self._mode == Mode.IQ:
-            data = np.frombuffer(payload, dtype=">i2").astype("float")
-            data = data.reshape((-1, 2)).view(dtype="complex").flatten()
-        elif self._mode in (Mode.ENVELOPE, Mode.POWER_BINS):
-            data = np.frombuffer(payload, dtype=">u2").astype("float")
-        else:  # Fallback
-            data = np.frombuffer(payload, dtype=">u2")
-
-        if not squeeze:
-            data = data.reshape((self._num_sensors, -1))
-
-        return data
+        return self._decode_output_buffer(payload, byteorder=">")
 
     def _get_dict_for_config(self, config):
         d = {}
@@ -294,9 +296,10 @@ class JsonProtocolStreamingServer(JsonProtocolBase):
 
 
 class JsonProtocolExplorationServer(JsonProtocolBase):
-    def __init__(self, link, squeeze):
+    def __init__(self, link, squeeze, num_output_buffers):
         super().__init__(link)
         self._squeeze = squeeze
+        self._num_output_buffers = num_output_buffers
 
     def get_system_info(self):
         self._send_cmd({"cmd": "get_system_info"})
@@ -326,6 +329,8 @@ class JsonProtocolExplorationServer(JsonProtocolBase):
             self._link.baudrate = baudrate
 
     def setup_session(self, config):
+        self._output_buffer_decoder = None
+
         if isinstance(config, dict):
             cmd = deepcopy(config)
             log.warning("setup with raw dict config - you're on your own")
@@ -465,30 +470,7 @@ class JsonProtocolExplorationServer(JsonProtocolBase):
         if not payload:
             return None
 
-        squeeze = self.squeeze and self._num_sensors == 1
-
-        if self._mode == Mode.SPARSE:
-            data = np.frombuffer(payload, dtype="<u2").astype("float")
-
-            if squeeze:
-                shape = (self._sweeps_per_frame, -1)
-            else:
-                shape = (self._num_sensors, self._sweeps_per_frame, -1)
-
-            return data.reshape(shape)
-
-        if self._mode == Mode.IQ:
-            data = np.frombuffer(payload, dtype="<i2").astype("float")
-            data = data.reshape((-1, 2)).view(dtype="complex").flatten()
-        elif self._mode in (Mode.ENVELOPE, Mode.POWER_BINS):
-            data = np.frombuffer(payload, dtype="<u2").astype("float")
-        else:  # Fallback
-            data = np.frombuffer(payload, dtype="<u2")
-
-        if not squeeze:
-            data = data.reshape((self._num_sensors, -1))
-
-        return data
+        return self._decode_output_buffer(payload, byteorder="<")
 
     @property
     def squeeze(self):
@@ -500,7 +482,15 @@ class JsonProtocolExplorationServer(JsonProtocolBase):
 
 
 class SocketClient(BaseClient):
-    def __init__(self, host, port=None, serial_link=False, override_baudrate=None, **kwargs):
+    def __init__(
+        self,
+        host,
+        port=None,
+        serial_link=False,
+        override_baudrate=None,
+        num_output_buffers=None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
 
         if serial_link:
@@ -509,6 +499,7 @@ class SocketClient(BaseClient):
             self._link = links.SocketLink(host, port)
         self._protocol = None
         self._override_baudrate = override_baudrate
+        self._num_output_buffers = num_output_buffers
 
     def _connect(self):
         info = {}
@@ -527,10 +518,14 @@ class SocketClient(BaseClient):
             server_version_str = msg[len(startstr) :].strip()
             info.update(decode_version_str(server_version_str))
 
-            self._protocol = JsonProtocolStreamingServer(self._link, self.squeeze)
+            self._protocol = JsonProtocolStreamingServer(
+                self._link, self.squeeze, self._num_output_buffers
+            )
             info["board_sensor_count"] = self._protocol.get_sensor_count()
         else:
-            self._protocol = JsonProtocolExplorationServer(self._link, self.squeeze)
+            self._protocol = JsonProtocolExplorationServer(
+                self._link, self.squeeze, self._num_output_buffers
+            )
             system_info = self._protocol.get_system_info()
             info.update(decode_version_str(system_info["rss_version"]))
             info["sensor"] = system_info["sensor"]
@@ -586,6 +581,13 @@ class SocketClient(BaseClient):
             self._protocol.squeeze = squeeze
         self._squeeze = squeeze
 
+    @property
+    def last_raw_data(self):
+        if self._protocol is None:
+            return None
+
+        return self._protocol.last_raw_data
+
     @property
     def description(self):
         if isinstance(self._link, links.ExploreSerialLink):
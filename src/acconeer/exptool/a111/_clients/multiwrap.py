@@ -1,11 +1,21 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
+import copy
+import logging
+import math
+import queue
+import threading
+from time import monotonic
+
 import numpy as np
 
 from acconeer.exptool.a111._clients.base import BaseClient, ClientError
 
 
+log = logging.getLogger(__name__)
+
+
 class MultiClientWrapper(BaseClient):
     def __init__(self, clients, **kwargs):
         kwargs["squeeze"] = False
@@ -28,12 +38,11 @@ class MultiClientWrapper(BaseClient):
             msg = "Invalid sensor selection for multi client wrapper"
             raise ClientError(msg)
 
-        config.sensor = 1
+        client_config = copy.deepcopy(config)
+        client_config.sensor = 1
 
         for client in self.clients:
-            info = client.setup_session(config)
-
-        config.sensor = expected_sensors
+            info = client.setup_session(client_config)
 
         return info
 
@@ -58,3 +67,226 @@ class MultiClientWrapper(BaseClient):
     def _disconnect(self):
         for client in self.clients:
             client.disconnect()
+
+    @property
+    def description(self):
+        return ", ".join(client.description for client in self.clients)
+
+
+class ConcurrentMultiClientWrapper(MultiClientWrapper):
+    """Like :class:`MultiClientWrapper`, but reads the clients concurrently
+
+    Every client is read on its own thread, so the latency of a frame is that of the
+    slowest link rather than the sum of all. The A111 result info has no sequence
+    number, so frames are aligned by the time they were received. A frame that has no
+    counterpart from every other client within ``max_skew`` seconds is dropped.
+
+    Errors raised by a client on its thread are raised from ``get_next`` as a
+    :class:`ClientError`.
+
+    :param max_skew:
+        Max difference (in seconds) in receive time between aligned frames. Defaults to
+        half the frame period if the config has an update rate, otherwise frames are
+        aligned only by their order.
+    :param max_missed_frames:
+        Number of consecutive frames a client may miss before ``get_next`` raises a
+        :class:`ClientError`.
+    :param timeout:
+        Max time (in seconds) to wait for a frame from a client before ``get_next``
+        raises a :class:`ClientError`. Also the max time to wait for the threads when
+        the session is stopped. Defaults to two frame periods plus 2 seconds.
+    :param num_output_buffers:
+        If given, the data is returned in this many preallocated buffers that are reused.
+        Returned data is then overwritten after this many further calls to ``get_next``.
+        By default, every frame is returned in a new array.
+    """
+
+    _QUEUE_SIZE = 64
+    _PUT_TIMEOUT = 0.1
+    _POLL_INTERVAL = 0.1
+    _DEFAULT_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        clients,
+        max_skew=None,
+        max_missed_frames=3,
+        timeout=None,
+        num_output_buffers=None,
+        **kwargs,
+    ):
+        super().__init__(clients, **kwargs)
+
+        self._max_skew_override = max_skew
+        self._max_missed_frames = max_missed_frames
+        self._timeout_override = timeout
+        self._num_output_buffers = num_output_buffers
+
+        self._max_skew = None
+        self._timeout = None
+        self._queues = None
+        self._threads = None
+        self._stop_event = None
+        self._output_buffers = None
+        self._output_index = 0
+        self._num_missed = None
+
+    def _setup_session(self, config):
+        info = super()._setup_session(config)
+
+        if self._max_skew_override is not None:
+            self._max_skew = self._max_skew_override
+        elif config.update_rate is not None:
+            self._max_skew = 0.5 / config.update_rate
+        else:
+            self._max_skew = None
+
+        if self._timeout_override is not None:
+            self._timeout = self._timeout_override
+        elif config.update_rate is not None:
+            self._timeout = 2 / config.update_rate + self._DEFAULT_TIMEOUT
+        else:
+            self._timeout = self._DEFAULT_TIMEOUT
+
+        return info
+
+    def _start_session(self):
+        super()._start_session()
+
+        self._queues = [queue.Queue(self._QUEUE_SIZE) for _ in self.clients]
+        self._stop_event = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._read_client, args=(client, q), daemon=True)
+            for client, q in zip(self.clients, self._queues)
+        ]
+        self._output_buffers = None
+        self._output_index = 0
+        self._num_missed = [0] * len(self.clients)
+
+        for thread in self._threads:
+            thread.start()
+
+    def _read_client(self, client, q):
+        while not self._stop_event.is_set():
+            try:
+                info, data = client.get_next()
+            except Exception as e:
+                item = e
+            else:
+                # The client may reuse its output buffers, while the frame is queued
+                item = (monotonic(), info, data.copy())
+
+            while not self._stop_event.is_set():
+                try:
+                    q.put(item, timeout=self._PUT_TIMEOUT)
+                except queue.Full:
+                    continue
+                else:
+                    break
+
+            if isinstance(item, Exception):
+                return
+
+    def _get_frame(self, client_index):
+        q = self._queues[client_index]
+        thread = self._threads[client_index]
+        num_polls = max(1, math.ceil(self._timeout / self._POLL_INTERVAL))
+
+        for _ in range(num_polls):
+            try:
+                item = q.get(timeout=self._POLL_INTERVAL)
+            except queue.Empty:
+                pass
+            else:
+                break
+
+            if not thread.is_alive():
+                # The thread may have put its last item after the get timed out
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    msg = "client {} stopped without an error".format(client_index)
+                    raise ClientError(msg) from None
+                else:
+                    break
+        else:
+            msg = "timeout while waiting for a frame from client {}".format(client_index)
+            raise ClientError(msg)
+
+        if isinstance(item, Exception):
+            msg = "failed to get next from client {}".format(client_index)
+            raise ClientError(msg) from item
+
+        return item
+
+    def _get_next(self):
+        frames = [self._get_frame(i) for i in range(len(self.clients))]
+
+        if self._max_skew is not None:
+            while True:
+                latest = max(t for t, _, _ in frames)
+                late = [i for i, (t, _, _) in enumerate(frames) if latest - t > self._max_skew]
+
+                if not late:
+                    break
+
+                # The other clients have missed the frames they have no counterpart to
+                for i in range(len(self.clients)):
+                    if i not in late:
+                        self._count_missed(i)
+
+                for i in late:
+                    frames[i] = self._get_frame(i)
+
+        for i in range(len(self.clients)):
+            self._num_missed[i] = 0
+
+        out = self._get_output_buffer(frames[0][2])
+
+        all_info = []
+        for i, (_, info, data) in enumerate(frames):
+            all_info.extend(info)
+            out[i] = data[0]
+
+        return all_info, out
+
+    def _get_output_buffer(self, data):
+        shape = (len(self.clients), *data.shape[1:])
+
+        if self._num_output_buffers is None:
+            return np.empty(shape, dtype=data.dtype)
+
+        if self._output_buffers is None:
+            self._output_buffers = [
+                np.empty(shape, dtype=data.dtype) for _ in range(self._num_output_buffers)
+            ]
+
+        out = self._output_buffers[self._output_index]
+        self._output_index = (self._output_index + 1) % self._num_output_buffers
+        return out
+
+    def _count_missed(self, client_index):
+        self._num_missed[client_index] += 1
+        log.info("client {} missed a frame".format(client_index))
+
+        if self._num_missed[client_index] > self._max_missed_frames:
+            msg = "client {} missed more than {} frames in a row".format(
+                client_index, self._max_missed_frames
+            )
+            raise ClientError(msg)
+
+    def _stop_session(self):
+        self._stop_event.set()
+
+        # A thread blocked in get_next returns when its client times out. Threads that
+        # don't are left behind, they are daemons and exit when their client does
+        for i, thread in enumerate(self._threads):
+            thread.join(self._timeout)
+
+            if thread.is_alive():
+                log.warning("client {} did not stop reading in time".format(i))
+
+        self._threads = None
+        self._queues = None
+
+        super()._stop_session()
@@ -0,0 +1,198 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+"""Decoding of the service output buffers sent by the servers
+
+The buffers hold 16 bit integers, unsigned for power bins, envelope and sparse and
+interleaved signed real and imaginary parts for IQ. :func:`raw_output_buffer` gives a
+view of the integers without copying. :func:`decode_output_buffer` converts them with a
+single copy, optionally into a buffer given by the caller. The clients decode with an
+:class:`OutputBufferDecoder`, which reuses preallocated buffers.
+"""
+
+import numpy as np
+
+from acconeer.exptool.a111._modes import Mode, get_mode
+
+
+_UNSIGNED_DTYPES = {byteorder: np.dtype(byteorder + "u2") for byteorder in "<>"}
+_SIGNED_DTYPES = {byteorder: np.dtype(byteorder + "i2") for byteorder in "<>"}
+_COMPLEX_DTYPES = {
+    np.dtype(np.float32): np.dtype(np.complex64),
+    np.dtype(np.float64): np.dtype(np.complex128),
+}
+
+# Looking up enum members is comparatively slow, this is called for every frame
+_IQ = Mode.IQ
+_SPARSE = Mode.SPARSE
+
+
+def raw_output_buffer(buffer, mode, sweeps_per_frame=None, num_sensors=None, byteorder="<"):
+    """Returns the integers of an output buffer as a view of it, without copying
+
+    The shape is that of the decoded data. For IQ, the real and imaginary parts are
+    interleaved in an extra last dimension of length 2.
+
+    :param num_sensors: If given, adds a leading sensor dimension
+    :param byteorder: ``"<"`` (little endian, the register protocol) or ``">"``
+    """
+    return _raw_output_buffer(buffer, get_mode(mode), sweeps_per_frame, num_sensors, byteorder)
+
+
+def _raw_output_buffer(buffer, mode, sweeps_per_frame, num_sensors, byteorder):
+    if mode is _IQ:
+        raw = np.frombuffer(buffer, dtype=_SIGNED_DTYPES[byteorder])
+        shape = (-1, 2)
+    else:
+        raw = np.frombuffer(buffer, dtype=_UNSIGNED_DTYPES[byteorder])
+
+        if mode is _SPARSE:
+            shape = (sweeps_per_frame, -1)
+        elif num_sensors is None:
+            return raw
+        else:
+            shape = (-1,)
+
+    if num_sensors is not None:
+        shape = (num_sensors, *shape)
+
+    return raw.reshape(shape)
+
+
+def decode_output_buffer(
+    buffer,
+    mode,
+    sweeps_per_frame=None,
+    num_sensors=None,
+    byteorder="<",
+    out=None,
+    dtype=np.float64,
+):
+    """Decodes an output buffer to float (complex for IQ) data
+
+    :param num_sensors: If given, adds a leading sensor dimension
+    :param byteorder: ``"<"`` (little endian, the register protocol) or ``">"``
+    :param out:
+        Array to write the data to, e.g. one that is reused between frames. Needs to have
+        the shape of the data. Its type is used instead of ``dtype``.
+    :param dtype: ``np.float64`` or ``np.float32``. Complex for IQ.
+    :return: ``out`` if given, otherwise a new array
+    """
+    if not isinstance(mode, Mode):
+        mode = get_mode(mode)
+
+    raw = _raw_output_buffer(buffer, mode, sweeps_per_frame, num_sensors, byteorder)
+    return _decode_raw(raw, mode, out, dtype)
+
+
+def decode_raw_output_buffer(raw, mode, out=None, dtype=np.float64):
+    """Decodes integers given by :func:`raw_output_buffer`, e.g. recorded frames of them
+
+    Any leading dimensions are kept.
+
+    :param out: See :func:`decode_output_buffer`
+    :param dtype: See :func:`decode_output_buffer`
+    """
+    return _decode_raw(np.asarray(raw), get_mode(mode), out, dtype)
+
+
+def _decode_raw(raw, mode, out, dtype):
+    if mode is not _IQ:
+        if out is None:
+            return raw.astype(dtype)
+
+        _check_out_shape(out, raw.shape)
+        out[...] = raw
+        return out
+
+    # Complex numbers are stored as (real, imaginary) pairs, so the pairs are converted
+    # to a float array that is then viewed as complex
+
+    if out is None:
+        return raw.astype(dtype).view(_COMPLEX_DTYPES[np.dtype(dtype)])[..., 0]
+
+    _check_out_shape(out, raw.shape[:-1])
+
+    if not out.flags.c_contiguous:
+        msg = "out needs to be C contiguous for IQ"
+        raise ValueError(msg)
+
+    out.view(out.real.dtype).reshape(raw.shape)[...] = raw
+    return out
+
+
+def _check_out_shape(out, shape):
+    # Assigning would otherwise broadcast a frame of the wrong shape
+    if out.shape != shape:
+        msg = "out has shape {} but the data has shape {}".format(out.shape, shape)
+        raise ValueError(msg)
+
+
+class OutputBufferDecoder:
+    """Decodes the output buffers of a session, optionally into preallocated arrays
+
+    :param byteorder: See :func:`decode_output_buffer`
+    :param dtype: See :func:`decode_output_buffer`
+    :param num_output_buffers:
+        If given, the number of preallocated arrays that are decoded into in turn. Returned
+        data is then overwritten after this many further calls to :meth:`decode`. By
+        default, every output buffer is decoded into a new array.
+    """
+
+    def __init__(
+        self,
+        mode,
+        sweeps_per_frame=None,
+        byteorder="<",
+        dtype=np.float64,
+        num_output_buffers=None,
+    ):
+        self._mode = get_mode(mode)
+        self._sweeps_per_frame = sweeps_per_frame
+        self._byteorder = byteorder
+
+        dtype = np.dtype(dtype)
+        self._out_dtype = _COMPLEX_DTYPES[dtype] if self._mode is _IQ else dtype
+
+        if num_output_buffers is not None and num_output_buffers < 1:
+            msg = "num_output_buffers needs to be at least 1"
+            raise ValueError(msg)
+
+        self._num_output_buffers = num_output_buffers
+        self._output_buffers = None
+        self._output_index = 0
+
+        self._last_raw = None
+
+    @property
+    def last_raw(self):
+        """The integers of the last decoded output buffer, see :func:`raw_output_buffer`"""
+        return self._last_raw
+
+    def decode(self, buffer, num_sensors=None):
+        """Decodes an output buffer into a new array, or the next of the preallocated arrays
+
+        :param num_sensors: If given, adds a leading sensor dimension
+        """
+        raw = _raw_output_buffer(
+            buffer, self._mode, self._sweeps_per_frame, num_sensors, self._byteorder
+        )
+        shape = raw.shape[:-1] if self._mode is _IQ else raw.shape
+
+        self._last_raw = raw
+        return _decode_raw(raw, self._mode, self._get_output_buffer(shape), self._out_dtype)
+
+    def _get_output_buffer(self, shape):
+        if self._num_output_buffers is None:
+            return np.empty(shape, dtype=self._out_dtype)
+
+        # The shape only changes if squeezing is changed during the session
+        if self._output_buffers is None or self._output_buffers[0].shape != shape:
+            self._output_buffers = [
+                np.empty(shape, dtype=self._out_dtype) for _ in range(self._num_output_buffers)
+            ]
+            self._output_index = 0
+
+        out = self._output_buffers[self._output_index]
+        self._output_index = (self._output_index + 1) % self._num_output_buffers
+        return out
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import abc
@@ -12,8 +12,6 @@ import traceback
 from collections import namedtuple
 from time import sleep, time
 
-import numpy as np
-
 from acconeer.exptool import libft4222
 from acconeer.exptool._core.communication import links
 from acconeer.exptool.a111._clients.base import (
@@ -22,6 +20,7 @@ from acconeer.exptool.a111._clients.base import (
     SessionSetupError,
     decode_version_str,
 )
+from acconeer.exptool.a111._clients.output_buffer import OutputBufferDecoder
 from acconeer.exptool.a111._clients.reg import protocol, regmap
 from acconeer.exptool.a111._modes import Mode
 
@@ -42,6 +41,8 @@ class RegBaseClient(BaseClient):
     _STATUS_TIMEOUT = 3.0
 
     def __init__(self, **kwargs):
+        self._num_output_buffers = kwargs.pop("num_output_buffers", None)
+
         super().__init__(**kwargs)
 
         self._streaming_control_val = "no_streaming"  # Override in subclass (UART)
@@ -49,6 +50,8 @@ class RegBaseClient(BaseClient):
         self._mode = None
         self._config = None
         self._data_length = None
+        self._result_info_decoder = None
+        self._output_buffer_decoder = None
 
     def _setup_session(self, config):
         if len(config.sensor) > 1:
@@ -61,6 +64,12 @@ class RegBaseClient(BaseClient):
         mode = config.mode
         self._mode = mode
         self._config = config
+        self._result_info_decoder = regmap.ResultInfoDecoder(mode)
+        self._output_buffer_decoder = OutputBufferDecoder(
+            mode,
+            getattr(config, "sweeps_per_frame", None),
+            num_output_buffers=self._num_output_buffers,
+        )
 
         self._write_reg("main_control", "stop")
         self._write_reg("mode_selection", mode)
@@ -104,6 +113,17 @@ class RegBaseClient(BaseClient):
 
         return info
 
+    def _decode_output_buffer(self, buffer):
+        num_sensors = None if self.squeeze else 1
+        return self._output_buffer_decoder.decode(buffer, num_sensors=num_sensors)
+
+    @property
+    def last_raw_data(self):
+        if self._output_buffer_decoder is None:
+            return None
+
+        return self._output_buffer_decoder.last_raw
+
     def _wait_status(self, val, mask=None):
         val = regmap.STATUS_FLAGS(val)
 
@@ -262,30 +282,14 @@ class UARTClient(RegBaseClient):
             msg = "got unexpected type of frame"
             raise ClientError(msg)
 
-        info = {}
-        for addr, enc_val in packet.result_info:
-            try:
-                reg = regmap.get_reg(addr, self._mode)
-                val = reg.decode(enc_val)
-            except (protocol.ProtocolError, ValueError):
-                log.info("got unknown reg val in result info")
-                log.info("addr: {}, value: {}".format(addr, fmt_enc_val(enc_val)))
-            else:
-                k = reg.stripped_name
-                k = regmap.STRIPPED_NAME_TO_INFO_REMAP.get(k, k)
-
-                if k is None:
-                    continue
-
-                info[k] = val
+        info = self._result_info_decoder.decode(packet.result_info)
 
-        sweeps_per_frame = getattr(self._config, "sweeps_per_frame", None)
-        data = protocol.decode_output_buffer(packet.buffer, self._mode, sweeps_per_frame)
+        data = self._decode_output_buffer(packet.buffer)
 
         if self.squeeze:
             return info, data
         else:
-            return [info], np.expand_dims(data, 0)
+            return [info], data
 
     def _stop_session(self):
         self._write_reg("main_control", "stop", expect_response=False)
@@ -476,27 +480,19 @@ class PollingUARTClient(UARTClient):
 
         buffer = self._read_buf_raw()
 
-        info = {}
-        info_regs = regmap.get_data_info_regs(self._config.mode)
-        for reg in info_regs:
-            k = reg.stripped_name
-            k = regmap.STRIPPED_NAME_TO_INFO_REMAP.get(k, k)
-
-            if k is None:
-                continue
-
-            info[k] = self._read_reg(reg)
+        info = {
+            k: self._read_reg(reg) for k, reg in self._result_info_decoder.data_info_keys_and_regs
+        }
 
         if not self._measure_on_call:
             self._write_reg("main_control", "clear_status")
 
-        sweeps_per_frame = getattr(self._config, "sweeps_per_frame", None)
-        data = protocol.decode_output_buffer(buffer, self._mode, sweeps_per_frame)
+        data = self._decode_output_buffer(buffer)
 
         if self.squeeze:
             return info, data
         else:
-            return [info], np.expand_dims(data, 0)
+            return [info], data
 
     def _stop_session(self):
         self._write_reg("main_control", "stop")
@@ -559,13 +555,12 @@ class SPIClient(RegBaseClient):
             raise ClientError
         info, buffer = ret_args
 
-        sweeps_per_frame = getattr(self._config, "sweeps_per_frame", None)
-        data = protocol.decode_output_buffer(buffer, self._mode, sweeps_per_frame)
+        data = self._decode_output_buffer(buffer)
 
         if self.squeeze:
             return info, data
         else:
-            return [info], np.expand_dims(data, 0)
+            return [info], data
 
     def _stop_session(self):
         self.__cmd_proc("stop_session")
@@ -643,6 +638,7 @@ class SPICommProcess(mp.Process):
         self.cmd_q = cmd_q
         self.data_q = data_q
         self.mode = None
+        self.result_info_decoder = None
 
     def run(self):
         self.log = logging.getLogger(__name__)
@@ -707,16 +703,10 @@ class SPICommProcess(mp.Process):
         else:
             buffer = bytearray()
 
-        info = {}
-        info_regs = regmap.get_data_info_regs(self.mode)
-        for reg in info_regs:
-            k = reg.stripped_name
-            k = regmap.STRIPPED_NAME_TO_INFO_REMAP.get(k, k)
-
-            if k is None:
-                continue
-
-            info[k] = self.read_reg(reg, do_log=False)
+        info = {
+            k: self.read_reg(reg, do_log=False)
+            for k, reg in self.result_info_decoder.data_info_keys_and_regs
+        }
 
         self.write_reg("main_control", "clear_status", do_log=False)
 
@@ -734,6 +724,7 @@ class SPICommProcess(mp.Process):
 
     def update_state(self, mode, update_rate, buffer_size):
         self.mode = mode
+        self.result_info_decoder = regmap.ResultInfoDecoder(mode)
 
         if update_rate is None:
             self.poll_timeout = 1.0
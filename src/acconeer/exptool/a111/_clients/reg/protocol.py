@@ -1,11 +1,9 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from collections import namedtuple
 
-import numpy as np
-
-from acconeer.exptool.a111._modes import Mode, get_mode
+from acconeer.exptool.a111._clients.output_buffer import decode_output_buffer  # noqa: F401
 
 
 RegVal = namedtuple("RegVal", ["addr", "val"])
@@ -201,19 +199,3 @@ def insert_packet_into_frame(packet):
     frame.extend(packet)
     frame.append(END_MARKER)
     return frame
-
-
-def decode_output_buffer(buffer, mode, sweeps_per_frame=None):
-    mode = get_mode(mode)
-
-    if mode == Mode.POWER_BINS or mode == Mode.ENVELOPE:
-        return np.frombuffer(buffer, dtype="<u2").astype("float")
-    elif mode == Mode.IQ:
-        data = np.frombuffer(buffer, dtype="<i2").astype("float")
-        return data.reshape((-1, 2)).view(dtype="complex").flatten()
-    elif mode == Mode.SPARSE:
-        data = np.frombuffer(buffer, dtype="<u2").astype("float")
-        data = data.reshape((sweeps_per_frame, -1))
-        return data
-    else:
-        raise NotImplementedError
@@ -1,9 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import contextlib
 import enum
 import importlib.resources
+import logging
 import operator
 from functools import partial, reduce
 
@@ -16,6 +17,8 @@ from acconeer.exptool.a111._modes import Mode, get_mode
 from . import data
 
 
+log = logging.getLogger(__name__)
+
 BYTEORDER = "little"
 BO = BYTEORDER
 
@@ -171,31 +174,23 @@ ENUM_REMAP = {
 
 REGISTERS = None
 
-
-def _match_reg_by_addr(addr, reg):
-    return reg.addr == addr
-
-
-def _match_reg_by_name(name, reg):
-    return name in (reg.full_name, reg.stripped_name)
+# Built from REGISTERS by load_yaml, {mode: {addr or name: [reg]}}
+# The mode None holds all registers
+_REGS_BY_ADDR = None
+_REGS_BY_NAME = None
 
 
 def get_reg(value, mode=None):
     if isinstance(value, Register):
         return value
     elif isinstance(value, int):
-        match_fun = partial(_match_reg_by_addr, value)
+        index = _REGS_BY_ADDR
     elif isinstance(value, str):
-        match_fun = partial(_match_reg_by_name, value)
+        index = _REGS_BY_NAME
     else:
         raise ValueError
 
-    mode = get_mode(mode)
-    matches = []
-
-    for reg in REGISTERS:
-        if match_fun(reg) and (mode is None or reg.modes is None or mode in reg.modes):
-            matches.append(reg)
+    matches = index[get_mode(mode)].get(value, ())
 
     if len(matches) < 1:
         msg = "unknown reg: {}".format(value)
@@ -255,6 +250,70 @@ def get_config_key_to_reg_map(mode):  # {config_key: reg}
     return m
 
 
+class ResultInfoDecoder:
+    """Decodes the (addr, encoded value) pairs of result info to a result info dict
+
+    Created once per session. The info keys of the data info registers of the mode are
+    looked up up front, those of other addresses the first time they are seen.
+    """
+
+    def __init__(self, mode):
+        self._mode = get_mode(mode)
+        self._keys_and_regs = {}  # {addr: (info key or None if ignored, reg)}
+
+        for reg in get_data_info_regs(self._mode):
+            self._keys_and_regs[reg.addr] = self._get_key_and_reg(reg)
+
+        self.data_info_keys_and_regs = [
+            (k, reg) for k, reg in self._keys_and_regs.values() if k is not None
+        ]
+
+    @staticmethod
+    def _get_key_and_reg(reg):
+        k = reg.stripped_name
+        return STRIPPED_NAME_TO_INFO_REMAP.get(k, k), reg
+
+    def decode(self, result_info):
+        info = {}
+
+        for addr, enc_val in result_info:
+            try:
+                try:
+                    k, reg = self._keys_and_regs[addr]
+                except KeyError:
+                    k, reg = self._get_key_and_reg(get_reg(addr, self._mode))
+                    self._keys_and_regs[addr] = (k, reg)
+
+                if k is not None:
+                    info[k] = reg.decode(enc_val)
+            except ValueError:
+                log.info("got unknown reg val in result info")
+                log.info("addr: {}, value: {}".format(addr, bytes(enc_val).hex(" ")))
+
+        return info
+
+
+def _build_indexes():
+    global _REGS_BY_ADDR
+    global _REGS_BY_NAME
+
+    _REGS_BY_ADDR = {}
+    _REGS_BY_NAME = {}
+
+    for mode in [None, *Mode]:
+        by_addr = _REGS_BY_ADDR[mode] = {}
+        by_name = _REGS_BY_NAME[mode] = {}
+
+        for reg in REGISTERS:
+            if mode is not None and reg.modes is not None and mode not in reg.modes:
+                continue
+
+            by_addr.setdefault(reg.addr, []).append(reg)
+
+            for name in dict.fromkeys([reg.full_name, reg.stripped_name]):
+                by_name.setdefault(name, []).append(reg)
+
+
 def load_yaml():
     global REGISTERS
 
@@ -348,6 +407,8 @@ def load_yaml():
 
         REGISTERS.append(reg)
 
+    _build_indexes()
+
 
 load_yaml()
 
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -9,7 +9,7 @@ import json
 import time
 import warnings
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, List, Optional, Union
 
 import attr
 import h5py
@@ -18,6 +18,7 @@ import numpy as np
 import acconeer.exptool as et
 from acconeer.exptool._structs import configbase
 from acconeer.exptool.a111 import _configs, _modes
+from acconeer.exptool.a111._clients.output_buffer import decode_raw_output_buffer
 
 
 @attr.s
@@ -65,7 +66,143 @@ class Record:
         return _configs.load(self.sensor_config_dump, self.mode)
 
 
+class _Ring:
+    """An array of rows that grows when appended to, or evicts its oldest row if bounded"""
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, row_shape, dtype, max_len=None):
+        capacity = self._INITIAL_CAPACITY if max_len is None else max_len
+        self._array = np.empty((capacity, *row_shape), dtype=dtype)
+        self._bounded = max_len is not None
+        self._start = 0
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def append(self, row):
+        capacity = len(self._array)
+
+        if self._len == capacity:
+            if self._bounded:
+                self._start = (self._start + 1) % capacity
+                self._len -= 1
+            else:
+                self._array = np.concatenate([self.to_array(), np.empty_like(self._array)])
+                self._start = 0
+                capacity *= 2
+
+        self._array[(self._start + self._len) % capacity] = row
+        self._len += 1
+
+    def to_array(self):
+        """Returns a copy of the rows, oldest first"""
+        end = self._start + self._len
+        capacity = len(self._array)
+
+        if end <= capacity:
+            return self._array[self._start : end].copy()
+        else:
+            return np.concatenate([self._array[self._start :], self._array[: end - capacity]])
+
+    def clear(self):
+        self._start = 0
+        self._len = 0
+
+
+class _DataInfoRing:
+    """
+    Stores data infos (lists of dicts, one per sensor) in a structured array
+
+    Falls back to storing copies of the lists if the keys or value types change between
+    frames, or if the values are not bool, int or float.
+    """
+
+    _FIELD_DTYPES = {bool: "?", int: "i8", float: "f8"}
+
+    def __init__(self, max_len=None):
+        self._max_len = max_len
+        self._ring = None
+        self._names = None
+        self._types = None
+
+    def __len__(self):
+        return 0 if self._ring is None else len(self._ring)
+
+    def append(self, data_info):
+        if self._ring is None:
+            self._create_structured_ring(data_info)
+
+        if self._names is not None:
+            try:
+                self._append_structured(data_info)
+            except (TypeError, ValueError, OverflowError):
+                self._convert_to_object_ring()
+            else:
+                return
+
+        self._ring.append(copy.deepcopy(data_info))
+
+    def _create_structured_ring(self, data_info):
+        keys = tuple(data_info[0]) if data_info else ()
+        types = tuple(type(v) for v in data_info[0].values()) if data_info else ()
+
+        if keys and all(t in self._FIELD_DTYPES for t in types):
+            self._names = keys
+            self._types = types
+            dtype = [(k, self._FIELD_DTYPES[t]) for k, t in zip(keys, types)]
+            self._ring = _Ring((len(data_info),), dtype, self._max_len)
+        else:
+            self._ring = _Ring((), object, self._max_len)
+
+    def _append_structured(self, data_info):
+        for d in data_info:
+            if tuple(d) != self._names or tuple(type(v) for v in d.values()) != self._types:
+                raise TypeError
+
+        self._ring.append([tuple(d.values()) for d in data_info])
+
+    def _convert_to_object_ring(self):
+        data_infos = self.to_list()
+        self._names = None
+        self._types = None
+        self._ring = _Ring((), object, self._max_len)
+
+        for data_info in data_infos:
+            self._ring.append(data_info)
+
+    def to_list(self) -> List[List[dict]]:
+        if self._ring is None:
+            return []
+
+        rows = self._ring.to_array().tolist()
+
+        if self._names is None:
+            return rows
+
+        return [[dict(zip(self._names, values)) for values in row] for row in rows]
+
+    def clear(self):
+        if self._ring is not None:
+            self._ring.clear()
+
+
 class Recorder:
+    """
+    Records the frames of a session
+
+    Frames are kept in preallocated arrays. With ``max_len``, only the last ``max_len``
+    frames are kept. With ``path``, frames are instead written to an ``.h5`` file (in the
+    layout of :func:`save_h5`) as they arrive. Only the data infos are then kept in memory
+    until :meth:`close`.
+
+    Frames can be sampled as the integers they were sent as (see ``Client.last_raw_data``),
+    which are kept and written as is.
+    """
+
+    _STREAM_BLOCK_LEN = 32
+
     def __init__(self, **kwargs):
         sensor_config = kwargs.pop("sensor_config")
         session_info = kwargs.pop("session_info")
@@ -76,6 +213,7 @@ class Recorder:
         mode = kwargs.pop("mode", sensor_config.mode)
 
         self.max_len = kwargs.pop("max_len", None)
+        path = kwargs.pop("path", None)
 
         if kwargs:
             key = next(iter(kwargs.keys()))
@@ -94,7 +232,11 @@ class Recorder:
             msg = "Unexpected processing config type"
             raise TypeError(msg)
 
-        self.record = Record(
+        if path is not None and self.max_len is not None:
+            msg = "Recorder can't both stream to a file and keep only the last frames"
+            raise ValueError(msg)
+
+        self._record = Record(
             mode=mode,
             sensor_config_dump=sensor_config._dumps(),
             session_info=copy.deepcopy(session_info),
@@ -105,30 +247,170 @@ class Recorder:
             timestamp=datetime.datetime.now().isoformat(timespec="seconds"),
         )
 
-        self.record.data = []
-        self.record.sample_times = []
+        self._data: Optional[_Ring] = None
+        self._data_is_raw: Optional[bool] = None
+        self._data_info = _DataInfoRing(self.max_len)
+        self._sample_times = _Ring((), float, self.max_len)
+        self._num_streamed = 0
+        self._file: Optional[h5py.File] = None
+
+        if path is not None:
+            path = str(path)
+            if not path.lower().endswith(".h5"):
+                path = path + ".h5"
+
+            self._file = h5py.File(path, "w")
 
-    def sample(self, data_info: list, data: np.ndarray):
-        expected_num_dims = 3 if self.record.mode == _modes.Mode.SPARSE else 2
+    def __len__(self):
+        return self._num_streamed + len(self._sample_times)
+
+    @property
+    def record(self) -> Record:
+        """The recorded frames so far. Not available when streaming to a file."""
+        if self._file is not None:
+            msg = "The frames are streamed to a file, load it after closing the recorder"
+            raise RuntimeError(msg)
+
+        if self._data is None:
+            data: Any = np.array([])
+        else:
+            data = self._decoded(self._data.to_array())
+
+        self._record.data = data
+        self._record.data_info = self._data_info.to_list()
+        self._record.sample_times = self._sample_times.to_array()
+        return self._record
+
+    def sample(self, data_info: list, data: np.ndarray, raw_data: Optional[np.ndarray] = None):
+        """
+        :param raw_data:
+            The integers the data was decoded from, e.g. ``Client.last_raw_data``. Recorded
+            instead of the data if given.
+        """
+        expected_num_dims = 3 if self._record.mode == _modes.Mode.SPARSE else 2
         if data.ndim != expected_num_dims:  # then assume data is squeezed
             # unsqueeze (add back sensor dim)
             data = data[None, ...]
             data_info = [data_info]
 
-        self.record.data.append(data.copy())
-        self.record.data_info.append(copy.deepcopy(data_info))
+            if raw_data is not None:
+                raw_data = raw_data[None, ...]
+
+        if raw_data is not None:
+            data = raw_data
+
+        if self._data is None:
+            # Stored in native byte order (the JSON protocol sends big endian integers)
+            self._data = _Ring(data.shape, data.dtype.newbyteorder("="), self.max_len)
+            self._data_is_raw = raw_data is not None
+        elif self._data_is_raw != (raw_data is not None):
+            msg = "Recorder can't mix frames sampled with and without raw data"
+            raise ValueError(msg)
+
+        self._data.append(data)
+        self._data_info.append(data_info)
+        self._sample_times.append(time.time())
+
+        if self._file is not None and len(self._data) == self._STREAM_BLOCK_LEN:
+            self._flush()
+
+    def _decoded(self, frames: np.ndarray) -> np.ndarray:
+        if not self._data_is_raw:
+            return frames
+
+        return decode_raw_output_buffer(frames, self._record.mode)
+
+    def _flush(self):
+        data = self._data.to_array()
+
+        # Raw IQ data is stored as complex, other raw data is already packed
+        if self._data_is_raw and self._record.mode == _modes.Mode.IQ:
+            data = self._decoded(data)
+        sample_times = self._sample_times.to_array()
+        self._data.clear()
+        self._sample_times.clear()
+
+        if "data" not in self._file:
+            dtype = _packed_data_dtype(data)
+            self._file.create_dataset(
+                "data",
+                shape=(0, *data.shape[1:]),
+                maxshape=(None, *data.shape[1:]),
+                dtype=dtype,
+                chunks=(self._STREAM_BLOCK_LEN, *data.shape[1:]),
+                compression="gzip",
+            )
+            self._file.create_dataset(
+                "sample_times",
+                shape=(0,),
+                maxshape=(None,),
+                dtype=float,
+                chunks=(self._STREAM_BLOCK_LEN,),
+                compression="gzip",
+            )
+        elif self._file["data"].dtype == "u2" and _packed_data_dtype(data) != "u2":
+            self._widen_data_dataset(data.dtype)
+
+        for name, values in [("data", data), ("sample_times", sample_times)]:
+            dataset = self._file[name]
+            dataset.resize(self._num_streamed + len(values), axis=0)
+            dataset[self._num_streamed :] = values
+
+        self._num_streamed += len(data)
+
+    def _widen_data_dataset(self, dtype):
+        # A block that doesn't fit in the packed (uint16) type, rewrite as the original type
+        old = self._file["data"]
+        new = self._file.create_dataset(
+            "_data",
+            shape=old.shape,
+            maxshape=old.maxshape,
+            dtype=dtype,
+            chunks=old.chunks,
+            compression="gzip",
+        )
+        for start in range(0, len(old), self._STREAM_BLOCK_LEN):
+            new[start : start + self._STREAM_BLOCK_LEN] = old[
+                start : start + self._STREAM_BLOCK_LEN
+            ]
+
+        del self._file["data"]
+        self._file.move("_data", "data")
+
+    def close(self) -> Optional[Record]:
+        """
+        Returns the record, or finishes the file and returns ``None`` when streaming to a file
+        """
+        if self._file is None:
+            return self.record
+
+        if len(self._sample_times) > 0:
+            self._flush()
+
+        # Only the datasets not already streamed
+        self._record.data = np.array([])
+        self._record.data_info = self._data_info.to_list()
+        self._record.sample_times = np.array([])
+        self._data_info.clear()
+
+        _write_h5_datasets(
+            self._file,
+            {k: v for k, v in pack(self._record).items() if k not in self._file},
+        )
+        self._file.close()
+        self._file = None
+        return None
+
 
-        self.record.sample_times.append(time.time())
+def _packed_data_dtype(data: np.ndarray) -> np.dtype:
+    """The dtype :func:`pack` stores data with, uint16 if it fits"""
+    if data.dtype == np.dtype("u2"):
+        return data.dtype
 
-        if self.max_len is not None and len(self.record.data) > self.max_len:
-            self.record.data.pop(0)
-            self.record.data_info.pop(0)
-            self.record.sample_times.pop(0)
+    if np.isrealobj(data) and np.all(data == data.astype("u2")):
+        return np.dtype("u2")
 
-    def close(self):
-        self.record.data = np.array(self.record.data)
-        self.record.sample_times = np.array(self.record.sample_times)
-        return self.record
+    return data.dtype
 
 
 def save(filename: Union[str, Path], record: Record):
@@ -153,12 +435,7 @@ def pack(record: Record) -> dict:
     packed["data_info"] = json.dumps(record.data_info)
 
     data = np.array(record.data)
-    if np.isrealobj(data):
-        data_u16 = data.astype("u2")
-        if np.all(data == data_u16):
-            data = data_u16
-
-    packed["data"] = data
+    packed["data"] = data.astype(_packed_data_dtype(data))
 
     if record.sample_times is not None:
         packed["sample_times"] = np.array(record.sample_times)
@@ -187,17 +464,21 @@ def save_h5(filename: Union[str, Path], record: Record):
     packed = pack(record)
 
     with h5py.File(filename, "w") as f:
-        for k, v in packed.items():
-            if isinstance(v, str):
-                dtype = h5py.special_dtype(vlen=str)
-                compression = None
-            elif isinstance(v, np.ndarray):
-                dtype = v.dtype
-                compression = "gzip"
-            else:
-                raise TypeError
+        _write_h5_datasets(f, packed)
+
+
+def _write_h5_datasets(f: h5py.File, packed: dict):
+    for k, v in packed.items():
+        if isinstance(v, str):
+            dtype = h5py.special_dtype(vlen=str)
+            compression = None
+        elif isinstance(v, np.ndarray):
+            dtype = v.dtype
+            compression = "gzip"
+        else:
+            raise TypeError
 
-            f.create_dataset(k, data=v, dtype=dtype, compression=compression)
+        f.create_dataset(k, data=v, dtype=dtype, compression=compression)
 
 
 def load(filename: Union[str, Path]) -> Record:
@@ -44,6 +44,7 @@ from ._core import (
     SessionConfig,
     StackedResults,
     SubsweepConfig,
+    are_valid_session_configs,
     iterate_extended_structure,
     iterate_extended_structure_values,
     load_record,
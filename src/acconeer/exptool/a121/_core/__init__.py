@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from acconeer.exptool._core.communication.client import ClientError, ServerError
@@ -26,6 +26,7 @@ from .entities import (
     SessionConfig,
     StackedResults,
     SubsweepConfig,
+    are_valid_session_configs,
 )
 from .recording import (
     _H5PY_STR_DTYPE,
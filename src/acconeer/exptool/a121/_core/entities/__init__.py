@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from acconeer.exptool._core.int_16_complex import (
@@ -14,6 +14,7 @@ from .configs import (
     SensorConfig,
     SessionConfig,
     SubsweepConfig,
+    are_valid_session_configs,
 )
 from .containers import (
     Metadata,
@@ -1,7 +1,7 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from .config_enums import PRF, IdleState, Profile
 from .sensor_config import SensorConfig
-from .session_config import SessionConfig
+from .session_config import SessionConfig, are_valid_session_configs
 from .subsweep_config import SubsweepConfig
@@ -1,11 +1,13 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import json
+import struct
 import warnings
-from typing import Any, List, Optional, TypeVar
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
 import numpy as np
 
@@ -31,6 +33,18 @@ _TOO_MANY_SUBSWEEPS_ERROR_FORMAT = (
 )
 VALIDATION_TAG_BUFFER_SIZE_TOO_LARGE = object()
 
+# sweeps_per_frame, sweep_rate, frame_rate, continuous_sweep_mode, double_buffering,
+# inter_frame_idle_state, inter_sweep_idle_state, number of subsweeps
+_BINARY_FORMAT = struct.Struct("<Idd??BBB")
+
+# (validation key, identities of the subsweeps, validation results)
+_ValidationMemo = Tuple[Tuple[Any, ...], Tuple[int, ...], List[ValidationResult]]
+
+# Memoized validation results by the id of their sensor config. Kept outside of the configs
+# so that they are neither serialized nor carried over to copies. Entries are removed when
+# their config is garbage collected.
+_VALIDATION_MEMOS: Dict[int, _ValidationMemo] = {}
+
 
 def subsweep_delegate_field(descriptor: Any, type_: type[T]) -> Descriptor[T]:
     return delegate_field(
@@ -275,6 +289,64 @@ class SensorConfig:
     def from_json(cls, json_str: str) -> SensorConfig:
         return cls.from_dict(json.loads(json_str))
 
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding, see :meth:`SessionConfig.to_bytes`"""
+        return bytes([utils.BINARY_FORMAT_VERSION]) + self._pack()
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> SensorConfig:
+        utils.check_binary_format_version(buffer)
+        sensor_config, _ = cls._unpack_from(buffer, 1)
+        return sensor_config
+
+    def _pack(self) -> bytes:
+        header = _BINARY_FORMAT.pack(
+            self.sweeps_per_frame,
+            utils.optional_float_to_binary(self.sweep_rate),
+            utils.optional_float_to_binary(self.frame_rate),
+            self.continuous_sweep_mode,
+            self.double_buffering,
+            self.inter_frame_idle_state.value,
+            self.inter_sweep_idle_state.value,
+            self.num_subsweeps,
+        )
+        return header + b"".join(subsweep._pack() for subsweep in self.subsweeps)
+
+    @classmethod
+    def _unpack_from(cls, buffer: bytes, offset: int) -> tuple[SensorConfig, int]:
+        """Unpacks a sensor config packed at ``offset``
+
+        :returns: The sensor config and the offset just after it
+        """
+        (
+            sweeps_per_frame,
+            sweep_rate,
+            frame_rate,
+            continuous_sweep_mode,
+            double_buffering,
+            inter_frame_idle_state,
+            inter_sweep_idle_state,
+            num_subsweeps,
+        ) = _BINARY_FORMAT.unpack_from(buffer, offset)
+        offset += _BINARY_FORMAT.size
+
+        subsweeps = []
+        for _ in range(num_subsweeps):
+            subsweep, offset = SubsweepConfig._unpack_from(buffer, offset)
+            subsweeps.append(subsweep)
+
+        sensor_config = cls(
+            subsweeps=subsweeps,
+            sweeps_per_frame=sweeps_per_frame,
+            sweep_rate=utils.optional_float_from_binary(sweep_rate),
+            frame_rate=utils.optional_float_from_binary(frame_rate),
+            continuous_sweep_mode=continuous_sweep_mode,
+            double_buffering=double_buffering,
+            inter_frame_idle_state=IdleState(inter_frame_idle_state),
+            inter_sweep_idle_state=IdleState(inter_sweep_idle_state),
+        )
+        return sensor_config, offset
+
     def validate(self) -> None:
         """Performs self-validation and validation of its subsweep configs
 
@@ -286,7 +358,40 @@ class SensorConfig:
             except ValidationWarning as vw:
                 warnings.warn(vw.message)
 
+    def _validation_key(self) -> tuple[Any, ...]:
+        """Structural key of everything that validation depends on
+
+        Sensor configs with equal keys have equal validation results, apart from their sources.
+        """
+        return (
+            self._sweeps_per_frame,
+            self._sweep_rate,
+            self._frame_rate,
+            self._continuous_sweep_mode,
+            self._double_buffering,
+            self._inter_frame_idle_state,
+            self._inter_sweep_idle_state,
+            *(subsweep._validation_key() for subsweep in self._subsweeps),
+        )
+
     def _collect_validation_results(self) -> list[ValidationResult]:
+        # Validation results are memoized on the validation key. Since results refer to their
+        # source, the identities of the subsweeps also need to be the same
+        key = self._validation_key()
+        subsweep_ids = tuple(map(id, self._subsweeps))
+
+        memo = _VALIDATION_MEMOS.get(id(self))
+
+        if memo is None or memo[0] != key or memo[1] != subsweep_ids:
+            if memo is None:
+                weakref.finalize(self, _VALIDATION_MEMOS.pop, id(self), None)
+
+            memo = (key, subsweep_ids, self._validate())
+            _VALIDATION_MEMOS[id(self)] = memo
+
+        return list(memo[2])
+
+    def _validate(self) -> list[ValidationResult]:
         sensor_config_validate_results = (
             self._validate_continuous_sweep_mode()
             + self._validate_idle_states()
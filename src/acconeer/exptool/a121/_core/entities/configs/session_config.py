@@ -1,11 +1,12 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import json
+import struct
 import warnings
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
 
 import numpy as np
 
@@ -21,6 +22,14 @@ from acconeer.exptool.a121._core import utils
 from .sensor_config import SensorConfig
 
 
+# format version, extended, update_rate, number of groups
+_BINARY_HEADER_FORMAT = struct.Struct("<B?dB")
+# number of sensor configs in the group
+_BINARY_GROUP_FORMAT = struct.Struct("<B")
+# sensor id (followed by the sensor config)
+_BINARY_ENTRY_FORMAT = struct.Struct("<I")
+
+
 @utils.no_dynamic_member_creation
 class SessionConfig:
     """Session configuration
@@ -289,6 +298,58 @@ class SessionConfig:
 
         return cls.from_dict(session_config_dict)
 
+    def to_bytes(self) -> bytes:
+        """Compact, versioned binary encoding
+
+        Encoding and decoding is many times faster than going through JSON, which makes it
+        suitable for caching decoded configs. The encoding may change between versions of
+        Exploration Tool, so use :meth:`to_json` for anything that is stored.
+        """
+        parts = [
+            _BINARY_HEADER_FORMAT.pack(
+                utils.BINARY_FORMAT_VERSION,
+                self.extended,
+                utils.optional_float_to_binary(self.update_rate),
+                len(self._groups),
+            )
+        ]
+        for group in self._groups:
+            parts.append(_BINARY_GROUP_FORMAT.pack(len(group)))
+            for sensor_id, sensor_config in group.items():
+                parts.append(_BINARY_ENTRY_FORMAT.pack(sensor_id))
+                parts.append(sensor_config._pack())
+
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> SessionConfig:
+        """Decodes a session config encoded with :meth:`to_bytes`
+
+        :raises ValueError: If ``buffer`` was encoded with another version of the format
+        """
+        utils.check_binary_format_version(buffer)
+        (_, extended, update_rate, num_groups) = _BINARY_HEADER_FORMAT.unpack_from(buffer, 0)
+        offset = _BINARY_HEADER_FORMAT.size
+
+        groups = []
+        for _ in range(num_groups):
+            (num_entries,) = _BINARY_GROUP_FORMAT.unpack_from(buffer, offset)
+            offset += _BINARY_GROUP_FORMAT.size
+
+            group = {}
+            for _ in range(num_entries):
+                (sensor_id,) = _BINARY_ENTRY_FORMAT.unpack_from(buffer, offset)
+                offset += _BINARY_ENTRY_FORMAT.size
+                group[sensor_id], offset = SensorConfig._unpack_from(buffer, offset)
+
+            groups.append(group)
+
+        return cls(
+            groups,
+            extended=extended,
+            update_rate=utils.optional_float_from_binary(update_rate),
+        )
+
     def __str__(self) -> str:
         lines = []
 
@@ -308,6 +369,50 @@ class SessionConfig:
         return "\n".join(lines)
 
 
+_SENSOR_CONFIG_VALIDITY_CACHE_SIZE = 4096
+_sensor_config_validity: dict[tuple[Any, ...], bool] = {}
+
+
+def are_valid_session_configs(session_configs: Iterable[SessionConfig]) -> list[bool]:
+    """Checks whether session configs would pass :meth:`SessionConfig.validate`
+
+    Neither raises nor warns. Whether a sensor config is valid is shared between all sensor
+    configs with the same parameters, which makes checking many similar configs (e.g. when
+    searching for a config) fast.
+
+    :returns: For each session config, whether it is free from validation errors
+    """
+    return [_is_valid(session_config) for session_config in session_configs]
+
+
+def _is_valid(session_config: SessionConfig) -> bool:
+    sensor_configs = list(utils.iterate_extended_structure_values(session_config.groups))
+
+    if session_config.update_rate is not None and any(
+        sensor_config.frame_rate is not None for sensor_config in sensor_configs
+    ):
+        return False
+
+    for sensor_config in sensor_configs:
+        key = sensor_config._validation_key()
+
+        try:
+            is_valid = _sensor_config_validity[key]
+        except KeyError:
+            is_valid = not any(
+                isinstance(result, ValidationError) for result in sensor_config._validate()
+            )
+
+            if len(_sensor_config_validity) >= _SENSOR_CONFIG_VALIDITY_CACHE_SIZE:
+                del _sensor_config_validity[next(iter(_sensor_config_validity))]
+            _sensor_config_validity[key] = is_valid
+
+        if not is_valid:
+            return False
+
+    return True
+
+
 def _unsqueeze_groups(
     arg: Union[SensorConfig, dict[int, SensorConfig], list[dict[int, SensorConfig]]],
 ) -> list[dict[int, SensorConfig]]:
@@ -1,9 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import json
+import struct
 import typing as t
 import warnings
 
@@ -29,6 +30,11 @@ from .config_enums import PRF, Profile
 
 SPARSE_IQ_PPC = 24
 
+# start_point, num_points, step_length, profile, hwaas, receiver_gain, enable_tx,
+# enable_loopback, phase_enhancement, iq_imbalance_compensation, prf frequency
+_BINARY_FORMAT = struct.Struct("<iIIBHB????I")
+_PRF_BY_FREQUENCY = {prf.frequency: prf for prf in PRF}
+
 # The `converter` argument to `attrs.field` influences the signature of `__init__`
 # - (https://www.attrs.org/en/stable/api.html#converters)
 # This is mirrored in LSPs and the docs.
@@ -185,6 +191,22 @@ class SubsweepConfig:
     def prf(self, value: PRF) -> None:
         self._prf = PRF(value)
 
+    def _validation_key(self) -> tuple[t.Any, ...]:
+        """Structural key of everything that validation depends on"""
+        return (
+            self.start_point,
+            self.num_points,
+            self.step_length,
+            self.profile,
+            self.hwaas,
+            self.receiver_gain,
+            self.enable_tx,
+            self.enable_loopback,
+            self.phase_enhancement,
+            self.iq_imbalance_compensation,
+            self._prf,
+        )
+
     def _collect_validation_results(self) -> list[ValidationResult]:
         APPROX_BASE_STEP_LENGTH = 2.5e-3
         validation_results: list[ValidationResult] = []
@@ -295,6 +317,56 @@ class SubsweepConfig:
     def from_json(cls, json_str: str) -> SubsweepConfig:
         return cls.from_dict(json.loads(json_str))
 
+    def _pack(self) -> bytes:
+        return _BINARY_FORMAT.pack(
+            self.start_point,
+            self.num_points,
+            self.step_length,
+            self.profile.value,
+            self.hwaas,
+            self.receiver_gain,
+            self.enable_tx,
+            self.enable_loopback,
+            self.phase_enhancement,
+            self.iq_imbalance_compensation,
+            self.prf.frequency,
+        )
+
+    @classmethod
+    def _unpack_from(cls, buffer: bytes, offset: int) -> t.Tuple[SubsweepConfig, int]:
+        """Unpacks a subsweep config packed at ``offset``
+
+        :returns: The subsweep config and the offset just after it
+        """
+        (
+            start_point,
+            num_points,
+            step_length,
+            profile,
+            hwaas,
+            receiver_gain,
+            enable_tx,
+            enable_loopback,
+            phase_enhancement,
+            iq_imbalance_compensation,
+            prf_frequency,
+        ) = _BINARY_FORMAT.unpack_from(buffer, offset)
+
+        subsweep_config = cls(
+            start_point=start_point,
+            num_points=num_points,
+            step_length=step_length,
+            profile=Profile(profile),
+            hwaas=hwaas,
+            receiver_gain=receiver_gain,
+            enable_tx=enable_tx,
+            enable_loopback=enable_loopback,
+            phase_enhancement=phase_enhancement,
+            iq_imbalance_compensation=iq_imbalance_compensation,
+            prf=_PRF_BY_FREQUENCY[prf_frequency],
+        )
+        return subsweep_config, offset + _BINARY_FORMAT.size
+
     def _pretty_str_lines(self, index: t.Optional[int] = None) -> list[str]:
         lines = []
         index_str = "" if index is None else f" @ index {index}"
@@ -1,9 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import json
+import struct
 from typing import Any, Optional, Tuple
 
 import attrs
@@ -11,6 +12,15 @@ import numpy as np
 import numpy.typing as npt
 
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_eq
+from acconeer.exptool.a121._core import utils
+
+
+# format version, frame_data_length, sweep_data_length, calibration_temperature, tick_period,
+# base_step_length_m, max_sweep_rate, high_speed_mode, number of subsweeps.
+# Followed by the subsweep data offsets and lengths
+_BINARY_HEADER_FORMAT = struct.Struct("<BIIiIddbB")
+_BINARY_HIGH_SPEED_MODE_NONE = -1
+_BINARY_ARRAY_DTYPE = np.dtype("<i8")
 
 
 @attrs.frozen(kw_only=True)
@@ -111,6 +121,63 @@ class Metadata:
     def from_json(cls, json_str: str) -> Metadata:
         return cls.from_dict(json.loads(json_str, cls=MetadataDecoder))
 
+    def to_bytes(self) -> bytes:
+        """Compact binary encoding, see :meth:`SessionConfig.to_bytes`"""
+        header = _BINARY_HEADER_FORMAT.pack(
+            utils.BINARY_FORMAT_VERSION,
+            self.frame_data_length,
+            self.sweep_data_length,
+            self.calibration_temperature,
+            self.tick_period,
+            self.base_step_length_m,
+            self.max_sweep_rate,
+            _BINARY_HIGH_SPEED_MODE_NONE
+            if self.high_speed_mode is None
+            else int(self.high_speed_mode),
+            len(self.subsweep_data_offset),
+        )
+        return (
+            header
+            + np.asarray(self.subsweep_data_offset, dtype=_BINARY_ARRAY_DTYPE).tobytes()
+            + np.asarray(self.subsweep_data_length, dtype=_BINARY_ARRAY_DTYPE).tobytes()
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> Metadata:
+        utils.check_binary_format_version(buffer)
+        (
+            _,
+            frame_data_length,
+            sweep_data_length,
+            calibration_temperature,
+            tick_period,
+            base_step_length_m,
+            max_sweep_rate,
+            high_speed_mode,
+            num_subsweeps,
+        ) = _BINARY_HEADER_FORMAT.unpack_from(buffer, 0)
+
+        arrays = np.frombuffer(
+            buffer,
+            dtype=_BINARY_ARRAY_DTYPE,
+            count=2 * num_subsweeps,
+            offset=_BINARY_HEADER_FORMAT.size,
+        ).astype(np.int_)
+
+        return cls(
+            frame_data_length=frame_data_length,
+            sweep_data_length=sweep_data_length,
+            subsweep_data_offset=arrays[:num_subsweeps],
+            subsweep_data_length=arrays[num_subsweeps:],
+            calibration_temperature=calibration_temperature,
+            tick_period=tick_period,
+            base_step_length_m=base_step_length_m,
+            max_sweep_rate=max_sweep_rate,
+            high_speed_mode=None
+            if high_speed_mode == _BINARY_HIGH_SPEED_MODE_NONE
+            else bool(high_speed_mode),
+        )
+
 
 class MetadataEncoder(json.JSONEncoder):
     """Encoder that transforms a Metadata instance to a serializable
@@ -1,14 +1,14 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
+import functools
 import re
 import warnings
-from typing import Callable, Iterator, Tuple, TypeVar
+from typing import Callable, Iterator, Optional, Sequence, Tuple, TypeVar
 
 import h5py
-import numpy as np
 from packaging.version import Version
 
 import acconeer.exptool
@@ -37,19 +37,93 @@ class H5RecordException(RecordException):
     pass
 
 
+class _DecodeCache:
+    """Decodes the JSON representations of configs and metadata stored in a record
+
+    Each distinct JSON string is only parsed once and is then kept in its binary encoding,
+    which is much faster to decode.
+    """
+
+    def __init__(self) -> None:
+        self._session_configs: dict[str, bytes] = {}
+        self._metadata: dict[str, bytes] = {}
+
+    def encoded_session_config(self, json_str: str) -> bytes:
+        """Returns the binary encoding of the session config, see ``SessionConfig.to_bytes``"""
+        try:
+            return self._session_configs[json_str]
+        except KeyError:
+            pass
+
+        encoded = SessionConfig.from_json(json_str).to_bytes()
+        self._session_configs[json_str] = encoded
+        return encoded
+
+    def metadata(self, json_str: str) -> Metadata:
+        try:
+            return Metadata.from_bytes(self._metadata[json_str])
+        except KeyError:
+            pass
+
+        metadata = Metadata.from_json(json_str)
+        self._metadata[json_str] = metadata.to_bytes()
+        return metadata
+
+
 class H5SessionRecord(SessionRecord):
-    def __init__(self, group: h5py.Group, ticks_per_second: int) -> None:
+    """Session in a H5 file
+
+    Everything but the frames is written when the session is started and never changes. Those
+    attributes are cached after the first access. The number of frames is only cached if the
+    file is opened read-only, since it grows while the session is being recorded.
+    """
+
+    _RESULTS_BLOCK_SIZE = 64
+
+    def __init__(
+        self,
+        group: h5py.Group,
+        ticks_per_second: int,
+        decode_cache: Optional[_DecodeCache] = None,
+    ) -> None:
         self._group = group
         self._ticks_per_second = ticks_per_second
+        self._decode_cache = _DecodeCache() if decode_cache is None else decode_cache
+        self._read_only = group.file.mode == "r"
+        self._num_frames: Optional[int] = None
+        self._result_contexts: dict[str, ResultContext] = {}
+
+    @property
+    def group(self) -> h5py.Group:
+        """The H5 group of the session"""
+        return self._group
+
+    @property
+    def entry_groups(self) -> list[dict[int, h5py.Group]]:
+        """The H5 groups with the metadata and results of each sensor, in the extended structure"""
+        return [dict(group) for group in self._entries]
 
     @property
     def extended_metadata(self) -> list[dict[int, Metadata]]:
-        return self._map_over_entries(self._get_metadata_for_entry_group)
+        return [dict(group) for group in self._extended_metadata]
 
     @property
     def extended_results(self) -> Iterator[list[dict[int, Result]]]:
-        for frame_no in range(self.num_frames):
-            yield self._get_result_for_all_entries(frame_no)
+        # Results are read a block of frames at a time. Reading single frames from the
+        # compressed datasets decompresses the same chunk over and over
+        num_frames = self.num_frames
+
+        for start in range(0, num_frames, self._RESULTS_BLOCK_SIZE):
+            stop = min(start + self._RESULTS_BLOCK_SIZE, num_frames)
+            results_block = self._map_over_entries(
+                functools.partial(self._read_results, start=start, stop=stop)
+            )
+
+            for i in range(stop - start):
+                yield [
+                    {sensor_id: results[i] for sensor_id, results in group.items()}
+                    for group in results_block
+                ]
 
     @property
     def extended_stacked_results(self) -> list[dict[int, StackedResults]]:
@@ -57,51 +131,83 @@ class H5SessionRecord(SessionRecord):
 
     @property
     def num_frames(self) -> int:
+        if self._num_frames is not None:
+            return self._num_frames
+
         (num_frames,) = {len(entry["result/frame"]) for _, _, entry in self._iterate_entries()}
+
+        if self._read_only:
+            self._num_frames = num_frames
+
         return num_frames
 
     @property
     def session_config(self) -> SessionConfig:
-        return SessionConfig.from_json(self._group["session_config"][()])
+        # Session configs are mutable, so every access gets a config of its own
+        return SessionConfig.from_bytes(self._encoded_session_config)
 
-    @property
+    @functools.cached_property
     def sensor_id(self) -> int:
         entry_group = utils.unextend(self._get_entries())
         return int(entry_group["sensor_id"][()])
 
     @property
     def calibrations(self) -> dict[int, SensorCalibration]:
+        return dict(self._calibrations)
+
+    @property
+    def calibrations_provided(self) -> dict[int, bool]:
+        return dict(self._calibrations_provided)
+
+    @functools.cached_property
+    def _extended_metadata(self) -> list[dict[int, Metadata]]:
+        return self._map_over_entries(self._get_metadata_for_entry_group)
+
+    @functools.cached_property
+    def _encoded_session_config(self) -> bytes:
+        return self._decode_cache.encoded_session_config(self._group["session_config"][()])
+
+    @functools.cached_property
+    def _calibrations(self) -> dict[int, SensorCalibration]:
         sensor_calibrations_dict = {}
         for sensor_id, group in self._iterate_calibrations():
             sensor_calibrations_dict[sensor_id] = SensorCalibration.from_h5(group)
 
         return sensor_calibrations_dict
 
-    @property
-    def calibrations_provided(self) -> dict[int, bool]:
+    @functools.cached_property
+    def _calibrations_provided(self) -> dict[int, bool]:
         calibrations_provided = {}
         for sensor_id, group in self._iterate_calibrations():
             calibrations_provided[sensor_id] = group["provided"][()] > 0
 
         return calibrations_provided
 
-    @staticmethod
-    def _get_metadata_for_entry_group(g: h5py.Group) -> Metadata:
-        return Metadata.from_json(g["metadata"][()])
-
-    def _get_result_for_all_entries(self, frame_no: int) -> list[dict[int, Result]]:
-        def entry_group_to_result(entry_group: h5py.Group) -> Result:
-            return Result(
-                data_saturated=entry_group["result/data_saturated"][frame_no],
-                frame_delayed=entry_group["result/frame_delayed"][frame_no],
-                calibration_needed=entry_group["result/calibration_needed"][frame_no],
-                temperature=entry_group["result/temperature"][frame_no],
-                tick=entry_group["result/tick"][frame_no],
-                frame=np.array(entry_group["result/frame"][frame_no]),
-                context=self._get_result_context_for_entry_group(entry_group),
+    def _get_metadata_for_entry_group(self, g: h5py.Group) -> Metadata:
+        return self._decode_cache.metadata(g["metadata"][()])
+
+    def _read_results(self, entry_group: h5py.Group, start: int, stop: int) -> list[Result]:
+        result_group = entry_group["result"]
+        data_saturated = result_group["data_saturated"][start:stop]
+        frame_delayed = result_group["frame_delayed"][start:stop]
+        calibration_needed = result_group["calibration_needed"][start:stop]
+        temperature = result_group["temperature"][start:stop]
+        tick = result_group["tick"][start:stop]
+        frame = result_group["frame"][start:stop]
+        context = self._get_result_context_for_entry_group(entry_group)
+
+        return [
+            Result(
+                data_saturated=data_saturated[i],
+                frame_delayed=frame_delayed[i],
+                calibration_needed=calibration_needed[i],
+                temperature=temperature[i],
+                tick=tick[i],
+                frame=frame[i],
+                context=context,
             )
-
-        return self._map_over_entries(entry_group_to_result)
+            for i in range(stop - start)
+        ]
 
     def _entry_group_to_stacked_results(self, entry_group: h5py.Group) -> StackedResults:
         return StackedResults(
@@ -115,12 +221,23 @@ class H5SessionRecord(SessionRecord):
         )
 
     def _get_result_context_for_entry_group(self, entry_group: h5py.Group) -> ResultContext:
-        return ResultContext(
+        try:
+            return self._result_contexts[entry_group.name]
+        except KeyError:
+            pass
+
+        result_context = ResultContext(
             metadata=self._get_metadata_for_entry_group(entry_group),
             ticks_per_second=self._ticks_per_second,
         )
+        self._result_contexts[entry_group.name] = result_context
+        return result_context
 
     def _get_entries(self) -> list[dict[int, h5py.Group]]:
+        return self._entries
+
+    @functools.cached_property
+    def _entries(self) -> list[dict[int, h5py.Group]]:
         structure: dict[int, dict[int, h5py.Group]] = {}
 
         for k, v in self._group.items():
@@ -173,12 +290,22 @@ class H5SessionRecord(SessionRecord):
 
 
 class H5Record(PersistentRecord):
+    """Record in a H5 file
+
+    Like :class:`H5SessionRecord`, attributes that never change are cached after the first
+    access. The sessions are cached too if the file is opened read-only.
+    """
+
     _schema = SessionSchema
 
     file: h5py.File
 
     def __init__(self, file: h5py.File) -> None:
         self.file = file
+        self._decode_cache = _DecodeCache()
+        self._read_only = file.mode == "r"
+        self._session_groups: Optional[Sequence[h5py.Group]] = None
+        self._sessions: dict[str, H5SessionRecord] = {}
 
         try:
             version_of_record = Version(self.lib_version)
@@ -193,23 +320,23 @@ class H5Record(PersistentRecord):
                     + f"than is installed ({installed_version})."
                 )
 
-    @property
+    @functools.cached_property
     def client_info(self) -> ClientInfo:
         return ClientInfo.from_json(self.file["client_info"][()])
 
-    @property
+    @functools.cached_property
     def lib_version(self) -> str:
         return self._h5py_dataset_to_str(self.file["lib_version"])
 
-    @property
+    @functools.cached_property
     def server_info(self) -> ServerInfo:
         return ServerInfo.from_json(self.file["server_info"][()])
 
-    @property
+    @functools.cached_property
     def timestamp(self) -> str:
         return self._h5py_dataset_to_str(self.file["timestamp"])
 
-    @property
+    @functools.cached_property
     def uuid(self) -> str:
         return self._h5py_dataset_to_str(self.file["uuid"])
 
@@ -230,11 +357,36 @@ class H5Record(PersistentRecord):
         return group
 
     def session(self, session_index: int) -> H5SessionRecord:
-        return H5SessionRecord(
-            group=self._schema.session_groups_on_disk(self.file)[session_index],
+        group = self._get_session_groups()[session_index]
+
+        try:
+            return self._sessions[group.name]
+        except KeyError:
+            pass
+
+        session = H5SessionRecord(
+            group=group,
             ticks_per_second=self.server_info.ticks_per_second,
+            decode_cache=self._decode_cache,
         )
 
+        # The session groups of a file opened for writing may still change
+        if self._read_only:
+            self._sessions[group.name] = session
+
+        return session
+
     @property
     def num_sessions(self) -> int:
-        return len(self._schema.session_groups_on_disk(self.file))
+        return len(self._get_session_groups())
+
+    def _get_session_groups(self) -> Sequence[h5py.Group]:
+        if self._session_groups is not None:
+            return self._session_groups
+
+        session_groups = self._schema.session_groups_on_disk(self.file)
+
+        if self._read_only:
+            self._session_groups = session_groups
+
+        return session_groups
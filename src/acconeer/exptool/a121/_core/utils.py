@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -6,6 +6,7 @@ from __future__ import annotations
 import enum
 import itertools
 import json
+import math
 from functools import wraps
 from typing import (
     Any,
@@ -358,6 +359,30 @@ def parse_rss_version(rss_version: str) -> packaging.version.Version:
     return version
 
 
+BINARY_FORMAT_VERSION = 1
+"""Version of the binary encoding of configs and metadata (see e.g. ``SessionConfig.to_bytes``)
+
+The encoding is meant for in-memory caching and transfer, not for long term storage.
+"""
+
+
+def check_binary_format_version(buffer: bytes) -> None:
+    """Raises ValueError if ``buffer`` does not start with the current binary format version"""
+    if len(buffer) == 0 or buffer[0] != BINARY_FORMAT_VERSION:
+        version = buffer[0] if len(buffer) > 0 else None
+        msg = f"Unsupported binary format version {version} (expected {BINARY_FORMAT_VERSION})"
+        raise ValueError(msg)
+
+
+def optional_float_to_binary(value: Optional[float]) -> float:
+    """Represents ``None`` as NaN, for packing optional floats with :mod:`struct`"""
+    return math.nan if value is None else value
+
+
+def optional_float_from_binary(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
 def indent_strs(strs: list[str], level: int) -> list[str]:
     return ["  " * level + s for s in strs]
 
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -21,6 +21,7 @@ from acconeer.exptool.a121 import (
     ServerInfo,
     SessionConfig,
 )
+from acconeer.exptool.a121._core.entities import SessionRecord
 
 
 class _StopReplay(Exception):
@@ -53,6 +54,10 @@ class _ReplayingClient(Client, register=False):
         self._origin_time: Optional[float] = None
         self._realtime_replay = realtime_replay
         self._session_idx: Optional[int] = None
+        # The current session and its config are kept for the whole session to not read
+        # them from the record on every access
+        self._session: Optional[SessionRecord] = None
+        self._session_config: Optional[SessionConfig] = None
         self._session_idx_iter: Union[Iterator[int], itertools.repeat[int]]
         if cycled_session_idx is not None:
             self._session_idx_iter = itertools.repeat(cycled_session_idx)
@@ -67,6 +72,22 @@ class _ReplayingClient(Client, register=False):
             msg = "Session is not set up."
             raise ClientError(msg)
 
+    @property
+    def _current_session(self) -> SessionRecord:
+        if self._session is not None:
+            return self._session
+        else:
+            msg = "Session is not set up."
+            raise ClientError(msg)
+
+    @property
+    def _current_session_config(self) -> SessionConfig:
+        if self._session_config is not None:
+            return self._session_config
+        else:
+            msg = "Session is not set up."
+            raise ClientError(msg)
+
     def _assert_connected(self) -> None:
         if not self.connected:
             msg = "Client is not connected."
@@ -101,17 +122,19 @@ class _ReplayingClient(Client, register=False):
             raise ReplaySessionsExhaustedError
         else:
             self._session_idx = new_session_idx
+            self._session = self._record.session(new_session_idx)
+            self._session_config = self._session.session_config
 
-        if config != self.session_config:
+        if config != self._current_session_config:
             raise ValueError
 
-        if self.session_config.extended:
+        if self._current_session_config.extended:
             return self.extended_metadata
         else:
             return core_utils.unextend(self.extended_metadata)
 
     def start_session(self) -> None:
-        self._result_iterator = self._record.session(self._actual_session_idx).extended_results
+        self._result_iterator = self._current_session.extended_results
         self._is_started = True
         self._origin_time = None
 
@@ -140,7 +163,7 @@ class _ReplayingClient(Client, register=False):
             if delta < 0:
                 time.sleep(-delta)
 
-        if self.session_config.extended:
+        if self._current_session_config.extended:
             return result
         else:
             return core_utils.unextend(result)
@@ -180,16 +203,17 @@ class _ReplayingClient(Client, register=False):
 
     @property
     def session_config(self) -> SessionConfig:
-        return self._record.session(self._actual_session_idx).session_config
+        # Session configs are mutable, so every access gets a config of its own
+        return SessionConfig.from_bytes(self._current_session_config.to_bytes())
 
     @property
     def extended_metadata(self) -> list[dict[int, Metadata]]:
-        return self._record.session(self._actual_session_idx).extended_metadata
+        return self._current_session.extended_metadata
 
     @property
     def calibrations(self) -> dict[int, SensorCalibration]:
-        return self._record.session(self._actual_session_idx).calibrations
+        return self._current_session.calibrations
 
     @property
     def calibrations_provided(self) -> dict[int, bool]:
-        return self._record.session(self._actual_session_idx).calibrations_provided
+        return self._current_session.calibrations_provided
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from ._base import (
@@ -11,6 +11,7 @@ from ._base import (
     GenericProcessorBase,
     ProcessorBase,
 )
+from ._cfar import Cfar
 from ._utils import (
     APPROX_BASE_STEP_LENGTH_M,
     ENVELOPE_FWHM_M,
@@ -18,6 +19,7 @@ from ._utils import (
     RLG_PER_HWAAS_MAP,
     PeakSortingMethod,
     ReflectorShape,
+    ZeroPhaseFilter,
     _convert_amplitude_to_strength,
     _convert_multiple_amplitudes_to_strengths,
     calc_processing_gain,
@@ -0,0 +1,114 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+class Cfar:
+    """Cell averaging CFAR (constant false alarm rate) threshold
+
+    The threshold of a point is formed from the averages of two windows of ``window_length``
+    points, one to the left and one to the right of the point. The windows are separated from
+    the point by ``guard_length`` points. The margin, ``window_length + guard_length``, is the
+    number of points at each edge for which a window doesn't fit. The threshold is NaN there.
+
+    The window averages are calculated from prefix sums, so the cost is linear in the number of
+    points regardless of the window length. The data may have any number of dimensions, e.g.
+    a batch of sweeps or a range-Doppler map. The windows are taken along ``axis``.
+    """
+
+    def __init__(self, window_length: int, guard_length: int, axis: int = -1) -> None:
+        if window_length < 1:
+            msg = "window_length must be >= 1"
+            raise ValueError(msg)
+
+        if guard_length < 0:
+            msg = "guard_length must be >= 0"
+            raise ValueError(msg)
+
+        self.window_length = window_length
+        self.guard_length = guard_length
+        self.margin = window_length + guard_length
+        self.axis = axis
+
+        # Buffers that are reused as long as the shape of the data is the same
+        self._prefix_sums: Optional[npt.NDArray[np.float64]] = None
+        self._left = np.empty(0)
+        self._right = np.empty(0)
+
+    def window_means(
+        self, data: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Averages of the left and right windows of every point
+
+        Both have the shape of ``data`` and are NaN where the window doesn't fit.
+        """
+        left, right = self._window_means(data)
+        return left.copy(), right.copy()
+
+    def _window_means(
+        self, data: npt.NDArray[np.float64]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        # Like window_means, but the returned arrays are buffers that are reused by the next
+        # call with data of the same shape
+        data = np.moveaxis(data, self.axis, -1)
+        num_points = data.shape[-1]
+        shape = data.shape[:-1] + (num_points + 1,)
+
+        if self._prefix_sums is None or self._prefix_sums.shape != shape:
+            self._prefix_sums = np.zeros(shape)
+            # Where the windows don't fit only depends on the shape, so the NaNs are kept
+            self._left = np.full(data.shape, np.nan)
+            self._right = np.full(data.shape, np.nan)
+
+        prefix_sums = self._prefix_sums
+        np.cumsum(data, axis=-1, out=prefix_sums[..., 1:])
+
+        # window_sums[..., i] is the sum of data[..., i : i + window_length]
+        window_sums = (
+            prefix_sums[..., self.window_length :] - prefix_sums[..., : -self.window_length]
+        )
+        window_sums /= self.window_length
+
+        num_valid = max(num_points - self.margin, 0)
+        self._left[..., num_points - num_valid :] = window_sums[..., :num_valid]
+        self._right[..., :num_valid] = window_sums[..., self.guard_length + 1 :][..., :num_valid]
+
+        return np.moveaxis(self._left, -1, self.axis), np.moveaxis(self._right, -1, self.axis)
+
+    def two_sided(
+        self, data: npt.NDArray[np.float64], one_sided_below: Optional[int] = None
+    ) -> npt.NDArray[np.float64]:
+        """Average of the left and right window averages
+
+        The threshold is NaN within the margin at both edges.
+
+        :param one_sided_below:
+            If given, the left window is left out (counted as zero) for the points below this
+            index, e.g. to keep direct leakage out of the threshold.
+        """
+        left, right = self._window_means(data)
+
+        if one_sided_below is not None:
+            left = np.moveaxis(left, self.axis, -1)
+            left[..., self.margin : one_sided_below] = 0
+            left = np.moveaxis(left, -1, self.axis)
+
+        return (left + right) / 2
+
+    def one_sided(self, data: npt.NDArray[np.float64], split: int) -> npt.NDArray[np.float64]:
+        """Left window average below ``split``, right window average from ``split`` and up
+
+        The threshold is NaN within the margin at both edges.
+        """
+        left, right = self._window_means(data)
+
+        threshold = np.moveaxis(left, self.axis, -1).copy()
+        threshold[..., split:] = np.moveaxis(right, self.axis, -1)[..., split:]
+
+        return np.moveaxis(threshold, -1, self.axis)
@@ -1,14 +1,34 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
-from ._a121 import A121BackendPluginBase, A121ViewPluginBase
-from ._processor_main import processor_main
+from __future__ import annotations
+
+import typing as t
+
+from acconeer.exptool._core.lazy_import import lazy_module_getattr
+
+from ._a121 import A121BackendPluginBase
 from .processor import (
     ExtendedProcessorBackendPluginBase,
     ProcessorBackendPluginBase,
     ProcessorBackendPluginSharedState,
     ProcessorPluginPreset,
-    ProcessorPluginSpec,
-    ProcessorViewPluginBase,
     SetupMessage,
 )
+
+
+if t.TYPE_CHECKING:
+    from ._a121_view_plugin import A121ViewPluginBase
+    from ._processor_main import processor_main
+    from .processor import ProcessorPluginSpec, ProcessorViewPluginBase
+
+# The view plugin bases and processor_main depend on PySide6 and pyqtgraph. They are
+# imported on first access, so that backend plugins can be used without Qt.
+_LAZY_ATTRIBUTE_MODULES = {
+    "A121ViewPluginBase": "._a121_view_plugin",
+    "processor_main": "._processor_main",
+    "ProcessorPluginSpec": ".processor",
+    "ProcessorViewPluginBase": ".processor",
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_ATTRIBUTE_MODULES)
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -7,7 +7,7 @@ import abc
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Optional, Tuple, TypeVar
 
 import h5py
 from packaging.version import Version
@@ -23,10 +23,10 @@ from acconeer.exptool.app.new import (
     PluginGeneration,
     PluginState,
     PluginStateMessage,
-    ViewPluginBase,
     get_temp_h5_path,
     is_task,
 )
+from acconeer.exptool.app.new.backend import BackendPipeline, PlotMessage
 
 
 log = logging.getLogger(__name__)
@@ -34,6 +34,10 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_PIPELINE_POLL_INTERVAL_S = 0.05
+
+PipelineStages = Tuple[Callable[[], Any], Callable[[Any], Any]]
+
 
 class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
     _live_client: Optional[a121.Client]
@@ -41,6 +45,7 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
     _opened_record: Optional[a121.H5Record]
     _started: bool = False
     _recorder: Optional[a121.H5Recorder] = None
+    _pipeline: Optional[BackendPipeline[Any, Any]] = None
 
     def __init__(
         self,
@@ -63,6 +68,7 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
         path: Path,
         config_override: Optional[Any] = None,
         context_override: Optional[Any] = None,
+        realtime_replay: bool = True,
     ) -> None:
         if config_override is not None:
             self._logger.warning(f"Ignoring config override of type: {type(config_override)}")
@@ -83,9 +89,13 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
             # This is to be able to replay files recorded before v7.0.0
             # when there were only one session per file
             if self._opened_record.num_sessions <= 1 and Version(log_version) < Version("7.0.0"):
-                replaying_client = a121._ReplayingClient(self._opened_record, cycled_session_idx=0)
+                replaying_client = a121._ReplayingClient(
+                    self._opened_record, cycled_session_idx=0, realtime_replay=realtime_replay
+                )
             else:
-                replaying_client = a121._ReplayingClient(self._opened_record)
+                replaying_client = a121._ReplayingClient(
+                    self._opened_record, realtime_replay=realtime_replay
+                )
 
             self.load_from_record_setup(record=self._opened_record)
         except Exception as exc:
@@ -142,6 +152,38 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
     def get_next(self) -> None:
         pass
 
+    def _get_pipeline_stages(self) -> Optional[PipelineStages]:
+        """Hook for splitting ``get_next`` into an acquisition and a processing stage
+
+        If the stages are returned (instead of ``None``) and ``pipelined`` is set,
+        they are run concurrently by a :class:`BackendPipeline` instead of calling
+        ``get_next`` from ``idle``. Processed results are sent as plot messages.
+        """
+        return None
+
+    def _start_pipeline(self) -> None:
+        stages = self._get_pipeline_stages() if self.pipelined else None
+        if stages is None:
+            return
+
+        (acquire, process) = stages
+        self._pipeline = BackendPipeline(
+            acquire,
+            process,
+            lambda processor_result: self.callback(PlotMessage(result=processor_result)),
+            timing_callback=self.callback,
+            name=type(self).__name__,
+        )
+        self._pipeline.start()
+
+    def _stop_pipeline(self) -> None:
+        if self._pipeline is None:
+            return
+
+        pipeline = self._pipeline
+        self._pipeline = None
+        pipeline.stop()
+
     def idle(self) -> bool:
         if self._started:
             if self.client is None:
@@ -149,7 +191,10 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
                 raise RuntimeError(msg)
 
             try:
-                self.get_next()
+                if self._pipeline is not None:
+                    self._pipeline.raise_if_failed(timeout=_PIPELINE_POLL_INTERVAL_S)
+                else:
+                    self.get_next()
             except (a121._StopReplay, a121.ReplaySessionsExhaustedError):
                 self.stop_session()
                 return True
@@ -186,6 +231,7 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
         self.broadcast()
 
     def detach_client(self) -> None:
+        self._stop_pipeline()
         self._live_client = None
 
     @abc.abstractmethod
@@ -232,6 +278,7 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
             raise HandledException(msg) from exc
 
         self._started = True
+        self._start_pipeline()
 
         self.broadcast()
 
@@ -245,6 +292,7 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
 
         self.callback(PluginStateMessage(state=PluginState.LOADED_STOPPING))
         try:
+            self._stop_pipeline()
             self.end_session()
         except Exception as exc:
             msg = "Failure when stopping session"
@@ -281,14 +329,3 @@ class A121BackendPluginBase(Generic[T], BackendPlugin[T]):
     @abc.abstractmethod
     def save_to_cache(self, file: h5py.File) -> None:
         pass
-
-
-class A121ViewPluginBase(ViewPluginBase):
-    def _send_start_request(self) -> None:
-        A121BackendPluginBase.start_session.rpc(
-            self.app_model.put_task,
-            with_recorder=self.app_model.recording_enabled,
-        )
-
-    def _send_stop_request(self) -> None:
-        A121BackendPluginBase.stop_session.rpc(self.app_model.put_task)
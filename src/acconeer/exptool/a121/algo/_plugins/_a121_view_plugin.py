@@ -0,0 +1,19 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+from acconeer.exptool.app.new import ViewPluginBase
+
+from ._a121 import A121BackendPluginBase
+
+
+class A121ViewPluginBase(ViewPluginBase):
+    def _send_start_request(self) -> None:
+        A121BackendPluginBase.start_session.rpc(
+            self.app_model.put_task,
+            with_recorder=self.app_model.recording_enabled,
+        )
+
+    def _send_stop_request(self) -> None:
+        A121BackendPluginBase.stop_session.rpc(self.app_model.put_task)
@@ -1,6 +1,12 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
+from __future__ import annotations
+
+import typing as t
+
+from acconeer.exptool._core.lazy_import import lazy_module_getattr
+
 from .backend_plugin import (
     ExtendedProcessorBackendPluginBase,
     GenericProcessorBackendPluginBase,
@@ -9,5 +15,16 @@ from .backend_plugin import (
     ProcessorPluginPreset,
     SetupMessage,
 )
-from .plugin import ProcessorPluginSpec
-from .view_plugin import ProcessorViewPluginBase
+
+
+if t.TYPE_CHECKING:
+    from .plugin import ProcessorPluginSpec
+    from .view_plugin import ProcessorViewPluginBase
+
+# Imported on first access since they depend on PySide6, see acconeer.exptool.app.new
+_LAZY_ATTRIBUTE_MODULES = {
+    "ProcessorPluginSpec": ".plugin",
+    "ProcessorViewPluginBase": ".view_plugin",
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_ATTRIBUTE_MODULES)
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -20,7 +20,7 @@ from acconeer.exptool.a121.algo._base import (
     ProcessorConfigT,
     ResultT,
 )
-from acconeer.exptool.a121.algo._plugins._a121 import A121BackendPluginBase
+from acconeer.exptool.a121.algo._plugins._a121 import A121BackendPluginBase, PipelineStages
 from acconeer.exptool.app.new import (
     PluginGeneration,
 )
@@ -192,6 +192,28 @@ class GenericProcessorBackendPluginBase(
             )
         )
 
+    @abc.abstractmethod
+    def _get_processor_input(self) -> InputT:
+        pass
+
+    def _get_pipeline_stages(self) -> Optional[PipelineStages]:
+        if self._processor_instance is None:
+            return None
+
+        return (self._get_processor_input, self._processor_instance.process)
+
+    def get_next(self) -> None:
+        if self._processor_instance is None:
+            msg = "Processor is None. 'start' needs to be called before 'get_next'"
+            raise RuntimeError(msg)
+
+        processor_input = self._get_processor_input()
+
+        with self.report_timing(f"{type(self._processor_instance).__name__}.process()"):
+            processor_result = self._processor_instance.process(processor_input)
+
+        self.callback(PlotMessage(result=processor_result))
+
     def end_session(self) -> None:
         if self.client is None:
             msg = "Client is not attached. Can not 'stop'."
@@ -246,18 +268,11 @@ class ProcessorBackendPluginBase(
         self.shared_state.processor_config = processor_preset.processor_config
         self.broadcast()
 
-    def get_next(self) -> None:
-        if self._processor_instance is None:
-            msg = "Processor is None. 'start' needs to be called before 'get_next'"
-            raise RuntimeError(msg)
-
+    def _get_processor_input(self) -> a121.Result:
         assert self.client
         result = self.client.get_next()
         assert isinstance(result, a121.Result)  # TODO: fix
-
-        processor_result = self._processor_instance.process(result)
-
-        self.callback(PlotMessage(result=processor_result))
+        return result
 
 
 class ExtendedProcessorBackendPluginBase(
@@ -282,18 +297,10 @@ class ExtendedProcessorBackendPluginBase(
         self.shared_state.processor_config = processor_preset.processor_config
         self.broadcast()
 
-    def get_next(self) -> None:
-        if self._processor_instance is None:
-            msg = "Processor is None. 'start' needs to be called before 'get_next'"
-            raise RuntimeError(msg)
-
+    def _get_processor_input(self) -> List[Dict[int, a121.Result]]:
         assert self.client
         result = self.client.get_next()
         if isinstance(result, a121.Result):
-            results = [{self.client.session_config.sensor_id: result}]
+            return [{self.client.session_config.sensor_id: result}]
         else:
-            results = result
-
-        processor_result = self._processor_instance.process(results)
-
-        self.callback(PlotMessage(result=processor_result))
+            return result
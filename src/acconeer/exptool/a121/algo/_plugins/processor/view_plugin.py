@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import QPushButton, QVBoxLayout
 
 from acconeer.exptool import a121
 from acconeer.exptool.a121.algo._base import ProcessorConfigT
-from acconeer.exptool.a121.algo._plugins._a121 import A121ViewPluginBase
+from acconeer.exptool.a121.algo._plugins._a121_view_plugin import A121ViewPluginBase
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
@@ -0,0 +1,28 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+"""The SciPy functions used by the processors
+
+SciPy is slow to import, and importing it with the processors made up a large part of the
+startup time of the app. The functions are instead imported from SciPy when first used::
+
+    from acconeer.exptool.a121.algo import _scipy
+
+    _scipy.filtfilt(b, a, x)
+"""
+
+from __future__ import annotations
+
+from acconeer.exptool._core.lazy_import import lazy_module_getattr
+
+
+__getattr__ = lazy_module_getattr(
+    globals(),
+    {
+        "binom": "scipy.special",
+        "butter": "scipy.signal",
+        "filtfilt": "scipy.signal",
+        "lfilter": "scipy.signal",
+        "lfilter_zi": "scipy.signal",
+        "linear_sum_assignment": "scipy.optimize",
+    },
+)
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -9,10 +9,9 @@ from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import butter, filtfilt
 
 from acconeer.exptool import a121
-from acconeer.exptool.a121.algo import AlgoParamEnum
+from acconeer.exptool.a121.algo import AlgoParamEnum, _scipy
 
 
 ENVELOPE_FWHM_M = {
@@ -221,7 +220,7 @@ def calculate_loopback_peak_location(result: a121.Result, config: a121.SensorCon
 
     (B, A) = get_distance_filter_coeffs(config.profile, config.step_length, narrow_filter=True)
     sweep = np.squeeze(result.frame, axis=0)
-    abs_sweep = np.abs(filtfilt(B, A, sweep))
+    abs_sweep = np.abs(_scipy.filtfilt(B, A, sweep))
     peak_idx = [int(np.argmax(abs_sweep))]
 
     (estimated_dist, _) = interpolate_peaks(
@@ -350,7 +349,7 @@ def get_distance_filter_coeffs(
     wnc = APPROX_BASE_STEP_LENGTH_M * step_length / (ENVELOPE_FWHM_M[profile])
     if narrow_filter:
         wnc *= NARROW_FILTER_MULTIPLIER
-    return butter(N=1, Wn=wnc)
+    return _scipy.butter(N=1, Wn=wnc)
 
 
 def get_distance_filter_edge_margin(profile: a121.Profile, step_length: int) -> int:
@@ -361,6 +360,54 @@ def get_distance_filter_edge_margin(profile: a121.Profile, step_length: int) ->
     return int(_safe_ceil(ENVELOPE_FWHM_M[profile] / (APPROX_BASE_STEP_LENGTH_M * step_length)))
 
 
+class ZeroPhaseFilter:
+    """Zero-phase (forward-backward) IIR filter along the last axis
+
+    Gives the same result as ``scipy.signal.filtfilt(b, a, x)`` with its default arguments,
+    i.e. odd extension of ``3 * max(len(a), len(b))`` points at each edge and initial
+    conditions from ``lfilter_zi``. The initial conditions are calculated once, and the
+    buffer for the extended data is reused as long as the shape and type of the data are the
+    same, which makes it suitable for filtering every frame. The data can be a single sweep or
+    a batch of sweeps.
+    """
+
+    def __init__(self, b: npt.ArrayLike, a: npt.ArrayLike) -> None:
+        self.b = np.atleast_1d(b)
+        self.a = np.atleast_1d(a)
+        self.pad_length = 3 * max(self.a.size, self.b.size)
+        self._zi = _scipy.lfilter_zi(self.b, self.a)
+        self._lfilter = _scipy.lfilter
+
+        self._extended: Optional[npt.NDArray[Any]] = None
+
+    def __call__(self, x: npt.NDArray[Any]) -> npt.NDArray[Any]:
+        num_points = x.shape[-1]
+        pad = self.pad_length
+
+        if num_points <= pad:
+            msg = f"The data needs to be longer than {pad} points"
+            raise ValueError(msg)
+
+        shape = x.shape[:-1] + (num_points + 2 * pad,)
+        dtype = np.result_type(x, self._zi)
+        if (
+            self._extended is None
+            or self._extended.shape != shape
+            or self._extended.dtype != dtype
+        ):
+            self._extended = np.empty(shape, dtype=dtype)
+
+        extended = self._extended
+        extended[..., :pad] = 2 * x[..., :1] - x[..., pad:0:-1]
+        extended[..., pad:-pad] = x
+        extended[..., -pad:] = 2 * x[..., -1:] - x[..., -2 : -pad - 2 : -1]
+
+        y, _ = self._lfilter(self.b, self.a, extended, zi=self._zi * extended[..., :1])
+        y, _ = self._lfilter(self.b, self.a, y[..., ::-1], zi=self._zi * y[..., -1:])
+
+        return y[..., -pad - 1 : pad - 1 : -1]  # type: ignore[no-any-return]
+
+
 def double_buffering_frame_filter(
     _frame: npt.NDArray[Any],
 ) -> Optional[npt.NDArray[np.complex128]]:
@@ -508,6 +555,9 @@ def estimate_frame_rate(client: a121.Client, session_config: a121.SessionConfig)
 
     for i in range(4):
         result = client.get_next()
+        if isinstance(result, list):
+            # All entries of an extended session have the same frame timing
+            result = next(iter(result[0].values()))
         assert isinstance(result, a121.Result)
 
         if i < 2:
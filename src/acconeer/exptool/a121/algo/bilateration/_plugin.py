@@ -4,11 +4,8 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Callable, Dict, Optional
 
-import attrs
-import h5py
 import numpy as np
 
 from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
@@ -16,29 +13,23 @@ from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121, opser
+from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo import distance
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo.distance import (
     DetailedStatus,
     Detector,
     DetectorConfig,
-    DetectorContext,
     DetectorResult,
 )
-from acconeer.exptool.a121.algo.distance._detector import _load_algo_data
 from acconeer.exptool.a121.algo.distance._detector_plugin import ViewPlugin as DistanceViewPlugin
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    GeneralMessage,
     GroupBox,
-    HandledException,
     Message,
     MiscErrorView,
     PgPlotPlugin,
@@ -47,241 +38,25 @@ from acconeer.exptool.app.new import (
     PluginGeneration,
     PluginPresetBase,
     PluginSpecBase,
-    PluginState,
-    PluginStateMessage,
     TwoSensorIdsEditor,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 
-from ._configs import get_default_detector_config
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
 from ._processor import Processor, ProcessorConfig, ProcessorResult
 
 
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_ids: list[int] = attrs.field(factory=lambda: [1, 1])
-    config: DetectorConfig = attrs.field(factory=DetectorConfig)
-    bilateration_config: ProcessorConfig = attrs.field(factory=ProcessorConfig)
-    context: DetectorContext = attrs.field(factory=DetectorContext)
-    replaying: bool = attrs.field(default=False)
-
-
-def serialized_attrs_instance_has_diverged(attrs_instance: Any) -> bool:
-    """Checks (recursively) if a de-serialized attrs-instances contains
-    all attributes defined its respective class definition.
-
-    :param attrs_config:
-        An instance of an attrs-class, that possibly contains other attrs-instances.
-    :returns: True if any attrs-instance have diverged from its class, False otherwise
-    """
-    # TODO: Should end up in the `Config` ABC
-    attrs_class = type(attrs_instance)
-    if not attrs.has(attrs_class):
-        msg = f"Cannot check object of type {attrs_class!r}. It's not an attrs-class."
-        raise TypeError(msg)
-
-    for attribute in attrs_instance.__attrs_attrs__:
-        try:
-            value = getattr(attrs_instance, attribute.name)
-
-            if attrs.has(type(value)) and serialized_attrs_instance_has_diverged(value):
-                return True
-        except AttributeError:
-            log.info(
-                f"Serialized object of type {attrs_class.__name__!r} "
-                + "seems to have converged from its definition."
-            )
-            log.info(f"Should contain the attribute {attribute.name!r} but did not.")
-            return True
-
-    return False
-
-
-class PluginPresetId(Enum):
-    DEFAULT = auto()
-
-
-@attrs.mutable(kw_only=True)
-class BilaterationPreset:
-    detector_config: DetectorConfig = attrs.field()
-    bilateration_config: ProcessorConfig = attrs.field()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    bilateration_config: ProcessorConfig
-    num_curves: int
-    detector_config: DetectorConfig
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, BilaterationPreset] = {
-        PluginPresetId.DEFAULT.value: BilaterationPreset(
-            detector_config=get_default_detector_config(),
-            bilateration_config=ProcessorConfig(),
-        )
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._detector_instance: Optional[Detector] = None
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = DetectorConfig.from_json(file["config"][()])
-        self.shared_state.bilateration_config = ProcessorConfig.from_json(
-            file["bilateration_config"][()]
-        )
-        self.shared_state.context = opser.deserialize(file["context"], DetectorContext)
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState(config=get_default_detector_config())
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            # Try to use the sensor ids from the last calibration
-            if self.shared_state.context.sensor_ids:
-                self.shared_state.sensor_ids = self.shared_state.context.sensor_ids
-
-            for i in range(len(self.shared_state.sensor_ids)):
-                if len(sensor_ids) > 0 and self.shared_state.sensor_ids[i] not in sensor_ids:
-                    self.shared_state.sensor_ids[i] = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: DetectorConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    @is_task
-    def update_processor_config(self, *, config: ProcessorConfig) -> None:
-        self.shared_state.bilateration_config = config
-        self.broadcast()
-
-    @is_task
-    def update_sensor_ids(self, *, sensor_ids: list[int]) -> None:
-        self.shared_state.sensor_ids = sensor_ids
-        self.broadcast()
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config.detector_config
-        self.shared_state.bilateration_config = preset_config.bilateration_config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-        _create_h5_string_dataset(
-            file, "bilateration_config", self.shared_state.bilateration_config.to_json()
-        )
-        context_group = file.create_group("context")
-        opser.serialize(self.shared_state.context, context_group)
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        _, config, context = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.context = context
-        self.shared_state.sensor_ids = list(next(iter(record.session_config.groups)).keys())
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._detector_instance = Detector(
-            client=self.client,
-            sensor_ids=self.shared_state.sensor_ids,
-            detector_config=self.shared_state.config,
-            context=self.shared_state.context,
-        )
-
-        if recorder:
-            algo_group = recorder.require_algo_group("bilateration")
-        else:
-            algo_group = None
-
-        self._processor_instance = Processor(
-            session_config=self._detector_instance.session_config,
-            processor_config=self.shared_state.bilateration_config,
-            sensor_ids=self.shared_state.sensor_ids,
-        )
-
-        self._detector_instance.start(
-            recorder,
-            _algo_group=algo_group,
-        )
-
-        self.callback(
-            SetupMessage(
-                bilateration_config=self.shared_state.bilateration_config,
-                num_curves=len(self._detector_instance.processor_specs),
-                detector_config=self.shared_state.config,
-            )
-        )
-
-    def end_session(self) -> None:
-        if self._detector_instance is None:
-            raise RuntimeError
-        if self._recorder is not None:
-            self._recorder.close()
-        self._detector_instance.stop()
-
-    def get_next(self) -> None:
-        if self._detector_instance is None:
-            raise RuntimeError
-        detector_result = self._detector_instance.get_next()
-
-        processor_result = self._processor_instance.process(result=detector_result)
-
-        assert self.client is not None
-        self.callback(backend.PlotMessage(result=(detector_result, processor_result)))
-
-    @is_task
-    def calibrate_detector(self) -> None:
-        if self._started:
-            raise RuntimeError
-
-        if self.client is None:
-            raise RuntimeError
-
-        if not self.client.connected:
-            raise RuntimeError
-
-        self.callback(PluginStateMessage(state=PluginState.LOADED_BUSY))
-
-        try:
-            self._detector_instance = Detector(
-                client=self.client,
-                sensor_ids=self.shared_state.sensor_ids,
-                detector_config=self.shared_state.config,
-                context=None,
-            )
-            self._detector_instance.calibrate_detector()
-        except Exception as exc:
-            msg = "Failed to calibrate detector"
-            raise HandledException(msg) from exc
-        finally:
-            self.callback(PluginStateMessage(state=PluginState.LOADED_IDLE))
-
-        self.shared_state.context = self._detector_instance.context
-        self.broadcast()
-
-
 class PlotPlugin(PgPlotPlugin):
     def __init__(self, app_model: AppModel) -> None:
         super().__init__(app_model=app_model)
@@ -2,7 +2,6 @@
 # All rights reserved
 from __future__ import annotations
 
-import copy
 import typing as t
 from typing import Tuple
 
@@ -13,7 +12,7 @@ import numpy.typing as npt
 from attributes_doc import attributes_doc
 
 from acconeer.exptool import a121, opser
-from acconeer.exptool.a121.algo import AlgoProcessorConfigBase
+from acconeer.exptool.a121.algo import AlgoProcessorConfigBase, _scipy
 from acconeer.exptool.a121.algo.distance import DetectorConfig, DetectorContext, DetectorResult
 
 
@@ -35,14 +34,6 @@ class ObjectWithoutCounterpart:
     sensor_position: str
 
 
-@attrs.frozen(kw_only=True)
-class _KalmanFilterResult:
-    """Result from a Kalman filter."""
-
-    distance: float
-    sensor_position: str
-
-
 @attrs.frozen(kw_only=True)
 class ProcessorResult:
     """Processor result"""
@@ -123,8 +114,12 @@ class Processor:
             self._SENSOR_POSITION_LEFT: sensor_ids[0],
             self._SENSOR_POSITION_RIGHT: sensor_ids[1],
         }
-        self.left_sensor_kfs: list[_KalmanFilter] = []
-        self.right_sensor_kfs: list[_KalmanFilter] = []
+        self.left_sensor_kfs = _KalmanFilters(
+            1 / self.update_rate, self.process_noise_gain_sensitivity
+        )
+        self.right_sensor_kfs = _KalmanFilters(
+            1 / self.update_rate, self.process_noise_gain_sensitivity
+        )
 
     def process(self, result: t.Dict[int, DetectorResult]) -> ProcessorResult:
         distances_left = result[self.sensor_position_to_ids[self._SENSOR_POSITION_LEFT]].distances
@@ -148,34 +143,17 @@ class Processor:
             rcs_right,
             self.sensor_spacing_m,
         )
-        # Truncate list to a known max length.
-        if len(distances_left_cleaned) > self._MAX_NUM_OBJECTS:
-            distances_left_cleaned = distances_left_cleaned[self._MAX_NUM_OBJECTS :]
-        if len(distances_right_cleaned) > self._MAX_NUM_OBJECTS:
-            distances_right_cleaned = distances_right_cleaned[self._MAX_NUM_OBJECTS :]
+        # Truncate to a known max length, keeping the closest distances.
+        distances_left_cleaned = distances_left_cleaned[: self._MAX_NUM_OBJECTS]
+        distances_right_cleaned = distances_right_cleaned[: self._MAX_NUM_OBJECTS]
         # Update kalman filters.
-        self.left_sensor_kfs = self._update_kalman_filters(
-            self.left_sensor_kfs, distances_left_cleaned, self._SENSOR_POSITION_LEFT
-        )
-        self.right_sensor_kfs = self._update_kalman_filters(
-            self.right_sensor_kfs,
-            distances_right_cleaned,
-            self._SENSOR_POSITION_RIGHT,
-        )
-        # Extract result after filtering.
-        kf_result_left_sensor = [
-            _KalmanFilterResult(distance=kf.get_distance(), sensor_position=kf.sensor_position)
-            for kf in self.left_sensor_kfs
-            if kf.has_init
-        ]
-        kf_result_right_sensor = [
-            _KalmanFilterResult(distance=kf.get_distance(), sensor_position=kf.sensor_position)
-            for kf in self.right_sensor_kfs
-            if kf.has_init
-        ]
+        self._update_kalman_filters(self.left_sensor_kfs, distances_left_cleaned)
+        self._update_kalman_filters(self.right_sensor_kfs, distances_right_cleaned)
         # Match result from both sensors to create pairs and objects without counterpart.
         (points, objects_without_counterpart) = self._pair_distances(
-            kf_result_left_sensor, kf_result_right_sensor, self.sensor_spacing_m
+            self.left_sensor_kfs.distances[self.left_sensor_kfs.has_init],
+            self.right_sensor_kfs.distances[self.right_sensor_kfs.has_init],
+            self.sensor_spacing_m,
         )
         return ProcessorResult(
             points=points, objects_without_counterpart=objects_without_counterpart
@@ -183,235 +161,224 @@ class Processor:
 
     def _pair_distances(
         self,
-        kf_result_left_sensor: t.List[_KalmanFilterResult],
-        kf_result_right_sensor: t.List[_KalmanFilterResult],
+        distances_left: npt.NDArray[np.float64],
+        distances_right: npt.NDArray[np.float64],
         sensor_spacing: float,
     ) -> t.Tuple[t.List[Point], t.List[ObjectWithoutCounterpart]]:
         """Pair distance from each sensor to form points.
-        The sensor with the least number of results is identified and looped over. In each loop,
-        the distance is matched to a distance from the other sensor. The condition for a match is
-        the absolute distance difference being lower than the sensor spacing.
-        A distance can only be matched once. When matched, it is marked and can not be
-        matched other distances.
+        The distances are paired by minimizing the sum of the absolute distance differences of
+        the pairs. Only distances with an absolute difference lower than the sensor spacing can
+        be paired and each distance can only be paired once.
         Each pair is used to form a point, for which the distance and angle is calculated, along
         with its cartesian coordinates.
         Distances without a pair is regarded as an object without a counterpart.
-
-        The bilateration function expects the distance estimate from the left sensor as the first
-        argmument. If the value from the right sensor is fed as the first element, the sign of the
-        angle needs to be flipped.
         """
-        if len(kf_result_left_sensor) <= len(kf_result_right_sensor):
-            shorter_result = kf_result_left_sensor
-            longer_result = kf_result_right_sensor
-            flip_angle = False
-        else:
-            shorter_result = kf_result_right_sensor
-            longer_result = kf_result_left_sensor
-            flip_angle = True
-
-        shorter_result_item_has_pair = [False] * len(shorter_result)
-        longer_result_item_has_pair = [False] * len(longer_result)
-        distances_longer_result = np.array([kf_result.distance for kf_result in longer_result])
-        points = []
-        for kf_idx, kf_shorter in enumerate(shorter_result):
-            # Find the closest distance in the other array
-            idx_closest = np.argmin(np.abs(kf_shorter.distance - distances_longer_result))
-            # Add as a pair, if the distance is within the expected range(plus a small margin).
-            if np.abs(kf_shorter.distance - distances_longer_result[idx_closest]) < sensor_spacing:
-                distance = (kf_shorter.distance + distances_longer_result[idx_closest]) / 2
-
-                angle = self._estimate_angle(
-                    kf_shorter.distance, distances_longer_result[idx_closest], sensor_spacing
-                )
-
-                if flip_angle:
-                    angle = -angle
+        idxs_left, idxs_right = _assign(
+            np.abs(distances_left[:, None] - distances_right[None, :]), sensor_spacing
+        )
 
-                points.append(
-                    Point(
-                        angle=angle,
-                        distance=distance,
-                        x_coord=np.sin(angle) * distance,
-                        y_coord=np.cos(angle) * distance,
-                    )
-                )
-                shorter_result_item_has_pair[kf_idx] = True
-                longer_result_item_has_pair[idx_closest] = True
-        objects_without_counterpart = []
-        for i in [i for i, has_init in enumerate(shorter_result_item_has_pair) if not has_init]:
-            objects_without_counterpart.append(
-                ObjectWithoutCounterpart(
-                    distance=shorter_result[i].distance,
-                    sensor_position=shorter_result[i].sensor_position,
-                )
-            )
-        for i in [i for i, has_init in enumerate(longer_result_item_has_pair) if not has_init]:
-            objects_without_counterpart.append(
-                ObjectWithoutCounterpart(
-                    distance=longer_result[i].distance,
-                    sensor_position=longer_result[i].sensor_position,
-                )
+        paired_left = distances_left[idxs_left]
+        paired_right = distances_right[idxs_right]
+        distances = (paired_left + paired_right) / 2
+        angles = self._estimate_angle(paired_left, paired_right, sensor_spacing)
+
+        points = [
+            Point(angle=angle, distance=distance, x_coord=x_coord, y_coord=y_coord)
+            for angle, distance, x_coord, y_coord in zip(
+                angles.tolist(),
+                distances.tolist(),
+                (np.sin(angles) * distances).tolist(),
+                (np.cos(angles) * distances).tolist(),
             )
+        ]
+
+        objects_without_counterpart = [
+            ObjectWithoutCounterpart(distance=distance, sensor_position=sensor_position)
+            for sensor_position, unpaired_distances in [
+                (self._SENSOR_POSITION_LEFT, np.delete(distances_left, idxs_left)),
+                (self._SENSOR_POSITION_RIGHT, np.delete(distances_right, idxs_right)),
+            ]
+            for distance in unpaired_distances.tolist()
+        ]
+
         return (points, objects_without_counterpart)
 
     @staticmethod
     def _remove_closely_spaced_distances(
         distances: npt.NDArray[np.float64], rcs: npt.NDArray[np.float64], min_dist: float
-    ) -> t.List[float]:
+    ) -> npt.NDArray[np.float64]:
         """Remove closely spaced distances to avoid ambiguity in later filtering and distance
         pairing stages.
-        If two distance are closely spaced, keep the one with highest RCS.
+        Distances closer than min_dist to their neighbour form a group, of which only the one
+        with the highest RCS is kept. The returned distances are sorted.
         """
-        if len(distances) == 0:
-            return []
+        distances = np.asarray(distances, dtype=float)
+        rcs = np.asarray(rcs, dtype=float)
+        if distances.size == 0:
+            return distances
+
         # Sort according to distance.
-        distances, rcs = zip(*sorted(zip(distances, rcs)))  # type: ignore[assignment]
-        # If two distance are closer than the senor spacing, remove the one with smaller amplitude.
-        index_closely_spaced_distances = np.where(np.abs(np.diff(distances)) < min_dist)[0]
-        # Flip the array of indexes to avoid altering the order of the elements to the left in
-        # the array.
-        for index in np.flip(index_closely_spaced_distances):
-            # Remove the element with the lower amplitude.
-            if rcs[index] < rcs[index + 1]:
-                rcs = np.delete(rcs, index)
-                distances = np.delete(distances, index)
-            else:
-                rcs = np.delete(rcs, index + 1)
-                distances = np.delete(distances, index + 1)
-        return list(distances)
+        order = np.lexsort((rcs, distances))
+        distances = distances[order]
+        rcs = rcs[order]
+
+        # Index of the group of closely spaced distances that each distance belongs to.
+        groups = np.concatenate(([0], np.cumsum(~(np.abs(np.diff(distances)) < min_dist))))
+        # Sort by group, highest RCS and first position, and keep the first of each group.
+        order = np.lexsort((np.arange(distances.size), -rcs, groups))
+        is_first_in_group = np.concatenate(([True], np.diff(groups[order]) != 0))
+
+        return distances[order[is_first_in_group]]
 
     def _update_kalman_filters(
-        self,
-        kfs: t.List[_KalmanFilter],
-        distances: t.List[float],
-        sensor_position: str,
-    ) -> t.List[_KalmanFilter]:
+        self, kfs: _KalmanFilters, distances: npt.NDArray[np.float64]
+    ) -> None:
         """Update Kalman filters for a sensor, using new distance estimates.
-        Identifying the distance closest to the current state of the filter. If the distance is
-        sufficiently close to the current state, it is used to update the filter. Once a distance
-        has been used to update a filter, it can't be used by other filters.
-        If no estimated distance matches the filter, dead reckoning is used. Each time dead
+        The distances are assigned to the filters by minimizing the sum of the differences
+        between the distances and the current states of the filters. Only a distance
+        sufficiently close to the current state can be assigned to a filter and a distance can
+        only be used to update one filter.
+        If no estimated distance is assigned to a filter, dead reckoning is used. Each time dead
         reckoning is performed, a counter is incremented. If the counter exceeds a certain value,
         the filter is deleted.
         A filter must have a minimum number of updates before it is regarded as initiated and used
         for bilateration in a subsequent steps.
         """
-        distances = copy.deepcopy(list(distances))
-        kfs = copy.deepcopy(kfs)
-        for kf in kfs:
-            # Find the index of the closest distance.
-            state_vs_distance_diff = np.abs(np.array(kf.get_distance()) - np.array(distances))
-            idxs_close_to_estimate = np.where(state_vs_distance_diff < self.max_meas_state_diff_m)[
-                0
-            ]
-            kf.predict()
-            if len(distances) == 0 or len(idxs_close_to_estimate) == 0:
-                # No estimates found.
-                kf.dead_reckoning_count += 1
-                # Remove the filter if not initialized or number of dead reckoning steps is to
-                # high.
-                if (
-                    self.num_dead_reckoning_frames < kf.dead_reckoning_count
-                    or kf.num_updates < self.num_dead_reckoning_frames - 1
-                ):
-                    kfs.remove(kf)
-            else:
-                # Estimates found.
-                kf.dead_reckoning_count = 0
-                # Find the point in the data closest to the current estimated distance.
-                idx_closest = np.argmin(state_vs_distance_diff[idxs_close_to_estimate])
-                idx_in_r_array = idxs_close_to_estimate[idx_closest]
-                # Update KF
-                kf.update(distances[idx_in_r_array])
-                # Remove distance as it has now been used to update a filter.
-                distances.pop(idx_in_r_array)
-                # Check if the minimum number of updates have been reached. If so, the filter has
-                # been initialized.
-                if self.min_num_updates_valid_estimate <= kf.num_updates:
-                    kf.has_init = True
-        for distance in distances:
-            kfs.append(
-                _KalmanFilter(
-                    1 / self.update_rate,
-                    self.process_noise_gain_sensitivity,
-                    distance,
-                    sensor_position,
-                    self.min_num_updates_valid_estimate,
-                )
+        idxs_filter, idxs_distance = _assign(
+            np.abs(kfs.distances[:, None] - distances[None, :]), self.max_meas_state_diff_m
+        )
+
+        kfs.predict()
+        kfs.update(idxs_filter, distances[idxs_distance])
+        kfs.num_updates[idxs_filter] += 1
+        kfs.dead_reckoning_count[idxs_filter] = 0
+        kfs.has_init |= self.min_num_updates_valid_estimate <= kfs.num_updates
+
+        # No estimates found for the rest of the filters.
+        not_updated = np.ones(len(kfs), dtype=bool)
+        not_updated[idxs_filter] = False
+        kfs.dead_reckoning_count[not_updated] += 1
+        # Remove the filter if not initialized or number of dead reckoning steps is to high.
+        kfs.remove(
+            not_updated
+            & (
+                (self.num_dead_reckoning_frames < kfs.dead_reckoning_count)
+                | (kfs.num_updates < self.num_dead_reckoning_frames - 1)
             )
-        return kfs
+        )
+
+        kfs.add(np.delete(distances, idxs_distance))
 
     @staticmethod
     def _estimate_angle(
-        left_sensor: float, right_sensor: float, sensor_spacing: float
-    ) -> float | t.Any:
+        left_sensor: npt.ArrayLike, right_sensor: npt.ArrayLike, sensor_spacing: float
+    ) -> t.Any:
         """Calculates the angle to an object given two distance values. The first argument should
         reflect the value at the left sensor(left from the perspective of the sensor, facing
-        forward). The second argument should reflect the value of the right sensor."""
-        if sensor_spacing < np.abs(left_sensor - right_sensor):
-            return np.nan
+        forward). The second argument should reflect the value of the right sensor.
+        Works element-wise on arrays of distances."""
+        left_sensor = np.asarray(left_sensor)
+        right_sensor = np.asarray(right_sensor)
         x0 = left_sensor**2 - right_sensor**2
         x1 = np.sqrt(
             2 * sensor_spacing**2 * (left_sensor**2 + right_sensor**2)
             - (left_sensor**2 - right_sensor**2) ** 2
             - sensor_spacing**4 / 2
         )
-        return np.arctan(x0 / x1)
+        return np.where(
+            sensor_spacing < np.abs(left_sensor - right_sensor), np.nan, np.arctan(x0 / x1)
+        )
 
     @staticmethod
     def _sensitivity_to_min_num_updates_for_tracking(sensitivity: float) -> int:
         return int(2 + (1 - sensitivity) * 20)
 
 
-class _KalmanFilter:
+def _assign(
+    cost: npt.NDArray[np.float64], max_cost: float
+) -> t.Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Assigns rows to columns, minimizing the sum of the costs of the assigned pairs.
+    Only pairs with a cost lower than max_cost are assigned, as many as possible.
+    Returns the row and column indexes of the pairs, sorted by row."""
+    feasible = cost < max_cost
+    if not feasible.any():
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+    # Higher than the sum of the costs of any assignment of feasible pairs, so that as many
+    # feasible pairs as possible are assigned.
+    infeasible_cost = max_cost * (min(cost.shape) + 1)
+    rows, cols = _scipy.linear_sum_assignment(np.where(feasible, cost, infeasible_cost))
+    is_feasible = feasible[rows, cols]
+    return rows[is_feasible], cols[is_feasible]
+
+
+class _KalmanFilters:
+    """Constant velocity Kalman filters of the distances to multiple objects, with the states
+    of all filters stacked in arrays."""
+
     # Acceleration noise std (m/s^2).
     _PROCESS_NOISE_STD = 0.01
     # Distance estimated noise std (m).
     _MEASUREMENT_NOISE_STD = 0.005
 
-    def __init__(
-        self,
-        dt: float,
-        process_noise_gain_sensitivity: float,
-        init_state: float,
-        sensor_position: str,
-        min_num_updates_valid_estimate: int,
-    ) -> None:
-        self.A: npt.NDArray[np.float64] = np.matrix([[1.0, dt], [0.0, 1.0]])
-        self.H: npt.NDArray[np.float64] = np.matrix([[1, 0]])
+    def __init__(self, dt: float, process_noise_gain_sensitivity: float) -> None:
+        self.A = np.array([[1.0, dt], [0.0, 1.0]])
         process_noise_gain = self._sensitivity_to_gain(process_noise_gain_sensitivity)
         # Random acceleration process noise.
         self.Q = (
-            np.matrix([[(dt**4) / 4, (dt**3) / 2], [(dt**3) / 2, dt**2]])
+            np.array([[(dt**4) / 4, (dt**3) / 2], [(dt**3) / 2, dt**2]])
             * (self._PROCESS_NOISE_STD) ** 2
             * process_noise_gain
         )
         self.R = self._MEASUREMENT_NOISE_STD**2
-        self.P = np.eye(self.A.shape[1])
-        self.x: npt.NDArray[np.float64] = np.matrix([[init_state], [0.0]])
-        self.min_num_updates_valid_estimate = min_num_updates_valid_estimate
-        self.dead_reckoning_count = 0
-        self.num_updates = 0
-        self.sensor_position = sensor_position
-        self.has_init = False
+
+        # States (distance and velocity) and their covariances, one per filter.
+        self.x = np.zeros((0, 2))
+        self.P = np.zeros((0, 2, 2))
+        self.dead_reckoning_count = np.zeros(0, dtype=int)
+        self.num_updates = np.zeros(0, dtype=int)
+        self.has_init = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def distances(self) -> npt.NDArray[np.float64]:
+        return self.x[:, 0]
 
     def predict(self) -> None:
-        self.x = np.dot(self.A, self.x)
-        self.P = np.dot(np.dot(self.A, self.P), self.A.T) + self.Q
-
-    def update(self, z: float) -> None:
-        S = np.dot(self.H, np.dot(self.P, self.H.T)) + self.R
-        K = np.dot(np.dot(self.P, self.H.T), np.linalg.inv(S))
-        self.x = self.x + np.dot(K, (z - np.dot(self.H, self.x)))
-        I = np.eye(self.H.shape[1])
-        self.P = (I - (K * self.H)) * self.P
-        self.num_updates += 1
-        if self.min_num_updates_valid_estimate < self.num_updates:
-            self.has_init = True
-
-    def get_distance(self) -> float:
-        return float(self.x[0, 0])
+        self.x = self.x @ self.A.T
+        self.P = self.A @ self.P @ self.A.T + self.Q
+
+    def update(self, idxs: npt.NDArray[np.intp], z: npt.NDArray[np.float64]) -> None:
+        """Updates the filters at idxs with the measured distances z."""
+        # As only the distance is measured, the innovation covariance is a scalar and the gain
+        # is the first column of the covariance, scaled.
+        P = self.P[idxs]
+        S = P[:, 0, 0] + self.R
+        K = P[:, :, 0] / S[:, None]
+        self.x[idxs] += K * (z - self.x[idxs, 0])[:, None]
+        self.P[idxs] = P - K[:, :, None] * P[:, None, 0, :]
+
+    def add(self, init_states: npt.NDArray[np.float64]) -> None:
+        """Adds filters, starting at the given distances with zero velocity."""
+        num_new = len(init_states)
+        self.x = np.concatenate((self.x, np.stack((init_states, np.zeros(num_new)), axis=1)))
+        self.P = np.concatenate((self.P, np.broadcast_to(np.eye(2), (num_new, 2, 2))))
+        self.dead_reckoning_count = np.concatenate(
+            (self.dead_reckoning_count, np.zeros(num_new, dtype=int))
+        )
+        self.num_updates = np.concatenate((self.num_updates, np.zeros(num_new, dtype=int)))
+        self.has_init = np.concatenate((self.has_init, np.zeros(num_new, dtype=bool)))
+
+    def remove(self, mask: npt.NDArray[np.bool_]) -> None:
+        """Removes the filters where mask is True."""
+        keep = ~mask
+        self.x = self.x[keep]
+        self.P = self.P[keep]
+        self.dead_reckoning_count = self.dead_reckoning_count[keep]
+        self.num_updates = self.num_updates[keep]
+        self.has_init = self.has_init[keep]
 
     @staticmethod
     def _sensitivity_to_gain(sensitivity: float) -> float:
@@ -4,11 +4,8 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Callable, Mapping, Optional
+from typing import Callable, Optional
 
-import attrs
-import h5py
 import numpy as np
 
 from PySide6.QtGui import QFont
@@ -19,17 +16,13 @@ import pyqtgraph as pg
 import acconeer.exptool as et
 from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo import APPROX_BASE_STEP_LENGTH_M
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo.breathing import (
     AppState,
     BreathingProcessorConfig,
-    get_infant_config,
-    get_sitting_config,
 )
 from acconeer.exptool.a121.algo.presence import (
     DetectorConfig as PresenceDetectorConfig,
@@ -40,8 +33,6 @@ from acconeer.exptool.a121.algo.presence import (
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
     Message,
     MiscErrorView,
@@ -53,129 +44,26 @@ from acconeer.exptool.app.new import (
     PluginSpecBase,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 from acconeer.exptool.app.new.ui.components import CollapsibleWidget
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
 from ._ref_app import (
-    RefApp,
     RefAppConfig,
     RefAppResult,
-    _load_algo_data,
-    get_sensor_config,
 )
 
 
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: RefAppConfig = attrs.field(factory=RefAppConfig)
-
-
-class PluginPresetId(Enum):
-    SITTING = auto()
-    INFANT = auto()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    ref_app_config: RefAppConfig
-    sensor_config: a121.SensorConfig
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], RefAppConfig]] = {
-        PluginPresetId.SITTING.value: lambda: get_sitting_config(),
-        PluginPresetId.INFANT.value: lambda: get_infant_config(),
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._recorder: Optional[a121.H5Recorder] = None
-        self._ref_app_instance: Optional[RefApp] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = RefAppConfig.from_json(file["config"][()])
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: RefAppConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        _, config = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.sensor_id = record.sensor_id
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._ref_app_instance = RefApp(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            ref_app_config=self.shared_state.config,
-        )
-        self._ref_app_instance.start(recorder)
-        self.callback(
-            SetupMessage(
-                ref_app_config=self.shared_state.config,
-                sensor_config=get_sensor_config(self.shared_state.config),
-            )
-        )
-
-    def end_session(self) -> None:
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        self._ref_app_instance.stop()
-
-    def get_next(self) -> None:
-        assert self.client
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        result = self._ref_app_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
-
 class PlotPlugin(PgPlotPlugin):
     displayed_breathing_rate: Optional[str]
 
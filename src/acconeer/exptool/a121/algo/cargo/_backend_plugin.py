@@ -0,0 +1,204 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import logging
+from enum import Enum, auto
+from typing import Callable, Mapping, Optional
+
+import attrs
+import h5py
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
+from acconeer.exptool.a121.algo._plugins import (
+    A121BackendPluginBase,
+)
+from acconeer.exptool.a121.algo.distance._detector import ConfigMismatchError
+from acconeer.exptool.app.new import (
+    BackendLogger,
+    GeneralMessage,
+    Message,
+    PluginGeneration,
+    backend,
+    is_task,
+)
+
+from ._configs import (
+    get_10_ft_container_config,
+    get_20_ft_container_config,
+    get_40_ft_container_config,
+    get_no_lens_config,
+)
+from ._ex_app import (
+    CargoPresenceConfig,
+    ExApp,
+    ExAppConfig,
+    ExAppContext,
+    UtilizationLevelConfig,
+    _load_algo_data,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+@attrs.mutable(kw_only=True)
+class SharedState:
+    sensor_id: int = attrs.field(default=1)
+    config: ExAppConfig = attrs.field(factory=get_20_ft_container_config)
+    ex_app_context: Optional[ExAppContext] = attrs.field(default=None)
+
+
+class PluginPresetId(Enum):
+    CONTAINER_10_FT = auto()
+    CONTAINER_20_FT = auto()
+    CONTAINER_40_FT = auto()
+    NO_LENS = auto()
+
+
+@attrs.frozen(kw_only=True)
+class SetupMessage(GeneralMessage):
+    ex_app_config: ExAppConfig
+    estimated_frame_rate: Optional[float]
+    name: str = attrs.field(default="setup", init=False)
+    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
+
+
+class BackendPlugin(A121BackendPluginBase[SharedState]):
+    PLUGIN_PRESETS: Mapping[int, Callable[[], ExAppConfig]] = {
+        PluginPresetId.CONTAINER_10_FT.value: lambda: get_10_ft_container_config(),
+        PluginPresetId.CONTAINER_20_FT.value: lambda: get_20_ft_container_config(),
+        PluginPresetId.CONTAINER_40_FT.value: lambda: get_40_ft_container_config(),
+        PluginPresetId.NO_LENS.value: lambda: get_no_lens_config(),
+    }
+
+    def __init__(
+        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
+    ) -> None:
+        super().__init__(callback=callback, generation=generation, key=key, use_app_client=False)
+
+        self._recorder: Optional[a121.H5Recorder] = None
+        self._ex_app_instance: Optional[ExApp] = None
+        self._log = BackendLogger.getLogger(__name__)
+        self._frame_count = 0
+
+        self.restore_defaults()
+
+    def _load_from_cache(self, file: h5py.File) -> None:
+        self.shared_state.config = ExAppConfig.from_json(file["config"][()])
+
+    @is_task
+    def restore_defaults(self) -> None:
+        self.shared_state = SharedState(config=get_no_lens_config())
+        self.broadcast()
+
+    @is_task
+    def update_sensor_id(self, *, sensor_id: int) -> None:
+        self.shared_state.sensor_id = sensor_id
+        self.broadcast()
+
+    def _sync_sensor_ids(self) -> None:
+        if self.client is not None:
+            sensor_ids = self.client.server_info.connected_sensors
+
+            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
+                self.shared_state.sensor_id = sensor_ids[0]
+
+    @is_task
+    def update_config(self, *, config: ExAppConfig) -> None:
+        self.shared_state.config = config
+        self.broadcast()
+
+    @is_task
+    def update_utilization_level_config(self, *, config: UtilizationLevelConfig) -> None:
+        self.shared_state.config.utilization_level_config = config
+        self.broadcast()
+
+    @is_task
+    def update_cargo_presence_config(self, *, config: CargoPresenceConfig) -> None:
+        self.shared_state.config.cargo_presence_config = config
+        self.broadcast()
+
+    def save_to_cache(self, file: h5py.File) -> None:
+        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
+
+    @is_task
+    def set_preset(self, preset_id: int) -> None:
+        preset_config = self.PLUGIN_PRESETS[preset_id]
+        self.shared_state.config = preset_config()
+        self.broadcast()
+
+    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
+        algo_group = record.get_algo_group(self.key)
+        _, config, ex_app_context = _load_algo_data(algo_group)
+        self.shared_state.config = config
+        self.shared_state.ex_app_context = ex_app_context
+        self.shared_state.sensor_id = record.session(0).sensor_id
+
+    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
+        assert self.client
+
+        if (
+            self.shared_state.config.cargo_presence_config is not None
+            and self.shared_state.ex_app_context is not None
+            and self.shared_state.ex_app_context.presence_context is not None
+        ):
+            update_rate_diff = abs(
+                self.shared_state.ex_app_context.presence_context.estimated_frame_rate
+                - self.shared_state.config.cargo_presence_config.update_rate
+            )
+            if update_rate_diff > 0.01:
+                self.shared_state.ex_app_context.presence_context = None
+                self.send_status_message("Config mismatch, estimating frame rate.")
+
+        try:
+            self._ex_app_instance = ExApp(
+                client=self.client,
+                sensor_id=self.shared_state.sensor_id,
+                ex_app_config=self.shared_state.config,
+                ex_app_context=self.shared_state.ex_app_context,
+            )
+            self._ex_app_instance.start(recorder)
+        except ConfigMismatchError:
+            self._ex_app_instance = ExApp(
+                client=self.client,
+                sensor_id=self.shared_state.sensor_id,
+                ex_app_config=self.shared_state.config,
+                ex_app_context=None,
+            )
+            self.send_status_message("Config mismatch, recalibrating detector.")
+            self._ex_app_instance.start(recorder)
+
+        self.shared_state.ex_app_context = self._ex_app_instance.ex_app_context
+
+        if self._ex_app_instance.presence_context is not None:
+            estimated_frame_rate = self._ex_app_instance.presence_context.estimated_frame_rate
+        else:
+            estimated_frame_rate = None
+
+        self.callback(
+            SetupMessage(
+                ex_app_config=self.shared_state.config,
+                estimated_frame_rate=estimated_frame_rate,
+            )
+        )
+
+    def end_session(self) -> None:
+        if self._ex_app_instance is None:
+            raise RuntimeError
+        if self._recorder is not None:
+            self._recorder.close()
+        self._ex_app_instance.stop()
+        self._frame_count = 0
+
+    def get_next(self) -> None:
+        assert self.client
+        if self._ex_app_instance is None:
+            raise RuntimeError
+        result = self._ex_app_instance.get_next()
+        self._frame_count += 1
+
+        self.callback(backend.PlotMessage(result=result))
+        self.callback(GeneralMessage(name="frame_count", data=self._frame_count))
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -10,7 +10,6 @@ from typing import List, Optional
 import attrs
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import filtfilt
 
 from acconeer.exptool import a121
 from acconeer.exptool._core.class_creation.attrs import attrs_optional_ndarray_isclose
@@ -20,9 +19,12 @@ from acconeer.exptool.a121.algo import (
     RLG_PER_HWAAS_MAP,
     AlgoParamEnum,
     AlgoProcessorConfigBase,
+    Cfar,
     ProcessorBase,
     ReflectorShape,
+    ZeroPhaseFilter,
     _convert_multiple_amplitudes_to_strengths,
+    _scipy,
     calc_processing_gain,
     find_peaks,
     get_distance_filter_coeffs,
@@ -238,6 +240,7 @@ class Processor(ProcessorBase[ProcessorResult]):
             self.step_length,
             narrow_filter=self.start_point < NARROW_DISTANCE_FILTER_BREAKPOINT,
         )
+        self.distance_filter = ZeroPhaseFilter(self.b, self.a)
 
         self.processor_mode = processor_config.processor_mode
         self.threshold_method = processor_config.threshold_method
@@ -375,7 +378,7 @@ class Processor(ProcessorBase[ProcessorResult]):
                 frame = self._apply_phase_jitter_compensation(self.context, frame, lb_angle)
 
         sweep = frame.mean(axis=0)
-        filtered_sweep = filtfilt(self.b, self.a, sweep)
+        filtered_sweep = self.distance_filter(sweep)
         abs_sweep = np.abs(filtered_sweep)
         abs_sweep = abs_sweep[self.filt_margin : -self.filt_margin]
 
@@ -438,6 +441,7 @@ class Processor(ProcessorBase[ProcessorResult]):
             self.guard_half_length = self._calc_cfar_guard_half_length(
                 self.profile, self.step_length
             )
+            self.cfar = Cfar(self.window_length, self.guard_half_length)
 
             # breakpoint_lim defines at what distance cfar should go from being calculated
             # one-sided to symmetrical. One-sided is used to avoid introducing the direct leakage
@@ -593,6 +597,7 @@ class Processor(ProcessorBase[ProcessorResult]):
                 self.num_stds_in_threshold,
                 self.cfar_abs_noise,
                 self.one_sided_breakpoint_in_sweep,
+                cfar=self.cfar,
             )
         elif (
             self.threshold_method == ThresholdMethod.FIXED
@@ -670,6 +675,7 @@ class Processor(ProcessorBase[ProcessorResult]):
         num_stds: float,
         abs_noise_std: npt.NDArray[np.float64],
         one_sided_breakpoint_in_sweep: Optional[int] = None,
+        cfar: Optional[Cfar] = None,
     ) -> npt.NDArray[np.float64]:
         """Calculate CFAR threshold.
 
@@ -684,19 +690,20 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         One-sided theshold is applied for all points below one_sided_breakpoint_in_sweep. The
         purpose is to avoid the influence of direct leakage in the threshold.
-        """
 
-        threshold = np.full(abs_sweep.shape, np.nan)
-        margin = window_length + guard_half_length
-        sweep_len_without_margins = abs_sweep.shape[0] - 2 * margin
+        A ``cfar`` created with the same window length and guard half length can be given to
+        reuse it between sweeps.
+        """
 
-        filt_abs_sweep = np.convolve(abs_sweep, np.ones(window_length), "valid") / window_length
-        left_cfar_component = filt_abs_sweep[:sweep_len_without_margins] / 2
-        right_cfar_component = filt_abs_sweep[-sweep_len_without_margins:] / 2
-        if one_sided_breakpoint_in_sweep is not None:
-            left_cfar_component[:one_sided_breakpoint_in_sweep] = 0
+        if cfar is None:
+            cfar = Cfar(window_length, guard_half_length)
 
-        threshold[margin:-margin] = left_cfar_component + right_cfar_component
+        one_sided_below = (
+            None
+            if one_sided_breakpoint_in_sweep is None
+            else cfar.margin + one_sided_breakpoint_in_sweep
+        )
+        threshold = cfar.two_sided(abs_sweep, one_sided_below)
 
         threshold += abs_noise_std * num_stds
         return threshold
@@ -765,7 +772,7 @@ def calculate_bg_noise_std(
     filt_margin = get_distance_filter_edge_margin(profile, step_length)
 
     sweep = subframe.squeeze(axis=0)
-    filtered_sweep = filtfilt(B, A, sweep)
+    filtered_sweep = _scipy.filtfilt(B, A, sweep)
     abs_sweep = np.abs(filtered_sweep)
     abs_sweep = abs_sweep[filt_margin:-filt_margin]
 
@@ -1,25 +1,19 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import logging
 import time
-from enum import Enum, auto
-from typing import Callable, Mapping, Optional
-
-import attrs
-import h5py
+from typing import Callable, Optional
 
 from PySide6.QtWidgets import QPushButton, QVBoxLayout
 
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121, opser
 from acconeer.exptool._core.docstrings import get_attribute_docstring
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo.presence import DetectorConfig
@@ -29,8 +23,6 @@ from acconeer.exptool.a121.algo.presence._pidget_mapping import (
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
     Message,
     MiscErrorView,
@@ -42,130 +34,29 @@ from acconeer.exptool.app.new import (
     PluginSpecBase,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 from acconeer.exptool.app.new.ui.components import CollapsibleWidget
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
 from ._example_app import ExampleAppConfig
 from ._mode_handler import (
     AppMode,
     DetectionState,
-    ModeHandler,
     ModeHandlerConfig,
     ModeHandlerResult,
-    _load_algo_data,
-    get_default_config,
 )
 
 
-opser.register_json_presentable(ModeHandlerConfig)
-
-
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: ModeHandlerConfig = attrs.field(factory=ModeHandlerConfig)
-
-
-class PluginPresetId(Enum):
-    DEFAULT = auto()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    mode_handler_config: ModeHandlerConfig
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], ModeHandlerConfig]] = {
-        PluginPresetId.DEFAULT.value: lambda: get_default_config()
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._recorder: Optional[a121.H5Recorder] = None
-        self._exempel_app_instance: Optional[ModeHandler] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = opser.deserialize(file["config"], ModeHandlerConfig)
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: ModeHandlerConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        cfg_group = file.create_group("config")
-        opser.serialize(self.shared_state.config, cfg_group)
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        _, config = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.sensor_id = record.session(0).sensor_id
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._example_app_instance = ModeHandler(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            mode_handler_config=self.shared_state.config,
-        )
-        self._example_app_instance.start(recorder)
-        self.callback(SetupMessage(mode_handler_config=self.shared_state.config))
-
-    def end_session(self) -> None:
-        if self._example_app_instance is None:
-            raise RuntimeError
-        if self._recorder is not None:
-            self._recorder.close()
-        self._example_app_instance.stop()
-
-    def get_next(self) -> None:
-        assert self.client
-        if self._example_app_instance is None:
-            raise RuntimeError
-        result = self._example_app_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
-
 class PlotPlugin(PgPlotPlugin):
     def __init__(self, app_model: AppModel) -> None:
         super().__init__(app_model=app_model)
@@ -1,14 +1,11 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Callable, Mapping, Optional
+from typing import Callable, Optional
 
-import attrs
-import h5py
 import numpy as np
 
 from PySide6.QtGui import QTransform
@@ -17,21 +14,16 @@ from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121, opser
+from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo import PeakSortingMethod
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
-    HandledException,
     Message,
     MiscErrorView,
     PgPlotPlugin,
@@ -40,165 +32,30 @@ from acconeer.exptool.app.new import (
     PluginGeneration,
     PluginPresetBase,
     PluginSpecBase,
-    PluginState,
-    PluginStateMessage,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 from acconeer.exptool.app.new.ui.components.a121 import SensorConfigEditor
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
 from ._detector import (
     DetailedStatus,
     Detector,
     DetectorConfig,
-    DetectorContext,
     DetectorResult,
-    _load_algo_data,
 )
 
 
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_ids: list[int] = attrs.field(factory=lambda: [1])
-    config: DetectorConfig = attrs.field(factory=DetectorConfig)
-    context: DetectorContext = attrs.field(factory=DetectorContext)
-
-
-class PluginPresetId(Enum):
-    DEFAULT = auto()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], DetectorConfig]] = {
-        PluginPresetId.DEFAULT.value: lambda: DetectorConfig()
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-        self._detector_instance: Optional[Detector] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = DetectorConfig.from_json(file["config"][()])
-        self.shared_state.context = opser.deserialize(file["context"], DetectorContext)
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            # Try to use the sensor ids from the last calibration
-            if self.shared_state.context.sensor_ids:
-                self.shared_state.sensor_ids = self.shared_state.context.sensor_ids
-
-            for i in range(len(self.shared_state.sensor_ids)):
-                if len(sensor_ids) > 0 and self.shared_state.sensor_ids[i] not in sensor_ids:
-                    self.shared_state.sensor_ids[i] = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: DetectorConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    @is_task
-    def update_sensor_ids(self, *, sensor_ids: list[int]) -> None:
-        self.shared_state.sensor_ids = sensor_ids
-        self.broadcast()
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-        opser.serialize(self.shared_state.context, file.create_group("context"))
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        _, config, context = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.context = context
-        self.shared_state.sensor_ids = list(next(iter(record.session_config.groups)).keys())
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._detector_instance = Detector(
-            client=self.client,
-            sensor_ids=self.shared_state.sensor_ids,
-            detector_config=self.shared_state.config,
-            context=self.shared_state.context,
-        )
-        self._detector_instance.start(recorder)
-        self.callback(SetupMessage())
-
-    def end_session(self) -> None:
-        assert self._detector_instance
-        if self._recorder is not None:
-            self._recorder.close()
-        self._detector_instance.stop()
-
-    def get_next(self) -> None:
-        if self._detector_instance is None:
-            raise RuntimeError
-
-        assert self.client
-        result = self._detector_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
-    @is_task
-    def calibrate_detector(self) -> None:
-        if self._started:
-            raise RuntimeError
-
-        if self.client is None:
-            raise RuntimeError
-
-        if not self.client.connected:
-            raise RuntimeError
-
-        self.callback(PluginStateMessage(state=PluginState.LOADED_BUSY))
-
-        try:
-            self._detector_instance = Detector(
-                client=self.client,
-                sensor_ids=self.shared_state.sensor_ids,
-                detector_config=self.shared_state.config,
-                context=None,
-            )
-            self._detector_instance.calibrate_detector()
-        except Exception as exc:
-            msg = "Failed to calibrate detector"
-            raise HandledException(msg) from exc
-        finally:
-            self.callback(PluginStateMessage(state=PluginState.LOADED_IDLE))
-
-        self.shared_state.context = self._detector_instance.context
-        self.broadcast()
-
-
 class PlotPlugin(PgPlotPlugin):
     _PLOT_HISTORY_FRAMES = 50
 
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -9,7 +9,6 @@ from typing import List, Optional
 import attrs
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import filtfilt
 
 from acconeer.exptool import a121
 from acconeer.exptool.a121.algo import (
@@ -19,6 +18,7 @@ from acconeer.exptool.a121.algo import (
     AlgoProcessorConfigBase,
     PeakSortingMethod,
     ProcessorBase,
+    ZeroPhaseFilter,
     _convert_amplitude_to_strength,
     get_distance_filter_coeffs,
     get_distance_filter_edge_margin,
@@ -159,6 +159,7 @@ class SubsweepProcessor:
         (self.b, self.a) = get_distance_filter_coeffs(
             sensor_config.profile, sensor_config.step_length
         )
+        self.depth_filter = ZeroPhaseFilter(self.b, self.a)
         self.fwhm_points = ENVELOPE_FWHM_M[sensor_config.profile] / (
             APPROX_BASE_STEP_LENGTH_M * sensor_config.step_length
         )
@@ -261,7 +262,7 @@ class SubsweepProcessor:
     def apply_depth_filter(self, frame: npt.NDArray[np.complex128]) -> npt.NDArray[np.complex128]:
         # Written as a separate function to be callable during detector calibration
 
-        filtered_array = np.array(filtfilt(self.b, self.a, frame), dtype=complex)
+        filtered_array = np.array(self.depth_filter(frame), dtype=complex)
         cropped_array = filtered_array[:, self.filt_margin : -self.filt_margin]
         return cropped_array
 
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 from __future__ import annotations
 
@@ -176,8 +176,9 @@ class ProcessorConfig:
 
 @attrs.frozen(kw_only=True)
 class ProcessorExtraResult:
-    signature_history: npt.NDArray[np.float64] = attrs.field()
-    """Array containing queue_length last signatures."""
+    signature_history: npt.NDArray[np.void] = attrs.field()
+    """Array containing queue_length last signatures, with the fields ``weighted_distance``
+    and ``max_energy``."""
 
     parking_data: npt.NDArray[np.float64] = attrs.field()
     """The scaled amplitude array used to calculate the last signature."""
@@ -224,10 +225,33 @@ class Processor:
 
         # signature history
         self.queue_length = processor_config.queue_length
-        self.sig_history = np.zeros(
-            self.queue_length,
+
+        # The history is kept in a ring, where _ring_index is the oldest signature. Every
+        # signature is written twice, queue_length elements apart, so that the history is
+        # always the contiguous slice of queue_length elements starting at _ring_index. The
+        # signatures above the weight threshold are also kept sorted, by weighted distance
+        # and then energy, in the first _num_trigs elements of _sorted_distances and
+        # _sorted_energies. Both are updated as signatures are added and removed.
+        self._ring = np.zeros(
+            2 * self.queue_length,
             dtype=[("weighted_distance", float), ("max_energy", float)],
         )
+        self._ring_index = 0
+        self._sorted_distances = np.zeros(self.queue_length)
+        self._sorted_energies = np.zeros(self.queue_length)
+        self._num_trigs = 0
+
+        for weighted_distance, max_energy in self.sig_history.tolist():
+            if max_energy > self.weight_threshold:
+                self._insert_sorted(weighted_distance, max_energy)
+
+    @property
+    def sig_history(self) -> npt.NDArray[np.void]:
+        """The last queue_length signatures, oldest first
+
+        A view of the ring buffer, which changes as signatures are added.
+        """
+        return self._ring[self._ring_index : self._ring_index + self.queue_length]
 
     @classmethod
     def process_noise_frame(cls, frame: npt.NDArray[np.complex128]) -> float:
@@ -249,36 +273,86 @@ class Processor:
             ]  # We should return a distance, so pick the first.
         return (weighted_distance, max_energy)
 
+    def _sorted_index(self, weighted_distance: float, max_energy: float) -> int:
+        distances = self._sorted_distances[: self._num_trigs]
+        lo = int(np.searchsorted(distances, weighted_distance, side="left"))
+        hi = int(np.searchsorted(distances, weighted_distance, side="right"))
+        return lo + int(np.searchsorted(self._sorted_energies[lo:hi], max_energy))
+
+    def _insert_sorted(self, weighted_distance: float, max_energy: float) -> None:
+        i = self._sorted_index(weighted_distance, max_energy)
+        n = self._num_trigs
+        self._sorted_distances[i + 1 : n + 1] = self._sorted_distances[i:n]
+        self._sorted_energies[i + 1 : n + 1] = self._sorted_energies[i:n]
+        self._sorted_distances[i] = weighted_distance
+        self._sorted_energies[i] = max_energy
+        self._num_trigs += 1
+
+    def _remove_sorted(self, weighted_distance: float, max_energy: float) -> None:
+        i = self._sorted_index(weighted_distance, max_energy)
+        n = self._num_trigs
+        self._sorted_distances[i : n - 1] = self._sorted_distances[i + 1 : n]
+        self._sorted_energies[i : n - 1] = self._sorted_energies[i + 1 : n]
+        self._num_trigs -= 1
+
+    def _add_signature(self, weighted_distance: float, max_energy: float) -> None:
+        old_weighted_distance, old_max_energy = self._ring[self._ring_index].tolist()
+        if old_max_energy > self.weight_threshold:
+            self._remove_sorted(old_weighted_distance, old_max_energy)
+
+        self._ring[self._ring_index] = (weighted_distance, max_energy)
+        self._ring[self._ring_index + self.queue_length] = (weighted_distance, max_energy)
+        self._ring_index = (self._ring_index + 1) % self.queue_length
+
+        if max_energy > self.weight_threshold:
+            self._insert_sorted(weighted_distance, max_energy)
+
     def objects_present(self) -> bool:
-        energy_history = np.array([elm[1] for elm in self.sig_history])
-        n_trigs = sum(energy_history > self.weight_threshold)
-        ret = n_trigs > (self.queue_length * self.similarity_threshold)
+        ret = self._num_trigs > (self.queue_length * self.similarity_threshold)
         return ret
 
     def same_objects(self) -> Dict[str, Any]:
-        depth_sigs = np.sort(self.sig_history, axis=0, order=["weighted_distance", "max_energy"])
-        weights = np.array([elm[1] for elm in depth_sigs])
-        depth_sigs = depth_sigs[weights > self.weight_threshold]
-
-        clusters = []
-        curr_cluster: list[Tuple[float, float]] = []
-        for elm in depth_sigs:
-            if len(curr_cluster) == 0:
-                curr_cluster.append(elm)
-            else:
-                if (elm[0] - curr_cluster[0][0]) > self.distance_threshold:
-                    clusters.append(curr_cluster)
-                    curr_cluster = []
-                else:
-                    curr_cluster.append(elm)
-        if len(curr_cluster) > 0:
-            clusters.append(curr_cluster)
-
-        if len(clusters) > 0:
-            cluster_lengths = np.array([len(cluster) for cluster in clusters])
-            long_cluster_ind = np.argmax(cluster_lengths)
-            closest_dist = clusters[long_cluster_ind][0][0]
-            similarity = max(cluster_lengths) / self.queue_length
+        # A cluster starts at a signature and holds the following signatures that are
+        # within the distance threshold of it. The first signature outside it is skipped
+        # and the next cluster starts at the signature after that.
+        distances = self._sorted_distances[: self._num_trigs]
+        n = distances.size
+        indexes = np.arange(n)
+
+        # Index of the first signature outside the cluster starting at each signature
+        cluster_ends = np.maximum(
+            np.searchsorted(distances, distances + self.distance_threshold, side="right"),
+            indexes + 1,
+        )
+
+        # distances + threshold is rounded, adjust the ends to exactly match comparing
+        # the differences to the threshold
+        padded_distances = np.append(distances, np.inf)
+        while True:
+            shrink = (cluster_ends > indexes + 1) & (
+                distances[cluster_ends - 1] - distances > self.distance_threshold
+            )
+            grow = padded_distances[cluster_ends] - distances <= self.distance_threshold
+            if not (shrink.any() or grow.any()):
+                break
+
+            cluster_ends += grow.astype(int) - shrink.astype(int)
+
+        cluster_ends_list = cluster_ends.tolist()
+        longest_cluster_start = 0
+        longest_cluster_length = 0
+        cluster_start = 0
+        while cluster_start < n:
+            cluster_end = cluster_ends_list[cluster_start]
+            if cluster_end - cluster_start > longest_cluster_length:
+                longest_cluster_start = cluster_start
+                longest_cluster_length = cluster_end - cluster_start
+
+            cluster_start = cluster_end + 1
+
+        if n > 0:
+            closest_dist = distances[longest_cluster_start]
+            similarity = longest_cluster_length / self.queue_length
             detection = similarity > self.similarity_threshold
         else:
             detection = False
@@ -309,8 +383,7 @@ class Processor:
 
         sig = self.signature(amp_scaled)
 
-        self.sig_history = np.roll(self.sig_history, -1, axis=0)
-        self.sig_history[-1] = sig
+        self._add_signature(*sig)
 
         objects_present = self.objects_present()
         same_objects_info = self.same_objects()
@@ -320,7 +393,8 @@ class Processor:
         parked_car = objects_present and same_objects
 
         extra_result = ProcessorExtraResult(
-            signature_history=self.sig_history,
+            # The history is a view that changes with the next frame
+            signature_history=self.sig_history.copy(),
             parking_data=amp_scaled,
             closest_observation=closest_object,
         )
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -175,7 +175,7 @@ class RefAppConfig(AlgoConfigBase):
 
 @attrs.frozen(kw_only=True)
 class RefAppExtraResult:
-    signature_history: npt.NDArray[np.float64] = attrs.field()
+    signature_history: npt.NDArray[np.void] = attrs.field()
     """Array containing queue_length_n last signatures."""
 
     parking_data: npt.NDArray[np.float64] = attrs.field()
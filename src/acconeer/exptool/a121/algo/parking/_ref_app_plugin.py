@@ -4,11 +4,8 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Callable, Mapping, Optional
+from typing import Callable, Optional
 
-import attrs
-import h5py
 import numpy as np
 
 from PySide6 import QtCore
@@ -17,26 +14,19 @@ from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121, opser
+from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo._utils import get_distances_m
 from acconeer.exptool.a121.algo.parking import (
     ObstructionProcessor,
-    get_ground_config,
-    get_pole_config,
 )
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
-    HandledException,
     Message,
     MiscErrorView,
     PgPlotPlugin,
@@ -46,22 +36,24 @@ from acconeer.exptool.app.new import (
     PluginPresetBase,
     PluginSpecBase,
     PluginState,
-    PluginStateMessage,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
 from ._processors import MAX_AMPLITUDE
 from ._ref_app import (
     DetailedStatus,
     RefApp,
     RefAppConfig,
-    RefAppContext,
     RefAppResult,
-    _load_algo_data,
     get_sensor_configs,
 )
 
@@ -69,163 +61,6 @@ from ._ref_app import (
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: RefAppConfig = attrs.field(factory=get_ground_config)
-    context: RefAppContext = attrs.field(default=None)
-
-
-class PluginPresetId(Enum):
-    GROUND = auto()
-    POLE = auto()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    ref_app_config: RefAppConfig
-    session_config: a121.SessionConfig
-    sensor_id: int
-    metadata: a121.Metadata
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], RefAppConfig]] = {
-        PluginPresetId.GROUND.value: lambda: get_ground_config(),
-        PluginPresetId.POLE.value: lambda: get_pole_config(),
-    }
-
-    def __init__(
-        self,
-        callback: Callable[[Message], None],
-        generation: PluginGeneration,
-        key: str,
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._recorder: Optional[a121.H5Recorder] = None
-        self._ref_app_instance: Optional[RefApp] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = RefAppConfig.from_json(file["config"][()])
-
-        context = opser.try_deserialize(file["context"], RefAppContext)
-        if context is None:
-            self.send_status_message(
-                "Could not load cached context. Falling back to empty context"
-            )
-            context = RefAppContext()
-
-        self.shared_state.context = context
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: RefAppConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-        opser.serialize(self.shared_state.context, file.create_group("context"))
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        sensor_id, config, context = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.sensor_id = sensor_id
-        self.shared_state.context = context
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._ref_app_instance = RefApp(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            ref_app_config=self.shared_state.config,
-            context=self.shared_state.context,
-        )
-        self._ref_app_instance.start(recorder)
-
-        metadata = self.client.extended_metadata[0][self.shared_state.sensor_id]
-        self.callback(
-            SetupMessage(
-                ref_app_config=self.shared_state.config,
-                metadata=metadata,
-                sensor_id=self.shared_state.sensor_id,
-                session_config=self.client.session_config,
-            )
-        )
-
-    def end_session(self) -> None:
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        self._ref_app_instance.stop()
-
-    def get_next(self) -> None:
-        assert self.client
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        result = self._ref_app_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
-    @is_task
-    def calibrate_detector(self) -> None:
-        if self._started:
-            raise RuntimeError
-
-        if self.client is None:
-            raise RuntimeError
-
-        if not self.client.connected:
-            raise RuntimeError
-
-        self.callback(PluginStateMessage(state=PluginState.LOADED_BUSY))
-
-        try:
-            self._ref_app_instance = RefApp(
-                client=self.client,
-                sensor_id=self.shared_state.sensor_id,
-                ref_app_config=self.shared_state.config,
-                context=RefAppContext(),
-            )
-            self._ref_app_instance.calibrate_ref_app()
-        except Exception as exc:
-            msg = "Failed to calibrate detector"
-            raise HandledException(msg) from exc
-        finally:
-            self.callback(PluginStateMessage(state=PluginState.LOADED_IDLE))
-
-        self.shared_state.context = self._ref_app_instance.context
-        self.broadcast()
-
-
 class PlotPlugin(PgPlotPlugin):
     def __init__(self, app_model: AppModel) -> None:
         super().__init__(app_model=app_model)
@@ -462,8 +297,8 @@ class PlotPlugin(PgPlotPlugin):
         signatures = ref_app_result.extra_result.signature_history
         parking_data = ref_app_result.extra_result.parking_data
 
-        signature_x = [elm[0] for elm in signatures]
-        signature_y = [elm[1] for elm in signatures]
+        signature_x = signatures["weighted_distance"]
+        signature_y = signatures["max_energy"]
 
         cluster_start = ref_app_result.extra_result.closest_object_dist
         cluster_end = cluster_start + self.cluster_width
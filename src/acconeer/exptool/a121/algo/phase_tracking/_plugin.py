@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
 from typing import Callable, Optional, Type
 
 import numpy as np
@@ -15,9 +14,6 @@ import acconeer.exptool as et
 from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
 from acconeer.exptool.a121.algo._plugins import (
-    ProcessorBackendPluginBase,
-    ProcessorBackendPluginSharedState,
-    ProcessorPluginPreset,
     ProcessorViewPluginBase,
     SetupMessage,
 )
@@ -26,7 +22,6 @@ from acconeer.exptool.a121.algo.phase_tracking import (
     Processor,
     ProcessorConfig,
     ProcessorResult,
-    get_sensor_config,
 )
 from acconeer.exptool.app.new import (
     AppModel,
@@ -41,45 +36,13 @@ from acconeer.exptool.app.new import (
     pidgets,
 )
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+)
 
-log = logging.getLogger(__name__)
-
-
-class PluginPresetId(Enum):
-    DEFAULT = auto()
-
-
-class BackendPlugin(ProcessorBackendPluginBase[ProcessorConfig, ProcessorResult]):
-    PLUGIN_PRESETS = {
-        PluginPresetId.DEFAULT.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_sensor_config()),
-            processor_config=BackendPlugin.get_processor_config_cls()(),
-        ),
-    }
-
-    @classmethod
-    def get_processor(cls, state: ProcessorBackendPluginSharedState[ProcessorConfig]) -> Processor:
-        if state.metadata is None:
-            msg = "metadata is None"
-            raise RuntimeError(msg)
-
-        if isinstance(state.metadata, list):
-            msg = "metadata is unexpectedly extended"
-            raise RuntimeError(msg)
-
-        return Processor(
-            sensor_config=state.session_config.sensor_config,
-            processor_config=state.processor_config,
-            metadata=state.metadata,
-        )
-
-    @classmethod
-    def get_processor_config_cls(cls) -> Type[ProcessorConfig]:
-        return ProcessorConfig
 
-    @classmethod
-    def get_default_sensor_config(cls) -> a121.SensorConfig:
-        return get_sensor_config()
+log = logging.getLogger(__name__)
 
 
 class ViewPlugin(ProcessorViewPluginBase[ProcessorConfig]):
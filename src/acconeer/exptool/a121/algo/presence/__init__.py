@@ -1,5 +1,18 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
-from ._detector import Detector, DetectorConfig, DetectorContext, DetectorMetadata, DetectorResult
-from ._processors import Processor, ProcessorConfig, ProcessorExtraResult, ProcessorResult
+from ._detector import (
+    Detector,
+    DetectorConfig,
+    DetectorContext,
+    DetectorMetadata,
+    DetectorResult,
+    MultiSensorDetector,
+)
+from ._processors import (
+    MultiSensorProcessor,
+    Processor,
+    ProcessorConfig,
+    ProcessorExtraResult,
+    ProcessorResult,
+)
@@ -1,10 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import warnings
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import attrs
 import h5py
@@ -32,7 +32,13 @@ from acconeer.exptool.a121.algo._utils import (
     get_max_step_length,
 )
 
-from ._processors import Processor, ProcessorConfig, ProcessorContext, ProcessorExtraResult
+from ._processors import (
+    MultiSensorProcessor,
+    Processor,
+    ProcessorConfig,
+    ProcessorContext,
+    ProcessorExtraResult,
+)
 from ._subsweep_utils import get_subsweep_configs
 
 
@@ -263,20 +269,26 @@ class Detector(Controller[DetectorConfig, DetectorResult]):
         self.detector_metadata: Optional[DetectorMetadata] = None
         self.detector_context = detector_context
 
+        self.prepared = False
+        self._metadata: Optional[a121.Metadata] = None
+        self.processor: Optional[Processor] = None
+
         self.started = False
 
-    def start(
-        self,
-        recorder: Optional[a121.Recorder] = None,
-        _algo_group: Optional[h5py.Group] = None,
-    ) -> None:
-        if self.started:
-            msg = "Already started"
-            raise RuntimeError(msg)
+    def prepare(self) -> None:
+        """Translates the detector config to the session and processor configs
+
+        Called by :meth:`start` if not called before. Preparing ahead of time leaves only
+        the session setup and start to :meth:`start`, which keeps the time needed to swap
+        between prepared detectors short. A processor created by an earlier start with
+        the same metadata is reset and reused.
+        """
+        if self.prepared:
+            return
 
-        sensor_config = self._get_sensor_config(self.config)
+        self._sensor_config = self._get_sensor_config(self.config)
         self.session_config = a121.SessionConfig(
-            {self.sensor_id: sensor_config},
+            {self.sensor_id: self._sensor_config},
             extended=False,
         )
 
@@ -286,47 +298,35 @@ class Detector(Controller[DetectorConfig, DetectorResult]):
         else:
             self.estimated_frame_rate = self.detector_context.estimated_frame_rate
 
-        # Add estimated frame rate to context if it differs more than
-        # 10% from the set frame rate
-        if (
-            np.abs(self.config.frame_rate - self.estimated_frame_rate) / self.config.frame_rate
-            > 0.1
-        ):
-            processor_context = ProcessorContext(estimated_frame_rate=self.estimated_frame_rate)
-        else:
-            processor_context = ProcessorContext(estimated_frame_rate=None)
+        self._processor_context = self._get_processor_context(
+            self.config, self.estimated_frame_rate
+        )
+        self._processor_config = self._get_processor_config(self.config)
 
-        metadata = self.client.setup_session(self.session_config)
-        assert isinstance(metadata, a121.Metadata)
+        self.prepared = True
 
-        processor_config = self._get_processor_config(self.config)
+    def start(
+        self,
+        recorder: Optional[a121.Recorder] = None,
+        _algo_group: Optional[h5py.Group] = None,
+    ) -> None:
+        if self.started:
+            msg = "Already started"
+            raise RuntimeError(msg)
 
-        start_m = sensor_config.subsweeps[0].start_point * APPROX_BASE_STEP_LENGTH_M
-        end_m = (
-            sensor_config.subsweeps[-1].start_point
-            + (sensor_config.subsweeps[-1].num_points - 1)
-            * sensor_config.subsweeps[-1].step_length
-        ) * APPROX_BASE_STEP_LENGTH_M
-        step_length_m = metadata.base_step_length_m * sensor_config.subsweeps[0].step_length
-        num_points = sum([subsweep.num_points for subsweep in sensor_config.subsweeps])
-        profile = sensor_config.subsweeps[0].profile
+        self.prepare()
 
-        self.detector_metadata = DetectorMetadata(
-            start_m=start_m,
-            end_m=end_m,
-            step_length_m=step_length_m if sensor_config.num_subsweeps == 1 else None,
-            num_points=num_points,
-            profile=profile if sensor_config.num_subsweeps == 1 else None,
-        )
+        metadata = self.client.setup_session(self.session_config)
+        assert isinstance(metadata, a121.Metadata)
 
-        self.processor = Processor(
-            sensor_config=sensor_config,
-            metadata=metadata,
-            processor_config=processor_config,
-            context=processor_context,
-        )
+        if self.processor is not None and metadata == self._metadata:
+            self.processor.reset()
+        else:
+            self._create_processor(metadata)
 
         if recorder is not None:
+            assert self.detector_context is not None  # Set by prepare()
+
             if isinstance(recorder, a121.H5Recorder):
                 if _algo_group is None:
                     _algo_group = recorder.require_algo_group("presence_detector")
@@ -346,6 +346,49 @@ class Detector(Controller[DetectorConfig, DetectorResult]):
 
         self.started = True
 
+    def _create_processor(self, metadata: a121.Metadata) -> None:
+        self.detector_metadata = self._get_detector_metadata(self._sensor_config, metadata)
+        self.processor = Processor(
+            sensor_config=self._sensor_config,
+            metadata=metadata,
+            processor_config=self._processor_config,
+            context=self._processor_context,
+        )
+        self._metadata = metadata
+
+    @classmethod
+    def _get_detector_metadata(
+        cls, sensor_config: a121.SensorConfig, metadata: a121.Metadata
+    ) -> DetectorMetadata:
+        start_m = sensor_config.subsweeps[0].start_point * APPROX_BASE_STEP_LENGTH_M
+        end_m = (
+            sensor_config.subsweeps[-1].start_point
+            + (sensor_config.subsweeps[-1].num_points - 1)
+            * sensor_config.subsweeps[-1].step_length
+        ) * APPROX_BASE_STEP_LENGTH_M
+        step_length_m = metadata.base_step_length_m * sensor_config.subsweeps[0].step_length
+        num_points = sum([subsweep.num_points for subsweep in sensor_config.subsweeps])
+        profile = sensor_config.subsweeps[0].profile
+
+        return DetectorMetadata(
+            start_m=start_m,
+            end_m=end_m,
+            step_length_m=step_length_m if sensor_config.num_subsweeps == 1 else None,
+            num_points=num_points,
+            profile=profile if sensor_config.num_subsweeps == 1 else None,
+        )
+
+    @classmethod
+    def _get_processor_context(
+        cls, config: DetectorConfig, estimated_frame_rate: float
+    ) -> ProcessorContext:
+        # Add estimated frame rate to context if it differs more than
+        # 10% from the set frame rate
+        if np.abs(config.frame_rate - estimated_frame_rate) / config.frame_rate > 0.1:
+            return ProcessorContext(estimated_frame_rate=estimated_frame_rate)
+        else:
+            return ProcessorContext(estimated_frame_rate=None)
+
     @classmethod
     def _get_sensor_config(cls, config: DetectorConfig) -> a121.SensorConfig:
         if config.automatic_subsweeps:
@@ -456,6 +499,143 @@ class Detector(Controller[DetectorConfig, DetectorResult]):
         return recorder_result
 
 
+class MultiSensorDetector(Controller[DetectorConfig, Dict[int, DetectorResult]]):
+    """Presence detector running the same config on several sensors
+
+    The sensors are measured together in one extended session group and their frames are
+    processed as one batch by a :class:`MultiSensorProcessor`. The result of each sensor is
+    the same as that of a :class:`Detector` for that sensor alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: a121.Client,
+        sensor_ids: list[int],
+        detector_config: DetectorConfig,
+        detector_context: Optional[DetectorContext] = None,
+    ) -> None:
+        super().__init__(client=client, config=detector_config)
+
+        if len(sensor_ids) == 0 or len(sensor_ids) != len(set(sensor_ids)):
+            msg = "sensor_ids must be non-empty and unique"
+            raise ValueError(msg)
+
+        self.sensor_ids = sensor_ids
+        self.detector_metadata: Optional[DetectorMetadata] = None
+        self.detector_context = detector_context
+        self.processor: Optional[MultiSensorProcessor] = None
+
+        self.started = False
+
+    def start(
+        self,
+        recorder: Optional[a121.Recorder] = None,
+        _algo_group: Optional[h5py.Group] = None,
+    ) -> None:
+        if self.started:
+            msg = "Already started"
+            raise RuntimeError(msg)
+
+        sensor_config = Detector._get_sensor_config(self.config)
+        self.session_config = a121.SessionConfig(
+            {sensor_id: sensor_config for sensor_id in self.sensor_ids},
+            extended=True,
+        )
+
+        if self.detector_context is None:
+            estimated_frame_rate = estimate_frame_rate(self.client, self.session_config)
+            self.detector_context = DetectorContext(estimated_frame_rate=estimated_frame_rate)
+
+        metadata = self.client.setup_session(self.session_config)
+        assert isinstance(metadata, list)
+
+        self.detector_metadata = Detector._get_detector_metadata(
+            sensor_config, metadata[0][self.sensor_ids[0]]
+        )
+        self.processor = MultiSensorProcessor(
+            session_config=self.session_config,
+            metadata=metadata,
+            processor_config=Detector._get_processor_config(self.config),
+            context=Detector._get_processor_context(
+                self.config, self.detector_context.estimated_frame_rate
+            ),
+        )
+
+        if recorder is not None:
+            if isinstance(recorder, a121.H5Recorder):
+                if _algo_group is None:
+                    _algo_group = recorder.require_algo_group("multi_sensor_presence_detector")
+                _record_multi_sensor_algo_data(
+                    _algo_group,
+                    self.sensor_ids,
+                    self.config,
+                    self.detector_context,
+                )
+            else:
+                # Should never happen as we currently only have the H5Recorder
+                warnings.warn("Will not save algo data")
+
+            self.client.attach_recorder(recorder)
+
+        self.client.start_session()
+
+        self.started = True
+
+    def get_next(self) -> Dict[int, DetectorResult]:
+        if not self.started:
+            msg = "Not started"
+            raise RuntimeError(msg)
+
+        results = self.client.get_next()
+        assert isinstance(results, list)
+
+        assert self.processor is not None
+        processor_results = self.processor.process(results)
+
+        return {
+            sensor_id: DetectorResult(
+                intra_presence_score=processor_result.intra_presence_score,
+                intra_depthwise_scores=processor_result.intra,
+                inter_presence_score=processor_result.inter_presence_score,
+                inter_depthwise_scores=processor_result.inter,
+                presence_distance=processor_result.presence_distance,
+                presence_detected=processor_result.presence_detected,
+                processor_extra_result=processor_result.extra_result,
+                service_result=results[0][sensor_id],
+            )
+            for sensor_id, processor_result in processor_results.items()
+        }
+
+    def update_config(self, config: DetectorConfig) -> None:
+        raise NotImplementedError
+
+    def stop_detector(self) -> Any:
+        if not self.started:
+            msg = "Already stopped"
+            raise RuntimeError(msg)
+
+        self.client.stop_session()
+        self.started = False
+
+        return None
+
+    def stop_recorder(self) -> Any:
+        recorder = self.client.detach_recorder()
+        if recorder is None:
+            recorder_result = None
+        else:
+            recorder_result = recorder.close()
+
+        return recorder_result
+
+    def stop(self) -> Any:
+        self.stop_detector()
+        recorder_result = self.stop_recorder()
+
+        return recorder_result
+
+
 def _record_algo_data(
     algo_group: h5py.Group,
     sensor_id: int,
@@ -471,6 +651,21 @@ def _record_algo_data(
     _create_h5_string_dataset(algo_group, "detector_context", context.to_json())
 
 
+def _record_multi_sensor_algo_data(
+    algo_group: h5py.Group,
+    sensor_ids: list[int],
+    config: DetectorConfig,
+    context: DetectorContext,
+) -> None:
+    algo_group.create_dataset(
+        "sensor_ids",
+        data=sensor_ids,
+        track_times=False,
+    )
+    _create_h5_string_dataset(algo_group, "detector_config", config.to_json())
+    _create_h5_string_dataset(algo_group, "detector_context", context.to_json())
+
+
 def _load_algo_data(
     algo_group: h5py.Group,
 ) -> Tuple[int, DetectorConfig, Optional[DetectorContext]]:
@@ -489,6 +684,20 @@ def _load_algo_data(
     return sensor_id, config, context
 
 
+def _load_multi_sensor_algo_data(
+    algo_group: h5py.Group,
+) -> Tuple[list[int], DetectorConfig, DetectorContext]:
+    sensor_ids = algo_group["sensor_ids"][()].tolist()
+    try:
+        config = detector_config_timeline.migrate(algo_group["detector_config"][()].decode())
+    except tm.core.MigrationErrorGroup as exc:
+        raise TypeError() from exc
+
+    context = DetectorContext.from_json(algo_group["detector_context"][()])
+
+    return sensor_ids, config, context
+
+
 @attrs.mutable(kw_only=True)
 class _DetectorConfig_v0(AlgoConfigBase):
     start_m: float = attrs.field(default=0.3)
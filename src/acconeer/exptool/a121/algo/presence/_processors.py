@@ -1,20 +1,24 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 
 import attrs
 import numpy as np
 import numpy.typing as npt
 from numpy import cos, pi, sqrt, square
-from scipy.special import binom
 
 from acconeer.exptool import a121
 from acconeer.exptool import type_migration as tm
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_isclose
-from acconeer.exptool.a121.algo import AlgoProcessorConfigBase, ProcessorBase
+from acconeer.exptool.a121.algo import (
+    AlgoProcessorConfigBase,
+    ExtendedProcessorBase,
+    ProcessorBase,
+    _scipy,
+)
 from acconeer.exptool.a121.algo._utils import get_distances_m
 
 
@@ -88,13 +92,18 @@ class ProcessorResult:
     extra_result: ProcessorExtraResult = attrs.field()
 
 
-class Processor(ProcessorBase[ProcessorResult]):
+class _BatchProcessor:
+    """Presence processing of frames from one or more sensors running the same sensor config
+
+    The frames of all sensors are processed as one batch, with the filter states kept in
+    arrays with one row per sensor.
+    """
+
     # lp(f): low pass (filtered)
     # cut: cutoff frequency [Hz]
     # tc: time constant [s]
     # sf: smoothing factor [dimensionless]
 
-    MAX_AMPLITUDE_WEIGHT = 5
     NOISE_ESTIMATION_DIFF_ORDER = 3
 
     def __init__(
@@ -103,34 +112,20 @@ class Processor(ProcessorBase[ProcessorResult]):
         sensor_config: a121.SensorConfig,
         metadata: a121.Metadata,
         processor_config: ProcessorConfig,
-        subsweep_indexes: Optional[list[int]] = None,
-        context: Optional[ProcessorContext] = None,
+        num_sensors: int,
+        context: ProcessorContext,
     ) -> None:
-        # Subsweep indexes contains a list of subsweep indexes for which to run the presence detector.
-        # If None is supplied, use all possible.
-        if subsweep_indexes is None:
-            subsweep_indexes = list(range(sensor_config.num_subsweeps))
-        self.subsweep_indexes = subsweep_indexes
-
-        if context is None:
-            context = ProcessorContext()
-
-        self.sensor_config = sensor_config
-        self.metadata = metadata
-        self.processor_config = processor_config
-
-        self.processor_config.validate(self.sensor_config)
-
         # Should never happen, checked in validate
-        assert self.sensor_config.frame_rate is not None
+        assert sensor_config.frame_rate is not None
 
-        self.sweeps_per_frame = self.sensor_config.sweeps_per_frame
-        self.distances = get_distances_m(self.sensor_config, metadata)
+        self.sweeps_per_frame = sensor_config.sweeps_per_frame
+        self.distances = get_distances_m(sensor_config, metadata)
         self.num_distances = self.distances.size
+        self.num_sensors = num_sensors
         if context.estimated_frame_rate is not None:
             self.f = context.estimated_frame_rate
         else:
-            self.f = self.sensor_config.frame_rate
+            self.f = sensor_config.frame_rate
 
         # Fixed parameters
         self.noise_est_diff_order = self.NOISE_ESTIMATION_DIFF_ORDER
@@ -139,20 +134,9 @@ class Processor(ProcessorBase[ProcessorResult]):
         self.noise_sf = self._tc_to_sf(noise_tc, self.f)
 
         nd = self.noise_est_diff_order
-        self.noise_norm_factor = np.sqrt(np.sum(np.square(binom(nd, np.arange(nd + 1)))))
-
-        self.fast_lp_mean_sweep = np.zeros(self.num_distances)
-        self.slow_lp_mean_sweep = np.zeros(self.num_distances)
-        self.lp_inter_dev = np.zeros(self.num_distances)
-        self.lp_intra_dev = np.zeros(self.num_distances)
-        self.lp_noise = np.zeros(self.num_distances)
+        self.noise_norm_factor = np.sqrt(np.sum(np.square(_scipy.binom(nd, np.arange(nd + 1)))))
 
-        self.intra_presence_score = 0
-        self.inter_presence_score = 0
-        self.presence_distance_index = 0
-        self.presence_distance = 0
-
-        self.update_index = 0
+        self.reset()
 
         self.intra_enable = processor_config.intra_enable
         self.intra_threshold = processor_config.intra_detection_threshold
@@ -169,9 +153,28 @@ class Processor(ProcessorBase[ProcessorResult]):
         self.intra_output_sf = self._tc_to_sf(processor_config.intra_output_time_const, self.f)
         self.inter_output_sf = self._tc_to_sf(processor_config.inter_output_time_const, self.f)
 
-        self.previous_presence_score = 0
-        self.negative_count = 0
-        self.inter_frame_presence_timeout = self.processor_config.inter_frame_presence_timeout
+        self.inter_frame_presence_timeout = processor_config.inter_frame_presence_timeout
+
+    def reset(self) -> None:
+        """Resets the filters to the state of a newly created processor"""
+
+        shape = (self.num_sensors, self.num_distances)
+
+        self.fast_lp_mean_sweep = np.zeros(shape)
+        self.slow_lp_mean_sweep = np.zeros(shape)
+        self.lp_inter_dev = np.zeros(shape)
+        self.lp_intra_dev = np.zeros(shape)
+        self.lp_noise = np.zeros(shape)
+
+        self.intra_presence_score = np.zeros(self.num_sensors)
+        self.inter_presence_score = np.zeros(self.num_sensors)
+        self.presence_distance_index = np.zeros(self.num_sensors, dtype=int)
+        self.presence_distance = np.zeros(self.num_sensors)
+
+        self.update_index = 0
+
+        self.previous_presence_score = np.zeros(self.num_sensors)
+        self.negative_count = np.zeros(self.num_sensors, dtype=int)
 
     @staticmethod
     def _cutoff_to_sf(fc: float, fs: float) -> float:
@@ -231,29 +234,28 @@ class Processor(ProcessorBase[ProcessorResult]):
             msg = "inter_frame_presence_timeout must be set"
             raise ValueError(msg)
 
-        scaling_factor = np.exp(
-            np.maximum(self.negative_count - self.inter_frame_presence_timeout * self.f, 0)
-            / (self.inter_frame_presence_timeout * self.f)
-        )
-        self.inter_presence_score /= scaling_factor
+        timeout = self.inter_frame_presence_timeout * self.f
+        scaling_factor = np.exp(np.maximum(self.negative_count - timeout, 0) / timeout)
+        self.inter_presence_score = self.inter_presence_score / scaling_factor
 
-    def process(self, result: a121.Result) -> ProcessorResult:
-        range_subframes = [result.subframes[i] for i in self.subsweep_indexes]
-        frame = np.concatenate(range_subframes, axis=1)
+    def process(self, frames: npt.NDArray[np.complex128]) -> list[ProcessorResult]:
+        """Processes a frame from every sensor, stacked along the first axis"""
+
+        sensors = np.arange(self.num_sensors)
 
         # Noise estimation
 
         nd = self.noise_est_diff_order
 
-        noise_diff = np.diff(frame, n=nd, axis=0)
-        noise = self._abs_dev(noise_diff, axis=0, subtract_mean=False)
+        noise_diff = np.diff(frames, n=nd, axis=1)
+        noise = self._abs_dev(noise_diff, axis=1, subtract_mean=False)
         noise /= self.noise_norm_factor
         sf = self._dynamic_sf(self.noise_sf, self.update_index)
         self.lp_noise = sf * self.lp_noise + (1.0 - sf) * noise
 
         # Intra-frame part
 
-        sweep_dev = self._abs_dev(frame, axis=0, ddof=1)
+        sweep_dev = self._abs_dev(frames, axis=1, ddof=1)
 
         sf = self._dynamic_sf(self.intra_sf, self.update_index)
         self.lp_intra_dev = sf * self.lp_intra_dev + (1.0 - sf) * sweep_dev
@@ -261,21 +263,20 @@ class Processor(ProcessorBase[ProcessorResult]):
         intra = np.divide(
             self.lp_intra_dev,
             self.lp_noise,
-            out=np.zeros(self.num_distances),
+            out=np.zeros_like(self.lp_intra_dev),
             where=(self.lp_noise > 1.0),
         )
 
-        intra_presence_distance_index = int(np.argmax(intra))
-        intra_presence_distance = self.distances[intra_presence_distance_index]
+        intra_presence_distance_index = np.argmax(intra, axis=1)
 
         self.intra_presence_score = (
             self.intra_output_sf * self.intra_presence_score
-            + (1.0 - self.intra_output_sf) * intra[intra_presence_distance_index]
+            + (1.0 - self.intra_output_sf) * intra[sensors, intra_presence_distance_index]
         )
 
         # Inter-frame part
 
-        mean_sweep = frame.mean(axis=0)
+        mean_sweep = frames.mean(axis=1)
         abs_mean_sweep = np.abs(mean_sweep)
 
         sf = self._dynamic_sf(self.fast_sf, self.update_index)
@@ -297,23 +298,19 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         inter *= np.sqrt(self.sweeps_per_frame)
 
-        inter_presence_distance_index = int(np.argmax(inter))
-        inter_presence_distance = self.distances[inter_presence_distance_index]
+        inter_presence_distance_index = np.argmax(inter, axis=1)
 
         sf = self._dynamic_sf(self.inter_output_sf, self.update_index)
         self.inter_presence_score = (
-            sf * self.inter_presence_score + (1.0 - sf) * inter[inter_presence_distance_index]
+            sf * self.inter_presence_score
+            + (1.0 - sf) * inter[sensors, inter_presence_distance_index]
         )
 
         # Inter-frame presence timeout
 
         if self.inter_frame_presence_timeout:
             delta = self.inter_presence_score - self.previous_presence_score
-
-            if delta < 0:
-                self.negative_count += 1
-            else:
-                self.negative_count = 0
+            self.negative_count = np.where(delta < 0, self.negative_count + 1, 0)
 
             self._inter_presence_score_scaling()
 
@@ -321,39 +318,159 @@ class Processor(ProcessorBase[ProcessorResult]):
 
         # Presence distance - intra presence distance is prioritized due to faster reaction time
 
-        if self.intra_presence_score > self.intra_threshold and self.intra_enable:
-            presence_detected = True
-            self.presence_distance_index = intra_presence_distance_index
-            self.presence_distance = intra_presence_distance
-        elif self.inter_presence_score > self.inter_threshold and self.inter_enable:
-            presence_detected = True
-            self.presence_distance_index = inter_presence_distance_index
-            self.presence_distance = inter_presence_distance
-        else:
-            presence_detected = False
-            self.presence_distance = 0
+        intra_detected = (self.intra_presence_score > self.intra_threshold) & self.intra_enable
+        inter_detected = (
+            ~intra_detected
+            & (self.inter_presence_score > self.inter_threshold)
+            & self.inter_enable
+        )
+        presence_detected = intra_detected | inter_detected
+
+        self.presence_distance_index = np.where(
+            intra_detected,
+            intra_presence_distance_index,
+            np.where(inter_detected, inter_presence_distance_index, self.presence_distance_index),
+        )
+        self.presence_distance = np.where(
+            presence_detected, self.distances[self.presence_distance_index], 0.0
+        )
 
         self.update_index += 1
 
-        extra_result = ProcessorExtraResult(
-            frame=frame,
-            abs_mean_sweep=abs_mean_sweep,
-            fast_lp_mean_sweep=self.fast_lp_mean_sweep,
-            slow_lp_mean_sweep=self.slow_lp_mean_sweep,
-            lp_noise=self.lp_noise,
-            presence_distance_index=self.presence_distance_index,
+        return [
+            ProcessorResult(
+                intra_presence_score=float(self.intra_presence_score[i]),
+                intra=intra[i],
+                inter_presence_score=float(self.inter_presence_score[i]),
+                inter=inter[i],
+                presence_detected=bool(presence_detected[i]),
+                presence_distance=float(self.presence_distance[i]),
+                extra_result=ProcessorExtraResult(
+                    frame=frames[i],
+                    abs_mean_sweep=abs_mean_sweep[i],
+                    fast_lp_mean_sweep=self.fast_lp_mean_sweep[i],
+                    slow_lp_mean_sweep=self.slow_lp_mean_sweep[i],
+                    lp_noise=self.lp_noise[i],
+                    presence_distance_index=int(self.presence_distance_index[i]),
+                ),
+            )
+            for i in range(self.num_sensors)
+        ]
+
+
+class Processor(ProcessorBase[ProcessorResult]):
+    MAX_AMPLITUDE_WEIGHT = 5
+    NOISE_ESTIMATION_DIFF_ORDER = _BatchProcessor.NOISE_ESTIMATION_DIFF_ORDER
+
+    def __init__(
+        self,
+        *,
+        sensor_config: a121.SensorConfig,
+        metadata: a121.Metadata,
+        processor_config: ProcessorConfig,
+        subsweep_indexes: Optional[list[int]] = None,
+        context: Optional[ProcessorContext] = None,
+    ) -> None:
+        # Subsweep indexes contains a list of subsweep indexes for which to run the presence detector.
+        # If None is supplied, use all possible.
+        if subsweep_indexes is None:
+            subsweep_indexes = list(range(sensor_config.num_subsweeps))
+        self.subsweep_indexes = subsweep_indexes
+
+        if context is None:
+            context = ProcessorContext()
+
+        self.sensor_config = sensor_config
+        self.metadata = metadata
+        self.processor_config = processor_config
+
+        self.processor_config.validate(self.sensor_config)
+
+        self._batch_processor = _BatchProcessor(
+            sensor_config=sensor_config,
+            metadata=metadata,
+            processor_config=processor_config,
+            num_sensors=1,
+            context=context,
+        )
+
+    def reset(self) -> None:
+        """Resets the filters to the state of a newly created processor"""
+
+        self._batch_processor.reset()
+
+    def process(self, result: a121.Result) -> ProcessorResult:
+        range_subframes = [result.subframes[i] for i in self.subsweep_indexes]
+        frame = np.concatenate(range_subframes, axis=1)
+
+        (processor_result,) = self._batch_processor.process(frame[np.newaxis])
+        return processor_result
+
+
+class MultiSensorProcessor(ExtendedProcessorBase[Dict[int, ProcessorResult]]):
+    """Presence processor for several sensors running the same sensor config
+
+    The sensors are expected to be in the first group of the session. Their frames are
+    stacked and processed as one batch, with the filter states of all sensors kept in
+    arrays with one row per sensor. The result of each sensor is the same as that of a
+    :class:`Processor` for that sensor alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_config: a121.SessionConfig,
+        metadata: list[dict[int, a121.Metadata]],
+        processor_config: ProcessorConfig,
+        subsweep_indexes: Optional[list[int]] = None,
+        context: Optional[ProcessorContext] = None,
+    ) -> None:
+        group = session_config.groups[0]
+        self.sensor_ids = list(group.keys())
+        sensor_config = group[self.sensor_ids[0]]
+
+        if any(config != sensor_config for config in group.values()):
+            msg = "All sensors need to have the same sensor config"
+            raise ValueError(msg)
+
+        if subsweep_indexes is None:
+            subsweep_indexes = list(range(sensor_config.num_subsweeps))
+        self.subsweep_indexes = subsweep_indexes
+
+        if context is None:
+            context = ProcessorContext()
+
+        self.sensor_config = sensor_config
+        self.processor_config = processor_config
+
+        self.processor_config.validate(self.sensor_config)
+
+        self._batch_processor = _BatchProcessor(
+            sensor_config=sensor_config,
+            metadata=metadata[0][self.sensor_ids[0]],
+            processor_config=processor_config,
+            num_sensors=len(self.sensor_ids),
+            context=context,
         )
 
-        return ProcessorResult(
-            intra_presence_score=self.intra_presence_score,
-            intra=intra,
-            inter_presence_score=self.inter_presence_score,
-            inter=inter,
-            presence_detected=presence_detected,
-            presence_distance=self.presence_distance,
-            extra_result=extra_result,
+    def reset(self) -> None:
+        """Resets the filters to the state of a newly created processor"""
+
+        self._batch_processor.reset()
+
+    def process(self, results: list[dict[int, a121.Result]]) -> Dict[int, ProcessorResult]:
+        group = results[0]
+        frames = np.stack(
+            [
+                np.concatenate(
+                    [group[sensor_id].subframes[i] for i in self.subsweep_indexes], axis=1
+                )
+                for sensor_id in self.sensor_ids
+            ]
         )
 
+        return dict(zip(self.sensor_ids, self._batch_processor.process(frames)))
+
 
 @attrs.mutable(kw_only=True)
 class _ProcessorConfig_v0(AlgoProcessorConfigBase):
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 from __future__ import annotations
 
@@ -64,11 +64,17 @@ class Processor:
 
         self.inter_enable = detector_config.inter_enable
         self.inter_threshold = detector_config.inter_detection_threshold
-        self.inter_zones = np.zeros(self.num_zones, dtype=int)
-        self.max_inter_zone = None
 
         self.intra_enable = detector_config.intra_enable
         self.intra_threshold = detector_config.intra_detection_threshold
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Resets the zone detections to the state of a newly created processor"""
+
+        self.inter_zones = np.zeros(self.num_zones, dtype=int)
+        self.max_inter_zone = None
         self.intra_zones = np.zeros(self.num_zones, dtype=int)
         self.max_intra_zone = None
 
@@ -1,12 +1,13 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import copy
+import time
 import warnings
 from enum import Enum
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import attrs
 import h5py
@@ -27,6 +28,7 @@ from acconeer.exptool.a121.algo.presence._detector import (
     Detector,
     DetectorConfig,
     DetectorContext,
+    DetectorMetadata,
     DetectorResult,
 )
 
@@ -176,6 +178,9 @@ class RefAppResult:
 
     service_result: a121.Result = attrs.field()
 
+    swap_duration: Optional[float] = attrs.field(default=None)
+    """Time in seconds spent swapping configuration after this frame, None if not swapped."""
+
 
 class _Mode(Enum):
     WAKE_UP_CONFIG = 0
@@ -224,8 +229,6 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             {self.sensor_id: sensor_config},
             extended=False,
         )
-        detector_config: DetectorConfig
-
         if self.ref_app_context.nominal_detector_context is None:
             self.nominal_detector_context = DetectorContext(
                 estimated_frame_rate=estimate_frame_rate(self.client, session_config)
@@ -286,14 +289,8 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
                 num_zones=self.config.wake_up_config.num_zones
             )
 
-            detector_config = self.wake_up_detector_config
-            detector_context = self.wake_up_detector_context
-            processor_config = self.wake_up_processor_config
         else:
             self._mode = _Mode.NOMINAL_CONFIG
-            detector_config = self.nominal_detector_config
-            detector_context = self.nominal_detector_context
-            processor_config = self.nominal_processor_config
 
         if recorder is not None:
             if isinstance(recorder, a121.H5Recorder):
@@ -308,22 +305,35 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
                 # Should never happen as we currently only have the H5Recorder
                 warnings.warn("Will not save algo data")
 
-        self.detector = Detector(
-            client=self.client,
-            sensor_id=self.sensor_id,
-            detector_config=detector_config,
-            detector_context=detector_context,
-        )
+        # The swap targets are prepared here, leaving only the session setup and start to
+        # the swap itself
+        self._detectors = {
+            _Mode.NOMINAL_CONFIG: Detector(
+                client=self.client,
+                sensor_id=self.sensor_id,
+                detector_config=self.nominal_detector_config,
+                detector_context=self.nominal_detector_context,
+            )
+        }
+        self._processor_configs = {_Mode.NOMINAL_CONFIG: self.nominal_processor_config}
+
+        if self.config.wake_up_mode:
+            self._detectors[_Mode.WAKE_UP_CONFIG] = Detector(
+                client=self.client,
+                sensor_id=self.sensor_id,
+                detector_config=self.wake_up_detector_config,
+                detector_context=self.wake_up_detector_context,
+            )
+            self._processor_configs[_Mode.WAKE_UP_CONFIG] = self.wake_up_processor_config
+
+        for detector in self._detectors.values():
+            detector.prepare()
+
+        self._ref_app_processors: Dict[_Mode, Tuple[DetectorMetadata, Processor]] = {}
+
+        self.detector = self._detectors[self._mode]
         self.detector.start(recorder=recorder, _algo_group=algo_group)
-        assert self.detector.detector_metadata is not None
-        session_config = self.detector.session_config
-
-        self.ref_app_processor = Processor(
-            processor_config,
-            detector_config,
-            session_config,
-            self.detector.detector_metadata,
-        )
+        self.ref_app_processor = self._get_ref_app_processor(self._mode)
 
         self.max_switch_delay_n = (
             np.maximum(
@@ -350,8 +360,9 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
         processor_result = self.ref_app_processor.process(result)
 
         used_config = self._mode
+        swap_duration = None
         if self.config.wake_up_mode:
-            self.determine_swapping(result, processor_result)
+            swap_duration = self.determine_swapping(result, processor_result)
 
         return RefAppResult(
             zone_limits=processor_result.zone_limits,
@@ -368,11 +379,15 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             wake_up_detections=copy.deepcopy(self.wake_up_detections),
             switch_delay=self.delay_count > 0,
             service_result=result.service_result,
+            swap_duration=swap_duration,
         )
 
     def determine_swapping(
         self, result: DetectorResult, processor_result: ProcessorResult
-    ) -> None:
+    ) -> Optional[float]:
+        """Swaps configuration if needed and returns the time spent swapping, if swapped"""
+        swap_duration = None
+
         if self.delay_count == 0:
             if self._mode == _Mode.WAKE_UP_CONFIG and result.presence_detected:
                 assert self.config.wake_up_config is not None
@@ -387,20 +402,10 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
                         self.wake_up_detections[i] -= 1
 
                 if num_detections >= self.config.wake_up_config.num_zones_for_wake_up:
-                    self.swap_config(
-                        self.nominal_detector_config,
-                        self.nominal_processor_config,
-                        self.nominal_detector_context,
-                    )
-                    self._mode = _Mode.NOMINAL_CONFIG
+                    swap_duration = self.swap_config(_Mode.NOMINAL_CONFIG)
                     self.delay_count += 1
             elif self._mode == _Mode.NOMINAL_CONFIG and not result.presence_detected:
-                self.swap_config(
-                    self.wake_up_detector_config,
-                    self.wake_up_processor_config,
-                    self.wake_up_detector_context,
-                )
-                self._mode = _Mode.WAKE_UP_CONFIG
+                swap_duration = self.swap_config(_Mode.WAKE_UP_CONFIG)
         else:
             if self.delay_count == 1:
                 assert self.wake_up_detections is not None
@@ -410,30 +415,46 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             if self.delay_count >= self.max_switch_delay_n + 1 or result.presence_detected:
                 self.delay_count = 0
 
-    def swap_config(
-        self,
-        detector_config: DetectorConfig,
-        processor_config: ProcessorConfig,
-        detector_context: DetectorContext,
-    ) -> None:
-        self.detector.stop_detector()
+        return swap_duration
 
-        self.detector = Detector(
-            client=self.client,
-            sensor_id=self.sensor_id,
-            detector_config=detector_config,
-            detector_context=detector_context,
-        )
+    def swap_config(self, mode: _Mode) -> float:
+        """Swaps to the prepared detector and processor of ``mode``
+
+        The wake up detections and switch delay of the ref app are kept. The detector and
+        processors start over, as after a restart.
 
+        :return: The time in seconds spent swapping
+        """
+        swap_start = time.perf_counter()
+
+        self.detector.stop_detector()
+        self.detector = self._detectors[mode]
         self.detector.start(recorder=None, _algo_group=None)
-        assert self.detector.detector_metadata is not None
+        self.ref_app_processor = self._get_ref_app_processor(mode)
+        self._mode = mode
+
+        return time.perf_counter() - swap_start
 
-        session_config = self.detector.session_config
-        processor_config = ProcessorConfig(num_zones=processor_config.num_zones)
+    def _get_ref_app_processor(self, mode: _Mode) -> Processor:
+        detector = self._detectors[mode]
+        assert detector.detector_metadata is not None
 
-        self.ref_app_processor = Processor(
-            processor_config, detector_config, session_config, self.detector.detector_metadata
+        if mode in self._ref_app_processors:
+            detector_metadata, processor = self._ref_app_processors[mode]
+
+            if detector_metadata is detector.detector_metadata:
+                processor.reset()
+                return processor
+
+        processor = Processor(
+            self._processor_configs[mode],
+            detector.config,
+            detector.session_config,
+            detector.detector_metadata,
         )
+        self._ref_app_processors[mode] = (detector.detector_metadata, processor)
+
+        return processor
 
     def update_config(self, config: RefAppConfig) -> None:
         raise NotImplementedError
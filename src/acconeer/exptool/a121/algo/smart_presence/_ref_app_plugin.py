@@ -1,14 +1,11 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Callable, List, Mapping, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
-import attrs
-import h5py
 import numpy as np
 import numpy.typing as npt
 
@@ -18,11 +15,8 @@ from PySide6.QtWidgets import QPushButton, QVBoxLayout
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo.presence._detector import Detector
@@ -30,8 +24,6 @@ from acconeer.exptool.a121.algo.presence._detector_plugin import ViewPlugin as P
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
     Message,
     MiscErrorView,
@@ -43,7 +35,6 @@ from acconeer.exptool.app.new import (
     PluginSpecBase,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
@@ -52,21 +43,17 @@ from acconeer.exptool.app.new.ui.components.a121 import (
     SensorConfigEditor,
 )
 
-from ._configs import (
-    get_ceiling_config,
-    get_long_range_config,
-    get_low_power_config,
-    get_medium_range_config,
-    get_short_range_config,
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
 )
 from ._ref_app import (
     PresenceWakeUpConfig,
     PresenceZoneConfig,
-    RefApp,
     RefAppConfig,
-    RefAppContext,
     RefAppResult,
-    _load_algo_data,
     _Mode,
 )
 
@@ -74,152 +61,6 @@ from ._ref_app import (
 log = logging.getLogger(__name__)
 
 
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: RefAppConfig = attrs.field(factory=get_medium_range_config)
-    ref_app_context: Optional[RefAppContext] = attrs.field(default=None)
-
-
-class PluginPresetId(Enum):
-    SHORT_RANGE = auto()
-    MEDIUM_RANGE = auto()
-    LONG_RANGE = auto()
-    CEILING = auto()
-    LOW_POWER = auto()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    ref_app_config: RefAppConfig
-    estimated_frame_rate: float
-    nominal_zone_limits: npt.NDArray[np.float64]
-    wake_up_zone_limits: npt.NDArray[np.float64]
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], RefAppConfig]] = {
-        PluginPresetId.SHORT_RANGE.value: lambda: get_short_range_config(),
-        PluginPresetId.MEDIUM_RANGE.value: lambda: get_medium_range_config(),
-        PluginPresetId.LONG_RANGE.value: lambda: get_long_range_config(),
-        PluginPresetId.CEILING.value: lambda: get_ceiling_config(),
-        PluginPresetId.LOW_POWER.value: lambda: get_low_power_config(),
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._recorder: Optional[a121.H5Recorder] = None
-        self._ref_app_instance: Optional[RefApp] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = RefAppConfig.from_json(file["config"][()])
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: RefAppConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    @is_task
-    def update_nominal_config(self, *, config: PresenceZoneConfig) -> None:
-        self.shared_state.config.nominal_config = config
-        self.broadcast()
-
-    @is_task
-    def update_wake_up_config(self, *, config: PresenceWakeUpConfig) -> None:
-        self.shared_state.config.wake_up_config = config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        _, config, ref_app_context = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.ref_app_context = ref_app_context
-        self.shared_state.sensor_id = record.session(0).sensor_id
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._ref_app_instance = RefApp(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            ref_app_config=self.shared_state.config,
-            ref_app_context=self.shared_state.ref_app_context,
-        )
-
-        self._ref_app_instance.start(recorder)
-
-        nominal_sensor_config = Detector._get_sensor_config(
-            self._ref_app_instance.nominal_detector_config
-        )
-        distances = np.linspace(
-            self.shared_state.config.nominal_config.start_m,
-            self.shared_state.config.nominal_config.end_m,
-            sum([subsweep.num_points for subsweep in nominal_sensor_config.subsweeps]),
-        )
-        nominal_zone_limits = self._ref_app_instance.ref_app_processor.create_zones(
-            distances, self.shared_state.config.nominal_config.num_zones
-        )
-
-        # self._ref_app_instance.ref_app_processor.zone_limits will always be for
-        # wake_up_config if wake_up_mode is enabled
-        self.callback(
-            SetupMessage(
-                ref_app_config=self.shared_state.config,
-                estimated_frame_rate=self._ref_app_instance.detector.estimated_frame_rate,
-                nominal_zone_limits=nominal_zone_limits,
-                wake_up_zone_limits=self._ref_app_instance.ref_app_processor.zone_limits,
-            )
-        )
-
-    def end_session(self) -> None:
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        if self._recorder is not None:
-            self._recorder.close()
-        self._ref_app_instance.stop()
-
-    def get_next(self) -> None:
-        assert self.client
-        if self._ref_app_instance is None:
-            raise RuntimeError
-        result = self._ref_app_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
-
 class PlotPlugin(PgPlotPlugin):
     def __init__(self, app_model: AppModel) -> None:
         super().__init__(app_model=app_model)
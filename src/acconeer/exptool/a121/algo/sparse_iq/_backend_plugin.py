@@ -0,0 +1,53 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import logging
+from enum import Enum, auto
+from typing import Type
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo._plugins import (
+    ExtendedProcessorBackendPluginBase,
+    ProcessorBackendPluginSharedState,
+    ProcessorPluginPreset,
+)
+
+from ._processor import (
+    Processor,
+    ProcessorConfig,
+    ProcessorResult,
+    get_sensor_config,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class PluginPresetId(Enum):
+    DEFAULT = auto()
+
+
+class BackendPlugin(ExtendedProcessorBackendPluginBase[ProcessorConfig, ProcessorResult]):
+    PLUGIN_PRESETS = {
+        PluginPresetId.DEFAULT.value: lambda: ProcessorPluginPreset(
+            session_config=a121.SessionConfig(get_sensor_config()),
+            processor_config=BackendPlugin.get_processor_config_cls()(),
+        ),
+    }
+
+    @classmethod
+    def get_processor(cls, state: ProcessorBackendPluginSharedState[ProcessorConfig]) -> Processor:
+        return Processor(
+            session_config=state.session_config,
+            processor_config=state.processor_config,
+        )
+
+    @classmethod
+    def get_processor_config_cls(cls) -> Type[ProcessorConfig]:
+        return ProcessorConfig
+
+    @classmethod
+    def get_default_sensor_config(cls) -> a121.SensorConfig:
+        return get_sensor_config()
@@ -1,11 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import itertools
 import logging
-from enum import Enum, auto
 from typing import Callable, Dict, List, Optional, Type, TypeVar
 
 import numpy as np
@@ -24,9 +23,6 @@ from acconeer.exptool import a121
 from acconeer.exptool.a121 import algo
 from acconeer.exptool.a121._core import utils as core_utils
 from acconeer.exptool.a121.algo._plugins import (
-    ExtendedProcessorBackendPluginBase,
-    ProcessorBackendPluginSharedState,
-    ProcessorPluginPreset,
     ProcessorPluginSpec,
     ProcessorViewPluginBase,
     SetupMessage,
@@ -44,12 +40,14 @@ from acconeer.exptool.app.new import (
 )
 from acconeer.exptool.app.new.ui.components import GotoResourceTabButton, TabPGWidget
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+)
 from ._processor import (
     AmplitudeMethod,
-    Processor,
     ProcessorConfig,
     ProcessorResult,
-    get_sensor_config,
 )
 
 
@@ -59,37 +57,9 @@ log = logging.getLogger(__name__)
 _T = TypeVar("_T")
 
 
-class PluginPresetId(Enum):
-    DEFAULT = auto()
-
-
 SEMI_TRANSPARENT_BRUSH = pg.mkBrush(color=(0xFF, 0xFF, 0xFF, int(0.8 * 0xFF)))
 
 
-class BackendPlugin(ExtendedProcessorBackendPluginBase[ProcessorConfig, ProcessorResult]):
-    PLUGIN_PRESETS = {
-        PluginPresetId.DEFAULT.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_sensor_config()),
-            processor_config=BackendPlugin.get_processor_config_cls()(),
-        ),
-    }
-
-    @classmethod
-    def get_processor(cls, state: ProcessorBackendPluginSharedState[ProcessorConfig]) -> Processor:
-        return Processor(
-            session_config=state.session_config,
-            processor_config=state.processor_config,
-        )
-
-    @classmethod
-    def get_processor_config_cls(cls) -> Type[ProcessorConfig]:
-        return ProcessorConfig
-
-    @classmethod
-    def get_default_sensor_config(cls) -> a121.SensorConfig:
-        return get_sensor_config()
-
-
 class ViewPlugin(ProcessorViewPluginBase[ProcessorConfig]):
     def __init__(self, app_model: AppModel) -> None:
         super().__init__(app_model=app_model)
@@ -0,0 +1,156 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import logging
+from enum import Enum, auto
+from typing import Callable, Mapping, Optional
+
+import attrs
+import h5py
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
+from acconeer.exptool.a121.algo._plugins import (
+    A121BackendPluginBase,
+)
+from acconeer.exptool.a121.algo._utils import estimate_frame_rate
+from acconeer.exptool.app.new import (
+    BackendLogger,
+    GeneralMessage,
+    Message,
+    PluginGeneration,
+    backend,
+    is_task,
+)
+
+from ._configs import get_default_config, get_traffic_config
+from ._detector import (
+    Detector,
+    DetectorConfig,
+    DetectorMetadata,
+    _load_algo_data,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+@attrs.mutable(kw_only=True)
+class SharedState:
+    sensor_id: int = attrs.field(default=1)
+    config: DetectorConfig = attrs.field(factory=DetectorConfig)
+
+
+class PluginPresetId(Enum):
+    DEFAULT = auto()
+    TRAFFIC = auto()
+
+
+@attrs.frozen(kw_only=True)
+class SetupMessage(GeneralMessage):
+    detector_config: DetectorConfig
+    detector_metadata: DetectorMetadata
+    estimated_frame_rate: float
+    name: str = attrs.field(default="setup", init=False)
+    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
+
+
+class BackendPlugin(A121BackendPluginBase[SharedState]):
+    PLUGIN_PRESETS: Mapping[int, Callable[[], DetectorConfig]] = {
+        PluginPresetId.DEFAULT.value: lambda: get_default_config(),
+        PluginPresetId.TRAFFIC.value: lambda: get_traffic_config(),
+    }
+
+    def __init__(
+        self,
+        callback: Callable[[Message], None],
+        generation: PluginGeneration,
+        key: str,
+    ) -> None:
+        super().__init__(callback=callback, generation=generation, key=key)
+
+        self._recorder: Optional[a121.H5Recorder] = None
+        self._detector_instance: Optional[Detector] = None
+        self._log = BackendLogger.getLogger(__name__)
+
+        self.restore_defaults()
+
+    def _load_from_cache(self, file: h5py.File) -> None:
+        self.shared_state.config = DetectorConfig.from_json(file["config"][()])
+
+    @is_task
+    def restore_defaults(self) -> None:
+        self.shared_state = SharedState()
+        self.broadcast()
+
+    @is_task
+    def update_sensor_id(self, *, sensor_id: int) -> None:
+        self.shared_state.sensor_id = sensor_id
+        self.broadcast()
+
+    def _sync_sensor_ids(self) -> None:
+        if self.client is not None:
+            sensor_ids = self.client.server_info.connected_sensors
+
+            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
+                self.shared_state.sensor_id = sensor_ids[0]
+
+    @is_task
+    def update_config(self, *, config: DetectorConfig) -> None:
+        self.shared_state.config = config
+        self.broadcast()
+
+    def save_to_cache(self, file: h5py.File) -> None:
+        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
+
+    @is_task
+    def set_preset(self, preset_id: int) -> None:
+        preset_config = self.PLUGIN_PRESETS[preset_id]
+        self.shared_state.config = preset_config()
+        self.broadcast()
+
+    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
+        algo_group = record.get_algo_group(self.key)
+        _, config = _load_algo_data(algo_group)
+        self.shared_state.config = config
+        self.shared_state.sensor_id = record.sensor_id
+
+    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
+        assert self.client
+        self._detector_instance = Detector(
+            client=self.client,
+            sensor_id=self.shared_state.sensor_id,
+            detector_config=self.shared_state.config,
+        )
+        sensor_config = self._detector_instance._get_sensor_config(self._detector_instance.config)
+        session_config = a121.SessionConfig(
+            {self.shared_state.sensor_id: sensor_config},
+            extended=False,
+        )
+
+        estimated_frame_rate = estimate_frame_rate(self.client, session_config)
+
+        self._detector_instance.start(recorder)
+        assert self._detector_instance.detector_metadata is not None
+        self.callback(
+            SetupMessage(
+                detector_config=self.shared_state.config,
+                detector_metadata=self._detector_instance.detector_metadata,
+                estimated_frame_rate=estimated_frame_rate,
+            )
+        )
+
+    def end_session(self) -> None:
+        if self._detector_instance is None:
+            raise RuntimeError
+        self._detector_instance.stop()
+
+    def get_next(self) -> None:
+        assert self.client
+        if self._detector_instance is None:
+            raise RuntimeError
+        result = self._detector_instance.get_next()
+
+        self.callback(backend.PlotMessage(result=result))
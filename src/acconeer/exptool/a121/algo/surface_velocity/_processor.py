@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -15,6 +15,7 @@ from acconeer.exptool import a121
 from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_isclose
 from acconeer.exptool.a121.algo import (
     AlgoProcessorConfigBase,
+    Cfar,
     ProcessorBase,
     double_buffering_frame_filter,
 )
@@ -167,6 +168,7 @@ class Processor(ProcessorBase[ProcessorResult]):
         # cfar
         self.cfar_guard_length = processor_config.cfar_guard
         self.cfar_win_length = processor_config.cfar_win
+        self.cfar = Cfar(self.cfar_win_length, self.cfar_guard_length)
 
         if not processor_config.cfar_sensitivity > 0:
             msg = "cfar_sensitivity must be > 0"
@@ -219,17 +221,11 @@ class Processor(ProcessorBase[ProcessorResult]):
         return np.argmax(max_amps, axis=0)  # type: ignore[no-any-return]
 
     def get_cfar_threshold(self, psd: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
-        window_length = self.cfar_win_length
-        guard_length = self.cfar_guard_length
-        margin = window_length + guard_length
-        half_sweep_len_without_margin = int(np.around(psd.shape[0] / 2 - margin))
+        margin = self.cfar.margin
         min_psd = np.min(psd)
 
         # One-sided CFAR
-        threshold_cfar = np.full(psd.shape, np.nan)
-        filt_psd = np.convolve(psd, np.ones(window_length), "valid") / window_length
-        threshold_cfar[margin : self.middle_idx] = filt_psd[:half_sweep_len_without_margin]
-        threshold_cfar[self.middle_idx : -margin] = filt_psd[-half_sweep_len_without_margin:]
+        threshold_cfar = self.cfar.one_sided(psd, self.middle_idx)
 
         threshold_cfar[:margin] = threshold_cfar[margin]
         threshold_cfar[-margin:] = threshold_cfar[-margin - 1]
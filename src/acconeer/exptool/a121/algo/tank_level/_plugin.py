@@ -4,13 +4,8 @@
 from __future__ import annotations
 
 import logging
-import math
-import time
-from enum import Enum, auto
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Callable, Optional
 
-import attrs
-import h5py
 import numpy as np
 
 from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
@@ -18,46 +13,29 @@ from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 import pyqtgraph as pg
 
 import acconeer.exptool as et
-from acconeer.exptool import a121, opser
+from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo.distance._detector import DetailedStatus, Detector
 from acconeer.exptool.a121.algo.distance._detector_plugin import ViewPlugin as DistanceViewPlugin
-from acconeer.exptool.a121.algo.tank_level._configs import (
-    get_large_config,
-    get_medium_config,
-    get_small_config,
-)
 from acconeer.exptool.a121.algo.tank_level._processor import ProcessorLevelStatus
 from acconeer.exptool.a121.algo.tank_level._ref_app import (
-    RefApp,
     RefAppConfig,
-    RefAppContext,
     RefAppResult,
-    _load_algo_data,
-    ref_app_context_timeline,
 )
 from acconeer.exptool.app.new import (
     AppModel,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
-    HandledException,
     Message,
     PgPlotPlugin,
     PluginFamily,
     PluginGeneration,
     PluginPresetBase,
     PluginSpecBase,
-    PluginState,
-    PluginStateMessage,
     backend,
     icons,
-    is_task,
     visual_policies,
 )
 from acconeer.exptool.app.new.ui.components import (
@@ -72,252 +50,19 @@ from acconeer.exptool.app.new.ui.components.pidgets.hooks import (
     parameter_is,
 )
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
+)
+
 
 log = logging.getLogger(__name__)
 
 
 NO_DETECTION_TIMEOUT = 50
 TIME_HISTORY_S = 30
-UPDATE_RATE_EXP_FILTER = 0.1
-
-
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: RefAppConfig = attrs.field(factory=RefAppConfig)
-    context: RefAppContext = attrs.field(factory=RefAppContext)
-
-
-class PluginPresetId(Enum):
-    SMALL = auto()
-    MEDIUM = auto()
-    LARGE = auto()
-
-
-@attrs.mutable(kw_only=True)
-class TankLevelPreset:
-    config: RefAppConfig = attrs.field()
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    config: RefAppConfig
-    num_curves: int
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, TankLevelPreset] = {
-        PluginPresetId.SMALL.value: TankLevelPreset(
-            config=get_small_config(),
-        ),
-        PluginPresetId.MEDIUM.value: TankLevelPreset(
-            config=get_medium_config(),
-        ),
-        PluginPresetId.LARGE.value: TankLevelPreset(
-            config=get_large_config(),
-        ),
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key, use_app_client=False)
-
-        self._recorder = None
-        self._ref_app_instance: Optional[RefApp] = None
-        self._log = BackendLogger.getLogger(__name__)
-        self._last_get_next_time_s: Optional[float] = None
-        self._actual_update_rate_hz = 0.0
-        self._frame_count = 0
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = RefAppConfig.from_json(file["config"][()])
-        self.shared_state.context = ref_app_context_timeline.migrate(file["context"])
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState(config=get_small_config())
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: RefAppConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config.config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-        context_group = file.create_group("context")
-        opser.serialize(self.shared_state.context, context_group)
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        algo_group = record.get_algo_group(self.key)
-        sensor_id, config, context = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.context = context
-        self.shared_state.sensor_id = sensor_id
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-
-        self._ref_app_instance = RefApp(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            config=self.shared_state.config,
-            context=self.shared_state.context,
-        )
-
-        self._ref_app_instance.start(recorder)
-
-        self.callback(
-            SetupMessage(
-                config=self.shared_state.config,
-                num_curves=len(self._ref_app_instance._detector.processor_specs),
-            )
-        )
-
-    def end_session(self) -> None:
-        if self._ref_app_instance is None:
-            raise RuntimeError
-
-        if self._recorder is not None:
-            self._recorder.close()
-
-        self._ref_app_instance.stop()
-
-        self._clear_rate_stats()
-
-    def get_next(self) -> None:
-        assert self.client is not None
-        if self._ref_app_instance is None:
-            raise RuntimeError
-
-        sleep_time = self._sleep_until_next_frame()
-
-        self._actual_update_rate_hz = self._iteratively_estimate_update_rate(
-            last_get_next_time_s=self._last_get_next_time_s,
-            current_estimated_update_rate=self._actual_update_rate_hz,
-        )
-
-        self._last_get_next_time_s = time.perf_counter()
-        result = self._ref_app_instance.get_next()
-
-        # Report frame count and update-rate to GUI.
-        # usually done in ApplicationClient but because of erratic behavior
-        # when distance detector is re-calibrated, it has to be done by the
-        # ref app plugin instead.
-        self._update_rate_stats(sleep_time=sleep_time, result=result)
-
-    @is_task
-    def calibrate_detector(self) -> None:
-        if self._started:
-            raise RuntimeError
-
-        if self.client is None:
-            raise RuntimeError
-
-        if not self.client.connected:
-            raise RuntimeError
-
-        self.callback(PluginStateMessage(state=PluginState.LOADED_BUSY))
-
-        try:
-            self._ref_app_instance = RefApp(
-                client=self.client,
-                sensor_id=self.shared_state.sensor_id,
-                config=self.shared_state.config,
-                context=None,
-            )
-            self._ref_app_instance.calibrate()
-        except Exception as exc:
-            msg = "Failed to calibrate detector"
-            raise HandledException(msg) from exc
-        finally:
-            self.callback(PluginStateMessage(state=PluginState.LOADED_IDLE))
-
-        self.shared_state.context = self._ref_app_instance._detector.context
-        self.broadcast()
-
-    def _sleep_until_next_frame(self) -> Optional[float]:
-        if self._ref_app_instance is None:
-            raise RuntimeError
-
-        if self._ref_app_instance.config.update_rate is None:
-            return None
-
-        if self._last_get_next_time_s is None:
-            return None
-
-        sleep_time = (
-            self._last_get_next_time_s
-            + 1 / self._ref_app_instance.config.update_rate
-            - time.perf_counter()
-        )
-
-        if sleep_time > 0:
-            time.sleep(sleep_time)
-
-        return sleep_time
-
-    @staticmethod
-    def _iteratively_estimate_update_rate(
-        last_get_next_time_s: Optional[float], current_estimated_update_rate: float
-    ) -> float:
-        if last_get_next_time_s is None:
-            return 0.0
-
-        actual_update_rate_hz = UPDATE_RATE_EXP_FILTER * current_estimated_update_rate + (
-            1 - UPDATE_RATE_EXP_FILTER
-        ) / (time.perf_counter() - last_get_next_time_s)
-
-        return actual_update_rate_hz
-
-    def _update_rate_stats(self, sleep_time: Optional[float], result: RefAppResult) -> None:
-        if sleep_time is not None:
-            if sleep_time > 0:  # had time to sleep -> No rate warning
-                stats = backend._RateStats(self._actual_update_rate_hz, False, math.nan, False)
-                self.callback(GeneralMessage(name="rate_stats", data=stats))
-            else:  # no time to sleep -> rate warning
-                stats = backend._RateStats(self._actual_update_rate_hz, True, math.nan, False)
-                self.callback(GeneralMessage(name="rate_stats", data=stats))
-        else:  # Run as fast as possible -> no rate warning
-            stats = backend._RateStats(self._actual_update_rate_hz, False, math.nan, False)
-            self.callback(GeneralMessage(name="rate_stats", data=stats))
-
-        for value in result.extra_result.detector_result.values():
-            self._frame_count += len(
-                value.service_extended_result
-            )  # count frames in extended result
-        self.callback(backend.PlotMessage(result=result))
-        self.callback(GeneralMessage(name="frame_count", data=self._frame_count))
-
-    def _clear_rate_stats(self) -> None:
-        self._last_get_next_time_s = None
-        self._actual_update_rate_hz = 0.0
-        self._frame_count = 0
-        self.callback(GeneralMessage(name="rate_stats", data=None))
-        self.callback(GeneralMessage(name="frame_count", data=None))
 
 
 class PlotPlugin(PgPlotPlugin):
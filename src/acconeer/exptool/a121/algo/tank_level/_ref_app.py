@@ -1,9 +1,10 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import enum
+import time
 import warnings
 from typing import Any, Dict, Optional, Tuple
 
@@ -321,6 +322,9 @@ class RefAppResult:
     """Liquid level relative to the base of the tank."""
     extra_result: RefAppExtraResult
     """Extra result: Only used for the plots in the GUI."""
+    swap_duration: Optional[float] = None
+    """Time in seconds spent stopping, calibrating and starting the detector after a range
+    change, given with the first result after it. None if the range was not changed."""
 
 
 class RefApp(Controller[RefAppConfig, RefAppResult]):
@@ -343,6 +347,9 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             detector_config=self.detector_config,
             context=context,
         )
+        # Kept to swap back to full range without translating the config again
+        self._full_range_detector = self._detector
+        self._swap_duration: Optional[float] = None
 
         processor_config = ProcessorConfig(
             median_filter_length=self.config.median_filter_length,
@@ -404,9 +411,16 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             msg = "Not started"
             raise RuntimeError(msg)
 
+        swap_duration = None
         if not self._detector.started:
+            restart_start = time.perf_counter()
             self._detector.calibrate_detector()
             self._detector.start(recorder=None, _algo_group=None)
+
+            if self._swap_duration is not None:
+                swap_duration = self._swap_duration + time.perf_counter() - restart_start
+                self._swap_duration = None
+
         (processor_result, ref_app_extra_result) = self._get_next_mean_median()
 
         if self.config.update_rate is not None:
@@ -435,8 +449,7 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             ):
                 # No peak detected (NO_DETECTION) or outside range (OUT_OF_RANGE or OVERFLOW).
                 # Go to full range mode
-                detector_config = self.config.to_detector_config()
-                self._swap_detector(detector_config)
+                self._swap_detector(self.detector_config)
                 self.range_mode = RangeMode.FULL_RANGE
             else:
                 detector_config = self.config.to_detector_level_tracking_config(
@@ -449,6 +462,7 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
             peak_status=processor_result.peak_status,
             level=processor_result.filtered_level,
             extra_result=ref_app_extra_result,
+            swap_duration=swap_duration,
         )
 
     def update_config(self, config: RefAppConfig) -> None:
@@ -469,16 +483,25 @@ class RefApp(Controller[RefAppConfig, RefAppResult]):
         return recorder_result
 
     def _swap_detector(self, config: DetectorConfig) -> None:
-        """Create new detector object. No recorder is sent to detector.
-        The recorder is however attached to the client at initialization of the ref app."""
+        """Create new detector object, or reuse the full range one. No recorder is sent to
+        detector. The recorder is however attached to the client at initialization of the
+        ref app. The detector is calibrated and started by the next get_next."""
+        swap_start = time.perf_counter()
+
         if self._detector.started:
             self._detector.stop_detector()
-        self._detector = Detector(
-            client=self.client,
-            sensor_ids=[self.sensor_id],
-            detector_config=config,
-            context=self.context,
-        )
+
+        if config == self.detector_config:
+            self._detector = self._full_range_detector
+        else:
+            self._detector = Detector(
+                client=self.client,
+                sensor_ids=[self.sensor_id],
+                detector_config=config,
+                context=self.context,
+            )
+
+        self._swap_duration = time.perf_counter() - swap_start
 
 
 def _record_algo_data(
@@ -1,10 +1,9 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
 from typing import Any, Callable, List, Optional, Type, Union
 
 import numpy as np
@@ -16,24 +15,14 @@ import acconeer.exptool as et
 from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
 from acconeer.exptool.a121.algo._plugins import (
-    ProcessorBackendPluginBase,
-    ProcessorBackendPluginSharedState,
-    ProcessorPluginPreset,
     ProcessorViewPluginBase,
     SetupMessage,
 )
 from acconeer.exptool.a121.algo.touchless_button import (
     MeasurementType,
-    Processor,
     ProcessorConfig,
     ProcessorResult,
     RangeResult,
-    get_close_and_far_processor_config,
-    get_close_and_far_sensor_config,
-    get_close_processor_config,
-    get_close_sensor_config,
-    get_far_processor_config,
-    get_far_sensor_config,
 )
 from acconeer.exptool.app.new import (
     AppModel,
@@ -52,55 +41,13 @@ from acconeer.exptool.app.new.ui.components.pidgets.hooks import (
     parameter_is,
 )
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+)
 
-log = logging.getLogger(__name__)
-
-
-class PluginPresetId(Enum):
-    CLOSE_RANGE = auto()
-    FAR_RANGE = auto()
-    CLOSE_AND_FAR_RANGE = auto()
-
-
-class BackendPlugin(ProcessorBackendPluginBase[ProcessorConfig, ProcessorResult]):
-    PLUGIN_PRESETS = {
-        PluginPresetId.CLOSE_RANGE.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_close_sensor_config()),
-            processor_config=get_close_processor_config(),
-        ),
-        PluginPresetId.FAR_RANGE.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_far_sensor_config()),
-            processor_config=get_far_processor_config(),
-        ),
-        PluginPresetId.CLOSE_AND_FAR_RANGE.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_close_and_far_sensor_config()),
-            processor_config=get_close_and_far_processor_config(),
-        ),
-    }
-
-    @classmethod
-    def get_processor(cls, state: ProcessorBackendPluginSharedState[ProcessorConfig]) -> Processor:
-        if state.metadata is None:
-            msg = "metadata is None"
-            raise RuntimeError(msg)
-
-        if isinstance(state.metadata, list):
-            msg = "metadata is unexpectedly extended"
-            raise RuntimeError(msg)
-
-        return Processor(
-            sensor_config=state.session_config.sensor_config,
-            processor_config=state.processor_config,
-            metadata=state.metadata,
-        )
 
-    @classmethod
-    def get_processor_config_cls(cls) -> Type[ProcessorConfig]:
-        return ProcessorConfig
-
-    @classmethod
-    def get_default_sensor_config(cls) -> a121.SensorConfig:
-        return get_close_sensor_config()
+log = logging.getLogger(__name__)
 
 
 class ViewPlugin(ProcessorViewPluginBase[ProcessorConfig]):
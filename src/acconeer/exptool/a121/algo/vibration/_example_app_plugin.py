@@ -4,20 +4,13 @@
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
-from typing import Callable, Mapping, Optional
-
-import attrs
-import h5py
-from packaging.version import Version
+from typing import Callable, Optional
 
 from PySide6.QtWidgets import QLayout, QPushButton, QVBoxLayout
 
 from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
-from acconeer.exptool.a121._h5_utils import _create_h5_string_dataset
 from acconeer.exptool.a121.algo._plugins import (
-    A121BackendPluginBase,
     A121ViewPluginBase,
 )
 from acconeer.exptool.a121.algo._utils import APPROX_BASE_STEP_LENGTH_M
@@ -27,8 +20,6 @@ from acconeer.exptool.a121.algo.vibration import (
 from acconeer.exptool.app.new import (
     AppModel,
     AttrsConfigEditor,
-    BackendLogger,
-    GeneralMessage,
     GroupBox,
     Message,
     MiscErrorView,
@@ -40,134 +31,23 @@ from acconeer.exptool.app.new import (
     PluginSpecBase,
     backend,
     icons,
-    is_task,
     pidgets,
     visual_policies,
 )
 from acconeer.exptool.app.new.ui.components import RangeHelpView
 
-from ._configs import (
-    get_high_frequency_config,
-    get_low_frequency_config,
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+    SetupMessage,
+    SharedState,
 )
-from ._example_app import ExampleApp, ExampleAppConfig, ExampleAppResult, _load_algo_data
+from ._example_app import ExampleApp, ExampleAppConfig, ExampleAppResult
 from .plot import VibrationPlot
 
 
 log = logging.getLogger(__name__)
 
-REORDER_SUBSWEEP_ET_VERSION = Version("7.17.5")
-
-
-class PluginPresetId(Enum):
-    LOW_FREQ = auto()
-    HIGH_FREQ = auto()
-
-
-@attrs.mutable(kw_only=True)
-class SharedState:
-    sensor_id: int = attrs.field(default=1)
-    config: ExampleAppConfig = attrs.field(factory=ExampleAppConfig)
-
-
-@attrs.frozen(kw_only=True)
-class SetupMessage(GeneralMessage):
-    example_app_config: ExampleAppConfig
-    name: str = attrs.field(default="setup", init=False)
-    recipient: backend.RecipientLiteral = attrs.field(default="plot_plugin", init=False)
-
-
-class BackendPlugin(A121BackendPluginBase[SharedState]):
-    PLUGIN_PRESETS: Mapping[int, Callable[[], ExampleAppConfig]] = {
-        PluginPresetId.LOW_FREQ.value: lambda: get_low_frequency_config(),
-        PluginPresetId.HIGH_FREQ.value: lambda: get_high_frequency_config(),
-    }
-
-    def __init__(
-        self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
-    ) -> None:
-        super().__init__(callback=callback, generation=generation, key=key)
-
-        self._recorder: Optional[a121.H5Recorder] = None
-        self._exempel_app_instance: Optional[ExampleApp] = None
-        self._log = BackendLogger.getLogger(__name__)
-
-        self.restore_defaults()
-
-    def _load_from_cache(self, file: h5py.File) -> None:
-        self.shared_state.config = ExampleAppConfig.from_json(file["config"][()])
-
-    @is_task
-    def restore_defaults(self) -> None:
-        self.shared_state = SharedState()
-        self.broadcast()
-
-    @is_task
-    def update_sensor_id(self, *, sensor_id: int) -> None:
-        self.shared_state.sensor_id = sensor_id
-        self.broadcast()
-
-    def _sync_sensor_ids(self) -> None:
-        if self.client is not None:
-            sensor_ids = self.client.server_info.connected_sensors
-
-            if len(sensor_ids) > 0 and self.shared_state.sensor_id not in sensor_ids:
-                self.shared_state.sensor_id = sensor_ids[0]
-
-    @is_task
-    def update_config(self, *, config: ExampleAppConfig) -> None:
-        self.shared_state.config = config
-        self.broadcast()
-
-    def save_to_cache(self, file: h5py.File) -> None:
-        _create_h5_string_dataset(file, "config", self.shared_state.config.to_json())
-
-    @is_task
-    def set_preset(self, preset_id: int) -> None:
-        preset_config = self.PLUGIN_PRESETS[preset_id]
-        self.shared_state.config = preset_config()
-        self.broadcast()
-
-    def load_from_record_setup(self, *, record: a121.H5Record) -> None:
-        try:
-            client_cfg = record.session_config.sensor_config
-        except Exception as e:
-            msg = "Unexpectedly couldn't get sole SensorConfig. Is this file recorded with Vibration?"
-            raise ValueError(msg) from e
-        if client_cfg.num_subsweeps == 2 and client_cfg.subsweeps[1].enable_loopback:
-            msg = f"Subsweep order has changed. Try opening the file in an earlier version of ET <= {REORDER_SUBSWEEP_ET_VERSION}"
-            raise ValueError(msg)
-
-        algo_group = record.get_algo_group(self.key)
-        _, config = _load_algo_data(algo_group)
-        self.shared_state.config = config
-        self.shared_state.sensor_id = record.sensor_id
-
-    def _start_session(self, recorder: Optional[a121.H5Recorder]) -> None:
-        assert self.client
-        self._example_app_instance = ExampleApp(
-            client=self.client,
-            sensor_id=self.shared_state.sensor_id,
-            example_app_config=self.shared_state.config,
-        )
-        self._example_app_instance.start(recorder)
-        self.callback(SetupMessage(example_app_config=self.shared_state.config))
-
-    def end_session(self) -> None:
-        if self._example_app_instance is None:
-            raise RuntimeError
-        if self._recorder is not None:
-            self._recorder.close()
-        self._example_app_instance.stop()
-
-    def get_next(self) -> None:
-        assert self.client
-        if self._example_app_instance is None:
-            raise RuntimeError
-        result = self._example_app_instance.get_next()
-
-        self.callback(backend.PlotMessage(result=result))
-
 
 class ViewPlugin(A121ViewPluginBase):
     def __init__(self, app_model: AppModel) -> None:
@@ -20,6 +20,7 @@ from acconeer.exptool.a121.algo import (
     PERCEIVED_WAVELENGTH,
     AlgoParamEnum,
     AlgoProcessorConfigBase,
+    Cfar,
     ProcessorBase,
     double_buffering_frame_filter,
 )
@@ -253,6 +254,7 @@ class Processor(ProcessorBase[ProcessorResult]):
         )
         self.lp_coeffs = processor_config.lp_coeff
         self.sensitivity = processor_config.threshold_margin
+        self.cfar = Cfar(self._WINDOW_BASE_LENGTH, self._HALF_GUARD_BASE_LENGTH)
         self.time_series_length = processor_config.time_series_length
         self.amplitude_threshold = processor_config.amplitude_threshold
         self.spf = sensor_config.sweeps_per_frame
@@ -348,12 +350,7 @@ class Processor(ProcessorBase[ProcessorResult]):
         time_series_rms = np.sqrt(np.mean(zm_time_series_um**2))
 
         # Identify peaks in spectrum
-        lp_displacements_threshold = self._calculate_cfar_threshold(
-            self.lp_displacements,
-            self.sensitivity,
-            self._WINDOW_BASE_LENGTH,
-            self._HALF_GUARD_BASE_LENGTH,
-        )
+        lp_displacements_threshold = self.cfar.two_sided(self.lp_displacements) + self.sensitivity
 
         lp_displacements_threshold = self._extend_cfar_threshold(lp_displacements_threshold)
 
@@ -424,20 +421,3 @@ class Processor(ProcessorBase[ProcessorResult]):
         )
 
         return threshold
-
-    @staticmethod
-    def _calculate_cfar_threshold(
-        psd: npt.NDArray[np.float64],
-        sensitivity: float,
-        window_length: int,
-        half_guard_length: int,
-    ) -> npt.NDArray[np.float64]:
-        threshold = np.full(psd.shape, np.nan)
-        margin = window_length + half_guard_length
-        length_after_filtering = psd.shape[0] - 2 * margin
-
-        filt_psd = np.convolve(psd, np.ones(window_length), "valid") / window_length
-        threshold[margin:-margin] = (
-            filt_psd[:length_after_filtering] + filt_psd[-length_after_filtering:]
-        ) / 2 + sensitivity
-        return threshold
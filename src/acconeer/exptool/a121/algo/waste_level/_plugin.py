@@ -1,10 +1,9 @@
-# Copyright (c) Acconeer AB, 2024
+# Copyright (c) Acconeer AB, 2024-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import logging
-from enum import Enum, auto
 from typing import Callable, Optional, Type
 
 import numpy as np
@@ -17,19 +16,13 @@ import acconeer.exptool as et
 from acconeer.exptool import a121
 from acconeer.exptool._core.docstrings import get_attribute_docstring
 from acconeer.exptool.a121.algo._plugins import (
-    ProcessorBackendPluginBase,
-    ProcessorBackendPluginSharedState,
-    ProcessorPluginPreset,
     ProcessorViewPluginBase,
     SetupMessage,
 )
 from acconeer.exptool.a121.algo._utils import APPROX_BASE_STEP_LENGTH_M, get_distances_m
 from acconeer.exptool.a121.algo.waste_level import (
-    Processor,
     ProcessorConfig,
     ProcessorResult,
-    get_processor_config,
-    get_sensor_config,
 )
 from acconeer.exptool.app.new import (
     AppModel,
@@ -44,45 +37,13 @@ from acconeer.exptool.app.new import (
     pidgets,
 )
 
+from ._backend_plugin import (
+    BackendPlugin,
+    PluginPresetId,
+)
 
-log = logging.getLogger(__name__)
-
-
-class PluginPresetId(Enum):
-    PLASTIC_WASTE_BIN = auto()
-
-
-class BackendPlugin(ProcessorBackendPluginBase[ProcessorConfig, ProcessorResult]):
-    PLUGIN_PRESETS = {
-        PluginPresetId.PLASTIC_WASTE_BIN.value: lambda: ProcessorPluginPreset(
-            session_config=a121.SessionConfig(get_sensor_config()),
-            processor_config=get_processor_config(),
-        ),
-    }
-
-    @classmethod
-    def get_processor(cls, state: ProcessorBackendPluginSharedState[ProcessorConfig]) -> Processor:
-        if state.metadata is None:
-            msg = "metadata is None"
-            raise RuntimeError(msg)
-
-        if isinstance(state.metadata, list):
-            msg = "metadata is unexpectedly extended"
-            raise RuntimeError(msg)
-
-        return Processor(
-            sensor_config=state.session_config.sensor_config,
-            processor_config=state.processor_config,
-            metadata=state.metadata,
-        )
-
-    @classmethod
-    def get_processor_config_cls(cls) -> Type[ProcessorConfig]:
-        return ProcessorConfig
 
-    @classmethod
-    def get_default_sensor_config(cls) -> a121.SensorConfig:
-        return get_sensor_config()
+log = logging.getLogger(__name__)
 
 
 class ViewPlugin(ProcessorViewPluginBase[ProcessorConfig]):
@@ -0,0 +1,323 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+"""
+Search for session configs that fit current, heap memory and update rate constraints.
+
+Every combination of the parameters in a :class:`SearchSpace` is applied to a base
+session config and evaluated with the power and memory models. Combinations that
+violate the :class:`Constraints` are discarded and the Pareto-optimal ones (with regard
+to objective, average current and heap memory) are returned:
+
+.. code-block:: python
+
+    search = ConfigSearch(a121.SessionConfig(a121.SensorConfig(start_point=80, num_points=40)))
+    candidates = search.run(Constraints(update_rate=10.0, max_average_current=1e-3))
+    best = candidates[0].session_config
+
+Evaluations are memoized per search, so running it again with e.g. a different current
+budget only re-evaluates the constraints.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import math
+import typing as t
+
+import attrs
+import numpy as np
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core import utils as core_utils
+from acconeer.exptool.a121.algo import RLG_PER_HWAAS_MAP, calc_processing_gain
+
+from . import memory, power
+
+
+Objective = t.Callable[[a121.SessionConfig], float]
+
+
+def snr_proxy_db(session_config: a121.SessionConfig) -> float:
+    """
+    Approximates the SNR (in dB) of the worst subsweep in the session config.
+
+    Radar loop gain, HWAAS and the processing gain of the matched filter are
+    considered, like when converting amplitudes to strengths.
+    """
+    return min(
+        RLG_PER_HWAAS_MAP[subsweep.profile]
+        + 10 * math.log10(subsweep.hwaas)
+        + 10 * math.log10(calc_processing_gain(subsweep.profile, subsweep.step_length))
+        for sensor_config in core_utils.iterate_extended_structure_values(session_config.groups)
+        for subsweep in sensor_config.subsweeps
+    )
+
+
+@attrs.frozen(kw_only=True)
+class SearchSpace:
+    """
+    The values to try for each parameter.
+
+    Subsweep parameters are applied to every subsweep and sensor parameters to every
+    sensor config. ``None`` keeps the value of the base session config.
+    """
+
+    profiles: t.Sequence[t.Optional[a121.Profile]] = attrs.field(
+        default=tuple(a121.Profile), converter=tuple
+    )
+    prfs: t.Sequence[t.Optional[a121.PRF]] = attrs.field(default=(None,), converter=tuple)
+    hwaas: t.Sequence[t.Optional[int]] = attrs.field(
+        default=(1, 2, 4, 8, 16, 32, 64), converter=tuple
+    )
+    step_lengths: t.Sequence[t.Optional[int]] = attrs.field(
+        default=(1, 2, 3, 4, 6, 8, 12, 24), converter=tuple
+    )
+    sweeps_per_frame: t.Sequence[t.Optional[int]] = attrs.field(default=(None,), converter=tuple)
+    inter_frame_idle_states: t.Sequence[t.Optional[a121.IdleState]] = attrs.field(
+        default=tuple(a121.IdleState), converter=tuple
+    )
+    inter_sweep_idle_states: t.Sequence[t.Optional[a121.IdleState]] = attrs.field(
+        default=(None,), converter=tuple
+    )
+    keep_range: bool = attrs.field(default=True)
+    """Scale the number of points with the step length so that the range stays the same"""
+
+
+@attrs.frozen(kw_only=True)
+class Constraints:
+    """
+    Hard constraints on the candidates. ``None`` means unconstrained.
+
+    If ``update_rate`` is set, it replaces the update rate of the base session config
+    and candidates need to be able to keep it.
+    """
+
+    update_rate: t.Optional[float] = None
+    max_average_current: t.Optional[float] = None
+    max_heap_memory: t.Optional[int] = None
+    lower_idle_state: t.Optional[power.Sensor.LowerIdleState] = None
+
+
+@attrs.frozen
+class _Parameters:
+    profile: t.Optional[a121.Profile]
+    prf: t.Optional[a121.PRF]
+    step_length: t.Optional[int]
+    inter_frame_idle_state: t.Optional[a121.IdleState]
+    inter_sweep_idle_state: t.Optional[a121.IdleState]
+    sweeps_per_frame: t.Optional[int]
+    hwaas: t.Optional[int]
+
+
+@attrs.frozen(kw_only=True)
+class Candidate:
+    session_config: a121.SessionConfig
+    objective: float
+    average_current: float
+    heap_memory: int
+    active_duration: float
+    """Duration (in seconds) of measuring all groups once"""
+
+
+class ConfigSearch:
+    """
+    Searches the configs reachable from ``base_session_config`` through ``search_space``.
+
+    :param base_session_config: Provides everything that is not searched over
+    :param search_space: The parameter values to try
+    :param objective: Higher is better. Defaults to :func:`snr_proxy_db`
+    :param algorithm: The algorithm used by the power model
+    """
+
+    def __init__(
+        self,
+        base_session_config: a121.SessionConfig,
+        search_space: SearchSpace = SearchSpace(),
+        objective: Objective = snr_proxy_db,
+        algorithm: power.algo.Algorithm = power.algo.SparseIq(),
+    ) -> None:
+        self._base_session_config = copy.deepcopy(base_session_config)
+        self._search_space = search_space
+        self._objective = objective
+        self._algorithm = algorithm
+        self._evaluations: t.Dict[
+            t.Tuple[_Parameters, t.Optional[float], t.Optional[power.Sensor.LowerIdleState]],
+            t.Optional[Candidate],
+        ] = {}
+
+    @property
+    def num_evaluations(self) -> int:
+        """Number of evaluated parameter combinations so far"""
+        return len(self._evaluations)
+
+    def run(self, constraints: Constraints = Constraints()) -> t.List[Candidate]:
+        """
+        Returns the Pareto-optimal candidates that fulfill the constraints, best objective first
+
+        A candidate is Pareto-optimal if no other candidate is at least as good in
+        objective, average current and heap memory, and better in one of them.
+        """
+        space = self._search_space
+        feasible: t.List[Candidate] = []
+
+        for (
+            profile,
+            prf,
+            step_length,
+            inter_frame_idle_state,
+            inter_sweep_idle_state,
+        ) in itertools.product(
+            space.profiles,
+            space.prfs,
+            space.step_lengths,
+            space.inter_frame_idle_states,
+            space.inter_sweep_idle_states,
+        ):
+            # Time, charge and memory grow with sweeps per frame and HWAAS. Once a
+            # combination is too slow or draws too much current or memory, larger
+            # values will be too and are not evaluated. 'None' (the value of the base
+            # config) cannot be ordered and is never pruned.
+            for sweeps_per_frame in _ascending(space.sweeps_per_frame):
+                smallest_hwaas_was_pruned = False
+
+                for hwaas in _ascending(space.hwaas):
+                    parameters = _Parameters(
+                        profile=profile,
+                        prf=prf,
+                        step_length=step_length,
+                        inter_frame_idle_state=inter_frame_idle_state,
+                        inter_sweep_idle_state=inter_sweep_idle_state,
+                        sweeps_per_frame=sweeps_per_frame,
+                        hwaas=hwaas,
+                    )
+                    candidate = self._evaluate(parameters, constraints)
+
+                    if candidate is None:  # Invalid config
+                        continue
+
+                    if self._violates_growing_constraint(candidate, constraints):
+                        if hwaas is None:
+                            continue
+
+                        smallest_hwaas_was_pruned = _ascending(space.hwaas)[0] == hwaas
+                        break
+
+                    if self._fulfills(candidate, constraints):
+                        feasible.append(candidate)
+
+                if smallest_hwaas_was_pruned and sweeps_per_frame is not None:
+                    break
+
+        return _pareto_optimal(feasible)
+
+    def _evaluate(
+        self, parameters: _Parameters, constraints: Constraints
+    ) -> t.Optional[Candidate]:
+        key = (parameters, constraints.update_rate, constraints.lower_idle_state)
+
+        try:
+            return self._evaluations[key]
+        except KeyError:
+            pass
+
+        session_config = self._create_session_config(parameters, constraints.update_rate)
+
+        if not a121.are_valid_session_configs([session_config])[0]:
+            candidate = None
+        else:
+            summary = power.session_summary(
+                session_config, constraints.lower_idle_state, self._algorithm
+            )
+            candidate = Candidate(
+                session_config=session_config,
+                objective=self._objective(session_config),
+                average_current=summary.average_current,
+                heap_memory=memory.session_heap_memory(session_config),
+                active_duration=summary.active.duration,
+            )
+
+        self._evaluations[key] = candidate
+        return candidate
+
+    def _create_session_config(
+        self, parameters: _Parameters, update_rate: t.Optional[float]
+    ) -> a121.SessionConfig:
+        session_config = copy.deepcopy(self._base_session_config)
+
+        if update_rate is not None:
+            session_config.update_rate = update_rate
+
+        for sensor_config in core_utils.iterate_extended_structure_values(session_config.groups):
+            if parameters.sweeps_per_frame is not None:
+                sensor_config.sweeps_per_frame = parameters.sweeps_per_frame
+            if parameters.inter_frame_idle_state is not None:
+                sensor_config.inter_frame_idle_state = parameters.inter_frame_idle_state
+            if parameters.inter_sweep_idle_state is not None:
+                sensor_config.inter_sweep_idle_state = parameters.inter_sweep_idle_state
+
+            for subsweep in sensor_config.subsweeps:
+                if parameters.profile is not None:
+                    subsweep.profile = parameters.profile
+                if parameters.prf is not None:
+                    subsweep.prf = parameters.prf
+                if parameters.hwaas is not None:
+                    subsweep.hwaas = parameters.hwaas
+                if parameters.step_length is not None:
+                    if self._search_space.keep_range:
+                        span = subsweep.num_points * subsweep.step_length
+                        subsweep.num_points = max(1, math.ceil(span / parameters.step_length))
+                    subsweep.step_length = parameters.step_length
+
+        return session_config
+
+    @classmethod
+    def _fulfills(cls, candidate: Candidate, constraints: Constraints) -> bool:
+        return not cls._violates_growing_constraint(candidate, constraints) and (
+            constraints.max_average_current is None
+            or candidate.average_current <= constraints.max_average_current
+        )
+
+    @staticmethod
+    def _violates_growing_constraint(candidate: Candidate, constraints: Constraints) -> bool:
+        rate = power.configured_rate(candidate.session_config)
+
+        if rate is not None and candidate.active_duration >= 1 / rate:
+            return True
+
+        # Without a rate, the session is only measuring and its average current
+        # does not necessarily grow with the measurement time
+        if (
+            rate is not None
+            and constraints.max_average_current is not None
+            and candidate.average_current > constraints.max_average_current
+        ):
+            return True
+
+        return (
+            constraints.max_heap_memory is not None
+            and candidate.heap_memory > constraints.max_heap_memory
+        )
+
+
+def _ascending(values: t.Sequence[t.Optional[int]]) -> t.List[t.Optional[int]]:
+    """Sorts values ascending, with 'None' first"""
+    return sorted(values, key=lambda v: -1 if v is None else v)
+
+
+def _pareto_optimal(candidates: t.Sequence[Candidate]) -> t.List[Candidate]:
+    if not candidates:
+        return []
+
+    # Negated where lower is better, so that higher is better in every column
+    scores = np.array(
+        [(c.objective, -c.average_current, -c.heap_memory) for c in candidates], dtype=float
+    )
+    at_least_as_good = (scores[:, None, :] >= scores[None, :, :]).all(axis=-1)
+    better_somewhere = (scores[:, None, :] > scores[None, :, :]).any(axis=-1)
+    dominated = (at_least_as_good & better_somewhere).any(axis=0)
+
+    return sorted(
+        (candidates[i] for i in np.flatnonzero(~dominated).tolist()),
+        key=lambda c: (-c.objective, c.average_current, c.heap_memory),
+    )
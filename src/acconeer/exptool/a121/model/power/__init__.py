@@ -1,8 +1,11 @@
-# Copyright (c) Acconeer AB, 2023
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from . import algo
 from .api import (
+    SessionSummary,
+    average_currents,
+    average_currents_at_rates,
     configured_rate,
     converged_average_current,
     frame_active,
@@ -11,6 +14,7 @@ from .api import (
     group_idle,
     power_state,
     session,
+    session_summary,
     subsweep_active,
     sweep_active,
     sweep_idle,
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 """
 API for generating power regions (for more info see ./domain.py).
@@ -48,8 +48,12 @@ Going deeper down into, the frame active consists of sweep active and sweep idle
 
 from __future__ import annotations
 
-import collections
 import typing as t
+import warnings
+
+import attrs
+import numpy as np
+import numpy.typing as npt
 
 from acconeer.exptool import a121
 from acconeer.exptool.a121._core import utils as core_utils
@@ -355,36 +359,106 @@ def group_idle(
     )
 
 
-def session_generator(
+@attrs.frozen
+class SessionSummary:
+    """
+    One period of a session, i.e. its group active and group idle (if any).
+
+    The session repeats its period indefinitely, so the steady-state average current of
+    the session is the average current of a single period.
+    """
+
+    active: domain.CompositeRegion
+    idle: t.Optional[domain.SimpleRegion]
+
+    @property
+    def regions(self) -> t.Tuple[domain.EnergyRegion, ...]:
+        return (self.active,) if self.idle is None else (self.active, self.idle)
+
+    @property
+    def duration(self) -> float:
+        return domain.duration(*self.regions)
+
+    @property
+    def charge(self) -> float:
+        return sum(r.charge for r in self.regions)
+
+    @property
+    def average_current(self) -> float:
+        return self.charge / self.duration
+
+
+@attrs.frozen(eq=False)
+class _ByIdentity:
+    """Makes unhashable objects (e.g. a Sensor) usable in cache keys. Compares by identity"""
+
+    obj: t.Any
+
+
+_SESSION_SUMMARY_CACHE_SIZE = 1024
+_session_summaries: t.Dict[t.Tuple[t.Any, ...], SessionSummary] = {}
+
+
+def session_summary(
     session_config: a121.SessionConfig,
     lower_idle_state: t.Optional[Sensor.LowerIdleState],
     algorithm: algo.Algorithm = di.DEFAULT_ALGO,
     sensor: Sensor = di.DEFAULT_SENSOR,
     module: Module = di.DEFAULT_MODULE,
-) -> t.Iterator[domain.EnergyRegion]:
+) -> SessionSummary:
     """
-    Indefinitely simulates the session, yielding region per region
+    Returns one period of the session.
+
+    Periods are cached per session config (by value), lower idle state and
+    algorithm, sensor and module (by identity).
     """
+    key = (
+        session_config.to_json(),
+        lower_idle_state,
+        _ByIdentity(algorithm),
+        _ByIdentity(sensor),
+        _ByIdentity(module),
+    )
+
+    try:
+        return _session_summaries[key]
+    except KeyError:
+        pass
+
     active = group_active(session_config, lower_idle_state, algorithm, sensor, module)
 
     rate = configured_rate(session_config)
-
-    regions: list[domain.EnergyRegion]
-    if rate is None:
-        regions = [active]
+    if rate is None or 1 / rate - active.duration <= 0:
+        summary = SessionSummary(active, idle=None)
     else:
-        duration = 1 / rate - active.duration
-
-        if duration > 0:
-            idle = group_idle(
+        summary = SessionSummary(
+            active,
+            group_idle(
                 lower_idle_state or algo.last_inter_frame_idle_state(session_config),
-                duration,
+                1 / rate - active.duration,
                 sensor=sensor,
                 module=module,
-            )
-            regions = [active, idle]
-        else:
-            regions = [active]
+            ),
+        )
+
+    if len(_session_summaries) >= _SESSION_SUMMARY_CACHE_SIZE:
+        del _session_summaries[next(iter(_session_summaries))]
+    _session_summaries[key] = summary
+
+    return summary
+
+
+def session_generator(
+    session_config: a121.SessionConfig,
+    lower_idle_state: t.Optional[Sensor.LowerIdleState],
+    algorithm: algo.Algorithm = di.DEFAULT_ALGO,
+    sensor: Sensor = di.DEFAULT_SENSOR,
+    module: Module = di.DEFAULT_MODULE,
+) -> t.Iterator[domain.EnergyRegion]:
+    """
+    Indefinitely simulates the session, yielding region per region
+    """
+    regions = session_summary(session_config, lower_idle_state, algorithm, sensor, module).regions
 
     while True:
         yield from regions
@@ -402,36 +476,39 @@ def session(
     """
     Models the first `duration` seconds of a session
     """
-    regions: list[domain.EnergyRegion] = []
-    elapsed_time = 0.0
-    found_actives = 0
-
     if num_actives is None and duration is None:
         msg = "At least one of 'num_actives' and 'duration' needs to be not None"
         raise ValueError(msg)
 
-    for region in session_generator(
-        session_config,
-        lower_idle_state,
-        algorithm,
-        sensor,
-        module,
-    ):
-        regions += [region]
-        elapsed_time += region.duration
-
-        if not (
-            isinstance(region, domain.SimpleRegion) and region.tag is domain.EnergyRegion.Tag.IDLE
-        ):
-            found_actives += 1
-
-        if duration is not None and elapsed_time > duration:
-            break
-        if num_actives is not None and found_actives >= num_actives:
-            break
+    summary = session_summary(session_config, lower_idle_state, algorithm, sensor, module)
+    period = summary.regions
+
+    # Every period starts with the only active region of the period. The session ends
+    # with the region that passes 'duration' or with the 'num_actives'th active region.
+    num_regions = None
+    if num_actives is not None:
+        num_regions = (max(num_actives, 1) - 1) * len(period) + 1
+
+    if duration is not None:
+        num_whole_periods = int(duration // summary.duration)
+        elapsed_time = num_whole_periods * summary.duration
+        num_regions_for_duration = num_whole_periods * len(period)
+
+        for region in period * 2:
+            num_regions_for_duration += 1
+            elapsed_time += region.duration
+            if elapsed_time > duration:
+                break
+
+        if num_regions is None or num_regions_for_duration < num_regions:
+            num_regions = num_regions_for_duration
+
+    assert num_regions is not None
+    num_repeats = -(-num_regions // len(period))
+    regions = (period * num_repeats)[:num_regions]
 
     sequence = domain.CompositeRegion(
-        tuple(regions),
+        regions,
         f"First {duration} seconds of session",
     )
 
@@ -444,40 +521,99 @@ def session(
 def converged_average_current(
     session_config: a121.SessionConfig,
     lower_idle_state: t.Optional[Sensor.LowerIdleState],
-    absolute_tolerance: float,
-    convergence_window: int = 10,
+    absolute_tolerance: t.Optional[float] = None,
+    convergence_window: t.Optional[int] = None,
     algorithm: algo.Algorithm = di.DEFAULT_ALGO,
     sensor: Sensor = di.DEFAULT_SENSOR,
     module: Module = di.DEFAULT_MODULE,
 ) -> float:
     """
-    Simulates the session until the average current has been within 'absolute_tolerance'.
-    for 'convergence_window' iterations.
+    Returns the steady-state average current of the session.
+
+    The average is calculated exactly from one period of the session (see
+    `session_summary`). 'absolute_tolerance' and 'convergence_window' are deprecated
+    and ignored, they were used when the session was simulated until the average
+    converged.
     """
-    gen = session_generator(
-        session_config,
-        lower_idle_state,
-        algorithm,
-        sensor,
-        module,
-    )
+    if absolute_tolerance is not None or convergence_window is not None:
+        warnings.warn(
+            "'absolute_tolerance' and 'convergence_window' are ignored and will be removed",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    return session_summary(
+        session_config, lower_idle_state, algorithm, sensor, module
+    ).average_current
 
-    first = next(gen)
-    total_duration = first.duration
-    cumulative_charge = first.charge
-    average_currents = collections.deque([first.average_current], maxlen=convergence_window)
 
-    for region in gen:
-        cumulative_charge += region.charge
-        total_duration += region.duration
+def average_currents(
+    session_configs: t.Union[a121.SessionConfig, t.Sequence[a121.SessionConfig]],
+    lower_idle_states: t.Union[
+        t.Optional[Sensor.LowerIdleState], t.Sequence[t.Optional[Sensor.LowerIdleState]]
+    ],
+    algorithm: algo.Algorithm = di.DEFAULT_ALGO,
+    sensor: Sensor = di.DEFAULT_SENSOR,
+    module: Module = di.DEFAULT_MODULE,
+) -> npt.NDArray[np.float64]:
+    """
+    Returns the steady-state average currents of many sessions in one call.
+
+    A single session config or lower idle state is used with every element of the
+    other argument. Otherwise, both sequences need to be equally long.
+    """
+    if isinstance(session_configs, a121.SessionConfig):
+        session_configs = [session_configs]
+    if lower_idle_states is None or isinstance(lower_idle_states, Sensor.IdleState):
+        lower_idle_states = [lower_idle_states]
+
+    if len(session_configs) == 1:
+        session_configs = list(session_configs) * len(lower_idle_states)
+    elif len(lower_idle_states) == 1:
+        lower_idle_states = list(lower_idle_states) * len(session_configs)
+
+    if len(session_configs) != len(lower_idle_states):
+        msg = (
+            f"Got {len(session_configs)} session configs and "
+            + f"{len(lower_idle_states)} lower idle states"
+        )
+        raise ValueError(msg)
+
+    summaries = [
+        session_summary(session_config, lower_idle_state, algorithm, sensor, module)
+        for session_config, lower_idle_state in zip(session_configs, lower_idle_states)
+    ]
+    charges = np.array([summary.charge for summary in summaries], dtype=float)
+    durations = np.array([summary.duration for summary in summaries], dtype=float)
+    currents: npt.NDArray[np.float64] = charges / durations
+    return currents
 
-        average_currents.append(cumulative_charge / total_duration)
-        if len(average_currents) == convergence_window and all(
-            ac - min(average_currents) < absolute_tolerance for ac in average_currents
-        ):
-            break
 
-    return average_currents[-1]
+def average_currents_at_rates(
+    session_config: a121.SessionConfig,
+    lower_idle_state: t.Optional[Sensor.LowerIdleState],
+    update_rates: npt.ArrayLike,
+    algorithm: algo.Algorithm = di.DEFAULT_ALGO,
+    sensor: Sensor = di.DEFAULT_SENSOR,
+    module: Module = di.DEFAULT_MODULE,
+) -> npt.NDArray[np.float64]:
+    """
+    Returns the steady-state average currents of the session at each of 'update_rates'.
+
+    Equivalent to, but a lot faster than, calling `converged_average_current` with copies
+    of 'session_config' that have their update rate replaced. Only the group idle depends
+    on the rate. Rates that cannot be kept leave no time for the group idle.
+    """
+    active = session_summary(session_config, lower_idle_state, algorithm, sensor, module).active
+    idle_current = group_idle(
+        lower_idle_state or algo.last_inter_frame_idle_state(session_config),
+        0.0,
+        sensor=sensor,
+        module=module,
+    ).current
+
+    idle_durations = np.maximum(1 / np.asarray(update_rates, dtype=float) - active.duration, 0.0)
+    return (active.charge + idle_current * idle_durations) / (active.duration + idle_durations)
 
 
 def dump_region(region: domain.EnergyRegion, indent: str = "") -> None:
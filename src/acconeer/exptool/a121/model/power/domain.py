@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 r"""
 This module contains the power modelling building blocks.
@@ -130,13 +130,27 @@ class CompositeRegion(EnergyRegion):
     regions: tuple[EnergyRegion, ...]
     description: str = ""
 
+    # Regions are immutable, so the totals are computed once instead of on every access
+    _duration: float = attrs.field(init=False, eq=False, repr=False)
+    _charge: float = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, "_duration", duration(*self.regions))
+        object.__setattr__(self, "_charge", sum(r.charge for r in self.regions))
+
     @property
     def average_current(self) -> float:
-        return sum(r.average_current * r.duration / self.duration for r in self.regions)
+        if not self.regions:
+            return 0.0
+        return self._charge / self._duration
 
     @property
     def duration(self) -> float:
-        return duration(*self.regions)
+        return self._duration
+
+    @property
+    def charge(self) -> float:
+        return self._charge
 
     def truncate(self, new_duration: float) -> CompositeRegion:
         durations = (r.duration for r in self.regions)
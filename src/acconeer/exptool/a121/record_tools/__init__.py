@@ -0,0 +1,2 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
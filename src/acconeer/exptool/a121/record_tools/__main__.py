@@ -0,0 +1,165 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from acconeer.exptool import a121
+
+from . import convert
+from .index import RecordIndex
+from .slicing import slice_record
+
+
+def _add_index_parser(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    parser = subparsers.add_parser("index", help="Index recordings in a SQLite database.")
+    parser.add_argument("database", help="Path of the index database. Created if missing.")
+    parser.add_argument("paths", nargs="+", help="Recordings and directories to index.")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes (default: CPUs)."
+    )
+    parser.set_defaults(func=_index)
+
+
+def _index(args: argparse.Namespace) -> None:
+    with RecordIndex(args.database) as index:
+        summary = index.update(args.paths, max_workers=args.workers)
+
+    print(
+        f"Indexed {summary.num_indexed}, unchanged {summary.num_unchanged}, "
+        f"removed {summary.num_removed}, failed {len(summary.failed)}"
+    )
+    for path in summary.failed:
+        print(f"  Failed: {path}")
+
+
+def _add_query_parser(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    parser = subparsers.add_parser("query", help="List indexed sessions matching filters.")
+    parser.add_argument("database", help="Path of the index database.")
+    parser.add_argument("--sensor-id", type=int, default=None)
+    parser.add_argument("--profile", type=int, choices=[p.value for p in a121.Profile])
+    parser.add_argument("--min-sweep-rate", type=float, default=None, metavar="HZ")
+    parser.add_argument("--min-rss-version", default=None, metavar="VERSION")
+    parser.add_argument("--min-num-frames", type=int, default=None)
+    parser.add_argument("--algo-key", default=None)
+    parser.set_defaults(func=_query)
+
+
+def _query(args: argparse.Namespace) -> None:
+    with RecordIndex(args.database) as index:
+        for session in index.sessions(
+            sensor_id=args.sensor_id,
+            profile=None if args.profile is None else a121.Profile(args.profile),
+            min_sweep_rate=args.min_sweep_rate,
+            min_rss_version=args.min_rss_version,
+            min_num_frames=args.min_num_frames,
+            algo_key=args.algo_key,
+        ):
+            print(
+                f"{session.record.path}\tsession {session.session_index}\t{session.num_frames} frames"
+            )
+
+
+def _add_convert_parser(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    parser = subparsers.add_parser(
+        "convert", help="Re-chunk and re-compress a directory of recordings."
+    )
+    parser.add_argument("source", help="Directory with recordings (.h5 or A111 .npz).")
+    parser.add_argument("destination", help="Directory to write the converted recordings to.")
+    parser.add_argument("--compression", choices=["gzip", "lzf", "none"], default="gzip")
+    parser.add_argument("--compression-level", type=int, default=4, help="gzip level, 0-9.")
+    parser.add_argument("--no-shuffle", action="store_true", help="Skip the shuffle filter.")
+    parser.add_argument("--chunk-frames", type=int, default=64, help="Frames per chunk.")
+    parser.add_argument("--drop-algo", action="store_true", help="Drop A121 algo groups.")
+    parser.add_argument("--no-verify", action="store_true", help="Skip frame comparison.")
+    parser.add_argument("--overwrite", action="store_true")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Number of worker processes (default: CPUs)."
+    )
+    parser.set_defaults(func=_convert)
+
+
+def _convert(args: argparse.Namespace) -> None:
+    options = convert.StorageOptions(
+        compression=None if args.compression == "none" else args.compression,
+        compression_level=args.compression_level,
+        shuffle=not args.no_shuffle,
+        chunk_frames=args.chunk_frames,
+        keep_algo_group=not args.drop_algo,
+    )
+
+    start = time.perf_counter()
+    results = convert.convert_directory(
+        args.source,
+        args.destination,
+        options,
+        verify=not args.no_verify,
+        overwrite=args.overwrite,
+        max_workers=args.workers,
+    )
+    print(convert.format_report(results, wall_time=time.perf_counter() - start))
+
+
+def _add_slice_parser(
+    subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+) -> None:
+    parser = subparsers.add_parser(
+        "slice", help="Copy a frame range and selected sessions/sensors to a new recording."
+    )
+    parser.add_argument("source", help="A121 recording to slice.")
+    parser.add_argument("destination", help="Path of the new recording.")
+    parser.add_argument(
+        "--session", type=int, nargs="+", dest="sessions", help="Sessions to keep (default: all)."
+    )
+    parser.add_argument("--start", type=int, default=None, help="First frame to keep.")
+    parser.add_argument("--stop", type=int, default=None, help="Frame to stop before.")
+    parser.add_argument(
+        "--group", type=int, nargs="+", dest="groups", help="Groups to keep (default: all)."
+    )
+    parser.add_argument(
+        "--sensor-id", type=int, nargs="+", dest="sensor_ids", help="Sensors to keep."
+    )
+    parser.add_argument("--drop-algo", action="store_true", help="Drop the algo group.")
+    parser.add_argument("--overwrite", action="store_true")
+    parser.set_defaults(func=_slice)
+
+
+def _slice(args: argparse.Namespace) -> None:
+    slice_record(
+        args.source,
+        args.destination,
+        sessions=args.sessions,
+        start=args.start,
+        stop=args.stop,
+        groups=args.groups,
+        sensor_ids=args.sensor_ids,
+        keep_algo_group=not args.drop_algo,
+        overwrite=args.overwrite,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m acconeer.exptool.a121.record_tools",
+        description="Tools for working with many A121 recordings.",
+    )
+    subparsers = parser.add_subparsers(required=True, metavar="command")
+    _add_index_parser(subparsers)
+    _add_query_parser(subparsers)
+    _add_convert_parser(subparsers)
+    _add_slice_parser(subparsers)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+
+import h5py
+
+
+_BLOCK_BYTES = 8 * 2**20
+
+
+def copy_frames(
+    source: t.Any,
+    destination: h5py.Group,
+    name: str,
+    start: int = 0,
+    stop: t.Optional[int] = None,
+    **dataset_kwargs: t.Any,
+) -> h5py.Dataset:
+    """Copies frames ``start:stop`` of an array or dataset to a new, resizable dataset
+
+    The frames are copied a block of whole destination chunks (about 8 MiB) at a time, so
+    memory use does not depend on the number of frames.
+
+    :param dataset_kwargs: Passed to ``create_dataset``, e.g. ``chunks`` or ``compression``
+    """
+    stop = source.shape[0] if stop is None else stop
+    shape = (stop - start, *source.shape[1:])
+    dataset = destination.create_dataset(
+        name,
+        shape=shape,
+        maxshape=(None, *shape[1:]),
+        dtype=source.dtype,
+        track_times=False,
+        **dataset_kwargs,
+    )
+
+    for block in frame_blocks(dataset):
+        dataset[block] = source[start + block.start : start + block.stop]
+
+    return dataset
+
+
+def frame_blocks(dataset: h5py.Dataset) -> t.Iterator[slice]:
+    """Slices of the frames of ``dataset``, each a block of whole chunks of about 8 MiB"""
+    num_frames = dataset.shape[0]
+    chunk_frames = num_frames if dataset.chunks is None else dataset.chunks[0]
+    chunk_bytes = max(1, dataset.dtype.itemsize * chunk_frames * _product(dataset.shape[1:]))
+    block_frames = max(1, _BLOCK_BYTES // chunk_bytes) * max(1, chunk_frames)
+
+    for block_start in range(0, num_frames, block_frames):
+        yield slice(block_start, min(block_start + block_frames, num_frames))
+
+
+def storage_kwargs(dataset: h5py.Dataset) -> t.Dict[str, t.Any]:
+    """The ``create_dataset`` arguments that give a dataset the same storage as ``dataset``"""
+    return dict(
+        chunks=dataset.chunks,
+        compression=dataset.compression,
+        compression_opts=dataset.compression_opts,
+        shuffle=dataset.shuffle,
+    )
+
+
+def _product(values: t.Iterable[int]) -> int:
+    product = 1
+    for value in values:
+        product *= value
+    return product
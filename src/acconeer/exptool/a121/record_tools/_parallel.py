@@ -0,0 +1,28 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import concurrent.futures
+import typing as t
+
+
+T = t.TypeVar("T")
+
+
+def parallel_map(
+    func: t.Callable[..., T],
+    *iterables: t.Iterable[t.Any],
+    max_workers: t.Optional[int],
+    chunksize: int = 1,
+) -> t.Iterator[T]:
+    """Like ``map``, but calls ``func`` in a process pool
+
+    ``func`` needs to be a module level function. ``max_workers=None`` uses one process per
+    CPU and ``max_workers=1`` calls ``func`` in the calling process.
+    """
+    if max_workers == 1:
+        yield from map(func, *iterables)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            yield from executor.map(func, *iterables, chunksize=chunksize)
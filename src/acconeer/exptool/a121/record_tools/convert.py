@@ -0,0 +1,383 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+"""
+Re-encodes recordings with other storage options, e.g. to compact old recordings.
+
+A121 recordings are copied dataset by dataset. The frame datasets are re-chunked and
+re-compressed, everything else is copied as-is. A111 recordings (``.npz`` or ``.h5``) are
+re-written as A111 ``.h5`` files in the same way:
+
+.. code-block:: python
+
+    results = convert_directory("old", "new", StorageOptions(compression="lzf"))
+    print(format_report(results))
+
+Frames are copied in blocks, so memory use does not depend on the length of the
+recording. The exception is A111 ``.npz`` files, whose arrays can only be read whole.
+After conversion, every frame of the new file is compared to the original, also a block of
+frames at a time.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import typing as t
+from pathlib import Path
+
+import attrs
+import h5py
+import numpy as np
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core.entities import RecordException, SessionRecord
+
+from ._copy import copy_frames, frame_blocks
+from ._parallel import parallel_map
+
+
+_RECORDING_SUFFIXES = (".h5", ".npz")
+# Read unconditionally by a111.recording.unpack
+_A111_REQUIRED_NAMES = ("mode", "sensor_config_dump", "session_info", "data", "data_info")
+
+
+@attrs.frozen(kw_only=True)
+class StorageOptions:
+    """How frames are stored in the converted recordings"""
+
+    compression: t.Optional[str] = attrs.field(default="gzip")
+    """``"gzip"``, ``"lzf"`` or ``None`` for no compression"""
+    compression_level: t.Optional[int] = 4
+    """Only used with ``"gzip"``, 0-9"""
+    shuffle: bool = True
+    """Apply the HDF5 byte shuffle filter, which often improves compression"""
+    chunk_frames: int = attrs.field(default=64, validator=attrs.validators.ge(1))
+    """Number of frames per HDF5 chunk"""
+    keep_algo_group: bool = True
+    """Keep the ``algo`` group (e.g. detector configs) of A121 recordings"""
+
+    @compression.validator
+    def _validate_compression(self, _: t.Any, compression: t.Optional[str]) -> None:
+        if compression not in ["gzip", "lzf", None]:
+            msg = f"compression must be 'gzip', 'lzf' or None, not {compression!r}"
+            raise ValueError(msg)
+
+    def _dataset_kwargs(self, shape: t.Tuple[int, ...]) -> t.Dict[str, t.Any]:
+        compressed = self.compression is not None
+        return dict(
+            chunks=(self.chunk_frames, *shape[1:]),
+            compression=self.compression,
+            compression_opts=self.compression_level if self.compression == "gzip" else None,
+            shuffle=self.shuffle and compressed,
+        )
+
+
+@attrs.frozen(kw_only=True)
+class ConversionResult:
+    source: Path
+    destination: Path
+    source_size: int = 0
+    destination_size: int = 0
+    num_frames: int = 0
+    duration: float = 0.0
+    """Time (in seconds) spent converting and verifying"""
+    error: t.Optional[str] = None
+
+
+class VerificationError(Exception):
+    """The converted recording differs from the original"""
+
+
+def convert_record(
+    source: t.Union[str, os.PathLike[str]],
+    destination: t.Union[str, os.PathLike[str]],
+    options: StorageOptions = StorageOptions(),
+    *,
+    verify: bool = True,
+    overwrite: bool = False,
+) -> ConversionResult:
+    """
+    Converts a single recording
+
+    Errors are not raised, but returned in :attr:`ConversionResult.error`. If the
+    conversion or verification fails, the destination is removed.
+    """
+    source = Path(source)
+    destination = Path(destination)
+    start = time.perf_counter()
+
+    try:
+        if destination.exists() and not overwrite:
+            msg = f"'{destination}' already exists"
+            raise FileExistsError(msg)
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            if _is_a121_record(source):
+                num_frames = _convert_a121(source, destination, options)
+                if verify:
+                    _verify_a121(source, destination)
+            else:
+                num_frames = _convert_a111(source, destination, options)
+                if verify:
+                    _verify_a111(source, destination)
+        except Exception:
+            destination.unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        return ConversionResult(
+            source=source,
+            destination=destination,
+            duration=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    return ConversionResult(
+        source=source,
+        destination=destination,
+        source_size=source.stat().st_size,
+        destination_size=destination.stat().st_size,
+        num_frames=num_frames,
+        duration=time.perf_counter() - start,
+    )
+
+
+def _convert_job(args: t.Tuple[t.Any, ...]) -> ConversionResult:
+    source, destination, options, verify, overwrite = args
+    return convert_record(source, destination, options, verify=verify, overwrite=overwrite)
+
+
+def convert_directory(
+    source: t.Union[str, os.PathLike[str]],
+    destination: t.Union[str, os.PathLike[str]],
+    options: StorageOptions = StorageOptions(),
+    *,
+    verify: bool = True,
+    overwrite: bool = False,
+    max_workers: t.Optional[int] = None,
+) -> t.List[ConversionResult]:
+    """
+    Converts all recordings in the ``source`` directory (recursively) in a process pool
+
+    The converted recordings keep their paths relative to ``source``, but always get the
+    ``.h5`` suffix.
+
+    :param max_workers:
+        Number of worker processes. ``None`` uses one per CPU, ``1`` converts in the
+        calling process.
+    """
+    source = Path(source)
+    destination = Path(destination)
+
+    sources = sorted(
+        path
+        for path in source.rglob("*")
+        if path.suffix.lower() in _RECORDING_SUFFIXES and path.is_file()
+    )
+    jobs = [
+        (path, (destination / path.relative_to(source)).with_suffix(".h5"), options)
+        for path in sources
+    ]
+
+    return list(
+        parallel_map(
+            _convert_job,
+            [(*job, verify, overwrite) for job in jobs],
+            max_workers=max_workers,
+        )
+    )
+
+
+def format_report(
+    results: t.Sequence[ConversionResult], wall_time: t.Optional[float] = None
+) -> str:
+    """
+    Formats a table of the conversions with totals
+
+    :param wall_time:
+        Total time (in seconds) of the conversion. Used for the throughput, which otherwise
+        is based on the summed up conversion times.
+    """
+    lines = [f"{'file':50} {'frames':>8} {'in [MB]':>9} {'out [MB]':>9} {'ratio':>6} {'[s]':>7}"]
+    for result in results:
+        if result.error is None:
+            lines.append(
+                f"{str(result.source):50} {result.num_frames:8} "
+                f"{result.source_size / 1e6:9.2f} {result.destination_size / 1e6:9.2f} "
+                f"{_ratio(result.destination_size, result.source_size):6.2f} "
+                f"{result.duration:7.2f}"
+            )
+        else:
+            lines.append(f"{str(result.source):50} FAILED {result.error}")
+
+    converted = [result for result in results if result.error is None]
+    source_size = sum(result.source_size for result in converted)
+    destination_size = sum(result.destination_size for result in converted)
+    duration = sum(result.duration for result in converted) if wall_time is None else wall_time
+
+    lines.extend(
+        [
+            "",
+            f"Converted {len(converted)} of {len(results)} recordings, "
+            f"{sum(result.num_frames for result in converted)} frames",
+            f"Size: {source_size / 1e6:.2f} MB -> {destination_size / 1e6:.2f} MB "
+            f"({_ratio(destination_size, source_size):.2f})",
+            f"Throughput: {_ratio(source_size / 1e6, duration):.2f} MB/s",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+def _is_a121_record(path: Path) -> bool:
+    if path.suffix.lower() != ".h5":
+        return False
+
+    with h5py.File(path, "r") as f:
+        return "generation" in f and bytes(f["generation"][()]).decode() == "a121"
+
+
+def _copy_group(source: h5py.Group, destination: h5py.Group, options: StorageOptions) -> None:
+    destination.attrs.update(source.attrs)
+
+    for name in source:
+        link = source.get(name, getlink=True)
+
+        if isinstance(link, h5py.SoftLink):
+            destination[name] = h5py.SoftLink(link.path)
+            continue
+
+        obj = source[name]
+
+        if isinstance(obj, h5py.Group):
+            _copy_group(obj, destination.create_group(name), options)
+        elif obj.ndim > 0 and obj.maxshape[0] is None:
+            # Datasets that grow with the number of frames
+            dataset = copy_frames(obj, destination, name, **options._dataset_kwargs(obj.shape))
+            dataset.attrs.update(obj.attrs)
+        else:
+            source.copy(obj, destination, name=name)
+
+
+def _convert_a121(source: Path, destination: Path, options: StorageOptions) -> int:
+    with h5py.File(source, "r") as src, h5py.File(destination, "w") as dst:
+        for name in src:
+            if name == "algo" and not options.keep_algo_group:
+                continue
+
+            link = src.get(name, getlink=True)
+            if isinstance(link, h5py.SoftLink):
+                dst[name] = h5py.SoftLink(link.path)
+            elif isinstance(src[name], h5py.Group):
+                _copy_group(src[name], dst.create_group(name), options)
+            else:
+                src.copy(src[name], dst, name=name)
+
+    with a121.open_record(destination) as record:
+        return sum(record.session(i).num_frames for i in range(record.num_sessions))
+
+
+def _get_calibrations_provided(session: SessionRecord) -> t.Optional[t.Dict[int, bool]]:
+    try:
+        return session.calibrations_provided
+    except RecordException:  # Recorded without calibrations
+        return None
+
+
+def _verify_a121(source: Path, destination: Path) -> None:
+    with a121.open_record(source) as expected, a121.open_record(destination) as actual:
+        if expected.num_sessions != actual.num_sessions:
+            msg = "Number of sessions differ"
+            raise VerificationError(msg)
+
+        for session_index in range(expected.num_sessions):
+            expected_session = expected.session(session_index)
+            actual_session = actual.session(session_index)
+            calibrations_provided = _get_calibrations_provided(expected_session)
+
+            if (
+                expected_session.session_config != actual_session.session_config
+                or expected_session.extended_metadata != actual_session.extended_metadata
+                or calibrations_provided != _get_calibrations_provided(actual_session)
+                or (
+                    calibrations_provided is not None
+                    and expected_session.calibrations != actual_session.calibrations
+                )
+                or expected_session.num_frames != actual_session.num_frames
+            ):
+                msg = f"Session {session_index} differs"
+                raise VerificationError(msg)
+
+            for frame_index, (expected_results, actual_results) in enumerate(
+                zip(expected_session.extended_results, actual_session.extended_results)
+            ):
+                if expected_results != actual_results:
+                    msg = f"Frame {frame_index} of session {session_index} differs"
+                    raise VerificationError(msg)
+
+
+def _open_a111(source: Path) -> t.Any:
+    if source.suffix.lower() == ".npz":
+        return np.load(source, allow_pickle=False)
+    else:
+        return h5py.File(source, "r")
+
+
+def _convert_a111(source: Path, destination: Path, options: StorageOptions) -> int:
+    with _open_a111(source) as src, h5py.File(destination, "w") as dst:
+        if "generation" in src or any(name not in src for name in _A111_REQUIRED_NAMES):
+            msg = f"'{source}' is neither an A111 nor an A121 recording"
+            raise ValueError(msg)
+
+        for name in src:
+            value = src[name]
+
+            if _is_string(value):
+                dst.create_dataset(
+                    name, data=_read_string(value), dtype=h5py.special_dtype(vlen=str)
+                )
+            elif value.ndim == 0:
+                dst.create_dataset(name, data=value[()])
+            else:
+                copy_frames(value, dst, name, **options._dataset_kwargs(value.shape))
+
+        return int(dst["data"].shape[0])
+
+
+def _verify_a111(source: Path, destination: Path) -> None:
+    with _open_a111(source) as expected, h5py.File(destination, "r") as actual:
+        if set(expected) != set(actual):
+            msg = "Datasets differ"
+            raise VerificationError(msg)
+
+        for name in expected:
+            expected_value = expected[name]
+            actual_value = actual[name]
+
+            if _is_string(expected_value):
+                equal = _read_string(expected_value) == _read_string(actual_value)
+            elif expected_value.ndim == 0:
+                equal = expected_value[()] == actual_value[()]
+            else:
+                equal = expected_value.shape == actual_value.shape and all(
+                    np.array_equal(expected_value[block], actual_value[block])
+                    for block in frame_blocks(actual_value)
+                )
+
+            if not equal:
+                msg = f"'{name}' differs"
+                raise VerificationError(msg)
+
+
+def _is_string(value: t.Any) -> bool:
+    # Strings, see a111.recording.save_h5
+    return bool(value.dtype.kind in "USO")
+
+
+def _read_string(value: t.Any) -> str:
+    string = value[()]
+    return string.decode() if isinstance(string, bytes) else str(string)
@@ -0,0 +1,581 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+"""
+SQLite index over many A121 recordings.
+
+Scanning a directory extracts the session configs, metadata, server and client info, frame
+counts and algo group keys of every recording into a local SQLite database. Queries are then
+answered from the database without opening a single recording:
+
+.. code-block:: python
+
+    with RecordIndex("recordings.sqlite") as index:
+        index.update(["path/to/recordings"])
+
+        for session in index.sessions(profile=a121.Profile.PROFILE_3, min_sweep_rate=1000):
+            with session.open() as session_record:
+                ...
+
+Updating is incremental. Recordings whose modification time and size are unchanged since
+they were indexed are not scanned again, and recordings that no longer exist are dropped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import typing as t
+from pathlib import Path
+
+import attrs
+import packaging.version
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121._core import utils as core_utils
+from acconeer.exptool.a121._core.entities import SessionRecord
+
+from ._parallel import parallel_map
+
+
+SCHEMA_VERSION = 1
+"""Version of the database layout. Databases of other versions are re-created"""
+
+_SCHEMA = """
+CREATE TABLE records (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    error TEXT,
+    lib_version TEXT,
+    timestamp TEXT,
+    uuid TEXT,
+    rss_version TEXT,
+    hardware_name TEXT,
+    server_info TEXT,
+    client_info TEXT,
+    algo_key TEXT
+);
+
+CREATE TABLE sessions (
+    id INTEGER PRIMARY KEY,
+    record_id INTEGER NOT NULL REFERENCES records(id) ON DELETE CASCADE,
+    session_index INTEGER NOT NULL,
+    num_frames INTEGER NOT NULL,
+    update_rate REAL,
+    session_config TEXT NOT NULL
+);
+
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    group_index INTEGER NOT NULL,
+    sensor_id INTEGER NOT NULL,
+    sweeps_per_frame INTEGER NOT NULL,
+    sweep_rate REAL NOT NULL,
+    frame_rate REAL,
+    calibration_temperature INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+
+CREATE TABLE subsweeps (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    subsweep_index INTEGER NOT NULL,
+    profile INTEGER NOT NULL,
+    prf TEXT NOT NULL,
+    hwaas INTEGER NOT NULL,
+    start_point INTEGER NOT NULL,
+    num_points INTEGER NOT NULL,
+    step_length INTEGER NOT NULL
+);
+
+CREATE INDEX sessions_record_id ON sessions(record_id);
+CREATE INDEX entries_session_id ON entries(session_id);
+CREATE INDEX entries_sensor_id ON entries(sensor_id);
+CREATE INDEX subsweeps_entry_id ON subsweeps(entry_id);
+"""
+
+_COMMIT_INTERVAL = 256
+_RECORD_COLUMNS = "r.path, r.lib_version, r.timestamp, r.uuid, r.rss_version, r.algo_key"
+
+
+@attrs.frozen
+class _ScannedEntry:
+    group_index: int
+    sensor_id: int
+    sensor_config: a121.SensorConfig
+    metadata: a121.Metadata
+
+
+@attrs.frozen
+class _ScannedSession:
+    num_frames: int
+    session_config: a121.SessionConfig
+    entries: t.List[_ScannedEntry]
+
+
+@attrs.frozen
+class _ScannedRecord:
+    path: str
+    mtime_ns: int
+    size: int
+    error: t.Optional[str] = None
+    lib_version: t.Optional[str] = None
+    timestamp: t.Optional[str] = None
+    uuid: t.Optional[str] = None
+    server_info: t.Optional[a121.ServerInfo] = None
+    client_info: t.Optional[a121.ClientInfo] = None
+    algo_key: t.Optional[str] = None
+    sessions: t.List[_ScannedSession] = attrs.field(factory=list)
+
+
+def _scan_record(path: str, mtime_ns: int, size: int) -> _ScannedRecord:
+    """Reads everything but the results from a recording. Runs in the worker processes
+
+    Any error while reading the recording is recorded on the returned record, so that a
+    single broken recording doesn't stop the update of the index.
+    """
+    try:
+        return _read_record(path, mtime_ns, size)
+    except Exception as e:
+        return _ScannedRecord(path=path, mtime_ns=mtime_ns, size=size, error=str(e) or repr(e))
+
+
+def _read_record(path: str, mtime_ns: int, size: int) -> _ScannedRecord:
+    record = a121.open_record(path)
+    assert isinstance(record, a121.H5Record)
+
+    with record:
+        try:
+            algo_key: t.Optional[str] = record._h5py_dataset_to_str(record.file["algo/key"])
+        except KeyError:
+            algo_key = None
+
+        sessions = []
+        for session_index in range(record.num_sessions):
+            session = record.session(session_index)
+            session_config = session.session_config
+            entries = [
+                _ScannedEntry(
+                    group_index=group_index,
+                    sensor_id=int(sensor_id),
+                    sensor_config=sensor_config,
+                    metadata=metadata,
+                )
+                for group_index, sensor_id, (sensor_config, metadata) in (
+                    core_utils.iterate_extended_structure(
+                        core_utils.zip_extended_structures(
+                            session_config.groups, session.extended_metadata
+                        )
+                    )
+                )
+            ]
+            sessions.append(
+                _ScannedSession(
+                    num_frames=session.num_frames, session_config=session_config, entries=entries
+                )
+            )
+
+        return _ScannedRecord(
+            path=path,
+            mtime_ns=mtime_ns,
+            size=size,
+            lib_version=record.lib_version,
+            timestamp=record.timestamp,
+            uuid=record.uuid,
+            server_info=record.server_info,
+            client_info=record.client_info,
+            algo_key=algo_key,
+            sessions=sessions,
+        )
+
+
+def _rss_version_at_least(rss_version: t.Optional[str], min_version: str) -> bool:
+    if rss_version is None:
+        return False
+
+    try:
+        return core_utils.parse_rss_version(rss_version) >= packaging.version.Version(min_version)
+    except ValueError:
+        return False
+
+
+@attrs.frozen(kw_only=True)
+class UpdateSummary:
+    num_indexed: int
+    """Number of recordings that were (re-)scanned"""
+    num_unchanged: int
+    """Number of recordings that were already up to date"""
+    num_removed: int
+    """Number of recordings that no longer exist and were dropped from the index"""
+    failed: t.List[str]
+    """Paths of the scanned files that could not be read as A121 recordings"""
+
+
+@attrs.frozen(kw_only=True)
+class IndexedRecord:
+    """A recording in the index. Nothing is read from the file until it's opened"""
+
+    path: Path
+    lib_version: str
+    timestamp: str
+    uuid: str
+    rss_version: str
+    algo_key: t.Optional[str]
+
+    def open(self) -> a121.PersistentRecord:
+        """Opens the recording, see :func:`a121.open_record`"""
+        return a121.open_record(self.path)
+
+
+@attrs.frozen(kw_only=True)
+class IndexedSession:
+    """A session in the index. Nothing is read from the file until it's opened"""
+
+    record: IndexedRecord
+    session_index: int
+    num_frames: int
+    _session_config_json: str
+
+    @property
+    def session_config(self) -> a121.SessionConfig:
+        return a121.SessionConfig.from_json(self._session_config_json)
+
+    @contextlib.contextmanager
+    def open(self) -> t.Iterator[SessionRecord]:
+        """Opens the recording and gives the session. The recording is closed on exit"""
+        with self.record.open() as record:
+            yield record.session(self.session_index)
+
+
+class RecordIndex:
+    """
+    An index stored in the SQLite database at ``database_path``
+
+    The database is created if it doesn't exist. Use the index as a context manager, or
+    :meth:`close` it when done.
+    """
+
+    def __init__(self, database_path: t.Union[str, os.PathLike[str]]) -> None:
+        self._connection = sqlite3.connect(database_path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.create_function(
+            "rss_version_at_least", 2, _rss_version_at_least, deterministic=True
+        )
+
+        (schema_version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if schema_version != SCHEMA_VERSION:
+            self._create_schema()
+
+    def _create_schema(self) -> None:
+        # The index only holds what can be scanned again, so older layouts are thrown away
+        with self._connection:
+            for table in ["subsweeps", "entries", "sessions", "records"]:
+                self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self) -> RecordIndex:
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def update(
+        self,
+        paths: t.Iterable[t.Union[str, os.PathLike[str]]],
+        *,
+        max_workers: t.Optional[int] = None,
+    ) -> UpdateSummary:
+        """
+        Indexes the recordings (``*.h5``) in the given files and directories
+
+        Directories are searched recursively. Recordings that are new or modified since
+        they were last indexed are scanned in a process pool, the others are skipped.
+        Indexed recordings in the given directories that no longer exist are removed.
+
+        :param paths: Files and directories to index
+        :param max_workers:
+            Number of worker processes. ``None`` uses one per CPU, ``1`` scans in the
+            calling process.
+        """
+        roots = [Path(path).resolve() for path in paths]
+        found = {}
+        for root in roots:
+            if root.is_dir():
+                files = sorted(root.rglob("*.h5"))
+            else:
+                files = [root] if root.exists() else []
+
+            for file in files:
+                stat = file.stat()
+                found[str(file)] = (stat.st_mtime_ns, stat.st_size)
+
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._connection.execute(
+                "SELECT path, mtime_ns, size FROM records"
+            )
+        }
+
+        removed = [
+            path
+            for path in indexed
+            if path not in found and any(Path(path).is_relative_to(root) for root in roots)
+        ]
+        to_scan = [
+            (path, mtime_ns, size)
+            for path, (mtime_ns, size) in found.items()
+            if indexed.get(path) != (mtime_ns, size)
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM records WHERE path = ?", [(path,) for path in removed]
+            )
+
+        paths, mtimes, sizes = zip(*to_scan) if to_scan else ((), (), ())
+        # Scanning a recording is quick, so they are handed out to the workers in batches
+        scanned_records = parallel_map(
+            _scan_record, paths, mtimes, sizes, max_workers=max_workers, chunksize=16
+        )
+
+        failed = []
+        for i, scanned_record in enumerate(scanned_records):
+            self._insert(scanned_record)
+
+            if scanned_record.error is not None:
+                failed.append(scanned_record.path)
+
+            if (i + 1) % _COMMIT_INTERVAL == 0:
+                self._connection.commit()
+
+        self._connection.commit()
+
+        return UpdateSummary(
+            num_indexed=len(to_scan),
+            num_unchanged=len(found) - len(to_scan),
+            num_removed=len(removed),
+            failed=failed,
+        )
+
+    def _insert(self, scanned: _ScannedRecord) -> None:
+        self._connection.execute("DELETE FROM records WHERE path = ?", (scanned.path,))
+        server_info = scanned.server_info
+        record_id = self._connection.execute(
+            "INSERT INTO records (path, mtime_ns, size, error, lib_version, timestamp, uuid, "
+            "rss_version, hardware_name, server_info, client_info, algo_key) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                scanned.path,
+                scanned.mtime_ns,
+                scanned.size,
+                scanned.error,
+                scanned.lib_version,
+                scanned.timestamp,
+                scanned.uuid,
+                None if server_info is None else server_info.rss_version,
+                None if server_info is None else server_info.hardware_name,
+                None if server_info is None else server_info.to_json(),
+                None if scanned.client_info is None else scanned.client_info.to_json(),
+                scanned.algo_key,
+            ),
+        ).lastrowid
+
+        for session_index, session in enumerate(scanned.sessions):
+            session_id = self._connection.execute(
+                "INSERT INTO sessions (record_id, session_index, num_frames, update_rate, "
+                "session_config) VALUES (?, ?, ?, ?, ?)",
+                (
+                    record_id,
+                    session_index,
+                    session.num_frames,
+                    session.session_config.update_rate,
+                    session.session_config.to_json(),
+                ),
+            ).lastrowid
+
+            for entry in session.entries:
+                sensor_config = entry.sensor_config
+                # Without a sweep rate, the sensor sweeps as fast as it can
+                sweep_rate = (
+                    entry.metadata.max_sweep_rate
+                    if sensor_config.sweep_rate is None
+                    else sensor_config.sweep_rate
+                )
+                entry_id = self._connection.execute(
+                    "INSERT INTO entries (session_id, group_index, sensor_id, sweeps_per_frame, "
+                    "sweep_rate, frame_rate, calibration_temperature, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        session_id,
+                        entry.group_index,
+                        entry.sensor_id,
+                        sensor_config.sweeps_per_frame,
+                        sweep_rate,
+                        sensor_config.frame_rate,
+                        entry.metadata.calibration_temperature,
+                        entry.metadata.to_json(),
+                    ),
+                ).lastrowid
+
+                self._connection.executemany(
+                    "INSERT INTO subsweeps (entry_id, subsweep_index, profile, prf, hwaas, "
+                    "start_point, num_points, step_length) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            entry_id,
+                            subsweep_index,
+                            subsweep.profile.value,
+                            subsweep.prf.name,
+                            subsweep.hwaas,
+                            subsweep.start_point,
+                            subsweep.num_points,
+                            subsweep.step_length,
+                        )
+                        for subsweep_index, subsweep in enumerate(sensor_config.subsweeps)
+                    ],
+                )
+
+    def sessions(
+        self,
+        *,
+        sensor_id: t.Optional[int] = None,
+        profile: t.Optional[a121.Profile] = None,
+        min_sweep_rate: t.Optional[float] = None,
+        min_rss_version: t.Optional[str] = None,
+        min_num_frames: t.Optional[int] = None,
+        algo_key: t.Optional[str] = None,
+        where: t.Optional[str] = None,
+        parameters: t.Sequence[t.Any] = (),
+    ) -> t.Iterator[IndexedSession]:
+        """
+        Yields the indexed sessions that match all given filters
+
+        Sensor filters (``sensor_id``, ``profile`` and ``min_sweep_rate``) need to match
+        the same sensor config in the session. ``profile`` matches if any subsweep has it.
+
+        :param min_rss_version: E.g. ``"1.4.0"``
+        :param where:
+            Additional SQL condition on the ``records r`` and ``sessions s`` tables,
+            e.g. ``"r.hardware_name = ?"``
+        :param parameters: Parameters of ``where``
+        """
+        conditions, condition_parameters = self._conditions(
+            sensor_id=sensor_id,
+            profile=profile,
+            min_sweep_rate=min_sweep_rate,
+            min_rss_version=min_rss_version,
+            min_num_frames=min_num_frames,
+            algo_key=algo_key,
+            where=where,
+        )
+        rows = self._connection.execute(
+            f"SELECT {_RECORD_COLUMNS}, s.session_index, s.num_frames, s.session_config "
+            "FROM sessions s JOIN records r ON r.id = s.record_id "
+            f"WHERE {conditions} ORDER BY r.path, s.session_index",
+            (*condition_parameters, *parameters),
+        )
+
+        for row in rows:
+            session_index, num_frames, session_config_json = row[-3:]
+            yield IndexedSession(
+                record=self._indexed_record(row[:-3]),
+                session_index=session_index,
+                num_frames=num_frames,
+                session_config_json=session_config_json,
+            )
+
+    def records(self, **filters: t.Any) -> t.Iterator[IndexedRecord]:
+        """Yields the indexed records with any session that matches, see :meth:`sessions`"""
+        last_path = None
+        for session in self.sessions(**filters):
+            if session.record.path != last_path:
+                last_path = session.record.path
+                yield session.record
+
+    @staticmethod
+    def _conditions(
+        *,
+        sensor_id: t.Optional[int],
+        profile: t.Optional[a121.Profile],
+        min_sweep_rate: t.Optional[float],
+        min_rss_version: t.Optional[str],
+        min_num_frames: t.Optional[int],
+        algo_key: t.Optional[str],
+        where: t.Optional[str],
+    ) -> t.Tuple[str, t.List[t.Any]]:
+        conditions = ["r.error IS NULL"]
+        parameters: t.List[t.Any] = []
+
+        entry_conditions = ["e.session_id = s.id"]
+        if sensor_id is not None:
+            entry_conditions.append("e.sensor_id = ?")
+            parameters.append(sensor_id)
+        if min_sweep_rate is not None:
+            entry_conditions.append("e.sweep_rate >= ?")
+            parameters.append(min_sweep_rate)
+        if profile is not None:
+            entry_conditions.append(
+                "EXISTS (SELECT 1 FROM subsweeps ss WHERE ss.entry_id = e.id AND ss.profile = ?)"
+            )
+            parameters.append(profile.value)
+        if len(entry_conditions) > 1:
+            conditions.append(
+                f"EXISTS (SELECT 1 FROM entries e WHERE {' AND '.join(entry_conditions)})"
+            )
+
+        if min_rss_version is not None:
+            conditions.append("rss_version_at_least(r.rss_version, ?)")
+            parameters.append(min_rss_version)
+        if min_num_frames is not None:
+            conditions.append("s.num_frames >= ?")
+            parameters.append(min_num_frames)
+        if algo_key is not None:
+            conditions.append("r.algo_key = ?")
+            parameters.append(algo_key)
+        if where is not None:
+            conditions.append(f"({where})")
+
+        return " AND ".join(conditions), parameters
+
+    @staticmethod
+    def _indexed_record(row: t.Sequence[t.Any]) -> IndexedRecord:
+        path, lib_version, timestamp, uuid, rss_version, algo_key = row
+        return IndexedRecord(
+            path=Path(path),
+            lib_version=lib_version,
+            timestamp=timestamp,
+            uuid=uuid,
+            rss_version=rss_version,
+            algo_key=algo_key,
+        )
+
+    def server_info(self, record: IndexedRecord) -> a121.ServerInfo:
+        """Returns the server info of an indexed record"""
+        (server_info,) = self._connection.execute(
+            "SELECT server_info FROM records WHERE path = ?", (str(record.path),)
+        ).fetchone()
+        return a121.ServerInfo.from_json(server_info)
+
+    def extended_metadata(self, session: IndexedSession) -> t.List[t.Dict[int, a121.Metadata]]:
+        """Returns the metadata of an indexed session"""
+        rows = self._connection.execute(
+            "SELECT e.group_index, e.sensor_id, e.metadata FROM entries e "
+            "JOIN sessions s ON s.id = e.session_id JOIN records r ON r.id = s.record_id "
+            "WHERE r.path = ? AND s.session_index = ? ORDER BY e.id",
+            (str(session.record.path), session.session_index),
+        )
+
+        extended_metadata: t.List[t.Dict[int, a121.Metadata]] = []
+        for group_index, sensor_id, metadata in rows:
+            if group_index == len(extended_metadata):
+                extended_metadata.append({})
+            extended_metadata[group_index][sensor_id] = a121.Metadata.from_json(metadata)
+
+        return extended_metadata
@@ -0,0 +1,158 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+"""
+Extracts frame ranges, sessions, groups and sensors of a recording into a new recording.
+
+.. code-block:: python
+
+    # Frames 10000 to 20000 of session 3, only sensor 2
+    slice_record("big.h5", "small.h5", sessions=[3], start=10000, stop=20000, sensor_ids=[2])
+
+The frames are copied dataset to dataset in blocks of whole chunks, keeping the storage
+(chunking and compression) of the original. Memory use is bounded regardless of the number
+of frames. Session configs, metadata, calibrations and the algo group are kept.
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+import h5py
+
+from acconeer.exptool import a121
+from acconeer.exptool._core.recording.h5_session_schema import SessionSchema
+from acconeer.exptool.a121._core.recording.h5_record.record import H5SessionRecord
+
+from ._copy import copy_frames, storage_kwargs
+
+
+def slice_record(
+    source: t.Union[str, os.PathLike[str]],
+    destination: t.Union[str, os.PathLike[str]],
+    *,
+    sessions: t.Optional[t.Sequence[int]] = None,
+    start: t.Optional[int] = None,
+    stop: t.Optional[int] = None,
+    groups: t.Optional[t.Collection[int]] = None,
+    sensor_ids: t.Optional[t.Collection[int]] = None,
+    keep_algo_group: bool = True,
+    overwrite: bool = False,
+) -> None:
+    """
+    Copies a part of the ``source`` recording to a new recording at ``destination``
+
+    :param sessions: Indices of the sessions to keep, in order. Defaults to all sessions
+    :param start: First frame to keep in every kept session, like in ``slice``
+    :param stop: Frame to stop before in every kept session, like in ``slice``
+    :param groups: Indices of the groups to keep. Defaults to all groups
+    :param sensor_ids: Sensors to keep in the kept groups. Defaults to all sensors
+    :param keep_algo_group: Keep the ``algo`` group (e.g. detector configs)
+    :param overwrite: Overwrite ``destination`` if it exists
+    :raises ValueError:
+        If a session doesn't exist or has no groups or sensors left after the selection.
+        Nothing is written in that case.
+    """
+    with a121.open_record(source) as record:
+        assert isinstance(record, a121.H5Record)
+
+        session_indices = range(record.num_sessions) if sessions is None else sessions
+        for session_index in session_indices:
+            if not 0 <= session_index < record.num_sessions:
+                msg = f"The record has no session {session_index}"
+                raise ValueError(msg)
+
+        dst = h5py.File(destination, "w" if overwrite else "x")
+
+        try:
+            for name, obj in record.file.items():
+                if isinstance(obj, h5py.Dataset):
+                    record.file.copy(obj, dst, name=name)
+
+            if keep_algo_group and "algo" in record.file:
+                record.file.copy(record.file["algo"], dst, name="algo")
+
+            for session_index in session_indices:
+                _slice_session(
+                    record.session(session_index),
+                    SessionSchema.create_next_session_group(dst),
+                    frames=slice(start, stop),
+                    groups=groups,
+                    sensor_ids=sensor_ids,
+                )
+        except BaseException:
+            dst.close()
+            os.remove(destination)
+            raise
+
+        dst.close()
+
+
+def _slice_session(
+    session: H5SessionRecord,
+    dst: h5py.Group,
+    frames: slice,
+    groups: t.Optional[t.Collection[int]],
+    sensor_ids: t.Optional[t.Collection[int]],
+) -> None:
+    session_config = session.session_config
+    start, stop, _ = frames.indices(session.num_frames)
+    stop = max(start, stop)
+
+    kept_groups = []
+    for group_index, entries in enumerate(session.entry_groups):
+        if groups is not None and group_index not in groups:
+            continue
+
+        kept_entries = {
+            int(sensor_id): entry
+            for sensor_id, entry in entries.items()
+            if sensor_ids is None or sensor_id in sensor_ids
+        }
+        if kept_entries:
+            kept_groups.append((group_index, kept_entries))
+
+    if not kept_groups:
+        msg = "No groups or sensors left in the session after the selection"
+        raise ValueError(msg)
+
+    new_session_config = a121.SessionConfig(
+        [
+            {
+                sensor_id: session_config.groups[group_index][sensor_id]
+                for sensor_id in kept_entries
+            }
+            for group_index, kept_entries in kept_groups
+        ],
+        extended=session_config.extended,
+        update_rate=session_config.update_rate,
+    )
+    dst.create_dataset(
+        "session_config",
+        data=new_session_config.to_json(),
+        dtype=a121._H5PY_STR_DTYPE,
+        track_times=False,
+    )
+
+    for new_group_index, (_, kept_entries) in enumerate(kept_groups):
+        group_group = dst.create_group(f"group_{new_group_index}")
+
+        for new_entry_index, entry in enumerate(kept_entries.values()):
+            entry_group = group_group.create_group(f"entry_{new_entry_index}")
+            entry.copy(entry["sensor_id"], entry_group, name="sensor_id")
+            entry.copy(entry["metadata"], entry_group, name="metadata")
+
+            result_group = entry_group.create_group("result")
+            for name, dataset in entry["result"].items():
+                copy_frames(dataset, result_group, name, start, stop, **storage_kwargs(dataset))
+
+    if "calibrations" in session.group:
+        kept_sensor_ids = {sensor_id for _, entries in kept_groups for sensor_id in entries}
+        calibrations_group = dst.create_group("calibrations")
+
+        for sensor_id in sorted(kept_sensor_ids):
+            name = f"sensor_{sensor_id}"
+            if name in session.group["calibrations"]:
+                session.group.copy(
+                    session.group[f"calibrations/{name}"], calibrations_group, name=name
+                )
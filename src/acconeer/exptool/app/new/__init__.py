@@ -1,6 +1,12 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
+from __future__ import annotations
+
+import typing as t
+
+from acconeer.exptool._core.lazy_import import lazy_module_getattr
+
 from ._enums import (
     ConnectionInterface,
     ConnectionState,
@@ -10,8 +16,6 @@ from ._enums import (
 )
 from ._exceptions import HandledException
 from ._version_checker import check_package_outdated, get_latest_changelog
-from .app import main
-from .app_model import AppModel
 from .backend import (
     ApplicationClient,
     BackendLogger,
@@ -21,23 +25,52 @@ from .backend import (
     PluginStateMessage,
     is_task,
 )
-from .plugin_loader import register_plugin
-from .pluginbase import (
-    PgPlotPlugin,
-    PlotPluginBase,
-    PluginPresetBase,
-    PluginSpecBase,
-    ViewPluginBase,
-    visual_policies,
-)
 from .storage import get_temp_dir, get_temp_h5_path
-from .ui import (
-    AttrsConfigEditor,
-    GroupBox,
-    MiscErrorView,
-    PidgetFactoryMapping,
-    PidgetGroupFactoryMapping,
-    TwoSensorIdsEditor,
-    icons,
-    pidgets,
-)
+
+
+if t.TYPE_CHECKING:
+    from .app import main
+    from .app_model import AppModel
+    from .plugin_loader import register_plugin
+    from .pluginbase import (
+        PgPlotPlugin,
+        PlotPluginBase,
+        PluginPresetBase,
+        PluginSpecBase,
+        ViewPluginBase,
+        visual_policies,
+    )
+    from .ui import (
+        AttrsConfigEditor,
+        GroupBox,
+        MiscErrorView,
+        PidgetFactoryMapping,
+        PidgetGroupFactoryMapping,
+        TwoSensorIdsEditor,
+        icons,
+        pidgets,
+    )
+
+# The app, plugin bases and UI depend on PySide6 and pyqtgraph. They are imported on first
+# access, so that the backend (e.g. the headless runner) can be used without Qt.
+_LAZY_ATTRIBUTE_MODULES = {
+    "main": ".app",
+    "AppModel": ".app_model",
+    "register_plugin": ".plugin_loader",
+    "PgPlotPlugin": ".pluginbase",
+    "PlotPluginBase": ".pluginbase",
+    "PluginPresetBase": ".pluginbase",
+    "PluginSpecBase": ".pluginbase",
+    "ViewPluginBase": ".pluginbase",
+    "visual_policies": ".pluginbase",
+    "AttrsConfigEditor": ".ui",
+    "GroupBox": ".ui",
+    "MiscErrorView": ".ui",
+    "PidgetFactoryMapping": ".ui",
+    "PidgetGroupFactoryMapping": ".ui",
+    "TwoSensorIdsEditor": ".ui",
+    "icons": ".ui",
+    "pidgets": ".ui",
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_ATTRIBUTE_MODULES)
@@ -117,9 +117,9 @@ def main() -> None:
 
     backend: Backend
     if args.same_process:
-        backend = GenBackend()
+        backend = GenBackend(pipelined=args.pipelined_backend)
     else:
-        backend = MpBackend()
+        backend = MpBackend(pipelined=args.pipelined_backend)
     backend.start()
 
     model = AppModel(
@@ -323,6 +323,15 @@ class _ExptoolArgumentParser(argparse.ArgumentParser):
             action="store_true",
             help="Run the application backend in the main thread. Deteriorates performance but enables backend plugin debugging (e.g. with breakpoint())",
         )
+        dbg_group.add_argument(
+            "--pipelined-backend",
+            action="store_true",
+            help=(
+                "Run acquisition, processing and sending of results on separate threads "
+                + "in the application backend (if supported by the plugin). "
+                + "Per-stage timings are shown in the AppModelViewer ('--amv')"
+            ),
+        )
         dbg_group.add_argument(
             "--amv",
             action="store_true",
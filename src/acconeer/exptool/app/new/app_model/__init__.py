@@ -1,5 +1,25 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
-from .app_model import AppModel, PluginPresetSpec, PluginSpec
+from __future__ import annotations
+
+import typing as t
+
+from acconeer.exptool._core.lazy_import import lazy_module_getattr
+
+from .lazy_plugin_spec import LazyPluginSpec, resolve_plugin_spec
 from .plugin_protocols import PlotPluginInterface
+
+
+if t.TYPE_CHECKING:
+    from .app_model import AppModel, PluginPresetSpec, PluginSpec
+
+# The app model depends on PySide6 and is imported on first access, like in
+# acconeer.exptool.app.new, so that the plugin loader can be used without Qt.
+_LAZY_ATTRIBUTE_MODULES = {
+    "AppModel": ".app_model",
+    "PluginPresetSpec": ".app_model",
+    "PluginSpec": ".app_model",
+}
+
+__getattr__ = lazy_module_getattr(globals(), _LAZY_ATTRIBUTE_MODULES)
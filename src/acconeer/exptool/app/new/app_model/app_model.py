@@ -66,6 +66,7 @@ from acconeer.exptool.app.new.backend import (
 )
 from acconeer.exptool.app.new.storage import get_config_dir, remove_temp_dir
 
+from .lazy_plugin_spec import resolve_plugin_spec
 from .plugin_protocols import PlotPluginInterface
 from .port_updater import PortUpdater
 
@@ -88,14 +89,25 @@ class PluginPresetSpec(Protocol):
 class PluginSpec(Protocol):
     """Defines what AppModel needs to know about a plugin.
 
-    Implementations are free to add additional fields.
+    Implementations are free to add additional fields. The fields are read-only
+    properties, so that they can be implemented as attributes as well as properties
+    (e.g. by the frozen ``LazyPluginSpec``).
     """
 
-    key: str
-    generation: PluginGeneration
-    presets: List[PluginPresetSpec]
-    title: str
-    default_preset_id: Enum
+    @property
+    def key(self) -> str: ...
+
+    @property
+    def generation(self) -> PluginGeneration: ...
+
+    @property
+    def presets(self) -> List[PluginPresetSpec]: ...
+
+    @property
+    def title(self) -> str: ...
+
+    @property
+    def default_preset_id(self) -> Enum: ...
 
     def create_backend_plugin(
         self, callback: Callable[[Message], None], key: str
@@ -835,6 +847,7 @@ class AppModel(QObject):
 
     def load_plugin(self, plugin: Optional[PluginSpec]) -> None:
         log.debug(f"AppModel is loading the plugin {plugin}")
+        plugin = resolve_plugin_spec(plugin)
         if plugin == self.plugin:
             return
 
@@ -0,0 +1,67 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import importlib
+from enum import Enum
+from typing import Any, Callable, List, Optional
+
+import attrs
+
+from acconeer.exptool.app.new._enums import PluginFamily, PluginGeneration
+
+
+@attrs.frozen(kw_only=True)
+class LazyPluginSpec:
+    """Stand-in for a plugin spec whose module has not been imported yet
+
+    Holds the metadata needed to list the plugin in the UI. The module defining the real
+    spec (``module``.``attribute``), including its backend, view and plot plugins, is
+    imported by :meth:`load` the first time anything else is needed.
+
+    If ``backend_module`` is given, backend plugins are created from its ``BackendPlugin``
+    without importing ``module``, which lets the backend run without PySide6.
+    """
+
+    generation: PluginGeneration = attrs.field()
+    key: str = attrs.field()
+    title: str = attrs.field()
+    docs_link: Optional[str] = attrs.field(default=None)
+    description: Optional[str] = attrs.field(default=None)
+    family: PluginFamily = attrs.field()
+    module: str = attrs.field()
+    attribute: str = attrs.field()
+    backend_module: Optional[str] = attrs.field(default=None)
+
+    def load(self) -> Any:
+        """Imports and returns the real plugin spec"""
+        return getattr(importlib.import_module(self.module), self.attribute)
+
+    @property
+    def presets(self) -> List[Any]:
+        return self.load().presets  # type: ignore[no-any-return]
+
+    @property
+    def default_preset_id(self) -> Enum:
+        return self.load().default_preset_id  # type: ignore[no-any-return]
+
+    def create_backend_plugin(self, callback: Callable[[Any], None], key: str) -> Any:
+        if self.backend_module is None:
+            return self.load().create_backend_plugin(callback, key)
+
+        backend_plugin = importlib.import_module(self.backend_module).BackendPlugin
+        return backend_plugin(callback=callback, generation=self.generation, key=key)
+
+    def create_view_plugin(self, app_model: Any) -> Any:
+        return self.load().create_view_plugin(app_model=app_model)
+
+    def create_plot_plugin(self, app_model: Any) -> Any:
+        return self.load().create_plot_plugin(app_model=app_model)
+
+
+def resolve_plugin_spec(plugin: Any) -> Any:
+    """Returns the real plugin spec behind ``plugin`` if it is a :class:`LazyPluginSpec`"""
+    if isinstance(plugin, LazyPluginSpec):
+        return plugin.load()
+    return plugin
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from ._application_client import ApplicationClient
@@ -19,5 +19,7 @@ from ._message import (
     TimingMessage,
 )
 from ._model import Model
+from ._pipeline import BackendPipeline
 from ._rate_calc import _RateCalculator, _RateStats
 from ._tasks import Task, is_task
+from ._trace import TraceRecorder
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import time
 import warnings
 from typing import Any, Callable, Generic, Optional, TypeVar, Union, cast
 
@@ -14,6 +15,7 @@ from acconeer.exptool.a121._core import utils
 
 from ._message import GeneralMessage, Message, StatusMessage
 from ._rate_calc import _RateCalculator, _RateStats
+from ._trace import get_trace_recorder
 
 
 ClientT = TypeVar("ClientT", bound=Client[Any, Any, Any, Any, Any])
@@ -102,6 +104,7 @@ class ApplicationClient(Generic[ClientT]):
         self.extractor_strategy = extractor_strategy
         self._rate_stats_calc = None
         self._frame_count = 0
+        self._trace_recorder = get_trace_recorder(callback)
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -130,7 +133,13 @@ class ApplicationClient(Generic[ClientT]):
         assert self._rate_stats_calc is not None
 
         with warnings.catch_warnings(record=True) as caught_warnings:
-            result = self._wrapped_client.get_next()
+            if self._trace_recorder is None:
+                result = self._wrapped_client.get_next()
+            else:
+                # Recorded directly instead of sent as a message to keep it off the IPC queue
+                start = time.perf_counter()
+                result = self._wrapped_client.get_next()
+                self._trace_recorder.add_span("Client.get_next()", start, time.perf_counter())
 
         for w in caught_warnings:
             if isinstance(w.message, str):
@@ -20,6 +20,7 @@ from ._backend_logger import BackendLogger
 from ._message import GeneralMessage, Message
 from ._model import Model
 from ._tasks import Task
+from ._trace import TraceRecorder
 
 
 log = logging.getLogger(__name__)
@@ -42,7 +43,7 @@ FromBackendQueueItem = Union[Message, ClosedTask]
 class MpBackend:
     """Application backend implemented with ``multiprocessing`` (runs in a separate process)"""
 
-    def __init__(self) -> None:
+    def __init__(self, pipelined: bool = False) -> None:
         self._recv_queue: mp.Queue[FromBackendQueueItem] = mp.Queue()
         self._send_queue: mp.Queue[ToBackendQueueItem] = mp.Queue()
         self._stop_event = mp.Event()
@@ -52,6 +53,7 @@ class MpBackend:
                 self._send_queue,
                 self._recv_queue,
                 self._stop_event,
+                pipelined,
             ),
             daemon=True,
         )
@@ -98,7 +100,7 @@ class MpBackend:
 class GenBackend:
     """Application backend implemented with a generator (runs in a main process)"""
 
-    def __init__(self) -> None:
+    def __init__(self, pipelined: bool = False) -> None:
         self._recv_queue: mp.Queue[FromBackendQueueItem] = mp.Queue()
         self._send_queue: mp.Queue[ToBackendQueueItem] = mp.Queue()
         self._stop_event = mp.Event()
@@ -108,6 +110,7 @@ class GenBackend:
             self._stop_event,
             cpu_msg_interval_s=0.5,
             recv_queue_block=False,
+            pipelined=pipelined,
         )
 
     def start(self) -> None:
@@ -146,6 +149,7 @@ def process_program(
     recv_queue: mp.Queue[ToBackendQueueItem],
     send_queue: mp.Queue[FromBackendQueueItem],
     stop_event: mp_EventType,
+    pipelined: bool = False,
 ) -> None:
     # Continuously consumes from the generator,
     # making the 'yield' not have any effect
@@ -156,6 +160,7 @@ def process_program(
         cpu_msg_interval_s=0.5,
         recv_queue_block=True,
         recv_queue_timeout_s=0.5,
+        pipelined=pipelined,
     ):
         pass
 
@@ -167,15 +172,19 @@ def process_generator(
     cpu_msg_interval_s: float,
     recv_queue_block: bool,
     recv_queue_timeout_s: Optional[float] = None,
+    pipelined: bool = False,
 ) -> Generator[None, None, None]:
     process = psutil.Process()
     process.cpu_percent()
     last_cpu_msg_time = time.monotonic()
 
+    trace_recorder = TraceRecorder()
+    send = trace_recorder.wrap(send_queue.put)
+
     try:
         BackendLogger.set_callback(send_queue.put)
         process_log = BackendLogger.getLogger(__name__)
-        model = Model(task_callback=send_queue.put)
+        model = Model(task_callback=send, pipelined=pipelined, trace_recorder=trace_recorder)
         model_wants_to_idle = False
 
         while not stop_event.is_set():
@@ -184,7 +193,7 @@ def process_generator(
             if now - last_cpu_msg_time > cpu_msg_interval_s:
                 last_cpu_msg_time = now
                 cpu_percent = round(process.cpu_percent())
-                send_queue.put(
+                send(
                     GeneralMessage(
                         name="cpu_percent",
                         data=cpu_percent,
@@ -212,7 +221,7 @@ def process_generator(
                     model_wants_to_idle = model.idle()
                 except Exception as exc:
                     model_wants_to_idle = False
-                    send_queue.put(
+                    send(
                         GeneralMessage(
                             name="error",
                             exception=exc,
@@ -234,9 +243,9 @@ def process_generator(
                 try:
                     model.execute_task(task)
                 except Exception as exc:
-                    send_queue.put(ClosedTask(key, exc, traceback.format_exc()))
+                    send(ClosedTask(key, exc, traceback.format_exc()))
                 else:
-                    send_queue.put(ClosedTask(key))
+                    send(ClosedTask(key))
 
                 model_wants_to_idle = True
             else:
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -30,6 +30,9 @@ StateT = TypeVar("StateT")
 class BackendPlugin(abc.ABC, Generic[StateT]):
     shared_state: StateT
 
+    pipelined: bool = False
+    """Opt-in to run acquisition, processing and IPC on separate threads, if supported"""
+
     def __init__(
         self, callback: Callable[[Message], None], generation: PluginGeneration, key: str
     ) -> None:
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -61,6 +61,7 @@ class TimingMessage(Message):
     name: str
     start: float
     end: float
+    occupancy: Optional[int] = None  # items queued up for the timed stage, if queue-fed
 
 
 @attrs.frozen(kw_only=True, slots=False)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import contextlib
 import time
+from pathlib import Path
 from typing import Any, Callable, Iterator, Optional, TypeVar
 
 import packaging.version
@@ -12,6 +13,7 @@ import packaging.version
 from acconeer.exptool import _core as core
 from acconeer.exptool.app.new._enums import ConnectionState, PluginState
 from acconeer.exptool.app.new._exceptions import HandledException
+from acconeer.exptool.app.new.storage import get_temp_dir
 
 from ._backend_logger import BackendLogger
 from ._backend_plugin import BackendPlugin
@@ -23,6 +25,7 @@ from ._message import (
     TimingMessage,
 )
 from ._tasks import Task, get_task, get_task_names, is_task
+from ._trace import TraceRecorder
 
 
 _AnyClient = core.Client[Any, Any, Any, Any, Any]
@@ -37,10 +40,17 @@ class Model:
     backend_plugin: Optional[BackendPlugin[Any]]
     client: Optional[_AnyClient]
 
-    def __init__(self, task_callback: Callable[[Message], None]) -> None:
+    def __init__(
+        self,
+        task_callback: Callable[[Message], None],
+        pipelined: bool = False,
+        trace_recorder: Optional[TraceRecorder] = None,
+    ) -> None:
         self.backend_plugin = None
         self.client = None
         self.task_callback = task_callback
+        self.pipelined = pipelined
+        self.trace_recorder = trace_recorder
         self._logger = BackendLogger.getLogger(__name__)
 
     def idle(self) -> bool:
@@ -80,6 +90,21 @@ class Model:
         end = time.perf_counter()
         self.task_callback(TimingMessage(name=name, start=start, end=end))
 
+    @is_task
+    def dump_trace(self, *, path: Optional[Path] = None) -> None:
+        """Writes the recorded backend trace to 'path' (defaults to the temp dir)"""
+        if self.trace_recorder is None:
+            msg = "The backend was not started with a trace recorder."
+            raise HandledException(msg)
+
+        if path is None:
+            path = get_temp_dir() / f"backend_trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+
+        written_path = self.trace_recorder.dump(path)
+        self._logger.info(
+            f"Wrote {len(self.trace_recorder)} backend trace events to '{written_path}'"
+        )
+
     @is_task
     def connect_client(
         self,
@@ -139,6 +164,7 @@ class Model:
         self.task_callback(PluginStateMessage(state=PluginState.LOADING))
 
         self.backend_plugin = plugin_factory(self.task_callback, key)
+        self.backend_plugin.pipelined = self.pipelined
         self._logger.info(f"{plugin_factory.__name__} was loaded.")
 
         if self.client is not None and self.client.connected:
@@ -0,0 +1,209 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from ._message import Message, TimingMessage
+
+
+_InputT = TypeVar("_InputT")
+_OutputT = TypeVar("_OutputT")
+
+_QUEUE_POLL_INTERVAL_S = 0.05
+
+
+class _EndOfStream:
+    """Sentinel passed down the pipeline when the acquisition stage has stopped"""
+
+
+_END_OF_STREAM = _EndOfStream()
+
+
+class BackendPipeline(Generic[_InputT, _OutputT]):
+    """Runs the acquisition, processing and emission of results on separate threads
+
+    The three stages are connected by bounded queues, which lets link I/O (``acquire``),
+    NumPy processing (``process``) and IPC (``emit``) overlap. If a downstream stage falls
+    behind, its input queue fills up and the upstream stage blocks, so memory usage is
+    bounded by ``queue_size``.
+
+    Each processed item is reported with ``timing_callback`` as one :class:`TimingMessage`
+    per stage (named ``<name>.<stage>``, with ``occupancy`` set to the number of items
+    waiting in the stage's input queue) and one end-to-end ``<name>.latency`` message
+    spanning from the end of acquisition to the end of emission.
+
+    Exceptions raised in any stage stop the pipeline and are re-raised in the owning thread
+    by :meth:`raise_if_failed`. An exception from ``acquire`` (e.g. the end of a replay) is
+    only re-raised once the items acquired before it have been emitted.
+    """
+
+    STAGES = ("acquire", "process", "emit")
+
+    def __init__(
+        self,
+        acquire: Callable[[], _InputT],
+        process: Callable[[_InputT], _OutputT],
+        emit: Callable[[_OutputT], None],
+        *,
+        timing_callback: Callable[[Message], None],
+        name: str = "Pipeline",
+        queue_size: int = 4,
+    ) -> None:
+        if queue_size < 1:
+            msg = "queue_size must be at least 1"
+            raise ValueError(msg)
+
+        self._acquire = acquire
+        self._process = process
+        self._emit = emit
+        self._timing_callback = timing_callback
+        self._name = name
+
+        self._process_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._emit_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._abort_event = threading.Event()
+        self._failed_event = threading.Event()
+        self._exception: Optional[BaseException] = None
+        self._threads = [
+            threading.Thread(target=self._run_acquire, name=f"{name}.acquire", daemon=True),
+            threading.Thread(target=self._run_process, name=f"{name}.process", daemon=True),
+            threading.Thread(target=self._run_emit, name=f"{name}.emit", daemon=True),
+        ]
+        self._started = False
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self._started:
+            msg = "Pipeline has already been started"
+            raise RuntimeError(msg)
+
+        self._started = True
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = 3.0) -> None:
+        """Stops acquisition and waits for the already acquired items to be emitted
+
+        Items that are still queued when ``timeout`` runs out are dropped.
+        """
+        self._stop_event.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        for thread in self._threads:
+            if not thread.is_alive():
+                continue
+
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            thread.join(timeout=remaining)
+
+            if thread.is_alive():
+                self._abort_event.set()
+                thread.join(timeout=_QUEUE_POLL_INTERVAL_S)
+
+        if any(thread.is_alive() for thread in self._threads):
+            msg = f"{self._name} did not shut down in time"
+            raise RuntimeError(msg)
+
+    def raise_if_failed(self, timeout: float = 0.0) -> None:
+        """Waits up to ``timeout`` seconds for a stage to fail and re-raises its exception"""
+        if self._failed_event.wait(timeout) and self._exception is not None:
+            exception = self._exception
+            self._exception = None
+            raise exception
+
+    def _fail(self, exception: BaseException, *, drain: bool = False) -> None:
+        if self._exception is None:
+            self._exception = exception
+
+        if not drain:
+            self._abort_event.set()
+            self._failed_event.set()
+
+    def _put(self, q: queue.Queue[Any], item: Any) -> bool:
+        while not self._abort_event.is_set():
+            try:
+                q.put(item, timeout=_QUEUE_POLL_INTERVAL_S)
+            except queue.Full:
+                continue
+            else:
+                return True
+        return False
+
+    def _get(self, q: queue.Queue[Any]) -> Any:
+        while not self._abort_event.is_set():
+            try:
+                return q.get(timeout=_QUEUE_POLL_INTERVAL_S)
+            except queue.Empty:
+                continue
+        return _END_OF_STREAM
+
+    def _report(self, stage: str, start: float, end: float, occupancy: Optional[int]) -> None:
+        self._timing_callback(
+            TimingMessage(name=f"{self._name}.{stage}", start=start, end=end, occupancy=occupancy)
+        )
+
+    def _run_acquire(self) -> None:
+        try:
+            while not self._stop_event.is_set() and not self._abort_event.is_set():
+                start = time.perf_counter()
+                item = self._acquire()
+                end = time.perf_counter()
+                self._report("acquire", start, end, occupancy=None)
+
+                if not self._put(self._process_queue, (end, item)):
+                    return
+        except BaseException as exc:
+            # Let the already acquired items through before reporting the failure
+            self._fail(exc, drain=True)
+        finally:
+            self._put(self._process_queue, _END_OF_STREAM)
+
+    def _run_process(self) -> None:
+        try:
+            while True:
+                entry = self._get(self._process_queue)
+                if entry is _END_OF_STREAM:
+                    return
+
+                acquired_at, item = entry
+                start = time.perf_counter()
+                processed = self._process(item)
+                end = time.perf_counter()
+                self._report("process", start, end, occupancy=self._process_queue.qsize())
+
+                if not self._put(self._emit_queue, (acquired_at, processed)):
+                    return
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            self._put(self._emit_queue, _END_OF_STREAM)
+
+    def _run_emit(self) -> None:
+        try:
+            while True:
+                entry = self._get(self._emit_queue)
+                if entry is _END_OF_STREAM:
+                    return
+
+                acquired_at, processed = entry
+                start = time.perf_counter()
+                self._emit(processed)
+                end = time.perf_counter()
+                self._report("emit", start, end, occupancy=self._emit_queue.qsize())
+                self._timing_callback(
+                    TimingMessage(name=f"{self._name}.latency", start=acquired_at, end=end)
+                )
+        except BaseException as exc:
+            self._fail(exc)
+        finally:
+            if self._exception is not None:
+                self._failed_event.set()
@@ -1,10 +1,9 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
 
 import math
-import statistics
 import typing as t
 from collections import deque
 
@@ -12,12 +11,51 @@ import attrs
 import typing_extensions as te
 
 
+_WINDOW_LENGTH = 199  # tick differences, i.e. the 200 latest ticks
+
+_SUB_BUCKET_BITS = 3
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+
+
+def _bucket_index(value: int) -> int:
+    """Maps a non-negative integer to a log-linear histogram bucket
+
+    Values below ``2 * _SUB_BUCKET_COUNT`` get a bucket each. Above that, every power-of-two
+    range is split into ``_SUB_BUCKET_COUNT`` equally wide buckets, which bounds the relative
+    error of a bucket to 1 / ``_SUB_BUCKET_COUNT``.
+
+    >>> [_bucket_index(v) for v in (0, 1, 15, 16, 17, 31, 32, 1000)]
+    [0, 1, 15, 16, 16, 23, 24, 63]
+    """
+    if value < 2 * _SUB_BUCKET_COUNT:
+        return value
+
+    exponent = value.bit_length() - (_SUB_BUCKET_BITS + 1)
+    return _SUB_BUCKET_COUNT * (exponent + 1) + (value >> exponent) - _SUB_BUCKET_COUNT
+
+
+def _bucket_max_value(index: int) -> int:
+    """Inverse of ``_bucket_index``, returning the largest value of the bucket
+
+    >>> [_bucket_max_value(i) for i in (0, 1, 15, 16, 23, 24, 63)]
+    [0, 1, 15, 17, 31, 35, 1023]
+    """
+    if index < 2 * _SUB_BUCKET_COUNT:
+        return index
+
+    exponent = index // _SUB_BUCKET_COUNT - 1
+    mantissa = index % _SUB_BUCKET_COUNT + _SUB_BUCKET_COUNT
+    return ((mantissa + 1) << exponent) - 1
+
+
 @attrs.frozen
 class _RateStats:
     rate: float
     rate_warning: bool
     jitter: float
     jitter_warning: bool
+    jitter_p50: float = math.nan
+    jitter_p99: float = math.nan
 
     @classmethod
     def invalid(cls) -> te.Self:
@@ -33,28 +71,36 @@ class _RateCalculator:
 
     >>> rc = _RateCalculator(ticks_per_second=1000, tick_period=100)
     >>> rc.update(tick=0, frame_delayed=False)
-    _RateStats(rate=nan, rate_warning=False, jitter=nan, jitter_warning=False)
+    _RateStats(rate=nan, rate_warning=False, jitter=nan, jitter_warning=False, jitter_p50=nan, jitter_p99=nan)
 
     Once the ``_RateCalculator`` is passed its second result, statistics are meaningful:
 
     >>> rc.update(tick=100, frame_delayed=False)
-    _RateStats(rate=10.0, rate_warning=False, jitter=0.0, jitter_warning=False)
+    _RateStats(rate=10.0, rate_warning=False, jitter=0.0, jitter_warning=False, jitter_p50=0.0, jitter_p99=0.0)
 
     Once the passed result aren't exactly equidistant in time, jitter will be non-zero:
 
     >>> rc.update(tick=201, frame_delayed=False)
-    _RateStats(rate=9.95..., rate_warning=False, jitter=0.0005..., jitter_warning=False)
+    _RateStats(rate=9.95..., rate_warning=False, jitter=0.0005..., jitter_warning=False, jitter_p50=0.0, jitter_p99=0.001)
 
     If the result has the indication ``frame_delayed``, ``rate_warning`` will always be true.
 
     >>> rc.update(tick=300, frame_delayed=True)
-    _RateStats(rate=10.0, rate_warning=True, jitter=0.0008..., jitter_warning=False)
+    _RateStats(rate=10.0, rate_warning=True, jitter=0.0008..., jitter_warning=False, jitter_p50=0.001, jitter_p99=0.001)
 
     If the measured rate or its jitter becomes too large, both warning flag will be
     set to True:
 
     >>> rc.update(tick=600, frame_delayed=False)
-    _RateStats(rate=6.66..., rate_warning=True, jitter=0.08..., jitter_warning=True)
+    _RateStats(rate=6.66..., rate_warning=True, jitter=0.08..., jitter_warning=True, jitter_p50=0.001, jitter_p99=0.2...)
+
+    Rate and (standard deviation) jitter are kept as running sums over the latest tick
+    differences, and the percentile jitters (``jitter_p50``, ``jitter_p99``) are read from
+    a compact histogram over the same window. A tick difference's contribution to the
+    percentile jitters is its deviation from ``tick_period``, or from the previous tick
+    difference if ``tick_period`` is 0. Steady drift thus shows up as a large ``jitter_p50``
+    while occasional, bursty delays only raise ``jitter_p99``. All of this is updated in
+    time independent of the window length.
     """
 
     _JITTER_WARNING_LIMIT: t.ClassVar[float] = 1.0e-3  # Based on testing
@@ -62,7 +108,12 @@ class _RateCalculator:
     ticks_per_second: int
     tick_period: int
 
-    ticks: deque[int] = attrs.field(factory=lambda: deque([], maxlen=200), init=False)
+    _last_tick: t.Optional[int] = attrs.field(default=None, init=False)
+    _tick_diffs: deque[int] = attrs.field(factory=deque, init=False)
+    _deviation_buckets: deque[int] = attrs.field(factory=deque, init=False)
+    _diff_sum: int = attrs.field(default=0, init=False)
+    _diff_square_sum: int = attrs.field(default=0, init=False)
+    _histogram: dict[int, int] = attrs.field(factory=dict, init=False)
 
     @property
     def tick_period_upper_bound(self) -> float:
@@ -73,21 +124,87 @@ class _RateCalculator:
 
     @property
     def tick_diffs(self) -> list[int]:
-        return [rhs - lhs for lhs, rhs in zip(self.ticks, list(self.ticks)[1:])]
+        return list(self._tick_diffs)
+
+    def _push(self, tick_diff: int) -> None:
+        if self.tick_period != 0:
+            deviation = abs(tick_diff - self.tick_period)
+        elif self._tick_diffs:
+            deviation = abs(tick_diff - self._tick_diffs[-1])
+        else:
+            deviation = 0
+
+        bucket = _bucket_index(deviation)
+        self._tick_diffs.append(tick_diff)
+        self._deviation_buckets.append(bucket)
+        self._diff_sum += tick_diff
+        self._diff_square_sum += tick_diff * tick_diff
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+
+        if len(self._tick_diffs) > _WINDOW_LENGTH:
+            evicted_diff = self._tick_diffs.popleft()
+            evicted_bucket = self._deviation_buckets.popleft()
+            self._diff_sum -= evicted_diff
+            self._diff_square_sum -= evicted_diff * evicted_diff
+
+            remaining = self._histogram[evicted_bucket] - 1
+            if remaining == 0:
+                del self._histogram[evicted_bucket]
+            else:
+                self._histogram[evicted_bucket] = remaining
+
+    def jitter_percentile(self, percentile: float) -> float:
+        """Returns the given percentile (0-100) of the tick difference deviations in seconds
+
+        The result is an upper bound, accurate to within 1/8 of the deviation.
+        """
+        if not self._deviation_buckets:
+            return math.nan
+
+        rank = max(math.ceil(percentile / 100 * len(self._deviation_buckets)), 1)
+        cumulative_count = 0
+        for bucket in sorted(self._histogram):
+            cumulative_count += self._histogram[bucket]
+            if cumulative_count >= rank:
+                return _bucket_max_value(bucket) / self.ticks_per_second
+
+        raise AssertionError
 
     def update(self, tick: int, frame_delayed: bool) -> _RateStats:
-        self.ticks.append(tick)
+        last_tick = self._last_tick
+        self._last_tick = tick
 
-        if len(self.ticks) < 2:
+        if last_tick is None:
             return _RateStats.invalid()
 
-        measured_tick_period = statistics.mean(self.tick_diffs)
+        self._push(tick - last_tick)
+
+        num_diffs = len(self._tick_diffs)
+        measured_tick_period = self._diff_sum / num_diffs
         measured_rate = 1.0 / (measured_tick_period / self.ticks_per_second)
         rate_warning = frame_delayed or measured_tick_period > self.tick_period_upper_bound
-
-        if len(self.tick_diffs) < 2:
-            return _RateStats(measured_rate, rate_warning, jitter=0.0, jitter_warning=False)
+        jitter_p50 = self.jitter_percentile(50)
+        jitter_p99 = self.jitter_percentile(99)
+
+        if num_diffs < 2:
+            return _RateStats(
+                measured_rate,
+                rate_warning,
+                jitter=0.0,
+                jitter_warning=False,
+                jitter_p50=jitter_p50,
+                jitter_p99=jitter_p99,
+            )
         else:
-            jitter_s = statistics.pstdev(self.tick_diffs) / self.ticks_per_second
+            # Integer arithmetic keeps the running sums exact, regardless of window length
+            variance_numerator = num_diffs * self._diff_square_sum - self._diff_sum**2
+            jitter_s = math.sqrt(variance_numerator) / num_diffs / self.ticks_per_second
             jitter_warning = jitter_s > self._JITTER_WARNING_LIMIT
-            return _RateStats(measured_rate, rate_warning, jitter_s, jitter_warning)
+            return _RateStats(
+                measured_rate,
+                rate_warning,
+                jitter_s,
+                jitter_warning,
+                jitter_p50=jitter_p50,
+                jitter_p99=jitter_p99,
+            )
@@ -0,0 +1,156 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from ._message import ConnectionStateMessage, GeneralMessage, PluginStateMessage, TimingMessage
+
+
+DEFAULT_TRACE_CAPACITY = 50_000
+
+#                  phase name ts     dur              thread args
+_TraceEvent = Tuple[str, str, float, Optional[float], int, Optional[Dict[str, Any]]]
+
+_COUNTER_MESSAGE_NAMES = ("cpu_percent", "frame_count")
+
+
+class TraceRecorder:
+    """Low-overhead recorder of backend timings, kept in a ring buffer
+
+    The recorder keeps the ``capacity`` latest events. Each event is a plain tuple, so
+    recording is a timestamp and a ``deque.append``. Nothing is formatted until the
+    trace is exported with :meth:`to_chrome_trace` or :meth:`dump`, which produce the
+    JSON "Trace Event Format" understood by e.g. ``chrome://tracing`` and Perfetto.
+
+    The easiest way to feed a recorder is to :meth:`wrap` the callback the backend sends
+    its messages through. The wrapped callback records
+
+    - every :class:`TimingMessage` as a span (``occupancy`` becomes a queue depth counter),
+    - ``cpu_percent`` and ``frame_count`` general messages as counters,
+    - connection and plugin state changes as instant events,
+    - the time spent sending each message (the IPC send time) as a span.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY) -> None:
+        self._events: deque[_TraceEvent] = deque(maxlen=capacity)
+        self._thread_names: Dict[int, str] = {}
+        self._thread_names_lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def capacity(self) -> Optional[int]:
+        return self._events.maxlen
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def _thread_id(self) -> int:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            with self._thread_names_lock:
+                self._thread_names[thread_id] = threading.current_thread().name
+        return thread_id
+
+    def add_span(
+        self, name: str, start: float, end: float, args: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Records a span. ``start`` and ``end`` are ``time.perf_counter()`` timestamps"""
+        self._events.append(("X", name, start, end - start, self._thread_id(), args))
+
+    def add_counter(self, name: str, value: float, timestamp: Optional[float] = None) -> None:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        self._events.append(("C", name, timestamp, None, self._thread_id(), {name: value}))
+
+    def add_instant(
+        self, name: str, args: Optional[Dict[str, Any]] = None, timestamp: Optional[float] = None
+    ) -> None:
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        self._events.append(("i", name, timestamp, None, self._thread_id(), args))
+
+    def record_message(self, message: Any) -> None:
+        if isinstance(message, TimingMessage):
+            self.add_span(message.name, message.start, message.end)
+            if message.occupancy is not None:
+                self.add_counter(f"{message.name} queue", message.occupancy, message.end)
+        elif isinstance(message, GeneralMessage) and message.name in _COUNTER_MESSAGE_NAMES:
+            if message.data is not None:
+                self.add_counter(message.name, message.data)
+        elif isinstance(message, (ConnectionStateMessage, PluginStateMessage)):
+            self.add_instant(type(message).__name__, {"state": message.state.name})
+
+    def wrap(self, callback: Callable[[Any], None]) -> Callable[[Any], None]:
+        """Returns a callback that records messages and their send times before forwarding"""
+        return functools.partial(_send_traced, self, callback)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        # Threads may register themselves while the trace is exported
+        with self._thread_names_lock:
+            thread_names = list(self._thread_names.items())
+
+        trace_events: list[Dict[str, Any]] = [
+            {
+                "ph": "M",
+                "name": "thread_name",
+                "pid": self._pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in thread_names
+        ]
+
+        for phase, name, timestamp, duration, thread_id, args in list(self._events):
+            event: Dict[str, Any] = {
+                "ph": phase,
+                "name": name,
+                "ts": timestamp * 1e6,
+                "pid": self._pid,
+                "tid": thread_id,
+            }
+            if duration is not None:
+                event["dur"] = duration * 1e6
+            if phase == "i":
+                event["s"] = "t"
+            if args is not None:
+                event["args"] = args
+            trace_events.append(event)
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """Writes the buffered events to ``path`` as a Chrome trace (JSON) file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+
+def _send_traced(recorder: TraceRecorder, callback: Callable[[Any], None], message: Any) -> None:
+    recorder.record_message(message)
+    start = time.perf_counter()
+    callback(message)
+    end = time.perf_counter()
+    recorder.add_span(f"send {type(message).__name__}", start, end)
+
+
+def get_trace_recorder(callback: Callable[[Any], None]) -> Optional[TraceRecorder]:
+    """Returns the recorder of a callback returned by :meth:`TraceRecorder.wrap`, if any"""
+    if isinstance(callback, functools.partial) and callback.func is _send_traced:
+        recorder: TraceRecorder = callback.args[0]
+        return recorder
+
+    return None
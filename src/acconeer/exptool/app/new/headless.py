@@ -0,0 +1,332 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+"""Headless runner for Exploration Tool backend plugins
+
+Runs the backend part of any registered plugin (the same code path as the
+Exploration Tool app) without a Qt event loop or a display. Run it as::
+
+    python -m acconeer.exptool.app.new.headless sparse_iq --mock --num-frames 100
+    python -m acconeer.exptool.app.new.headless distance_detector --replay rec.h5 \\
+        --output results.pkl
+
+or use :class:`HeadlessRunner` directly from Python.
+"""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Optional
+
+import attrs
+import numpy as np
+import typing_extensions as te
+
+from acconeer.exptool import a121
+from acconeer.exptool.utils import ExampleInterruptHandler, config_logging
+
+from ._enums import PluginState
+from .backend import (
+    BackendLogger,
+    GeneralMessage,
+    LogMessage,
+    Message,
+    Model,
+    PlotMessage,
+    PluginStateMessage,
+    TraceRecorder,
+)
+
+
+ResultCallback = Callable[[Any], None]
+
+
+@attrs.frozen(kw_only=True)
+class HeadlessRunStats:
+    num_frames: int
+    duration_s: float
+
+    @property
+    def frame_rate(self) -> float:
+        if self.duration_s <= 0:
+            return float("nan")
+        return self.num_frames / self.duration_s
+
+
+class HeadlessRunner:
+    """Drives a backend plugin through the application :class:`Model` in the calling thread
+
+    Results (the ``PlotMessage`` payloads) are passed to ``result_callback``. Exceptions
+    raised by the backend plugin are propagated to the caller instead of being sent as
+    error messages.
+
+    :param plugin_spec: Any ``PluginSpec``, e.g. one of ``load_plugins()``
+    :param result_callback: Called with each processed result
+    :param pipelined: Run acquisition, processing and emission on separate threads
+    :param trace_recorder: If given, records timings of everything the plugin reports
+    """
+
+    def __init__(
+        self,
+        plugin_spec: Any,
+        result_callback: ResultCallback,
+        *,
+        pipelined: bool = False,
+        trace_recorder: Optional[TraceRecorder] = None,
+    ) -> None:
+        self._result_callback = result_callback
+        self._trace_recorder = trace_recorder
+        self._num_frames = 0
+        self.plugin_state = PluginState.UNLOADED
+
+        callback: Callable[[Any], None] = self._handle_message
+        if trace_recorder is not None:
+            callback = trace_recorder.wrap(callback)
+
+        BackendLogger.set_callback(self._handle_message)
+        self._model = Model(task_callback=callback, pipelined=pipelined)
+        self._model.load_plugin(
+            plugin_factory=plugin_spec.create_backend_plugin, key=plugin_spec.key
+        )
+
+    def __enter__(self) -> te.Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    @property
+    def num_frames(self) -> int:
+        return self._num_frames
+
+    def _handle_message(self, message: Message) -> None:
+        if isinstance(message, PlotMessage):
+            self._num_frames += 1
+            self._result_callback(message.result)
+        elif isinstance(message, PluginStateMessage):
+            self.plugin_state = message.state
+        elif isinstance(message, LogMessage):
+            level = logging.getLevelName(message.log_level)
+            logging.getLogger(message.module_name).log(level, message.log_string)
+        elif isinstance(message, GeneralMessage) and message.exception is not None:
+            raise message.exception
+
+    def execute_task(self, name: str, **kwargs: Any) -> None:
+        """Executes a Model- or backend plugin task, e.g. ``calibrate_detector``"""
+        self._model.execute_task((name, kwargs))
+
+    def connect(self, client_factory: Callable[[], a121.Client]) -> None:
+        self.execute_task(
+            "connect_client",
+            client_factory=client_factory,
+            get_connection_warning=lambda _: None,
+        )
+
+    def start(self) -> None:
+        """Starts a session with the plugin's current configuration on the connected client"""
+        self.execute_task("start_session", with_recorder=False)
+
+    def replay(self, path: Path, realtime: bool = False) -> None:
+        """Starts replaying the record at ``path``, at full speed unless ``realtime`` is set"""
+        self.execute_task("load_from_file", path=path, realtime_replay=realtime)
+
+    def run(
+        self,
+        *,
+        num_frames: Optional[int] = None,
+        duration_s: Optional[float] = None,
+        should_stop: Callable[[], bool] = lambda: False,
+    ) -> HeadlessRunStats:
+        """Calls the plugin's ``idle`` as fast as possible until a stop condition is met
+
+        The run ends when the plugin stops by itself (e.g. a replay is exhausted), when
+        ``num_frames`` results have been produced, ``duration_s`` has passed or
+        ``should_stop`` returns ``True``. A session that is still running is then stopped,
+        which includes emitting the results that are still in flight when pipelined.
+        """
+        start_frames = self._num_frames
+        start = time.perf_counter()
+
+        while self._model.idle():
+            frames = self._num_frames - start_frames
+            if num_frames is not None and frames >= num_frames:
+                break
+            if duration_s is not None and time.perf_counter() - start >= duration_s:
+                break
+            if should_stop():
+                break
+
+        if self.plugin_state.is_busy:
+            self.execute_task("stop_session")
+
+        end = time.perf_counter()
+
+        return HeadlessRunStats(num_frames=self._num_frames - start_frames, duration_s=end - start)
+
+    def close(self) -> None:
+        if self.plugin_state.is_busy:
+            self.execute_task("stop_session")
+
+        self._model.unload_plugin(send_callback=False)
+        self._model.disconnect_client()
+
+
+class PickledResultWriter:
+    """Appends each result to a file as a separate pickle, see :func:`iterate_pickled_results`"""
+
+    def __init__(self, path: Path) -> None:
+        self._file: IO[bytes] = Path(path).open("wb")  # noqa: SIM115
+
+    def __call__(self, result: Any) -> None:
+        pickle.dump(result, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def iterate_pickled_results(path: Path) -> Iterator[Any]:
+    """Lazily reads back results written by :class:`PickledResultWriter`"""
+    with Path(path).open("rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+class _StdoutResultPrinter:
+    def __init__(self) -> None:
+        self._frame = 0
+
+    def __call__(self, result: Any) -> None:
+        with np.printoptions(threshold=8, edgeitems=2, precision=4):
+            print(f"{self._frame}: {result!r}")
+        self._frame += 1
+
+
+class _HeadlessArgumentParser(a121.ExampleArgumentParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.prog = "python -m acconeer.exptool.app.new.headless"
+        self.description = "Runs an Exploration Tool backend plugin without GUI."
+
+        self.add_argument("plugin_key", help="Key of the plugin to run, e.g. 'sparse_iq'.")
+        self.add_argument(
+            "--replay",
+            metavar="record",
+            type=Path,
+            help="Replay a recording (at full speed) instead of connecting to a server.",
+        )
+        self.add_argument(
+            "--plugin-module",
+            dest="plugin_modules",
+            metavar="module",
+            action="append",
+            default=[],
+            help="Python module with a 'register' function that registers additional plugins.",
+        )
+        self.add_argument(
+            "--tasks",
+            nargs="+",
+            default=[],
+            help="Zero-argument backend tasks to execute before starting, "
+            + "e.g. 'load_from_cache calibrate_detector'.",
+        )
+        self.add_argument("--num-frames", type=int, help="Stop after this many results.")
+        self.add_argument("--duration", type=float, help="Stop after this many seconds.")
+        self.add_argument(
+            "--output",
+            metavar="file",
+            type=Path,
+            help="Write each result as a pickle to this file.",
+        )
+        self.add_argument("--stdout", action="store_true", help="Print each result.")
+        self.add_argument(
+            "--pipelined",
+            action="store_true",
+            help="Run acquisition, processing and emission on separate threads.",
+        )
+        self.add_argument(
+            "--trace",
+            metavar="file",
+            type=Path,
+            help="Write a Chrome-trace (JSON) of the run to this file.",
+        )
+
+
+def main() -> None:
+    parser = _HeadlessArgumentParser()
+    args = parser.parse_args()
+    config_logging(args)
+
+    from .plugin_loader import import_and_register_plugin_module, load_plugins
+
+    for plugin_module_name in args.plugin_modules:
+        import_and_register_plugin_module(plugin_module_name)
+
+    plugins = {plugin.key: plugin for plugin in load_plugins()}
+    if args.plugin_key not in plugins:
+        parser.print_usage()
+        print(f"ERROR: Could not find plugin with key {args.plugin_key!r}")
+        print(f"ERROR: Available plugin keys: {list(plugins)}")
+        sys.exit(1)
+
+    sinks: list[ResultCallback] = []
+    writer = None
+    if args.output is not None:
+        writer = PickledResultWriter(args.output)
+        sinks.append(writer)
+    if args.stdout:
+        sinks.append(_StdoutResultPrinter())
+
+    def result_callback(result: Any) -> None:
+        for sink in sinks:
+            sink(result)
+
+    trace_recorder = TraceRecorder() if args.trace is not None else None
+    interrupt_handler = ExampleInterruptHandler()
+
+    try:
+        with HeadlessRunner(
+            plugins[args.plugin_key],
+            result_callback,
+            pipelined=args.pipelined,
+            trace_recorder=trace_recorder,
+        ) as runner:
+            client_args = a121.get_client_args(args)
+            if args.replay is None or any(v is not None for v in client_args.values()):
+                runner.connect(lambda: a121.Client.open(**client_args))
+
+            for task in args.tasks:
+                runner.execute_task(task)
+
+            if args.replay is not None:
+                runner.replay(args.replay)
+            else:
+                runner.start()
+
+            print("Press Ctrl-C to end session", file=sys.stderr)
+            stats = runner.run(
+                num_frames=args.num_frames,
+                duration_s=args.duration,
+                should_stop=lambda: interrupt_handler.got_signal,
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    print(
+        f"{stats.num_frames} results in {stats.duration_s:.3f} s ({stats.frame_rate:.1f} Hz)",
+        file=sys.stderr,
+    )
+
+    if trace_recorder is not None:
+        trace_recorder.dump(args.trace)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -10,10 +10,13 @@ import typing as t
 import attrs
 import typing_extensions as te
 
-from ._enums import PluginFamily
-from .app_model import PluginSpec
+from ._enums import PluginFamily, PluginGeneration
+from .app_model import LazyPluginSpec
 
 
+if t.TYPE_CHECKING:
+    from .app_model import PluginSpec
+
 _REGISTERED_PLUGINS: t.List[PluginSpec] = []
 _LOG = logging.getLogger(__name__)
 
@@ -59,45 +62,201 @@ def import_and_register_plugin_module(module_name: str) -> None:
 
 
 def load_default_plugins() -> list[PluginSpec]:
-    from acconeer.exptool.a121.algo.bilateration._plugin import BILATERATION_PLUGIN
-    from acconeer.exptool.a121.algo.breathing._ref_app_plugin import BREATHING_PLUGIN
-    from acconeer.exptool.a121.algo.cargo._ex_app_plugin import CARGO_PLUGIN
-    from acconeer.exptool.a121.algo.distance._detector_plugin import DISTANCE_DETECTOR_PLUGIN
-    from acconeer.exptool.a121.algo.hand_motion._example_app_plugin import HAND_MOTION_PLUGIN
-    from acconeer.exptool.a121.algo.obstacle._detector_plugin import OBSTACLE_DETECTOR_PLUGIN
-    from acconeer.exptool.a121.algo.parking._ref_app_plugin import PARKING_PLUGIN
-    from acconeer.exptool.a121.algo.phase_tracking._plugin import PHASE_TRACKING_PLUGIN
-    from acconeer.exptool.a121.algo.presence._detector_plugin import PRESENCE_DETECTOR_PLUGIN
-    from acconeer.exptool.a121.algo.smart_presence._ref_app_plugin import SMART_PRESENCE_PLUGIN
-    from acconeer.exptool.a121.algo.sparse_iq._plugin import SPARSE_IQ_PLUGIN
-    from acconeer.exptool.a121.algo.speed._detector_plugin import SPEED_DETECTOR_PLUGIN
-    from acconeer.exptool.a121.algo.surface_velocity._example_app_plugin import (
-        SURFACE_VELOCITY_PLUGIN,
-    )
-    from acconeer.exptool.a121.algo.tank_level._plugin import TANK_LEVEL_PLUGIN
-    from acconeer.exptool.a121.algo.touchless_button._plugin import TOUCHLESS_BUTTON_PLUGIN
-    from acconeer.exptool.a121.algo.vibration._example_app_plugin import VIBRATION_PLUGIN
-    from acconeer.exptool.a121.algo.waste_level._plugin import WASTE_LEVEL_PLUGIN
+    """Returns the built-in plugins
 
+    The plugin modules (and with them PySide6, pyqtgraph and the processing dependencies
+    of each plugin) are not imported until a plugin is loaded. The backend modules hold
+    the backend plugins without any Qt dependencies. The metadata below needs to be kept
+    in sync with the plugin specs, which ``tests/app/test_plugin_loader.py`` checks.
+    """
     # Please keep in lexicographical order
     return [
-        BILATERATION_PLUGIN,
-        BREATHING_PLUGIN,
-        CARGO_PLUGIN,
-        DISTANCE_DETECTOR_PLUGIN,
-        HAND_MOTION_PLUGIN,
-        OBSTACLE_DETECTOR_PLUGIN,
-        PARKING_PLUGIN,
-        PHASE_TRACKING_PLUGIN,
-        PRESENCE_DETECTOR_PLUGIN,
-        SMART_PRESENCE_PLUGIN,
-        SPARSE_IQ_PLUGIN,
-        SURFACE_VELOCITY_PLUGIN,
-        TANK_LEVEL_PLUGIN,
-        TOUCHLESS_BUTTON_PLUGIN,
-        VIBRATION_PLUGIN,
-        SPEED_DETECTOR_PLUGIN,
-        WASTE_LEVEL_PLUGIN,
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="bilateration",
+            title="Bilateration",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/bilateration.html",
+            description="Use two sensors to estimate distance and angle.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.bilateration._plugin",
+            attribute="BILATERATION_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.bilateration._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="breathing",
+            title="Breathing",
+            docs_link="https://docs.acconeer.com/en/latest/ref_apps/a121/breathing.html",
+            description="Detect breathing rate.",
+            family=PluginFamily.REF_APP,
+            module="acconeer.exptool.a121.algo.breathing._ref_app_plugin",
+            attribute="BREATHING_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.breathing._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="cargo",
+            title="Cargo",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/cargo.html",
+            description="Detects utilization level and presence in container.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.cargo._ex_app_plugin",
+            attribute="CARGO_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.cargo._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="distance_detector",
+            title="Distance detector",
+            docs_link="https://docs.acconeer.com/en/latest/detectors/a121/distance_detector.html",
+            description="Easily measure distance to objects.",
+            family=PluginFamily.DETECTOR,
+            module="acconeer.exptool.a121.algo.distance._detector_plugin",
+            attribute="DISTANCE_DETECTOR_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.distance._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="hand_motion",
+            title="Hand motion detection",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/hand_motion_detection.html",
+            description="Wake-up water faucet application.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.hand_motion._example_app_plugin",
+            attribute="HAND_MOTION_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.hand_motion._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="obstacle_detector",
+            title="Obstacle detection",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/obstacle_detection.html",
+            description="Measure distance and angle to objects from a moving platform.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.obstacle._detector_plugin",
+            attribute="OBSTACLE_DETECTOR_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.obstacle._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="parking",
+            title="Parking",
+            docs_link="https://docs.acconeer.com/en/latest/ref_apps/a121/parking.html",
+            description="Detect parked cars.",
+            family=PluginFamily.REF_APP,
+            module="acconeer.exptool.a121.algo.parking._ref_app_plugin",
+            attribute="PARKING_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.parking._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="phase_tracking",
+            title="Phase tracking",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/phase_tracking.html",
+            description="Track target with micrometer precision.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.phase_tracking._plugin",
+            attribute="PHASE_TRACKING_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.phase_tracking._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="presence_detector",
+            title="Presence detector",
+            docs_link="https://docs.acconeer.com/en/latest/detectors/a121/presence_detector.html",
+            description="Detect human presence.",
+            family=PluginFamily.DETECTOR,
+            module="acconeer.exptool.a121.algo.presence._detector_plugin",
+            attribute="PRESENCE_DETECTOR_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.presence._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="smart_presence",
+            title="Smart presence",
+            docs_link="https://docs.acconeer.com/en/latest/ref_apps/a121/smart_presence.html",
+            description="Split presence detection range into zones.",
+            family=PluginFamily.REF_APP,
+            module="acconeer.exptool.a121.algo.smart_presence._ref_app_plugin",
+            attribute="SMART_PRESENCE_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.smart_presence._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="sparse_iq",
+            title="Sparse IQ",
+            description="Basic usage of the sparse IQ service.",
+            family=PluginFamily.SERVICE,
+            module="acconeer.exptool.a121.algo.sparse_iq._plugin",
+            attribute="SPARSE_IQ_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.sparse_iq._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="surface_velocity",
+            title="Surface velocity",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/surface_velocity.html",
+            description="Estimate surface speed and direction of streaming water.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.surface_velocity._example_app_plugin",
+            attribute="SURFACE_VELOCITY_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.surface_velocity._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="tank_level",
+            title="Tank level",
+            docs_link="https://docs.acconeer.com/en/latest/ref_apps/a121/tank_level.html",
+            description="Measure liquid levels in tanks",
+            family=PluginFamily.REF_APP,
+            module="acconeer.exptool.a121.algo.tank_level._plugin",
+            attribute="TANK_LEVEL_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.tank_level._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="touchless_button",
+            title="Touchless button",
+            docs_link="https://docs.acconeer.com/en/latest/ref_apps/a121/touchless_button.html",
+            description="Detect tap/wave motion and register as button press.",
+            family=PluginFamily.REF_APP,
+            module="acconeer.exptool.a121.algo.touchless_button._plugin",
+            attribute="TOUCHLESS_BUTTON_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.touchless_button._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="vibration",
+            title="Vibration measurement",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/vibration.html",
+            description="Quantify the frequency content of vibrating object.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.vibration._example_app_plugin",
+            attribute="VIBRATION_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.vibration._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="speed_detector",
+            title="Speed detector",
+            docs_link="https://docs.acconeer.com/en/latest/detectors/a121/speed_detector.html",
+            description="Measure speed.",
+            family=PluginFamily.DETECTOR,
+            module="acconeer.exptool.a121.algo.speed._detector_plugin",
+            attribute="SPEED_DETECTOR_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.speed._backend_plugin",
+        ),
+        LazyPluginSpec(
+            generation=PluginGeneration.A121,
+            key="waste_level",
+            title="Waste level",
+            docs_link="https://docs.acconeer.com/en/latest/example_apps/a121/waste_level.html",
+            description="Detect waste level in a bin.",
+            family=PluginFamily.EXAMPLE_APP,
+            module="acconeer.exptool.a121.algo.waste_level._plugin",
+            attribute="WASTE_LEVEL_PLUGIN",
+            backend_module="acconeer.exptool.a121.algo.waste_level._backend_plugin",
+        ),
     ]
 
 
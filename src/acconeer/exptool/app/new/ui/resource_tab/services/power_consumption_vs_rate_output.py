@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -159,6 +159,18 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
                 reused_curve.setData(xs, ys)
                 return (reused_curve, False)
 
+    def _current_at_rate_function(
+        self,
+        config: a121.SessionConfig,
+        lower_idle_state: t.Optional[power.Sensor.LowerIdleState],
+        update_rates: list[float],
+    ) -> t.Callable[[float], float]:
+        """Evaluates all update rates at once. Returns a lookup to pass to incremental_plot"""
+        currents = power.average_currents_at_rates(
+            config, lower_idle_state, update_rates, algorithm=self._algorithm
+        )
+        return dict(zip(update_rates, currents.tolist())).__getitem__
+
     @staticmethod
     def _will_keep_rate(
         config: a121.SessionConfig,
@@ -215,7 +227,6 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
                     power.converged_average_current(
                         config,
                         lower_idle_state=lower_idle_state,
-                        absolute_tolerance=1e-3,
                         algorithm=self._algorithm,
                     )
                 ],
@@ -239,13 +250,9 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
             ):
                 curves_that_wont_keep_rate += ["Ready"]
 
-            def ready_f(update_rate: float) -> float:
-                return power.converged_average_current(
-                    ready_config_evolver(config, update_rate=update_rate),
-                    lower_idle_state=None,
-                    absolute_tolerance=1e-3,
-                    algorithm=self._algorithm,
-                )
+            ready_f = self._current_at_rate_function(
+                ready_config_evolver(config), None, update_rates
+            )
 
             self._ready_plotter = incremental_plot(update_rates, ready_f, ordering_strategy=range)
 
@@ -260,13 +267,7 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         ):
             curves_that_wont_keep_rate += ["Sleep"]
 
-        def sleep_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                sleep_config_evolver(config, update_rate=update_rate),
-                lower_idle_state=None,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
-            )
+        sleep_f = self._current_at_rate_function(sleep_config_evolver(config), None, update_rates)
 
         self._sleep_plotter = incremental_plot(update_rates, sleep_f, ordering_strategy=range)
 
@@ -281,13 +282,9 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         ):
             curves_that_wont_keep_rate += ["Deep Sleep"]
 
-        def deep_sleep_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                deep_sleep_config_evolver(config, update_rate=update_rate),
-                lower_idle_state=None,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
-            )
+        deep_sleep_f = self._current_at_rate_function(
+            deep_sleep_config_evolver(config), None, update_rates
+        )
 
         self._deep_sleep_plotter = incremental_plot(
             update_rates, deep_sleep_f, ordering_strategy=range
@@ -300,13 +297,9 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         ):
             curves_that_wont_keep_rate += ["Hibernate"]
 
-        def hibernate_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                self._evolve_config(config, update_rate=update_rate),
-                lower_idle_state=power.Sensor.IdleState.HIBERNATE,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
-            )
+        hibernate_f = self._current_at_rate_function(
+            config, power.Sensor.IdleState.HIBERNATE, update_rates
+        )
 
         self._hibernate_plotter = incremental_plot(
             update_rates, hibernate_f, ordering_strategy=range
@@ -319,13 +312,7 @@ class _PowerConsumptionVsRatePlot(pg.PlotWidget):
         ):
             curves_that_wont_keep_rate += ["Off"]
 
-        def off_f(update_rate: float) -> float:
-            return power.converged_average_current(
-                self._evolve_config(config, update_rate=update_rate),
-                lower_idle_state=power.Sensor.IdleState.OFF,
-                absolute_tolerance=1e-3,
-                algorithm=self._algorithm,
-            )
+        off_f = self._current_at_rate_function(config, power.Sensor.IdleState.OFF, update_rates)
 
         self._off_plotter = incremental_plot(update_rates, off_f, ordering_strategy=range)
 
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -211,7 +211,6 @@ class _EnergyRegionPlot(QWidget):
         approx_avg_current = power.converged_average_current(
             self._state.session_config,
             lower_idle_state=self._state.lower_idle_state,
-            absolute_tolerance=0.01 * _mA,
             algorithm=self._algorithm,
         )
 
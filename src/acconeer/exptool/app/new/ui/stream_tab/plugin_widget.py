@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -7,7 +7,7 @@ import logging
 from enum import Enum
 from functools import partial
 from importlib.resources import as_file, files
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import qtawesome as qta
 
@@ -29,7 +29,12 @@ from PySide6.QtWidgets import (
 
 from acconeer.exptool.app import resources
 from acconeer.exptool.app.new._enums import PluginFamily, PluginGeneration, PluginState
-from acconeer.exptool.app.new.app_model import AppModel, PluginPresetSpec, PluginSpec
+from acconeer.exptool.app.new.app_model import (
+    AppModel,
+    LazyPluginSpec,
+    PluginPresetSpec,
+    PluginSpec,
+)
 from acconeer.exptool.app.new.pluginbase import PlotPluginBase, PluginSpecBase
 from acconeer.exptool.app.new.ui.components.group_box import GroupBox
 from acconeer.exptool.app.new.ui.icons import ARROW_LEFT_BOLD, EXTERNAL_LINK, TEXT_GREY
@@ -47,7 +52,7 @@ log = logging.getLogger(__name__)
 class PluginSelectionButton(QPushButton):
     plugin: PluginSpec
 
-    def __init__(self, plugin: PluginSpecBase, parent: QWidget) -> None:
+    def __init__(self, plugin: Union[PluginSpecBase, LazyPluginSpec], parent: QWidget) -> None:
         super().__init__(parent)
 
         self.plugin = plugin
@@ -149,7 +154,10 @@ class PluginSelection(QWidget):
     ]
 
     def __init__(
-        self, app_model: AppModel, plugins: list[PluginSpecBase], parent: QWidget
+        self,
+        app_model: AppModel,
+        plugins: list[Union[PluginSpecBase, LazyPluginSpec]],
+        parent: QWidget,
     ) -> None:
         super().__init__(parent)
 
@@ -174,7 +182,7 @@ class PluginSelection(QWidget):
         self.button_group.buttonClicked.connect(self._on_load_click)
 
         for plugin in plugins:
-            assert isinstance(plugin, PluginSpecBase)
+            assert isinstance(plugin, (PluginSpecBase, LazyPluginSpec))
             group_box = group_boxes[plugin.family]
             group_box.setHidden(False)
 
@@ -227,7 +235,7 @@ class PluginSelection(QWidget):
         else:
             buttons = self.button_group.buttons()
             try:
-                (button_to_check,) = {b for b in buttons if b.plugin == plugin}
+                (button_to_check,) = {b for b in buttons if b.plugin.key == plugin.key}
             except ValueError:
                 pass
             else:
@@ -252,7 +260,7 @@ class PluginSelectionArea(QWidget):
                         for plugin in app_model.plugins
                         if (
                             plugin.generation == PluginGeneration.A121
-                            and isinstance(plugin, PluginSpecBase)
+                            and isinstance(plugin, (PluginSpecBase, LazyPluginSpec))
                         )
                     ],
                     self,
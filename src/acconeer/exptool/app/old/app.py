@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -2121,7 +2121,7 @@ class Threaded_Scan(QtCore.QThread):
 
     def run(self):
         if self.params["data_source"] == "stream":
-            record = None
+            recorder = None
 
             try:
                 session_info = self.client.setup_session(self.sensor_config)
@@ -2135,7 +2135,7 @@ class Threaded_Scan(QtCore.QThread):
                 traceback.print_exc()
                 self._emit(
                     "client_error",
-                    "Failed to setup streaming!\n" "{}".format(self.format_error(e)),
+                    "Failed to setup streaming!\n{}".format(self.format_error(e)),
                 )
                 self.running = False
 
@@ -2143,7 +2143,9 @@ class Threaded_Scan(QtCore.QThread):
                 while self.running:
                     info, sweep = self.client.get_next()
                     self._emit("sweep_info", "", info)
-                    process_results, record = self.radar.process(sweep, info)
+                    process_results, recorder = self.radar.process(
+                        sweep, info, raw_data=self.client.last_raw_data
+                    )
 
                     if isinstance(process_results, dict) and "new_calibration" in process_results:
                         self._emit("new_calibration", "", process_results["new_calibration"])
@@ -2157,8 +2159,8 @@ class Threaded_Scan(QtCore.QThread):
             except Exception:
                 pass
 
-            if record is not None and len(record.data) > 0:
-                self._emit("scan_data", "", record)
+            if recorder is not None and len(recorder) > 0:
+                self._emit("scan_data", "", recorder.close())
         elif self.params["data_source"] == "file":
             self._emit("session_info", "ok", self.data.session_info)
 
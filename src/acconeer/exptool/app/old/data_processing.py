@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import json
@@ -54,7 +54,7 @@ class DataProcessing:
         self.abort = False
         self.first_run = True
 
-    def process(self, unsqueezed_data, info, do_record=True):
+    def process(self, unsqueezed_data, info, do_record=True, raw_data=None):
         if self.multi_sensor:
             in_data = unsqueezed_data
             in_info = info
@@ -85,9 +85,9 @@ class DataProcessing:
                 self.parent._emit("process_data", "", out_data["send_process_data"])
 
         if do_record:
-            self.recorder.sample(info, unsqueezed_data)
+            self.recorder.sample(info, unsqueezed_data, raw_data=raw_data)
 
-        return out_data, self.recorder.record
+        return out_data, self.recorder
 
     def process_saved_data(self, record, parent):
         self.parent = parent
@@ -1,7 +1,7 @@
-# Copyright (c) Acconeer AB, 2023-2024
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
-from . import builtin_persistors, core, optimizing_persistors
+from . import builtin_persistors, core, optimizing_persistors, stream
 from .api import (
     deserialize,
     register_json_presentable,
@@ -9,3 +9,4 @@ from .api import (
     serialize,
     try_deserialize,
 )
+from .stream import StreamReader, StreamWriter
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -371,6 +371,86 @@ def create_type_tree(__type: TypeLike, attr_path: str = "") -> Node:
         raise TypeError(msg)
 
 
+TypeCacheKey = t.Tuple[t.Any, t.Tuple[t.Any, ...]]
+
+
+def type_cache_key(__type: TypeLike) -> TypeCacheKey:
+    """Returns the key under which things derived from a type are cached
+
+    Equal types can still differ in the order of their Union members, also when nested
+    (e.g. ``List[Optional[int]]`` and ``List[Union[None, int]]``), and neither equality nor
+    the repr tells them apart. The key is the origin and the keys of the type arguments, in
+    order. Raises ``TypeError`` for unhashable types, which can't be cached.
+    """
+    type_args = t.get_args(__type)
+    if not type_args:
+        return (__type, ())
+
+    return (t.get_origin(__type), tuple(type_cache_key(arg) for arg in type_args))
+
+
+_TYPE_TREES: dict[TypeCacheKey, Node] = {}
+
+
+def get_type_tree(__type: TypeLike) -> Node:
+    """Like `create_type_tree`, but creates the tree only once per type.
+
+    The returned tree is shared between callers and must not be modified.
+    """
+    key = type_cache_key(__type)
+    try:
+        return _TYPE_TREES[key]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable type, cannot be cached
+        return create_type_tree(__type)
+
+    type_tree = create_type_tree(__type)
+    _TYPE_TREES[key] = type_tree
+    return type_tree
+
+
+@attrs.frozen
+class _TypeTraits:
+    """What `sanitize_instance` needs to know about a type, see `_get_type_traits`"""
+
+    is_ndarray: bool
+    is_generic: bool
+    unwrapped: t.Sequence[TypeLike]
+    is_number: bool
+    is_class: bool
+
+
+_TYPE_TRAITS: dict[TypeCacheKey, _TypeTraits] = {}
+
+
+def _get_type_traits(__type: TypeLike) -> _TypeTraits:
+    # Keyed like the type trees, the unwrapped type arguments depend on the Union order
+    key = type_cache_key(__type)
+    try:
+        return _TYPE_TRAITS[key]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable type, cannot be cached
+        return _create_type_traits(__type)
+
+    traits = _create_type_traits(__type)
+    _TYPE_TRAITS[key] = traits
+    return traits
+
+
+def _create_type_traits(__type: TypeLike) -> _TypeTraits:
+    is_nd = is_ndarray(__type)
+    is_gen = not is_nd and is_generic(__type)
+    return _TypeTraits(
+        is_ndarray=is_nd,
+        is_generic=is_gen,
+        unwrapped=unwrap_generic(__type) if is_gen else (),
+        is_number=not is_nd and not is_gen and is_subclass(__type, numbers.Number),
+        is_class=is_class(__type),
+    )
+
+
 def sanitize_instance(instance: t.Any, type_tree: Node, attr_path: str = "") -> None:
     """Asserts that the instance conforms to its type and type annotations with instance-checks
 
@@ -380,11 +460,12 @@ def sanitize_instance(instance: t.Any, type_tree: Node, attr_path: str = "") ->
     """
 
     current_type = type_tree.data
+    traits = _get_type_traits(current_type)
 
-    if is_ndarray(current_type):
+    if traits.is_ndarray:
         return
-    elif is_generic(current_type):
-        origin, *type_args = unwrap_generic(current_type)
+    elif traits.is_generic:
+        origin, *type_args = traits.unwrapped
 
         if origin is t.Union:
             children = type_tree.children.items()
@@ -442,9 +523,9 @@ def sanitize_instance(instance: t.Any, type_tree: Node, attr_path: str = "") ->
 
         msg = "Fell through instance sanitization"
         raise RuntimeError(msg)
-    elif is_subclass(current_type, numbers.Number) and isinstance(instance, numbers.Number):
+    elif traits.is_number and isinstance(instance, numbers.Number):
         return
-    elif is_class(current_type):
+    elif traits.is_class:
         if isinstance(instance, current_type):
             for name, tree in type_tree.children.items():
                 child = getattr(instance, name)
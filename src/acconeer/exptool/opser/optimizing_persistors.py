@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 from __future__ import annotations
 
@@ -94,17 +94,13 @@ class RaggedNumpyArrayPersistor(core.Persistor):
         except ValueError as ve:
             raise core.TypeMissmatchError from ve
 
-        ragged_dtype = h5py.vlen_dtype(dtype)
-        num_arrays = len(data)
-
-        ragged_dataset = self.create_own_dataset(
-            data=None,
-            shape=(num_arrays,),
-            dtype=ragged_dtype,
-        )
-
+        # Writing all arrays at once is a lot faster than writing them one by one.
+        # The object array keeps NumPy from stacking arrays of equal length.
+        arrays = np.empty(len(data), dtype=object)
         for i, array in enumerate(data):
-            ragged_dataset[i] = array
+            arrays[i] = array
+
+        self.create_own_dataset(data=arrays, dtype=h5py.vlen_dtype(dtype))
 
     def _load(self) -> t.List[t.Any]:
         self.assert_not_empty(self.dataset[()])
@@ -112,6 +108,38 @@ class RaggedNumpyArrayPersistor(core.Persistor):
         return list(self.dataset[()])
 
 
+@RegistryPersistor.register_persistor
+class StackedNumpyArrayPersistor(core.Persistor):
+    """
+    Loads lists of equally shaped, multi-dimensional numpy arrays stored as a single Dataset
+
+    Only :class:`~acconeer.exptool.opser.StreamWriter` writes this layout. ``serialize``
+    keeps saving such lists with ``ListPersistor``, which older versions can read.
+    """
+
+    PRIORITY: t.ClassVar[int] = RegistryPersistor.priority_higher_than(ListPersistor)
+
+    @classmethod
+    def is_applicable(cls, __type: core.TypeLike) -> bool:
+        should_be_list, *type_args = core.unwrap_generic(__type)
+
+        if should_be_list is not list:
+            return False
+
+        (type_arg,) = type_args
+        return core.is_ndarray(type_arg)
+
+    def _save(self, data: t.Any) -> None:
+        msg = "Lists of multi-dimensional arrays are only stacked by StreamWriter"
+        raise core.TypeMissmatchError(msg)
+
+    def _load(self) -> t.List[t.Any]:
+        if self.dataset.ndim < 2:
+            raise core.LoadError
+
+        return list(self.dataset[()])
+
+
 @RegistryPersistor.register_persistor
 class TrileanListPersistor(core.Persistor):
     """
@@ -295,17 +323,14 @@ class EnumListPersistor(core.Persistor):
 
         h5_enum = H5Enum(self.enum_class, include_none=self.is_optional)
 
-        self.create_own_dataset(
-            data=[h5_enum.stored_value(e) for e in data],
-            dtype=h5_enum.dtype(),
-        )
+        self.create_own_dataset(data=h5_enum.stored_values(data), dtype=h5_enum.dtype())
 
     def _load(self) -> t.List[t.Optional[Enum]]:
         self.assert_not_empty(self.dataset[()])
 
         h5_enum = H5Enum(self.enum_class, include_none=self.is_optional)
 
-        return [h5_enum.member(e) for e in self.dataset[()]]
+        return h5_enum.members(self.dataset[()])
 
 
 @attrs.frozen
@@ -336,6 +361,19 @@ class H5Enum:
         else:
             return self.enum_class[self._stored_mapping[stored_value]]
 
+    def stored_values(self, members: t.Iterable[t.Optional[Enum]]) -> t.List[int]:
+        """Like `stored_value`, but for many members. Creates the mapping only once"""
+        name_mapping = self._name_mapping
+        return [name_mapping[self.NONE_NAME if m is None else m.name] for m in members]
+
+    def members(self, stored_values: t.Iterable[int]) -> t.List[t.Optional[Enum]]:
+        """Like `member`, but for many stored values. Creates the mapping only once"""
+        member_mapping: dict[int, t.Optional[Enum]] = {
+            index: None if name == self.NONE_NAME else self.enum_class[name]
+            for index, name in self._stored_mapping.items()
+        }
+        return [member_mapping[v] for v in stored_values]
+
     def dtype(self) -> h5py.Datatype:
         return h5py.enum_dtype(self._name_mapping, basetype="u1")
 
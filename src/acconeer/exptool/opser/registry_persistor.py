@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 from __future__ import annotations
 
@@ -16,9 +16,13 @@ class RegistryPersistor(core.Persistor):
 
     This persistor is the hub for recursion and allows circumventing
     the combinatorial explosion of the problem.
+
+    The applicable persistors of each type (its "plan") are resolved once and cached
+    until another persistor is registered.
     """
 
     _REGISTRY: t.ClassVar[t.Dict[str, t.Type[core.Persistor]]] = {}
+    _PLANS: t.ClassVar[t.Dict[core.TypeCacheKey, t.Tuple[t.Type[core.Persistor], ...]]] = {}
 
     @classmethod
     def register_persistor(cls, __persistor: t.Type[core.Persistor]) -> t.Type[core.Persistor]:
@@ -28,6 +32,7 @@ class RegistryPersistor(core.Persistor):
         This can be called many times with the same persistor without repercussions.
         """
         cls._REGISTRY[__persistor.__name__] = __persistor
+        cls._PLANS.clear()
         return __persistor
 
     @classmethod
@@ -40,12 +45,32 @@ class RegistryPersistor(core.Persistor):
             raise RuntimeError(msg)
 
     @classmethod
-    def _get_applicable_persistors(cls, __type: type) -> t.List[t.Type[core.Persistor]]:
-        """Retrieves the persistors that can handle the specified type"""
-        return sorted(
-            (persistor for persistor in cls._REGISTRY.values() if persistor.is_applicable(__type)),
-            key=lambda p: p.PRIORITY,
-            reverse=True,
+    def _get_applicable_persistors(cls, __type: type) -> t.Tuple[t.Type[core.Persistor], ...]:
+        """Retrieves the persistors that can handle the specified type, highest priority first"""
+        key = core.type_cache_key(__type)
+        try:
+            return cls._PLANS[key]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable type, cannot be cached
+            return cls._resolve_applicable_persistors(__type)
+
+        plan = cls._resolve_applicable_persistors(__type)
+        cls._PLANS[key] = plan
+        return plan
+
+    @classmethod
+    def _resolve_applicable_persistors(cls, __type: type) -> t.Tuple[t.Type[core.Persistor], ...]:
+        return tuple(
+            sorted(
+                (
+                    persistor
+                    for persistor in cls._REGISTRY.values()
+                    if persistor.is_applicable(__type)
+                ),
+                key=lambda p: p.PRIORITY,
+                reverse=True,
+            )
         )
 
     @classmethod
@@ -0,0 +1,536 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import abc
+import typing as t
+from enum import Enum
+
+import attrs
+import h5py
+import numpy as np
+import typing_extensions as te
+
+from . import core
+from .builtin_persistors import ListPersistor
+from .optimizing_persistors import (
+    EnumListPersistor,
+    H5Enum,
+    OptionalFloatListPersistor,
+    OptionalIntListPersistor,
+    RaggedNumpyArrayPersistor,
+    SausageableAttrsPersistor,
+    ScalarListPersistor,
+    StackedNumpyArrayPersistor,
+    TrileanListPersistor,
+    _Trilean,
+)
+from .registry_persistor import RegistryPersistor
+
+
+_T = t.TypeVar("_T")
+
+
+@attrs.frozen
+class _Codec:
+    """How a column of values is stored in a resizable Dataset"""
+
+    persistor: t.Type[core.Persistor]
+    dtype: t.Any
+    encode: t.Callable[[t.List[t.Any]], np.ndarray]
+    decode: t.Callable[[np.ndarray], t.List[t.Any]]
+
+
+def _scalar_codec(scalar_type: type) -> _Codec:
+    if scalar_type is bool:
+        allowed: t.Tuple[type, ...] = (bool, np.bool_)
+    elif scalar_type is int:
+        allowed = (int, np.integer)
+    else:
+        allowed = (float, int, np.floating, np.integer)
+
+    dtype = {float: np.float64, int: np.int64, bool: np.bool_}[scalar_type]
+
+    def encode(values: t.List[t.Any]) -> np.ndarray:
+        for value in values:
+            if not isinstance(value, allowed):
+                raise core.TypeMissmatchError.wrong_type_encountered(value, "?", *allowed)
+        return np.asarray(values, dtype=dtype)
+
+    return _Codec(
+        ScalarListPersistor,
+        dtype,
+        encode=encode,
+        decode=lambda raw: [scalar_type(e) for e in raw],
+    )
+
+
+def _optional_number_codec(
+    persistor: t.Union[t.Type[OptionalFloatListPersistor], t.Type[OptionalIntListPersistor]],
+    number_type: type,
+) -> _Codec:
+    sentinel = persistor.SENTINEL
+    dtype = np.float64 if number_type is float else np.int64
+
+    def encode(values: t.List[t.Any]) -> np.ndarray:
+        if any(v is not None and v == sentinel for v in values):
+            msg = f"{sentinel} cannot be stored, it represents None"
+            raise core.SaveError(msg)
+        return np.asarray([sentinel if v is None else v for v in values], dtype=dtype)
+
+    return _Codec(
+        persistor,
+        dtype,
+        encode=encode,
+        decode=lambda raw: [None if e == sentinel else number_type(e) for e in raw],
+    )
+
+
+def _trilean_codec() -> _Codec:
+    dtype = _Trilean.dtype()
+    return _Codec(
+        TrileanListPersistor,
+        dtype,
+        encode=lambda values: np.asarray(
+            [_Trilean.from_object_value(v).stored_value for v in values], dtype=dtype
+        ),
+        decode=lambda raw: [_Trilean.from_stored_value(e).object_value for e in raw],
+    )
+
+
+def _enum_codec(enum_class: t.Type[Enum], include_none: bool) -> _Codec:
+    h5_enum = H5Enum(enum_class, include_none=include_none)
+    dtype = h5_enum.dtype()
+    return _Codec(
+        EnumListPersistor,
+        dtype,
+        encode=lambda values: np.asarray(h5_enum.stored_values(values), dtype=dtype),
+        decode=h5_enum.members,
+    )
+
+
+def _ragged_codec(array_dtype: t.Any) -> _Codec:
+    def encode(values: t.List[t.Any]) -> np.ndarray:
+        if any(np.ndim(v) != 1 or v.dtype != array_dtype for v in values):
+            msg = f"Expected 1-dimensional arrays of {array_dtype}"
+            raise core.TypeMissmatchError(msg)
+
+        # The object array keeps NumPy from stacking arrays of equal length
+        arrays = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            arrays[i] = value
+        return arrays
+
+    return _Codec(
+        RaggedNumpyArrayPersistor,
+        h5py.vlen_dtype(array_dtype),
+        encode=encode,
+        decode=list,
+    )
+
+
+def _stacked_codec(array_dtype: t.Any, array_shape: t.Tuple[int, ...]) -> _Codec:
+    def encode(values: t.List[t.Any]) -> np.ndarray:
+        if any(np.shape(v) != array_shape or v.dtype != array_dtype for v in values):
+            msg = f"Expected arrays of {array_dtype} with shape {array_shape}"
+            raise core.TypeMissmatchError(msg)
+        return np.stack(values)
+
+    return _Codec(StackedNumpyArrayPersistor, array_dtype, encode=encode, decode=list)
+
+
+def _ndarray_codec(first_value: t.Any) -> _Codec:
+    if not isinstance(first_value, np.ndarray) or first_value.ndim == 0:
+        msg = f"Expected an array with at least one dimension, got {first_value!r:.100}"
+        raise core.TypeMissmatchError(msg)
+
+    if first_value.ndim == 1:
+        return _ragged_codec(first_value.dtype)
+    else:
+        return _stacked_codec(first_value.dtype, first_value.shape)
+
+
+def _create_codec(__type: core.TypeLike) -> t.Optional[_Codec]:
+    """Returns the codec for values of '__type', or None if it cannot be stored as a Dataset
+
+    Arrays are not handled here, their codec depend on the arrays themselves.
+    """
+    if __type in (float, int, bool):
+        return _scalar_codec(__type)
+    if __type == t.Optional[float]:
+        return _optional_number_codec(OptionalFloatListPersistor, float)
+    if __type == t.Optional[int]:
+        return _optional_number_codec(OptionalIntListPersistor, int)
+    if __type == t.Optional[bool]:
+        return _trilean_codec()
+    if core.is_subclass(__type, Enum):
+        return _enum_codec(__type, include_none=False)
+    if core.is_optional(__type) and core.is_subclass(core.optional_arg(__type), Enum):
+        return _enum_codec(core.optional_arg(__type), include_none=True)
+    return None
+
+
+class _Column(abc.ABC):
+    """A list of values of a single type, stored under 'name' in 'parent_group'"""
+
+    def __init__(self, parent_group: h5py.Group, name: str, type_tree: core.Node) -> None:
+        self.parent_group = parent_group
+        self.name = name
+        self.type_tree = type_tree
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abc.abstractmethod
+    def append(self, values: t.List[t.Any]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def finish(self) -> None:
+        """Makes sure the column is loadable, even if nothing has been appended"""
+
+    @abc.abstractmethod
+    def read(self, start: int, stop: int) -> t.List[t.Any]:
+        pass
+
+
+class _DatasetColumn(_Column):
+    """Stored in a resizable Dataset. Array columns get their codec from the first array"""
+
+    def __init__(
+        self,
+        parent_group: h5py.Group,
+        name: str,
+        type_tree: core.Node,
+        codec: t.Optional[_Codec],
+    ) -> None:
+        super().__init__(parent_group, name, type_tree)
+        self.codec = codec
+
+    def __len__(self) -> int:
+        dataset = self.parent_group.get(self.name)
+        return 0 if dataset is None else len(dataset)
+
+    def _require_dataset(self, codec: _Codec, encoded: np.ndarray) -> h5py.Dataset:
+        dataset = self.parent_group.get(self.name)
+        if dataset is not None:
+            return dataset
+
+        dataset = self.parent_group.create_dataset(
+            self.name,
+            shape=(0, *encoded.shape[1:]),
+            maxshape=(None, *encoded.shape[1:]),
+            dtype=codec.dtype,
+            chunks=True,
+        )
+        dataset.attrs["persistor"] = codec.persistor.__name__
+        return dataset
+
+    def append(self, values: t.List[t.Any]) -> None:
+        if self.codec is None:
+            self.codec = _ndarray_codec(values[0])
+
+        encoded = self.codec.encode(values)
+        dataset = self._require_dataset(self.codec, encoded)
+
+        if dataset.maxshape[0] is not None:
+            msg = f"{dataset} is not resizable and cannot be appended to"
+            raise core.SaveError(msg)
+
+        start = len(dataset)
+        dataset.resize(start + len(encoded), axis=0)
+        # 'write_direct' also handles object arrays of equally long arrays (ragged columns)
+        dataset.write_direct(encoded, dest_sel=np.s_[start : start + len(encoded)])
+
+    def finish(self) -> None:
+        if self.name in self.parent_group:
+            return
+
+        if self.codec is None:
+            # Without arrays, the shape and dtype are unknown. An empty list is stored instead
+            group = self.parent_group.create_group(self.name)
+            group.attrs["persistor"] = ListPersistor.__name__
+        else:
+            self._require_dataset(self.codec, np.empty((0,)))
+
+    def read(self, start: int, stop: int) -> t.List[t.Any]:
+        if self.codec is None:
+            msg = f"Nothing has been stored in {self.name!r}"
+            raise core.LoadError(msg)
+
+        return self.codec.decode(self.parent_group[self.name][start:stop])
+
+
+class _ElementsColumn(_Column):
+    """Stored one element at a time, like ``ListPersistor`` stores lists"""
+
+    def _group(self) -> h5py.Group:
+        group = self.parent_group.require_group(self.name)
+        group.attrs["persistor"] = ListPersistor.__name__
+        return group
+
+    def __len__(self) -> int:
+        group = self.parent_group.get(self.name)
+        return 0 if group is None else len(group)
+
+    def append(self, values: t.List[t.Any]) -> None:
+        group = self._group()
+        start = len(group)
+        for i, value in enumerate(values, start=start):
+            RegistryPersistor(group, str(i), self.type_tree).save(value)
+
+    def finish(self) -> None:
+        self._group()
+
+    def read(self, start: int, stop: int) -> t.List[t.Any]:
+        group = self.parent_group[self.name]
+        return [
+            RegistryPersistor(group, str(i), self.type_tree).load() for i in range(start, stop)
+        ]
+
+
+class _AttrsColumn(_Column):
+    """Stored like ``SausageableAttrsPersistor`` stores lists of attrs instances"""
+
+    def __init__(
+        self,
+        group: h5py.Group,
+        type_tree: core.Node,
+        columns: t.Dict[str, _Column],
+    ) -> None:
+        super().__init__(group, "./", type_tree)
+        self.group = group
+        self.columns = columns
+
+    @classmethod
+    def create(cls, group: h5py.Group, type_tree: core.Node) -> te.Self:
+        group.attrs["persistor"] = SausageableAttrsPersistor.__name__
+        return cls(
+            group,
+            type_tree,
+            {
+                name: _create_column(group, name, child_tree)
+                for name, child_tree in type_tree.children.items()
+            },
+        )
+
+    @classmethod
+    def open(cls, group: h5py.Group, type_tree: core.Node) -> te.Self:
+        if group.attrs.get("persistor") != SausageableAttrsPersistor.__name__:
+            msg = f"{group} was not stored by {SausageableAttrsPersistor.__name__}"
+            raise core.LoadError(msg)
+
+        return cls(
+            group,
+            type_tree,
+            {
+                name: _open_column(group, name, child_tree)
+                for name, child_tree in type_tree.children.items()
+            },
+        )
+
+    def __len__(self) -> int:
+        # Columns can differ in length if appending was interrupted
+        return min((len(column) for column in self.columns.values()), default=0)
+
+    def append(self, values: t.List[t.Any]) -> None:
+        for name, column in self.columns.items():
+            column.append([getattr(value, name) for value in values])
+
+    def finish(self) -> None:
+        for column in self.columns.values():
+            column.finish()
+
+    def read(self, start: int, stop: int) -> t.List[t.Any]:
+        attribute_lists = {name: column.read(start, stop) for name, column in self.columns.items()}
+        attrs_type = self.type_tree.data
+
+        return [
+            attrs_type(
+                **{
+                    name.strip("_"): attribute_list[index]
+                    for name, attribute_list in attribute_lists.items()
+                }
+            )
+            for index in range(stop - start)
+        ]
+
+
+def _create_column(parent_group: h5py.Group, name: str, type_tree: core.Node) -> _Column:
+    __type = type_tree.data
+
+    if attrs.has(__type):
+        return _AttrsColumn.create(parent_group.require_group(name), type_tree)
+
+    if core.is_ndarray(__type):
+        return _DatasetColumn(parent_group, name, type_tree, codec=None)
+
+    codec = _create_codec(__type)
+    if codec is None:
+        return _ElementsColumn(parent_group, name, type_tree)
+    else:
+        return _DatasetColumn(parent_group, name, type_tree, codec)
+
+
+def _open_column(parent_group: h5py.Group, name: str, type_tree: core.Node) -> _Column:
+    obj = parent_group.get(name)
+    if obj is None:
+        raise core.MissingH5ObjectError.create(parent_group, name)
+
+    __type = type_tree.data
+    persistor_name = obj.attrs.get("persistor")
+
+    if persistor_name == ListPersistor.__name__:
+        return _ElementsColumn(parent_group, name, type_tree)
+
+    if attrs.has(__type):
+        return _AttrsColumn.open(obj, type_tree)
+
+    codec: t.Optional[_Codec]
+    if core.is_ndarray(__type) and persistor_name == RaggedNumpyArrayPersistor.__name__:
+        codec = _ragged_codec(h5py.check_vlen_dtype(obj.dtype))
+    elif core.is_ndarray(__type) and persistor_name == StackedNumpyArrayPersistor.__name__:
+        codec = _stacked_codec(obj.dtype, obj.shape[1:])
+    else:
+        codec = _create_codec(__type)
+
+    if codec is None or codec.persistor.__name__ != persistor_name:
+        msg = f"Cannot read {__type} from {obj}, which was stored by {persistor_name}"
+        raise core.LoadError(msg)
+
+    return _DatasetColumn(parent_group, name, type_tree, codec)
+
+
+class StreamWriter(t.Generic[_T]):
+    """
+    Appends instances of an attrs class to a group, without keeping them all in memory
+
+    Each attribute is stored in its own resizable Dataset (or Group), in the same layout
+    ``serialize`` uses for a list of the attrs class. Everything written can therefore be
+    loaded with ``deserialize(group, typing.List[element_type])``, or in slices with
+    :class:`StreamReader`.
+
+    Appended instances are buffered and written ``buffer_size`` at a time. Arrays are
+    stored as "ragged" arrays if 1-dimensional. Otherwise they must have the same shape in
+    every instance. Attributes that cannot be stored in a Dataset are saved one by one.
+
+    If the group already contains a stream of ``element_type``, it is appended to.
+
+    .. code-block:: python
+
+        with h5py.File("results.h5", "w") as f, opser.StreamWriter(f, MyResult) as writer:
+            for result in results:
+                writer.append(result)
+    """
+
+    def __init__(
+        self, group: h5py.Group, element_type: t.Type[_T], *, buffer_size: int = 100
+    ) -> None:
+        if not attrs.has(element_type):
+            msg = f"Only attrs classes can be streamed, got {element_type}"
+            raise TypeError(msg)
+
+        if buffer_size < 1:
+            msg = "buffer_size must be positive"
+            raise ValueError(msg)
+
+        self._type_tree = core.get_type_tree(element_type)
+        self._buffer_size = buffer_size
+        self._buffer: t.List[_T] = []
+
+        if group.attrs.get("persistor") == SausageableAttrsPersistor.__name__:
+            self._column = _AttrsColumn.open(group, self._type_tree)
+        else:
+            self._column = _AttrsColumn.create(group, self._type_tree)
+
+        self._num_written = len(self._column)
+
+    def __enter__(self) -> te.Self:
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of instances appended, including ones not yet written"""
+        return self._num_written + len(self._buffer)
+
+    def append(self, instance: _T) -> None:
+        core.sanitize_instance(instance, self._type_tree)
+        self._buffer.append(instance)
+
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def extend(self, instances: t.Iterable[_T]) -> None:
+        for instance in instances:
+            self.append(instance)
+
+    def flush(self) -> None:
+        """Writes the buffered instances to the group"""
+        if not self._buffer:
+            return
+
+        buffer, self._buffer = self._buffer, []
+        self._column.append(buffer)
+        self._num_written += len(buffer)
+
+    def close(self) -> None:
+        """Writes the buffered instances. Makes the group loadable even if nothing was appended"""
+        self.flush()
+        self._column.finish()
+
+
+class StreamReader(t.Generic[_T]):
+    """
+    Loads instances of an attrs class from a group written by :class:`StreamWriter`
+
+    Indexing reads only the requested instances:
+
+    .. code-block:: python
+
+        with h5py.File("results.h5", "r") as f:
+            reader = opser.StreamReader(f, MyResult)
+            last_ten = reader[-10:]
+
+    Lists of attrs instances saved with ``serialize`` can be read as well, as long as the
+    attributes were stored in Datasets rather than one by one.
+    """
+
+    def __init__(self, group: h5py.Group, element_type: t.Type[_T]) -> None:
+        if not attrs.has(element_type):
+            msg = f"Only attrs classes can be streamed, got {element_type}"
+            raise TypeError(msg)
+
+        self._type_tree = core.get_type_tree(element_type)
+        self._column = _AttrsColumn.open(group, self._type_tree)
+
+    _ITER_CHUNK_SIZE: t.ClassVar[int] = 100
+
+    def __len__(self) -> int:
+        return len(self._column)
+
+    @t.overload
+    def __getitem__(self, index: int) -> _T: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[_T]: ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[_T, t.List[_T]]:
+        indices = range(len(self))[index]
+
+        if isinstance(indices, int):
+            (instance,) = self._column.read(indices, indices + 1)
+            return instance  # type: ignore[no-any-return]
+
+        if len(indices) == 0:
+            return []
+
+        start = min(indices)
+        instances = self._column.read(start, max(indices) + 1)
+        return [instances[i - start] for i in indices]
+
+    def __iter__(self) -> t.Iterator[_T]:
+        for start in range(0, len(self), self._ITER_CHUNK_SIZE):
+            yield from self[start : start + self._ITER_CHUNK_SIZE]
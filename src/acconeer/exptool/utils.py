@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -23,16 +23,6 @@ from acconeer.exptool._core.communication.comm_devices import (
 )
 
 
-try:
-    from PySide6 import QtCore
-except ImportError:
-    QtCore = None
-
-try:
-    import pyqtgraph as pg
-except ImportError:
-    pg = None
-
 S = TypeVar("S")
 T = TypeVar("T")
 DTypeT = TypeVar("DTypeT")
@@ -193,6 +183,10 @@ def color_cycler(i=0):
 
 
 def pg_pen_cycler(i=0, style=None, width=2):
+    from PySide6 import QtCore
+
+    import pyqtgraph as pg
+
     pen = pg.mkPen(color_cycler(i), width=width)
     if style == "--":
         pen.setStyle(QtCore.Qt.DashLine)
@@ -202,6 +196,8 @@ def pg_pen_cycler(i=0, style=None, width=2):
 
 
 def pg_brush_cycler(i=0):
+    import pyqtgraph as pg
+
     return pg.mkBrush(color_cycler(i))
 
 
@@ -305,6 +301,8 @@ pg_phase_ticks = [
 
 
 def pg_setup_polar_plot(plot, max_r=1):
+    import pyqtgraph as pg
+
     plot.showAxis("left", False)
     plot.showAxis("bottom", False)
     plot.setAspectLocked()
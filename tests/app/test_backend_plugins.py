@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 from __future__ import annotations
 
@@ -81,13 +81,17 @@ class TestBackendPlugins:
 
     @pytest.fixture
     def extra_tasks(self, plugin: PluginSpec) -> t.Iterable[Task]:
-        if plugin is BILATERATION_PLUGIN:
+        if plugin.key == BILATERATION_PLUGIN.key:
             return [
                 ("update_sensor_ids", dict(sensor_ids=[1, 2])),
             ]
         else:
             return []
 
+    @pytest.fixture(params=[False, True], ids=["sequential", "pipelined"])
+    def pipelined(self, request: pytest.FixtureRequest) -> bool:
+        return t.cast(bool, request.param)
+
     @pytest.fixture
     def backend(
         self,
@@ -95,8 +99,9 @@ class TestBackendPlugins:
         assert_messages: t.Callable[..., None],
         plugin: PluginSpec,
         extra_tasks: t.Iterable[Task],
+        pipelined: bool,
     ) -> t.Iterator[Backend]:
-        b = CaptureSaveableFile.wrap(MpBackend())
+        b = CaptureSaveableFile.wrap(MpBackend(pipelined=pipelined))
         b.start()
         b.put_task(tasks.CONNECT_CLIENT_TASK[plugin.generation])
         assert_messages(b, received=[tasks.SUCCESSFULLY_CLOSED_TASK])
@@ -161,7 +166,7 @@ class TestBackendPlugins:
             # the session is stopped
             pass
 
-        if plugin in [SPEED_DETECTOR_PLUGIN]:
+        if plugin.key in [SPEED_DETECTOR_PLUGIN.key]:
             pytest.xfail(
                 "Presence- & presence-based algorithms have an "
                 + "untestable 'load_from_file' task because of 'estimated_frame_rate'. "
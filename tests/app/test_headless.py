@@ -0,0 +1,92 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import functools
+import subprocess
+import sys
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo.sparse_iq._plugin import SPARSE_IQ_PLUGIN
+from acconeer.exptool.a121.algo.touchless_button._plugin import TOUCHLESS_BUTTON_PLUGIN
+from acconeer.exptool.app.new import PluginState
+from acconeer.exptool.app.new.backend import TraceRecorder
+from acconeer.exptool.app.new.headless import (
+    HeadlessRunner,
+    PickledResultWriter,
+    iterate_pickled_results,
+)
+
+
+pytestmark = pytest.mark.timeout(60)
+
+RECORDED_DATA_DIR = (
+    Path(__file__).parents[1] / "processing" / "a121" / "data_files" / "recorded_data"
+)
+
+
+@pytest.mark.parametrize("pipelined", [False, True], ids=["sequential", "pipelined"])
+def test_runs_plugin_on_mock_client_for_given_number_of_frames(pipelined: bool) -> None:
+    results: list[t.Any] = []
+    trace_recorder = TraceRecorder()
+
+    with HeadlessRunner(
+        SPARSE_IQ_PLUGIN,
+        results.append,
+        pipelined=pipelined,
+        trace_recorder=trace_recorder,
+    ) as runner:
+        runner.connect(functools.partial(a121.Client.open, mock=True))
+        runner.start()
+        assert runner.plugin_state == PluginState.LOADED_BUSY
+
+        stats = runner.run(num_frames=5)
+
+        assert runner.plugin_state == PluginState.LOADED_IDLE
+
+    # When pipelined, results may also be emitted between start() and run()
+    assert len(results) >= stats.num_frames >= 5
+    assert len(trace_recorder) > 0
+
+
+def test_replays_recording_until_exhausted(tmp_path: Path) -> None:
+    output_path = tmp_path / "results.pkl"
+    writer = PickledResultWriter(output_path)
+
+    with HeadlessRunner(TOUCHLESS_BUTTON_PLUGIN, writer) as runner:
+        runner.replay(RECORDED_DATA_DIR / "touchless_button_default.h5")
+        stats = runner.run()
+
+    writer.close()
+
+    with a121.open_record(RECORDED_DATA_DIR / "touchless_button_default.h5") as record:
+        assert stats.num_frames == record.num_frames
+
+    assert len(list(iterate_pickled_results(output_path))) == stats.num_frames
+
+
+def test_runs_backend_plugins_without_qt() -> None:
+    code = "\n".join(
+        [
+            "import functools, sys",
+            "from acconeer.exptool import a121",
+            "from acconeer.exptool.app.new.headless import HeadlessRunner",
+            "from acconeer.exptool.app.new.plugin_loader import load_plugins",
+            "assert 'PySide6' not in sys.modules",
+            "plugins = {spec.key: spec for spec in load_plugins()}",
+            "for spec in plugins.values():",
+            "    __import__(spec.backend_module)",
+            "with HeadlessRunner(plugins['sparse_iq'], lambda _: None) as runner:",
+            "    runner.connect(functools.partial(a121.Client.open, mock=True))",
+            "    runner.start()",
+            "    assert runner.run(num_frames=3).num_frames == 3",
+            "print(sorted(m for m in ['PySide6', 'pyqtgraph'] if m in sys.modules))",
+        ]
+    )
+    p = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, text=True)
+
+    assert p.stdout.strip() == "[]"
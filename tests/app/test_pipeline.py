@@ -0,0 +1,103 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import itertools
+import threading
+import typing as t
+
+import pytest
+
+from acconeer.exptool.app.new.backend import BackendPipeline, Message, TimingMessage
+
+
+pytestmark = pytest.mark.timeout(10)
+
+
+class _Acquirer:
+    def __init__(self, stop_after: t.Optional[int] = None) -> None:
+        self._counter = itertools.count()
+        self._stop_after = stop_after
+
+    def __call__(self) -> int:
+        n = next(self._counter)
+        if self._stop_after is not None and n >= self._stop_after:
+            msg = "out of data"
+            raise EOFError(msg)
+        return n
+
+
+def test_items_are_emitted_in_order_and_timed_per_stage() -> None:
+    emitted: list[int] = []
+    messages: list[Message] = []
+    done = threading.Event()
+
+    def emit(x: int) -> None:
+        emitted.append(x)
+        if len(emitted) >= 20:
+            done.set()
+
+    pipeline = BackendPipeline(
+        _Acquirer(), lambda x: 2 * x, emit, timing_callback=messages.append, name="P"
+    )
+    pipeline.start()
+    assert done.wait(5)
+    pipeline.stop()
+
+    assert not pipeline.running
+    assert emitted == [2 * n for n in range(len(emitted))]
+
+    timing_names = {m.name for m in messages if isinstance(m, TimingMessage)}
+    assert timing_names == {"P.acquire", "P.process", "P.emit", "P.latency"}
+
+
+def test_acquisition_failure_is_raised_after_acquired_items_are_emitted() -> None:
+    emitted: list[int] = []
+    pipeline = BackendPipeline(
+        _Acquirer(stop_after=5), lambda x: x, emitted.append, timing_callback=lambda _: None
+    )
+    pipeline.start()
+
+    with pytest.raises(EOFError):
+        pipeline.raise_if_failed(timeout=5)
+
+    pipeline.stop()
+    assert emitted == [0, 1, 2, 3, 4]
+
+
+def test_processing_failure_stops_the_pipeline() -> None:
+    def process(x: int) -> int:
+        if x == 3:
+            msg = "bad frame"
+            raise ValueError(msg)
+        return x
+
+    pipeline = BackendPipeline(
+        _Acquirer(), process, lambda _: None, timing_callback=lambda _: None
+    )
+    pipeline.start()
+
+    with pytest.raises(ValueError, match="bad frame"):
+        pipeline.raise_if_failed(timeout=5)
+
+    pipeline.stop()
+    assert not pipeline.running
+
+
+def test_stop_does_not_block_on_a_stalled_consumer() -> None:
+    release = threading.Event()
+    pipeline = BackendPipeline(
+        _Acquirer(),
+        lambda x: x,
+        lambda _: release.wait(),
+        timing_callback=lambda _: None,
+        queue_size=1,
+    )
+    pipeline.start()
+
+    with pytest.raises(RuntimeError):
+        pipeline.stop(timeout=0.2)
+
+    release.set()
+    pipeline.stop()
+    assert not pipeline.running
@@ -0,0 +1,49 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from acconeer.exptool.app.new.app_model import LazyPluginSpec, resolve_plugin_spec
+from acconeer.exptool.app.new.plugin_loader import load_default_plugins
+from acconeer.exptool.app.new.pluginbase import PluginSpecBase
+
+
+_METADATA_FIELDS = ["generation", "key", "title", "docs_link", "description", "family"]
+
+
+@pytest.mark.parametrize("lazy_spec", load_default_plugins(), ids=lambda p: p.key)
+def test_lazy_metadata_matches_plugin_spec(lazy_spec: LazyPluginSpec) -> None:
+    spec = lazy_spec.load()
+
+    assert isinstance(spec, PluginSpecBase)
+    assert {f: getattr(lazy_spec, f) for f in _METADATA_FIELDS} == {
+        f: getattr(spec, f) for f in _METADATA_FIELDS
+    }
+    assert lazy_spec.presets == spec.presets
+    assert lazy_spec.default_preset_id == spec.default_preset_id
+    assert resolve_plugin_spec(lazy_spec) is spec
+    assert resolve_plugin_spec(spec) is spec
+
+    assert lazy_spec.backend_module is not None
+    backend_module = importlib.import_module(lazy_spec.backend_module)
+    assert backend_module.BackendPlugin is importlib.import_module(lazy_spec.module).BackendPlugin
+
+
+def test_startup_does_not_import_plugin_modules() -> None:
+    code = "\n".join(
+        [
+            "import sys",
+            "import acconeer.exptool.app.new.app",
+            "from acconeer.exptool.app.new.plugin_loader import load_plugins",
+            "modules = [spec.module for spec in load_plugins()] + ['scipy.signal']",
+            "print(sorted(m for m in modules if m in sys.modules))",
+        ]
+    )
+    p = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, text=True)
+
+    assert p.stdout.strip() == "[]"
@@ -0,0 +1,50 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import random
+import statistics
+
+import pytest
+
+from acconeer.exptool.app.new.backend import _RateCalculator
+
+
+def test_running_statistics_match_full_recomputation_over_the_window() -> None:
+    rng = random.Random(1337)
+    rc = _RateCalculator(ticks_per_second=1_000_000, tick_period=10_000)
+
+    tick = 0
+    for _ in range(1000):
+        tick += 10_000 + rng.randint(-50, 50)
+        stats = rc.update(tick=tick, frame_delayed=False)
+
+    window = rc.tick_diffs
+    assert len(window) == 199
+    assert stats.rate == pytest.approx(1_000_000 / statistics.mean(window))
+    assert stats.jitter == pytest.approx(statistics.pstdev(window) / 1_000_000)
+
+
+def test_bursty_delays_only_raise_the_high_percentile() -> None:
+    rc = _RateCalculator(ticks_per_second=1000, tick_period=100)
+
+    tick = 0
+    for i in range(200):
+        tick += 150 if i % 50 == 0 else 100
+        stats = rc.update(tick=tick, frame_delayed=False)
+
+    assert stats.jitter_p50 == 0.0
+    assert stats.jitter_p99 == pytest.approx(0.050, rel=1 / 8)
+
+
+def test_steady_drift_raises_the_median_percentile() -> None:
+    rc = _RateCalculator(ticks_per_second=1000, tick_period=100)
+
+    tick = 0
+    for _ in range(200):
+        tick += 110
+        stats = rc.update(tick=tick, frame_delayed=False)
+
+    assert stats.jitter == 0.0
+    assert stats.jitter_p50 == pytest.approx(0.010, rel=1 / 8)
+    assert stats.jitter_p99 == stats.jitter_p50
@@ -0,0 +1,128 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.app.new import PluginState
+from acconeer.exptool.app.new.backend import (
+    ApplicationClient,
+    GeneralMessage,
+    MpBackend,
+    PluginStateMessage,
+    TimingMessage,
+    TraceRecorder,
+)
+
+
+pytestmark = pytest.mark.timeout(60)
+
+
+def test_wrapped_callback_records_and_forwards_messages() -> None:
+    forwarded: list[t.Any] = []
+    recorder = TraceRecorder()
+    send = recorder.wrap(forwarded.append)
+
+    messages = [
+        TimingMessage(name="Backend.load_plugin()", start=1.0, end=1.5),
+        TimingMessage(name="Pipeline.process", start=2.0, end=2.1, occupancy=3),
+        GeneralMessage(name="cpu_percent", data=42),
+        PluginStateMessage(state=PluginState.LOADED_BUSY),
+    ]
+    for message in messages:
+        send(message)
+
+    assert forwarded == messages
+
+    events = recorder.to_chrome_trace()["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    counters = [e["args"] for e in events if e["ph"] == "C"]
+    instants = [e["args"] for e in events if e["ph"] == "i"]
+
+    assert spans["Backend.load_plugin()"]["ts"] == pytest.approx(1.0e6)
+    assert spans["Backend.load_plugin()"]["dur"] == pytest.approx(0.5e6)
+    assert "send TimingMessage" in spans
+    assert {"Pipeline.process queue": 3} in counters
+    assert {"cpu_percent": 42} in counters
+    assert instants == [{"state": "LOADED_BUSY"}]
+
+
+def test_ring_buffer_keeps_the_latest_events() -> None:
+    recorder = TraceRecorder(capacity=10)
+
+    for i in range(100):
+        recorder.add_span(f"span{i}", float(i), float(i) + 0.5)
+
+    names = [e["name"] for e in recorder.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+    assert len(recorder) == 10
+    assert names == [f"span{i}" for i in range(90, 100)]
+
+
+def test_export_while_threads_register() -> None:
+    recorder = TraceRecorder(capacity=100)
+    done = threading.Event()
+
+    def add_span() -> None:
+        recorder.add_span("span", 0.0, 1.0)
+        done.wait()
+
+    # Threads are kept alive until the end, since thread ids may be reused
+    threads = [threading.Thread(target=add_span, name=f"worker{i}") for i in range(50)]
+    try:
+        for thread in threads:
+            thread.start()
+            recorder.to_chrome_trace()
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+
+    events = recorder.to_chrome_trace()["traceEvents"]
+    thread_names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert {f"worker{i}" for i in range(50)} <= thread_names
+
+
+@pytest.mark.parametrize("traced", [False, True])
+def test_application_client_get_next_timing(traced: bool) -> None:
+    forwarded: list[t.Any] = []
+    recorder = TraceRecorder()
+    callback = recorder.wrap(forwarded.append) if traced else forwarded.append
+
+    with a121.Client.open(mock=True) as client:
+        client.setup_session(a121.SessionConfig())
+        app_client = ApplicationClient.wrap_a121(client, callback)
+        app_client.start_session()
+        for _ in range(3):
+            app_client.get_next()
+        app_client.stop_session()
+
+    assert not any(isinstance(m, TimingMessage) for m in forwarded)
+
+    span_names = [e["name"] for e in recorder.to_chrome_trace()["traceEvents"] if e["ph"] == "X"]
+    assert span_names.count("Client.get_next()") == (3 if traced else 0)
+
+
+def test_backend_task_dumps_trace(
+    tmp_path: Path, tasks: t.Any, assert_messages: t.Callable[..., None]
+) -> None:
+    trace_path = tmp_path / "trace.json"
+
+    backend = MpBackend()
+    backend.start()
+    try:
+        backend.put_task(tasks.LOAD_PLUGIN_TASK)
+        assert_messages(backend, received=[tasks.SUCCESSFULLY_CLOSED_TASK])
+        backend.put_task(("dump_trace", dict(path=trace_path)))
+        assert_messages(backend, received=[tasks.SUCCESSFULLY_CLOSED_TASK])
+    finally:
+        backend.stop()
+
+    trace = json.loads(trace_path.read_text())
+    span_names = {e["name"] for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert "Backend.load_plugin()" in span_names
@@ -0,0 +1,112 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import itertools
+
+import attrs
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.model import config_search, power
+
+
+@pytest.fixture
+def base_session_config() -> a121.SessionConfig:
+    return a121.SessionConfig(a121.SensorConfig(start_point=80, num_points=40, sweeps_per_frame=8))
+
+
+@pytest.fixture
+def constraints() -> config_search.Constraints:
+    return config_search.Constraints(
+        update_rate=10.0,
+        max_average_current=2e-3,
+        lower_idle_state=power.Sensor.IdleState.OFF,
+    )
+
+
+def test_candidates_fulfill_constraints(
+    base_session_config: a121.SessionConfig, constraints: config_search.Constraints
+) -> None:
+    candidates = config_search.ConfigSearch(base_session_config).run(constraints)
+
+    assert candidates
+    for candidate in candidates:
+        candidate.session_config.validate()
+        assert candidate.session_config.update_rate == constraints.update_rate
+        assert candidate.active_duration < 1 / constraints.update_rate
+        assert candidate.average_current <= constraints.max_average_current
+
+    objectives = [candidate.objective for candidate in candidates]
+    assert objectives == sorted(objectives, reverse=True)
+
+
+def test_pruned_search_finds_same_candidates_as_exhaustive_search(
+    base_session_config: a121.SessionConfig, constraints: config_search.Constraints
+) -> None:
+    search = config_search.ConfigSearch(base_session_config)
+    candidates = search.run(constraints)
+
+    exhaustive_search = config_search.ConfigSearch(base_session_config)
+    space = config_search.SearchSpace()
+    feasible = []
+    for profile, step_length, inter_frame_idle_state, hwaas in itertools.product(
+        space.profiles, space.step_lengths, space.inter_frame_idle_states, space.hwaas
+    ):
+        parameters = config_search._Parameters(
+            profile=profile,
+            prf=None,
+            step_length=step_length,
+            inter_frame_idle_state=inter_frame_idle_state,
+            inter_sweep_idle_state=None,
+            sweeps_per_frame=None,
+            hwaas=hwaas,
+        )
+        candidate = exhaustive_search._evaluate(parameters, constraints)
+        if candidate is not None and exhaustive_search._fulfills(candidate, constraints):
+            feasible.append(candidate)
+
+    expected = config_search._pareto_optimal(feasible)
+
+    assert search.num_evaluations < exhaustive_search.num_evaluations
+    assert [c.session_config for c in candidates] == [c.session_config for c in expected]
+
+
+def test_rerun_with_other_current_budget_reuses_evaluations(
+    base_session_config: a121.SessionConfig, constraints: config_search.Constraints
+) -> None:
+    search = config_search.ConfigSearch(base_session_config)
+    search.run(constraints)
+    num_evaluations = search.num_evaluations
+
+    candidates = search.run(attrs.evolve(constraints, max_average_current=1e-3))
+
+    assert search.num_evaluations == num_evaluations
+    assert candidates
+    assert all(c.average_current <= 1e-3 for c in candidates)
+
+
+def test_unreachable_update_rate_gives_no_candidates(
+    base_session_config: a121.SessionConfig,
+) -> None:
+    search = config_search.ConfigSearch(base_session_config)
+
+    assert search.run(config_search.Constraints(update_rate=1e5)) == []
+
+
+def test_step_length_keeps_range(base_session_config: a121.SessionConfig) -> None:
+    search = config_search.ConfigSearch(
+        base_session_config,
+        config_search.SearchSpace(
+            profiles=[a121.Profile.PROFILE_3],
+            hwaas=[8],
+            step_lengths=[4],
+            inter_frame_idle_states=[None],
+        ),
+    )
+    (candidate,) = search.run()
+    subsweep = candidate.session_config.sensor_config.subsweeps[0]
+
+    assert subsweep.step_length == 4
+    assert subsweep.num_points == 10
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2023-2025
+# Copyright (c) Acconeer AB, 2023-2026
 # All rights reserved
 
 from __future__ import annotations
@@ -6,6 +6,7 @@ from __future__ import annotations
 import typing as t
 from pathlib import Path
 
+import numpy as np
 import pytest
 import yaml
 
@@ -300,7 +301,118 @@ def test_module_limits(
     avg_current = power.converged_average_current(
         session_config,
         lower_idle_state,
-        absolute_tolerance / 4,
         algorithm=algorithm,
     )
     _assert_percent_off_message(avg_current, expected_current, absolute_tolerance)
+
+
+_SPARSE_IQ_SESSION_CONFIG = a121.SessionConfig(
+    a121.SensorConfig(sweeps_per_frame=16, inter_frame_idle_state=a121.IdleState.DEEP_SLEEP),
+    update_rate=10.0,
+)
+
+
+@pytest.mark.parametrize(
+    "lower_idle_state",
+    [None, power.Sensor.IdleState.OFF, power.Sensor.IdleState.HIBERNATE],
+)
+def test_converged_average_current_is_the_average_of_a_long_session(
+    lower_idle_state: t.Optional[power.Sensor.LowerIdleState],
+) -> None:
+    long_session = power.session(_SPARSE_IQ_SESSION_CONFIG, lower_idle_state, num_actives=1000)
+    # The long session ends with an active, leaving out the last idle
+    num_periods = 1000
+    summary = power.session_summary(_SPARSE_IQ_SESSION_CONFIG, lower_idle_state)
+    expected = (long_session.charge + summary.idle.charge) / (num_periods * summary.duration)
+
+    avg_current = power.converged_average_current(_SPARSE_IQ_SESSION_CONFIG, lower_idle_state)
+
+    assert avg_current == pytest.approx(expected)
+
+
+def test_converged_average_current_warns_about_deprecated_arguments() -> None:
+    with pytest.warns(DeprecationWarning):
+        avg_current = power.converged_average_current(
+            _SPARSE_IQ_SESSION_CONFIG, None, absolute_tolerance=1e-3
+        )
+
+    assert avg_current == power.converged_average_current(_SPARSE_IQ_SESSION_CONFIG, None)
+
+
+def test_session_contains_whole_periods() -> None:
+    summary = power.session_summary(_SPARSE_IQ_SESSION_CONFIG, None)
+
+    assert power.session(_SPARSE_IQ_SESSION_CONFIG, None, num_actives=3).regions == (
+        summary.active,
+        summary.idle,
+        summary.active,
+        summary.idle,
+        summary.active,
+    )
+
+    truncated = power.session(_SPARSE_IQ_SESSION_CONFIG, None, duration=0.25)
+    assert truncated.duration == pytest.approx(0.25)
+    assert len(truncated.regions) == 6
+
+
+def test_average_currents_evaluates_every_combination() -> None:
+    configs = [
+        a121.SessionConfig(a121.SensorConfig(sweeps_per_frame=spf), update_rate=rate)
+        for spf in [1, 8, 32]
+        for rate in [1.0, 10.0]
+    ]
+    states = [None, power.Sensor.IdleState.OFF, power.Sensor.IdleState.HIBERNATE]
+
+    np.testing.assert_allclose(
+        power.average_currents(configs, power.Sensor.IdleState.OFF),
+        [power.converged_average_current(c, power.Sensor.IdleState.OFF) for c in configs],
+    )
+    np.testing.assert_allclose(
+        power.average_currents(configs[0], states),
+        [power.converged_average_current(configs[0], s) for s in states],
+    )
+    np.testing.assert_allclose(
+        power.average_currents(configs[:3], states),
+        [power.converged_average_current(c, s) for c, s in zip(configs, states)],
+    )
+
+    with pytest.raises(ValueError):
+        power.average_currents(configs, states)
+
+
+@pytest.mark.parametrize("algorithm", [power.algo.SparseIq(), power.algo.Distance()])
+def test_average_currents_at_rates_matches_configs_with_those_rates(
+    algorithm: power.algo.Algorithm,
+) -> None:
+    rates = [0.5, 1.0, 10.0, 100.0, 1000.0]
+
+    expected = []
+    for rate in rates:
+        config = a121.SessionConfig(_SPARSE_IQ_SESSION_CONFIG.sensor_config, update_rate=rate)
+        expected.append(
+            power.converged_average_current(
+                config, power.Sensor.IdleState.HIBERNATE, algorithm=algorithm
+            )
+        )
+
+    np.testing.assert_allclose(
+        power.average_currents_at_rates(
+            _SPARSE_IQ_SESSION_CONFIG,
+            power.Sensor.IdleState.HIBERNATE,
+            rates,
+            algorithm=algorithm,
+        ),
+        expected,
+    )
+
+
+def test_composite_region_charge_is_sum_of_charges() -> None:
+    regions = (power.SimpleRegion(1.0, 2.0), power.SimpleRegion(3.0, 1.0))
+    composite = power.CompositeRegion(
+        (power.SimpleRegion(0.5, 4.0), power.CompositeRegion(regions))
+    )
+
+    assert composite.duration == pytest.approx(7.0)
+    assert composite.charge == pytest.approx(2.0 + 2.0 + 3.0)
+    assert composite.average_current == pytest.approx(7.0 / 7.0)
+    assert power.CompositeRegion(()).average_current == 0.0
@@ -0,0 +1,124 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import types
+import typing as t
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import bilateration
+from acconeer.exptool.a121.algo.bilateration._processor import _assign, _KalmanFilters
+
+
+SENSOR_SPACING_M = 0.1
+UPDATE_RATE = 20.0
+
+
+def reference_remove_closely_spaced_distances(
+    distances: npt.NDArray[np.float64], rcs: npt.NDArray[np.float64], min_dist: float
+) -> t.List[float]:
+    if len(distances) == 0:
+        return []
+    distances, rcs = zip(*sorted(zip(distances, rcs)))  # type: ignore[assignment]
+    for index in np.flip(np.where(np.abs(np.diff(distances)) < min_dist)[0]):
+        if rcs[index] < rcs[index + 1]:
+            rcs = np.delete(rcs, index)
+            distances = np.delete(distances, index)
+        else:
+            rcs = np.delete(rcs, index + 1)
+            distances = np.delete(distances, index + 1)
+    return list(distances)
+
+
+@pytest.fixture
+def processor() -> bilateration.Processor:
+    sensor_config = a121.SensorConfig()
+    session_config = a121.SessionConfig(
+        [{1: sensor_config, 2: sensor_config}], update_rate=UPDATE_RATE
+    )
+    return bilateration.Processor(
+        session_config,
+        bilateration.ProcessorConfig(sensor_spacing_m=SENSOR_SPACING_M),
+        sensor_ids=[1, 2],
+    )
+
+
+def test_remove_closely_spaced_distances(processor: bilateration.Processor) -> None:
+    rng = np.random.default_rng(0)
+
+    for num_distances in [0, 1, 2, 5, 20]:
+        for _ in range(20):
+            distances = rng.choice(np.arange(0.0, 1.0, 0.04), num_distances)
+            rcs = rng.integers(0, 3, num_distances).astype(float)
+
+            actual = processor._remove_closely_spaced_distances(distances, rcs, 0.1)
+            expected = reference_remove_closely_spaced_distances(distances, rcs, 0.1)
+
+            np.testing.assert_array_equal(actual, expected)
+
+
+def test_kalman_filters_match_single_filter_equations() -> None:
+    dt = 1 / UPDATE_RATE
+    kfs = _KalmanFilters(dt, 0.5)
+    kfs.add(np.array([1.0, 2.0]))
+
+    A = np.array([[1.0, dt], [0.0, 1.0]])
+    H = np.array([[1.0, 0.0]])
+    x = np.array([[2.0], [0.0]])
+    P = np.eye(2)
+
+    for z in [2.01, 2.03, 2.04, 2.06]:
+        kfs.predict()
+        kfs.update(np.array([1]), np.array([z]))
+
+        x = A @ x
+        P = A @ P @ A.T + kfs.Q
+        K = P @ H.T / (H @ P @ H.T + kfs.R)
+        x = x + K @ (z - H @ x)
+        P = (np.eye(2) - K @ H) @ P
+
+    np.testing.assert_allclose(kfs.x[1], x[:, 0])
+    np.testing.assert_allclose(kfs.P[1], P)
+    # The filter that was not updated only predicts
+    assert kfs.x[0, 0] == 1.0
+
+
+def test_assign_maximizes_number_of_pairs() -> None:
+    # Greedily pairing the first row with its closest column leaves the second row unpaired
+    cost = np.array([[0.1, 0.2], [0.15, 5.0]])
+
+    rows, cols = _assign(cost, 1.0)
+
+    assert rows.tolist() == [0, 1]
+    assert cols.tolist() == [1, 0]
+    assert _assign(cost, 0.05)[0].size == 0
+    assert _assign(np.zeros((0, 3)), 1.0)[0].size == 0
+
+
+def test_tracks_objects(processor: bilateration.Processor) -> None:
+    # Left and right distances of two objects approaching the sensors
+    objects = np.array([[1.0, 1.02], [2.0, 1.97]])
+
+    for i in range(100):
+        distances = objects - 0.002 * i
+        result = processor.process(
+            {
+                sensor_id: types.SimpleNamespace(  # type: ignore[misc]
+                    distances=distances[:, column], strengths=np.ones(2)
+                )
+                for column, sensor_id in enumerate([1, 2])
+            }
+        )
+
+    assert len(processor.left_sensor_kfs) == 2
+    assert len(result.points) == 2
+    assert result.objects_without_counterpart == []
+
+    points = sorted(result.points, key=lambda point: point.distance)
+    for point, (left, right) in zip(points, distances):
+        assert point.distance == pytest.approx((left + right) / 2, abs=0.01)
+        assert np.sign(point.angle) == np.sign(left - right)
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import numpy as np
@@ -7,6 +7,7 @@ import pytest
 
 from acconeer.exptool import a121
 from acconeer.exptool.a121.algo import (
+    Cfar,
     distance,
     find_peaks,
     get_distance_filter_coeffs,
@@ -235,6 +236,27 @@ def test_calculate_cfar_threshold() -> None:
     npt.assert_almost_equal(actual_threshold, threshold, decimal=4)
 
 
+def test_calculate_cfar_threshold_with_reused_cfar() -> None:
+    rng = np.random.default_rng(0)
+    cfar = Cfar(window_length=3, guard_length=1)
+
+    for _ in range(3):
+        abs_sweep = rng.random(30)
+        kwargs = dict(
+            abs_sweep=abs_sweep,
+            window_length=3,
+            guard_half_length=1,
+            num_stds=2,
+            abs_noise_std=np.full(30, 0.1),
+            one_sided_breakpoint_in_sweep=5,
+        )
+
+        npt.assert_array_equal(
+            distance.Processor._calculate_cfar_threshold(**kwargs, cfar=cfar),
+            distance.Processor._calculate_cfar_threshold(**kwargs),
+        )
+
+
 def test_calc_cfar_guard_half_length() -> None:
     profile = a121.Profile.PROFILE_3
     step_length = 4
@@ -0,0 +1,95 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import parking
+
+
+def reference_objects_present(
+    sig_history: npt.NDArray[np.void], processor: parking.Processor
+) -> bool:
+    n_trigs = np.sum(sig_history["max_energy"] > processor.weight_threshold)
+    return bool(n_trigs > (processor.queue_length * processor.similarity_threshold))
+
+
+def reference_same_objects(
+    sig_history: npt.NDArray[np.void], processor: parking.Processor
+) -> tuple[bool, float]:
+    depth_sigs = np.sort(sig_history, axis=0, order=["weighted_distance", "max_energy"])
+    depth_sigs = depth_sigs[depth_sigs["max_energy"] > processor.weight_threshold]
+
+    clusters = []
+    curr_cluster: list[np.void] = []
+    for elm in depth_sigs:
+        if len(curr_cluster) == 0:
+            curr_cluster.append(elm)
+        elif (elm[0] - curr_cluster[0][0]) > processor.distance_threshold:
+            clusters.append(curr_cluster)
+            curr_cluster = []
+        else:
+            curr_cluster.append(elm)
+    if len(curr_cluster) > 0:
+        clusters.append(curr_cluster)
+
+    if len(clusters) == 0:
+        return False, 0
+
+    cluster_lengths = [len(cluster) for cluster in clusters]
+    longest_cluster = clusters[int(np.argmax(cluster_lengths))]
+    similarity = len(longest_cluster) / processor.queue_length
+    return similarity > processor.similarity_threshold, longest_cluster[0][0]
+
+
+@pytest.mark.parametrize("queue_length", [1, 5, 20, 200])
+@pytest.mark.parametrize("distance_threshold", [0.0, 0.1, 0.3])
+def test_history_and_clustering_match_reference(
+    queue_length: int, distance_threshold: float
+) -> None:
+    sensor_config = a121.SensorConfig(start_point=100, num_points=10, step_length=2)
+    metadata = a121.Metadata(
+        frame_data_length=10,
+        sweep_data_length=10,
+        subsweep_data_offset=np.array([0]),
+        subsweep_data_length=np.array([10]),
+        calibration_temperature=25,
+        tick_period=50,
+        base_step_length_m=0.0025,
+        max_sweep_rate=1000,
+        high_speed_mode=True,
+    )
+    processor = parking.Processor(
+        sensor_config=sensor_config,
+        processor_config=parking.ProcessorConfig(
+            queue_length=queue_length,
+            amplitude_threshold=1.0,
+            weighted_distance_threshold_m=distance_threshold,
+            signature_similarity_threshold=0.4,
+        ),
+        metadata=metadata,
+    )
+
+    rng = np.random.default_rng(queue_length)
+    # Few distinct values give ties in both distance and energy
+    distance_choices = np.arange(0.2, 0.6, 0.05)
+    expected_history = processor.sig_history.copy()
+
+    for _ in range(3 * queue_length + 20):
+        signature = (rng.choice(distance_choices), float(rng.integers(0, 4)))
+        processor._add_signature(*signature)
+
+        expected_history = np.roll(expected_history, -1, axis=0)
+        expected_history[-1] = signature
+        assert np.array_equal(processor.sig_history, expected_history)
+        assert processor.objects_present() == reference_objects_present(
+            expected_history, processor
+        )
+
+        same_objects = processor.same_objects()
+        detection, closest_dist = reference_same_objects(expected_history, processor)
+        assert same_objects["detection"] == detection
+        assert same_objects["closest_dist"] == closest_dist
@@ -0,0 +1,110 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import presence
+from acconeer.exptool.a121.algo.presence._detector import _load_multi_sensor_algo_data
+
+
+SENSOR_IDS = [1, 2, 3]
+
+
+@pytest.mark.parametrize("inter_frame_presence_timeout", [None, 1])
+def test_results_match_single_sensor_processors(inter_frame_presence_timeout) -> None:
+    detector_config = presence.DetectorConfig(
+        frame_rate=10.0,
+        inter_frame_presence_timeout=inter_frame_presence_timeout,
+        # Thresholds within the range of the scores of the mock data, to have frames with
+        # and without detection
+        intra_detection_threshold=1.15,
+        inter_detection_threshold=0.65,
+    )
+    detections = set()
+
+    with a121.Client.open(mock=True) as client:
+        detector = presence.MultiSensorDetector(
+            client=client,
+            sensor_ids=SENSOR_IDS,
+            detector_config=detector_config,
+            detector_context=presence.DetectorContext(estimated_frame_rate=10.0),
+        )
+        detector.start()
+
+        processors = {
+            sensor_id: presence.Processor(
+                sensor_config=detector.session_config.groups[0][sensor_id],
+                metadata=client.extended_metadata[0][sensor_id],
+                processor_config=presence.Detector._get_processor_config(detector_config),
+            )
+            for sensor_id in SENSOR_IDS
+        }
+
+        for _ in range(30):
+            detector_results = detector.get_next()
+            assert list(detector_results) == SENSOR_IDS
+
+            for sensor_id, detector_result in detector_results.items():
+                expected = processors[sensor_id].process(detector_result.service_result)
+
+                assert detector_result.intra_presence_score == pytest.approx(
+                    expected.intra_presence_score
+                )
+                assert detector_result.inter_presence_score == pytest.approx(
+                    expected.inter_presence_score
+                )
+                assert detector_result.presence_detected == expected.presence_detected
+                assert detector_result.presence_distance == pytest.approx(
+                    expected.presence_distance
+                )
+                np.testing.assert_allclose(detector_result.intra_depthwise_scores, expected.intra)
+                np.testing.assert_allclose(detector_result.inter_depthwise_scores, expected.inter)
+                assert detector_result.processor_extra_result == expected.extra_result
+                detections.add(expected.presence_detected)
+
+        detector.stop()
+
+    assert detections == {True, False}
+
+
+def test_algo_data_can_be_loaded(tmp_path) -> None:
+    path = tmp_path / "record.h5"
+    detector_config = presence.DetectorConfig(frame_rate=10.0)
+    detector_context = presence.DetectorContext(estimated_frame_rate=10.0)
+
+    with a121.Client.open(mock=True) as client:
+        detector = presence.MultiSensorDetector(
+            client=client,
+            sensor_ids=SENSOR_IDS,
+            detector_config=detector_config,
+            detector_context=detector_context,
+        )
+        detector.start(recorder=a121.H5Recorder(path))
+        detector.get_next()
+        detector.stop()
+
+    with a121.open_record(path) as record:
+        algo_group = record.get_algo_group("multi_sensor_presence_detector")
+        sensor_ids, config, context = _load_multi_sensor_algo_data(algo_group)
+
+    assert sensor_ids == SENSOR_IDS
+    assert config == detector_config
+    assert context == detector_context
+
+
+def test_sensor_configs_must_be_equal() -> None:
+    sensor_config = presence.Detector._get_sensor_config(presence.DetectorConfig())
+    other_sensor_config = presence.Detector._get_sensor_config(
+        presence.DetectorConfig(sweeps_per_frame=8)
+    )
+    session_config = a121.SessionConfig({1: sensor_config, 2: other_sensor_config}, extended=True)
+
+    with pytest.raises(ValueError):
+        presence.MultiSensorProcessor(
+            session_config=session_config,
+            metadata=[{}],
+            processor_config=presence.ProcessorConfig(),
+        )
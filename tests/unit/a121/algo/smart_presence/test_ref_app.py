@@ -0,0 +1,69 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import presence, smart_presence
+from acconeer.exptool.a121.algo.smart_presence._ref_app import _Mode
+
+
+@pytest.fixture
+def ref_app() -> t.Iterator[smart_presence.RefApp]:
+    with a121.Client.open(mock=True) as client:
+        ref_app = smart_presence.RefApp(
+            client=client,
+            sensor_id=1,
+            ref_app_config=smart_presence.RefAppConfig(wake_up_mode=True),
+        )
+        ref_app.start()
+
+        yield ref_app
+
+        ref_app.stop()
+
+
+def test_swap_reuses_prepared_targets(ref_app: smart_presence.RefApp) -> None:
+    wake_up_detector = ref_app.detector
+    wake_up_processor = ref_app.ref_app_processor
+    assert ref_app.get_next().used_config == _Mode.WAKE_UP_CONFIG
+
+    swap_duration = ref_app.swap_config(_Mode.NOMINAL_CONFIG)
+
+    assert swap_duration > 0
+    assert ref_app.detector is not wake_up_detector
+    assert ref_app.get_next().used_config == _Mode.NOMINAL_CONFIG
+
+    ref_app.swap_config(_Mode.WAKE_UP_CONFIG)
+
+    assert ref_app.detector is wake_up_detector
+    assert ref_app.ref_app_processor is wake_up_processor
+    assert ref_app.get_next().used_config == _Mode.WAKE_UP_CONFIG
+
+
+def test_restarted_processor_matches_new_processor(ref_app: smart_presence.RefApp) -> None:
+    detector = ref_app.detector
+    for _ in range(3):
+        detector.get_next()
+
+    ref_app.swap_config(_Mode.NOMINAL_CONFIG)
+    ref_app.swap_config(_Mode.WAKE_UP_CONFIG)
+
+    new_processor = presence.Processor(
+        sensor_config=detector._sensor_config,
+        metadata=detector._metadata,
+        processor_config=detector._processor_config,
+        context=detector._processor_context,
+    )
+
+    for _ in range(3):
+        result = detector.get_next()
+        expected = new_processor.process(result.service_result)
+
+        assert result.intra_presence_score == expected.intra_presence_score
+        assert result.inter_presence_score == expected.inter_presence_score
+        np.testing.assert_array_equal(result.inter_depthwise_scores, expected.inter)
@@ -0,0 +1,76 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+
+from acconeer.exptool.a121.algo import Cfar
+
+
+def reference_window_means(data, window_length, guard_length):
+    num_points = data.shape[0]
+    margin = window_length + guard_length
+    left = np.full(num_points, np.nan)
+    right = np.full(num_points, np.nan)
+
+    for i in range(num_points):
+        if i >= margin:
+            left[i] = np.mean(data[i - margin : i - guard_length])
+        if i + margin < num_points:
+            right[i] = np.mean(data[i + guard_length + 1 : i + margin + 1])
+
+    return left, right
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).exponential(size=(3, 4, 50))
+
+
+@pytest.mark.parametrize(("window_length", "guard_length"), [(1, 0), (3, 1), (10, 5), (30, 30)])
+def test_window_means(data, window_length, guard_length):
+    left, right = Cfar(window_length, guard_length).window_means(data)
+
+    for idx in np.ndindex(data.shape[:-1]):
+        expected_left, expected_right = reference_window_means(
+            data[idx], window_length, guard_length
+        )
+        npt.assert_allclose(left[idx], expected_left, atol=1e-12)
+        npt.assert_allclose(right[idx], expected_right, atol=1e-12)
+
+
+def test_axis(data):
+    expected = Cfar(4, 2).two_sided(data)
+    actual = Cfar(4, 2, axis=0).two_sided(np.moveaxis(data, -1, 0))
+
+    npt.assert_allclose(np.moveaxis(actual, 0, -1), expected, rtol=1e-12)
+
+
+def test_two_sided(data):
+    cfar = Cfar(3, 1)
+    left, right = cfar.window_means(data)
+
+    npt.assert_allclose(cfar.two_sided(data), (left + right) / 2, rtol=1e-12)
+
+    threshold = cfar.two_sided(data, one_sided_below=10)
+    assert np.all(np.isnan(threshold[..., : cfar.margin]))
+    npt.assert_allclose(threshold[..., cfar.margin : 10], right[..., cfar.margin : 10] / 2)
+    npt.assert_allclose(threshold[..., 10:], (left + right)[..., 10:] / 2)
+
+
+def test_one_sided(data):
+    cfar = Cfar(3, 1)
+    left, right = cfar.window_means(data)
+    threshold = cfar.one_sided(data, split=25)
+
+    npt.assert_allclose(threshold[..., :25], left[..., :25])
+    npt.assert_allclose(threshold[..., 25:], right[..., 25:])
+
+
+def test_invalid_lengths():
+    with pytest.raises(ValueError):
+        Cfar(0, 1)
+
+    with pytest.raises(ValueError):
+        Cfar(1, -1)
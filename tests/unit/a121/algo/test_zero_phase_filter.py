@@ -0,0 +1,41 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+from scipy.signal import filtfilt
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.algo import ZeroPhaseFilter, get_distance_filter_coeffs
+
+
+@pytest.fixture
+def coeffs():
+    return get_distance_filter_coeffs(a121.Profile.PROFILE_3, step_length=2)
+
+
+@pytest.mark.parametrize("shape", [(100,), (16, 100), (2, 3, 40), (7,)])
+def test_matches_filtfilt(coeffs, shape):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    zero_phase_filter = ZeroPhaseFilter(*coeffs)
+
+    for _ in range(2):
+        npt.assert_allclose(zero_phase_filter(x), filtfilt(*coeffs, x), rtol=1e-12)
+        npt.assert_allclose(zero_phase_filter(x.real), filtfilt(*coeffs, x.real), rtol=1e-12)
+
+
+def test_output_is_not_reused(coeffs):
+    zero_phase_filter = ZeroPhaseFilter(*coeffs)
+
+    first = zero_phase_filter(np.ones(20))
+    second = zero_phase_filter(np.zeros(20))
+
+    assert not np.shares_memory(first, second)
+    npt.assert_allclose(first, 1.0)
+
+
+def test_too_short(coeffs):
+    with pytest.raises(ValueError):
+        ZeroPhaseFilter(*coeffs)(np.ones(6))
@@ -1,14 +1,19 @@
-# Copyright (c) Acconeer AB, 2022-2025
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 # type: ignore
 
+import copy
+import gc
 import json
+import pickle
 import warnings
 
+import attrs
 import pytest
 
 from acconeer.exptool import a121
+from acconeer.exptool.a121._core.entities.configs import sensor_config as sensor_config_module
 
 
 def test_sweeps_per_frame():
@@ -270,6 +275,16 @@ def test_from_to_json():
     assert recreated_config == original_config
 
 
+def test_from_to_bytes():
+    config = a121.SensorConfig(
+        num_subsweeps=2, sweeps_per_frame=3, continuous_sweep_mode=True, sweep_rate=20.0
+    )
+    config.subsweeps[1].iq_imbalance_compensation = True
+    config.subsweeps[1].receiver_gain = 3
+
+    assert a121.SensorConfig.from_bytes(config.to_bytes()) == config
+
+
 def test_enum_fields_in_to_json():
     json_str = a121.SensorConfig(
         inter_frame_idle_state=a121.IdleState.DEEP_SLEEP,
@@ -414,3 +429,92 @@ def test_raises_validation_error_if_higher_indexed_subsweeps_has_higher_prf():
 
     with pytest.raises(a121.ValidationError, match=r"PRF.*It needs to be one of.*PRF"):
         config.validate()
+
+
+@pytest.mark.parametrize(
+    ("attribute", "invalid_value"),
+    [
+        ("start_point", -300),
+        ("sweeps_per_frame", 4096),
+        ("num_points", 4096),
+        ("enable_loopback", True),
+    ],
+)
+def test_validation_is_redone_after_config_is_modified(attribute, invalid_value):
+    config = a121.SensorConfig(profile=a121.Profile.PROFILE_2)
+    config.validate()
+    config.validate()
+
+    setattr(config, attribute, invalid_value)
+
+    with pytest.raises(a121.ValidationError):
+        config.validate()
+
+
+def test_validation_is_redone_after_subsweep_is_modified_or_replaced():
+    config = a121.SensorConfig(num_subsweeps=2)
+    config.validate()
+
+    config.subsweeps[1].prf = a121.PRF.PRF_19_5_MHz
+    with pytest.raises(a121.ValidationError):
+        config.validate()
+
+    config.subsweeps[1].prf = a121.PRF.PRF_15_6_MHz
+    config.validate()
+
+    invalid_subsweep = a121.SubsweepConfig(start_point=-300)
+    config.subsweeps[0] = invalid_subsweep
+    with pytest.raises(a121.ValidationError):
+        config.validate()
+
+    # Results refer to the current subsweep even if an equal one was validated before
+    config.subsweeps[0] = a121.SubsweepConfig(start_point=-300)
+    (result,) = config._collect_validation_results()
+    assert result.source is config.subsweeps[0]
+
+
+def test_validation_key_covers_all_subsweep_fields():
+    default_key = a121.SubsweepConfig()._validation_key()
+    non_default_values = {
+        "start_point": 100,
+        "num_points": 10,
+        "step_length": 2,
+        "profile": a121.Profile.PROFILE_1,
+        "hwaas": 16,
+        "receiver_gain": 10,
+        "enable_tx": False,
+        "enable_loopback": True,
+        "phase_enhancement": True,
+        "iq_imbalance_compensation": True,
+        "prf": a121.PRF.PRF_13_0_MHz,
+    }
+
+    assert len(non_default_values) == len(attrs.fields(a121.SubsweepConfig))
+    for attribute, value in non_default_values.items():
+        subsweep_config = a121.SubsweepConfig()
+        setattr(subsweep_config, attribute, value)
+        assert subsweep_config._validation_key() != default_key, attribute
+
+
+def test_memoized_validation_results_are_not_carried_over_to_copies():
+    config = a121.SensorConfig()
+    config.validate()
+
+    unpickled = pickle.loads(pickle.dumps(config))
+    copied = copy.copy(config)
+
+    assert id(config) in sensor_config_module._VALIDATION_MEMOS
+    assert id(unpickled) not in sensor_config_module._VALIDATION_MEMOS
+    assert id(copied) not in sensor_config_module._VALIDATION_MEMOS
+    assert unpickled == copied == config
+
+
+def test_memoized_validation_results_are_removed_with_their_config():
+    config = a121.SensorConfig()
+    config.validate()
+    config_id = id(config)
+
+    del config
+    gc.collect()
+
+    assert config_id not in sensor_config_module._VALIDATION_MEMOS
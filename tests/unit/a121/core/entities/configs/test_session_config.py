@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 # type: ignore
@@ -168,6 +168,43 @@ def test_to_from_dict_and_json_identity(original):
     assert original == reconstructed
 
 
+@pytest.mark.parametrize(
+    "original",
+    [
+        a121.SessionConfig(a121.SensorConfig()),
+        a121.SessionConfig(a121.SensorConfig(hwaas=20), update_rate=1337),
+        a121.SessionConfig(a121.SensorConfig(), extended=True),
+        a121.SessionConfig(
+            [
+                {
+                    2: a121.SensorConfig(
+                        subsweeps=[
+                            a121.SubsweepConfig(start_point=-100, prf=a121.PRF.PRF_19_5_MHz),
+                            a121.SubsweepConfig(profile=a121.Profile.PROFILE_5, step_length=48),
+                        ],
+                        sweep_rate=1000.5,
+                        inter_sweep_idle_state=a121.IdleState.SLEEP,
+                    ),
+                    3: a121.SensorConfig(frame_rate=10.0, double_buffering=True),
+                },
+                {2: a121.SensorConfig(enable_loopback=True, phase_enhancement=True)},
+            ]
+        ),
+    ],
+)
+def test_to_from_bytes_identity(original):
+    reconstructed = a121.SessionConfig.from_bytes(original.to_bytes())
+    assert original == reconstructed
+    assert len(original.to_bytes()) < len(original.to_json())
+
+
+def test_from_bytes_with_unknown_format_version_raises_error():
+    encoded = a121.SessionConfig().to_bytes()
+
+    with pytest.raises(ValueError, match="format version"):
+        a121.SessionConfig.from_bytes(bytes([0xFF]) + encoded[1:])
+
+
 def test_empty_init_is_the_same_as_single_sensor_config():
     assert a121.SessionConfig() == a121.SessionConfig(a121.SensorConfig())
 
@@ -195,3 +232,29 @@ def test_invalid_attribute():
 
     with pytest.raises(AttributeError, match="Invalid attribute*"):
         config.update_ratee = 10
+
+
+def test_are_valid_session_configs_agrees_with_validate():
+    session_configs = [
+        a121.SessionConfig(a121.SensorConfig()),
+        a121.SessionConfig(a121.SensorConfig(), update_rate=10),
+        a121.SessionConfig(a121.SensorConfig(frame_rate=10), update_rate=10),
+        a121.SessionConfig(a121.SensorConfig(num_points=4096)),
+        a121.SessionConfig(
+            [{1: a121.SensorConfig()}, {1: a121.SensorConfig(start_point=-300)}],
+        ),
+        # Same parameters as before, checked again
+        a121.SessionConfig(a121.SensorConfig(num_points=4096)),
+    ]
+
+    expected = []
+    for session_config in session_configs:
+        try:
+            session_config.validate()
+        except a121.ValidationError:
+            expected.append(False)
+        else:
+            expected.append(True)
+
+    assert a121.are_valid_session_configs(session_configs) == expected
+    assert expected == [True, True, False, False, False, False]
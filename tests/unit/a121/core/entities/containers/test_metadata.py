@@ -1,9 +1,10 @@
-# Copyright (c) Acconeer AB, 2022-2023
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 from __future__ import annotations
 
 import typing as t
 
+import attrs
 import numpy as np
 import pytest
 
@@ -94,6 +95,21 @@ def test_to_from_json_equality(ref_metadata: a121.Metadata) -> None:
     assert isinstance(reconstructed.subsweep_data_offset, np.ndarray)
 
 
+@pytest.mark.parametrize("high_speed_mode", [True, False, None])
+def test_to_from_bytes_equality(ref_metadata: a121.Metadata, high_speed_mode: bool) -> None:
+    metadata = attrs.evolve(
+        ref_metadata,
+        subsweep_data_offset=np.array([0, 4]),
+        subsweep_data_length=np.array([4, 6]),
+        high_speed_mode=high_speed_mode,
+    )
+    reconstructed = a121.Metadata.from_bytes(metadata.to_bytes())
+
+    assert reconstructed == metadata
+    assert reconstructed.high_speed_mode is high_speed_mode
+    assert reconstructed.subsweep_data_offset.dtype == np.int_
+
+
 def test_frame_shape(ref_metadata: a121.Metadata) -> None:
     num_sweeps = 1
     sweep_len = 10
@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 """
@@ -15,8 +15,10 @@ round-trip through:
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Iterator
 
+import h5py
 import numpy as np
 import numpy.typing as npt
 import pytest
@@ -116,3 +118,90 @@ def test_sensor_id(ref_record: a121.Record, ref_structure: Iterator[Iterator[int
         else:
             with pytest.raises(ValueError):
                 _ = ref_record.session(i).sensor_id
+
+
+def test_entry_groups(ref_record: a121.H5Record, ref_structure: Iterator[Iterator[int]]) -> None:
+    session = ref_record.session(0)
+
+    assert [set(group) for group in session.entry_groups] == [set(g) for g in ref_structure]
+    for group in session.entry_groups:
+        for sensor_id, entry_group in group.items():
+            assert entry_group.parent.parent == session.group
+            assert int(entry_group["sensor_id"][()]) == sensor_id
+
+
+def test_decoded_session_configs_are_independent(
+    ref_record: a121.Record, ref_session_config: a121.SessionConfig
+) -> None:
+    # The second access is decoded from the decode cache
+    first = ref_record.session(0).session_config
+    first.sensor_config.hwaas = 1
+
+    assert ref_record.session(0).session_config == ref_session_config
+    assert ref_record.session(0).session_config is not ref_record.session(0).session_config
+
+
+def test_sessions_are_cached_in_read_only_records(ref_record: a121.Record) -> None:
+    assert ref_record.session(0) is ref_record.session(0)
+
+
+def test_sessions_are_not_cached_in_writable_records(ref_record_file: Path) -> None:
+    with h5py.File(ref_record_file, mode="r+") as f:
+        record = a121.H5Record(f)
+
+        assert record.session(0) is not record.session(0)
+
+
+def test_cached_containers_are_independent(ref_record: a121.Record) -> None:
+    session = ref_record.session(0)
+
+    session.extended_metadata.clear()
+    session.calibrations.clear()
+
+    assert session.extended_metadata
+    assert session.extended_metadata is not session.extended_metadata
+    assert session.calibrations is not session.calibrations
+
+
+def test_results_are_read_in_blocks(
+    ref_record: a121.H5Record, ref_num_frames: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = ref_record.session(0)
+    monkeypatch.setattr(session, "_RESULTS_BLOCK_SIZE", 2)
+
+    results = list(session.extended_results)
+
+    assert len(results) == ref_num_frames
+    for group_id, group in enumerate(session.extended_stacked_results):
+        for sensor_id, stacked_results in group.items():
+            np.testing.assert_array_equal(
+                [result[group_id][sensor_id]._frame for result in results],
+                stacked_results._frame,
+            )
+            np.testing.assert_array_equal(
+                [result[group_id][sensor_id].tick for result in results], stacked_results.tick
+            )
+
+
+def test_replaying_client_holds_session(
+    ref_record: a121.Record, ref_structure: Iterator[Iterator[int]]
+) -> None:
+    from acconeer.exptool.a121._core_ext import _ReplayingClient
+
+    if ref_structure != [{1}]:
+        pytest.skip("The reference session config only has a single sensor")
+
+    client = _ReplayingClient(ref_record, realtime_replay=False)
+    client.setup_session(ref_record.session(0).session_config)
+
+    assert client.session_config == ref_record.session(0).session_config
+    assert client.session_config is not client.session_config
+    assert client.calibrations == ref_record.session(0).calibrations
+
+    client.start_session()
+    result = client.get_next()
+    assert isinstance(result, a121.Result)
+    expected = next(ref_record.session(0).extended_results)[0][1]
+
+    np.testing.assert_array_equal(result._frame, expected._frame)
+    assert result._context is expected._context
@@ -0,0 +1,71 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
+import h5py
+import pytest
+
+from acconeer.exptool import a121
+
+
+def _record(
+    path: Path,
+    session_configs: t.List[a121.SessionConfig],
+    num_frames: int = 3,
+    algo_key: t.Optional[str] = None,
+) -> None:
+    with a121.Client.open(mock=True) as client, a121.H5Recorder(path) as recorder:
+        if algo_key is not None:
+            recorder.require_algo_group(algo_key)
+
+        client.attach_recorder(recorder)
+        for session_config in session_configs:
+            client.setup_session(session_config)
+            client.start_session()
+            for _ in range(num_frames):
+                client.get_next()
+            client.stop_session()
+        client.detach_recorder()
+
+
+@pytest.fixture
+def record() -> t.Callable[..., None]:
+    """Records sessions from a mock client to a file"""
+    return _record
+
+
+@pytest.fixture
+def recordings_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "recordings"
+    (directory / "sub").mkdir(parents=True)
+
+    _record(
+        directory / "fast.h5",
+        [
+            a121.SessionConfig(
+                {1: a121.SensorConfig(profile=a121.Profile.PROFILE_3, sweep_rate=2000)}
+            )
+        ],
+        algo_key="distance",
+    )
+    _record(
+        directory / "sub" / "slow.h5",
+        [
+            a121.SessionConfig(
+                {2: a121.SensorConfig(profile=a121.Profile.PROFILE_1, sweep_rate=500)}
+            ),
+            a121.SessionConfig(
+                {2: a121.SensorConfig(profile=a121.Profile.PROFILE_3, sweep_rate=500)}
+            ),
+        ],
+        num_frames=5,
+    )
+
+    with h5py.File(directory / "not_a_record.h5", "w") as f:
+        f["data"] = [1, 2, 3]
+
+    return directory
@@ -0,0 +1,137 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pytest
+
+from acconeer.exptool import a111, a121
+from acconeer.exptool.a111._clients.mock.client import MockClient
+from acconeer.exptool.a121._core.entities import RecordException
+from acconeer.exptool.a121.record_tools import convert
+
+
+RECORDED_DATA_DIR = (
+    Path(__file__).parents[3] / "processing" / "a121" / "data_files" / "recorded_data"
+)
+
+
+@pytest.fixture
+def a111_npz_path(tmp_path: Path) -> Path:
+    client = MockClient()
+    client.squeeze = False
+    config = a111.EnvelopeServiceConfig()
+    recorder = a111.recording.Recorder(
+        sensor_config=config, session_info=client.start_session(config)
+    )
+    for _ in range(10):
+        recorder.sample(*client.get_next())
+
+    path = tmp_path / "a111" / "envelope.npz"
+    path.parent.mkdir()
+    a111.recording.save(path, recorder.close())
+    return path
+
+
+def test_convert_a121_directory(recordings_dir: Path, tmp_path: Path) -> None:
+    options = convert.StorageOptions(compression="lzf", chunk_frames=2)
+    results = convert.convert_directory(recordings_dir, tmp_path / "out", options, max_workers=1)
+
+    assert [result.source.name for result in results] == ["fast.h5", "not_a_record.h5", "slow.h5"]
+    fast, not_a_record, slow = results
+    assert fast.error is None
+    assert not_a_record.error is not None
+    assert not not_a_record.destination.exists()
+    assert slow.num_frames == 10
+    assert slow.destination == tmp_path / "out" / "sub" / "slow.h5"
+
+    with h5py.File(fast.destination, "r") as f:
+        frame = f["sessions/session_0/group_0/entry_0/result/frame"]
+        assert frame.compression == "lzf"
+        assert frame.chunks[0] == 2
+        assert f["session"] == f["sessions/session_0"]
+
+    with a121.open_record(fast.destination) as record:
+        assert record.get_algo_group("distance") is not None
+
+
+def test_drop_algo_group(recordings_dir: Path, tmp_path: Path) -> None:
+    result = convert.convert_record(
+        recordings_dir / "fast.h5",
+        tmp_path / "fast.h5",
+        convert.StorageOptions(compression=None, keep_algo_group=False),
+    )
+
+    assert result.error is None
+    with a121.open_record(result.destination) as record, pytest.raises(KeyError):
+        record.get_algo_group("distance")
+
+
+def test_existing_destination_is_kept(recordings_dir: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "fast.h5"
+    destination.write_bytes(b"keep")
+
+    result = convert.convert_record(recordings_dir / "fast.h5", destination)
+
+    assert result.error is not None
+    assert destination.read_bytes() == b"keep"
+
+
+def test_verification_detects_differences(recordings_dir: Path, tmp_path: Path) -> None:
+    source = recordings_dir / "fast.h5"
+    destination = tmp_path / "fast.h5"
+    assert convert.convert_record(source, destination, verify=False).error is None
+
+    with h5py.File(destination, "r+") as f:
+        f["sessions/session_0/group_0/entry_0/result/tick"][1] += 1
+
+    with pytest.raises(convert.VerificationError, match="Frame 1"):
+        convert._verify_a121(source, destination)
+
+
+def test_convert_record_without_calibrations(tmp_path: Path) -> None:
+    source = RECORDED_DATA_DIR / "input.h5"
+    with a121.open_record(source) as record, pytest.raises(RecordException):
+        record.session(0).calibrations_provided
+
+    result = convert.convert_record(source, tmp_path / "input.h5")
+
+    assert result.error is None
+    assert result.num_frames == 10
+    assert result.destination.exists()
+
+
+def test_convert_a111_npz(a111_npz_path: Path, tmp_path: Path) -> None:
+    result = convert.convert_record(a111_npz_path, tmp_path / "envelope.h5")
+
+    assert result.error is None
+    assert result.num_frames == 10
+
+    expected = a111.recording.load(a111_npz_path)
+    actual = a111.recording.load(result.destination)
+    np.testing.assert_array_equal(actual.data, expected.data)
+    assert actual.data_info == expected.data_info
+
+
+def test_a111_verification_detects_differences(a111_npz_path: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "envelope.h5"
+    assert convert.convert_record(a111_npz_path, destination, verify=False).error is None
+    convert._verify_a111(a111_npz_path, destination)
+
+    with h5py.File(destination, "r+") as f:
+        f["data"][-1] += 1
+
+    with pytest.raises(convert.VerificationError, match="'data'"):
+        convert._verify_a111(a111_npz_path, destination)
+
+
+def test_report(recordings_dir: Path, tmp_path: Path) -> None:
+    results = convert.convert_directory(recordings_dir, tmp_path / "out", max_workers=2)
+    report = convert.format_report(results)
+
+    assert "Converted 2 of 3 recordings, 13 frames" in report
+    assert "FAILED" in report
@@ -0,0 +1,116 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import os
+import typing as t
+from pathlib import Path
+
+import h5py
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.record_tools.index import RecordIndex
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> t.Iterator[RecordIndex]:
+    with RecordIndex(tmp_path / "index.sqlite") as index:
+        yield index
+
+
+def session_names(sessions: t.Iterable[t.Any]) -> t.List[t.Tuple[str, int]]:
+    return [(session.record.path.name, session.session_index) for session in sessions]
+
+
+def test_update_indexes_all_sessions(recordings_dir: Path, index: RecordIndex) -> None:
+    summary = index.update([recordings_dir], max_workers=1)
+
+    assert summary.num_indexed == 3
+    assert summary.failed == [str((recordings_dir / "not_a_record.h5").resolve())]
+    assert session_names(index.sessions()) == [("fast.h5", 0), ("slow.h5", 0), ("slow.h5", 1)]
+
+
+def test_update_records_recordings_that_fail_to_be_read(
+    recordings_dir: Path, index: RecordIndex
+) -> None:
+    broken_path = recordings_dir / "fast.h5"
+    with h5py.File(broken_path, "r+") as f:
+        del f["sessions/session_0/session_config"]
+
+    summary = index.update([recordings_dir], max_workers=1)
+
+    assert summary.num_indexed == 3
+    assert sorted(summary.failed) == sorted(
+        [str(broken_path.resolve()), str((recordings_dir / "not_a_record.h5").resolve())]
+    )
+    assert session_names(index.sessions()) == [("slow.h5", 0), ("slow.h5", 1)]
+
+
+def test_update_is_incremental(
+    recordings_dir: Path, index: RecordIndex, record: t.Callable[..., None]
+) -> None:
+    index.update([recordings_dir], max_workers=1)
+
+    (recordings_dir / "fast.h5").unlink()
+    slow_path = recordings_dir / "sub" / "slow.h5"
+    record(slow_path.with_name("new.h5"), [a121.SessionConfig()])
+    os.utime(slow_path, ns=(0, 0))
+
+    summary = index.update([recordings_dir], max_workers=1)
+
+    assert summary.num_indexed == 2
+    assert summary.num_unchanged == 1
+    assert summary.num_removed == 1
+    assert session_names(index.sessions()) == [("new.h5", 0), ("slow.h5", 0), ("slow.h5", 1)]
+
+
+def test_update_in_process_pool(recordings_dir: Path, index: RecordIndex) -> None:
+    summary = index.update([recordings_dir], max_workers=2)
+
+    assert summary.num_indexed == 3
+    assert len(list(index.sessions())) == 3
+
+
+def test_filters(recordings_dir: Path, index: RecordIndex) -> None:
+    index.update([recordings_dir], max_workers=1)
+
+    assert session_names(index.sessions(profile=a121.Profile.PROFILE_3)) == [
+        ("fast.h5", 0),
+        ("slow.h5", 1),
+    ]
+    assert session_names(index.sessions(sensor_id=2, min_sweep_rate=1000)) == []
+    assert session_names(index.sessions(sensor_id=1, min_sweep_rate=1000)) == [("fast.h5", 0)]
+    assert session_names(index.sessions(min_num_frames=4)) == [("slow.h5", 0), ("slow.h5", 1)]
+    assert session_names(index.sessions(algo_key="distance")) == [("fast.h5", 0)]
+    assert session_names(index.sessions(min_rss_version="1.0.0")) != []
+    assert session_names(index.sessions(min_rss_version="1000.0.0")) == []
+    assert session_names(index.sessions(where="s.session_index = ?", parameters=[1])) == [
+        ("slow.h5", 1)
+    ]
+    assert [r.path.name for r in index.records(sensor_id=2)] == ["slow.h5"]
+
+
+def test_indexed_session_matches_record(recordings_dir: Path, index: RecordIndex) -> None:
+    index.update([recordings_dir], max_workers=1)
+
+    (indexed_session,) = index.sessions(algo_key="distance")
+
+    with indexed_session.open() as session:
+        assert indexed_session.session_config == session.session_config
+        assert indexed_session.num_frames == session.num_frames
+        assert index.extended_metadata(indexed_session) == session.extended_metadata
+
+    with indexed_session.record.open() as record:
+        assert index.server_info(indexed_session.record) == record.server_info
+        assert indexed_session.record.uuid == record.uuid
+
+
+def test_other_schema_version_is_recreated(recordings_dir: Path, tmp_path: Path) -> None:
+    with RecordIndex(tmp_path / "index.sqlite") as index:
+        index.update([recordings_dir], max_workers=1)
+        index._connection.execute("PRAGMA user_version = 0")
+
+    with RecordIndex(tmp_path / "index.sqlite") as index:
+        assert list(index.sessions()) == []
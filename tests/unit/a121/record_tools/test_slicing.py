@@ -0,0 +1,101 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+from __future__ import annotations
+
+import typing as t
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a121
+from acconeer.exptool.a121.record_tools.slicing import slice_record
+
+
+@pytest.fixture
+def source(tmp_path: Path, record: t.Callable[..., None]) -> Path:
+    path = tmp_path / "source.h5"
+    record(
+        path,
+        [
+            a121.SessionConfig(),
+            a121.SessionConfig(
+                [
+                    {1: a121.SensorConfig(), 2: a121.SensorConfig(num_points=10)},
+                    {1: a121.SensorConfig(profile=a121.Profile.PROFILE_3)},
+                ]
+            ),
+        ],
+        num_frames=20,
+        algo_key="distance",
+    )
+    return path
+
+
+def test_frame_range_of_one_session(source: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "slice.h5"
+    slice_record(source, destination, sessions=[1], start=5, stop=12)
+
+    with a121.open_record(source) as expected, a121.open_record(destination) as actual:
+        assert actual.num_sessions == 1
+        assert actual.uuid == expected.uuid
+        assert actual.server_info == expected.server_info
+        assert actual.get_algo_group("distance") is not None
+
+        expected_session = expected.session(1)
+        actual_session = actual.session(0)
+        assert actual_session.session_config == expected_session.session_config
+        assert actual_session.extended_metadata == expected_session.extended_metadata
+        assert actual_session.calibrations == expected_session.calibrations
+        assert actual_session.num_frames == 7
+        assert (
+            list(actual_session.extended_results) == list(expected_session.extended_results)[5:12]
+        )
+
+
+def test_selected_groups_and_sensors(source: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "slice.h5"
+    slice_record(
+        source, destination, sessions=[1], groups=[0], sensor_ids=[2], keep_algo_group=False
+    )
+
+    with a121.open_record(source) as expected, a121.open_record(destination) as actual:
+        session = actual.session(0)
+        expected_stacked = expected.session(1).extended_stacked_results[0][2]
+
+        assert session.session_config == a121.SessionConfig(
+            [{2: a121.SensorConfig(num_points=10)}], extended=True
+        )
+        assert list(session.calibrations) == [2]
+        np.testing.assert_array_equal(
+            session.extended_stacked_results[0][2].frame, expected_stacked.frame
+        )
+
+        with pytest.raises(KeyError):
+            actual.get_algo_group("distance")
+
+
+def test_empty_selection_writes_nothing(source: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "slice.h5"
+
+    with pytest.raises(ValueError):
+        slice_record(source, destination, sessions=[0], sensor_ids=[2])
+
+    assert not destination.exists()
+
+
+def test_frames_are_copied_in_blocks(
+    source: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from acconeer.exptool.a121.record_tools import _copy
+
+    monkeypatch.setattr(_copy, "_BLOCK_BYTES", 1)
+    slice_record(source, tmp_path / "slice.h5", start=3)
+
+    with a121.open_record(source) as expected, a121.open_record(tmp_path / "slice.h5") as actual:
+        for i in range(expected.num_sessions):
+            assert (
+                list(actual.session(i).extended_results)
+                == list(expected.session(i).extended_results)[3:]
+            )
@@ -0,0 +1,225 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a111
+from acconeer.exptool.a111._clients import multiwrap
+from acconeer.exptool.a111._clients.base import ClientError
+from acconeer.exptool.a111._clients.mock.client import MockClient
+from acconeer.exptool.a111._clients.multiwrap import (
+    ConcurrentMultiClientWrapper,
+    MultiClientWrapper,
+)
+
+
+class CountingMockClient(MockClient):
+    """Fills the data with the frame number"""
+
+    def _get_next(self):
+        info, data = super()._get_next()
+        return info, np.full_like(data, self._data_count)
+
+
+@pytest.fixture
+def config():
+    config = a111.EnvelopeServiceConfig()
+    config.sensor = [1, 2]
+    config.update_rate = 10
+    return config
+
+
+@pytest.mark.parametrize("wrapper_class", [MultiClientWrapper, ConcurrentMultiClientWrapper])
+def test_get_next(config, wrapper_class):
+    client = wrapper_class([CountingMockClient(), CountingMockClient()])
+    client.start_session(config)
+
+    for _ in range(5):
+        info, data = client.get_next()
+
+        assert len(info) == 2
+        assert data.shape[0] == 2
+        assert np.all(data[0] == data[1])
+
+    client.disconnect()
+
+
+def test_concurrent_frames_kept_across_calls_are_unchanged(config):
+    client = ConcurrentMultiClientWrapper([CountingMockClient(), CountingMockClient()])
+    client.start_session(config)
+
+    kept = [client.get_next()[1] for _ in range(3)]
+
+    for frame_number, data in enumerate(kept, start=1):
+        assert np.all(data == frame_number)
+
+    client.disconnect()
+
+
+def test_concurrent_output_buffers_are_reused(config):
+    client = ConcurrentMultiClientWrapper(
+        [CountingMockClient(), CountingMockClient()], num_output_buffers=2
+    )
+    client.start_session(config)
+
+    _, first = client.get_next()
+    _, second = client.get_next()
+    _, third = client.get_next()
+
+    assert first is not second
+    assert first is third
+
+    client.disconnect()
+
+
+class VirtualClock:
+    """Replaces ``monotonic`` in the wrapper
+
+    Every thread sees the time set last on that thread. The scripted clients set the receive
+    time of a frame before returning it, so the frames are stamped with their scripted
+    receive times regardless of thread scheduling.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def set(self, now):
+        self._local.now = now
+
+    def __call__(self):
+        return getattr(self._local, "now", 0.0)
+
+
+class ScriptedMockClient(MockClient):
+    """Returns frames, filled with their frame number, at scripted receive times
+
+    After the last frame, ``get_next`` raises a ``RuntimeError``, or blocks until
+    ``release`` is set.
+    """
+
+    def __init__(self, clock, frames, release=None, **kwargs):
+        super().__init__(**kwargs)
+        self._clock = clock
+        self._frames = frames
+        self._release = release
+
+    def _start_session(self):
+        super()._start_session()
+        self._frame_iterator = iter(self._frames)
+
+    def _get_next(self):
+        try:
+            frame_number, receive_time = next(self._frame_iterator)
+        except StopIteration:
+            if self._release is None:
+                msg = "out of frames"
+                raise RuntimeError(msg) from None
+
+            self._release.wait()
+            raise
+
+        info, data = super()._get_next()
+        self._clock.set(receive_time)
+        return info, np.full_like(data, frame_number)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = VirtualClock()
+    monkeypatch.setattr(multiwrap, "monotonic", clock)
+    return clock
+
+
+def frames_every(period, frame_numbers, latency=0.0):
+    return [(n, n * period + latency) for n in frame_numbers]
+
+
+def test_concurrent_aligns_missed_frames(config, clock):
+    config.update_rate = None
+    client = ConcurrentMultiClientWrapper(
+        [
+            ScriptedMockClient(clock, frames_every(0.1, range(8))),
+            ScriptedMockClient(clock, frames_every(0.1, [0, 1, 3, 4, 6, 7], latency=0.03)),
+        ],
+        max_skew=0.05,
+        max_missed_frames=1,
+    )
+    client.start_session(config)
+
+    frame_numbers = []
+    for _ in range(6):
+        _, data = client.get_next()
+        assert np.all(data[0] == data[1])
+        frame_numbers.append(int(data[0].flat[0]))
+
+    assert frame_numbers == [0, 1, 3, 4, 6, 7]
+
+    client.disconnect()
+
+
+def test_concurrent_too_many_missed_frames(config, clock):
+    config.update_rate = None
+    client = ConcurrentMultiClientWrapper(
+        [
+            ScriptedMockClient(clock, frames_every(0.1, range(8))),
+            ScriptedMockClient(clock, frames_every(0.1, [0, 3, 4])),
+        ],
+        max_skew=0.05,
+        max_missed_frames=1,
+    )
+    client.start_session(config)
+
+    client.get_next()
+    with pytest.raises(ClientError, match="client 1 missed"):
+        client.get_next()
+
+    client.disconnect()
+
+
+def test_concurrent_raises_client_errors(config, clock):
+    config.update_rate = None
+    client = ConcurrentMultiClientWrapper(
+        [
+            ScriptedMockClient(clock, frames_every(0.1, range(8))),
+            ScriptedMockClient(clock, frames_every(0.1, range(2))),
+        ],
+        max_skew=0.05,
+    )
+    client.start_session(config)
+
+    client.get_next()
+    client.get_next()
+    with pytest.raises(ClientError) as exc_info:
+        client.get_next()
+
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    client.disconnect()
+
+
+def test_concurrent_does_not_hang_on_blocked_clients(config, clock):
+    config.update_rate = None
+    release = threading.Event()
+    client = ConcurrentMultiClientWrapper(
+        [
+            ScriptedMockClient(clock, frames_every(0.1, range(8))),
+            ScriptedMockClient(clock, frames_every(0.1, range(1)), release=release),
+        ],
+        max_skew=0.05,
+        timeout=0.3,
+    )
+    client.start_session(config)
+
+    client.get_next()
+    with pytest.raises(ClientError, match="timeout"):
+        client.get_next()
+
+    start = time.monotonic()
+    client.disconnect()
+    assert time.monotonic() - start < 1.0
+
+    release.set()
@@ -14,6 +14,7 @@ import numpy.typing as npt
 import pytest
 
 from acconeer.exptool import a121, opser
+from acconeer.exptool._core.class_creation.attrs import attrs_ndarray_eq
 from acconeer.exptool._core.int_16_complex import INT_16_COMPLEX
 from acconeer.exptool.a121._core.entities import ResultContext
 from acconeer.exptool.a121.algo import (
@@ -707,3 +708,250 @@ def test_ragged_numpy_array_persistor_should_not_be_able_to_store_mutlidim_ragge
             name="test",
             type_tree=opser.core.create_type_tree(type(data)),
         ).save(data)
+
+
+@attrs.frozen
+class RaggedParent:
+    arrays: t.List[npt.NDArray[np.float64]]
+
+
+@pytest.mark.parametrize("lengths", [(3, 1, 4), (2, 2, 2), (0,)], ids=str)
+def test_ragged_numpy_array_persistor_round_trips_arrays(
+    lengths: t.Tuple[int, ...], tmp_h5_file: h5py.File
+) -> None:
+    instance = RaggedParent([np.arange(length, dtype=float) for length in lengths])
+
+    opser.serialize(instance, tmp_h5_file)
+    loaded = opser.deserialize(tmp_h5_file, RaggedParent)
+
+    assert tmp_h5_file["arrays"].attrs["persistor"] == "RaggedNumpyArrayPersistor"
+    assert len(loaded.arrays) == len(instance.arrays)
+    for loaded_array, array in zip(loaded.arrays, instance.arrays):
+        np.testing.assert_array_equal(loaded_array, array)
+
+
+def test_type_tree_is_created_once_per_type() -> None:
+    assert opser.core.get_type_tree(ListParent) is opser.core.get_type_tree(ListParent)
+
+    # Equal Unions with differently ordered members get their own trees
+    int_first = opser.core.get_type_tree(t.Union[int, float])
+    float_first = opser.core.get_type_tree(t.Union[float, int])
+    assert [c.data for c in int_first.children.values()] == [int, float]
+    assert [c.data for c in float_first.children.values()] == [float, int]
+
+
+@attrs.frozen
+class Opaque:
+    value: str
+
+
+@attrs.frozen
+class OpaqueParent:
+    opaque: Opaque
+
+
+def test_registering_a_persistor_invalidates_resolved_persistors(tmp_h5_file: h5py.File) -> None:
+    class OpaquePersistor(opser.core.Persistor):
+        PRIORITY = RegistryPersistor.priority_higher_than(
+            opser.builtin_persistors.AttrsInstancePersistor
+        )
+
+        @classmethod
+        def is_applicable(cls, __type: opser.core.TypeLike) -> bool:
+            return __type is Opaque
+
+        def _save(self, data: t.Any) -> None:
+            self.create_own_dataset(data=data.value.encode())
+
+        def _load(self) -> Opaque:
+            return Opaque(bytes.decode(self.dataset[()]))
+
+    assert OpaquePersistor not in RegistryPersistor._get_applicable_persistors(Opaque)
+
+    opser.register_persistor(OpaquePersistor)
+    try:
+        opser.serialize(OpaqueParent(Opaque("hi")), tmp_h5_file)
+        assert tmp_h5_file["opaque"].attrs["persistor"] == "OpaquePersistor"
+        assert opser.deserialize(tmp_h5_file, OpaqueParent) == OpaqueParent(Opaque("hi"))
+    finally:
+        RegistryPersistor._REGISTRY.pop(OpaquePersistor.__name__)
+        RegistryPersistor._PLANS.clear()
+
+
+def test_resolved_persistors_are_cached_per_union_order() -> None:
+    class IntFirstPersistor(opser.core.Persistor):
+        PRIORITY = 0
+
+        @classmethod
+        def is_applicable(cls, __type: opser.core.TypeLike) -> bool:
+            return t.get_args(__type) == (int, float)
+
+    get_plan: t.Callable[[t.Any], t.Tuple[t.Type[opser.core.Persistor], ...]]
+    get_plan = RegistryPersistor._get_applicable_persistors
+
+    opser.register_persistor(IntFirstPersistor)
+    try:
+        int_first = get_plan(t.Union[int, float])
+        float_first = get_plan(t.Union[float, int])
+    finally:
+        RegistryPersistor._REGISTRY.pop(IntFirstPersistor.__name__)
+        RegistryPersistor._PLANS.clear()
+
+    assert IntFirstPersistor in int_first
+    assert IntFirstPersistor not in float_first
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (t.Union[int, float], t.Union[float, int]),
+        (t.Optional[int], t.Union[None, int]),
+        (t.List[t.Optional[int]], t.List[t.Union[None, int]]),
+        (t.List[int], list),
+        (t.Dict[str, int], t.Dict[str, float]),
+    ],
+)
+def test_type_traits_are_cached_per_type(first: t.Any, second: t.Any) -> None:
+    opser.core._get_type_traits(first)
+
+    assert opser.core._get_type_traits(second) == opser.core._create_type_traits(second)
+
+
+@attrs.frozen
+class StreamedInner:
+    value: float
+    kind: t.Optional[a121.Profile]
+
+
+@attrs.frozen
+class StreamedFrame:
+    integer: int
+    number: float
+    flag: bool
+    optional_number: t.Optional[float]
+    optional_integer: t.Optional[int]
+    optional_flag: t.Optional[bool]
+    kind: a121.Profile
+    ragged: npt.NDArray[np.float64] = attrs.field(eq=attrs_ndarray_eq)
+    matrix: npt.NDArray[np.complex128] = attrs.field(eq=attrs_ndarray_eq)
+    text: str
+    inner: StreamedInner
+    integers: t.List[int]
+
+
+def _streamed_frame(i: int) -> StreamedFrame:
+    return StreamedFrame(
+        integer=i,
+        number=i / 2,
+        flag=i % 2 == 0,
+        optional_number=None if i % 3 == 0 else float(i),
+        optional_integer=None if i % 4 == 0 else i,
+        optional_flag=[True, False, None][i % 3],
+        kind=list(a121.Profile)[i % len(a121.Profile)],
+        ragged=np.arange(i % 5, dtype=float),
+        matrix=np.full((2, 3), i + 1j),
+        text=f"frame {i}",
+        inner=StreamedInner(value=-i, kind=None if i % 2 else a121.Profile.PROFILE_1),
+        integers=list(range(i % 3)),
+    )
+
+
+@pytest.mark.parametrize("buffer_size", [1, 7, 100])
+def test_stream_writer_output_can_be_deserialized(
+    buffer_size: int, tmp_h5_file: h5py.File
+) -> None:
+    frames = [_streamed_frame(i) for i in range(23)]
+
+    with opser.StreamWriter(tmp_h5_file, StreamedFrame, buffer_size=buffer_size) as writer:
+        writer.append(frames[0])
+        writer.extend(frames[1:])
+        assert len(writer) == len(frames)
+
+    assert tmp_h5_file["matrix"].attrs["persistor"] == "StackedNumpyArrayPersistor"
+    assert tmp_h5_file["ragged"].attrs["persistor"] == "RaggedNumpyArrayPersistor"
+    assert tmp_h5_file["inner"].attrs["persistor"] == "SausageableAttrsPersistor"
+    assert tmp_h5_file["text"].attrs["persistor"] == "ListPersistor"
+
+    assert opser.deserialize(tmp_h5_file, t.List[StreamedFrame]) == frames
+
+
+def test_stream_writer_buffers_at_most_buffer_size_instances(tmp_h5_file: h5py.File) -> None:
+    writer = opser.StreamWriter(tmp_h5_file, StreamedFrame, buffer_size=4)
+
+    writer.extend(_streamed_frame(i) for i in range(10))
+    assert len(tmp_h5_file["integer"]) == 8
+
+    writer.close()
+    assert len(tmp_h5_file["integer"]) == 10
+
+
+def test_stream_writer_appends_to_existing_stream(tmp_h5_file: h5py.File) -> None:
+    frames = [_streamed_frame(i) for i in range(10)]
+
+    with opser.StreamWriter(tmp_h5_file, StreamedFrame) as writer:
+        writer.extend(frames[:4])
+
+    with opser.StreamWriter(tmp_h5_file, StreamedFrame) as writer:
+        assert len(writer) == 4
+        writer.extend(frames[4:])
+
+    assert opser.StreamReader(tmp_h5_file, StreamedFrame)[:] == frames
+
+
+def test_empty_stream_can_be_deserialized(tmp_h5_file: h5py.File) -> None:
+    opser.StreamWriter(tmp_h5_file, StreamedFrame).close()
+
+    assert opser.deserialize(tmp_h5_file, t.List[StreamedFrame]) == []
+    assert len(opser.StreamReader(tmp_h5_file, StreamedFrame)) == 0
+
+
+@pytest.mark.parametrize(
+    "index",
+    [slice(None), slice(3, 8), slice(-4, None), slice(None, None, 3), slice(9, 2, -2), 5, -1],
+    ids=str,
+)
+def test_stream_reader_reads_slices(index: t.Any, tmp_h5_file: h5py.File) -> None:
+    frames = [_streamed_frame(i) for i in range(12)]
+
+    with opser.StreamWriter(tmp_h5_file, StreamedFrame) as writer:
+        writer.extend(frames)
+
+    reader = opser.StreamReader(tmp_h5_file, StreamedFrame)
+
+    assert len(reader) == len(frames)
+    assert reader[index] == frames[index]
+    assert list(reader) == frames
+
+
+def test_stream_reader_reads_serialized_lists(tmp_h5_file: h5py.File) -> None:
+    frames = [_streamed_frame(i) for i in range(5)]
+    opser.serialize(frames, tmp_h5_file, override_type=t.List[StreamedFrame])
+
+    assert opser.StreamReader(tmp_h5_file, StreamedFrame)[1:3] == frames[1:3]
+
+
+def test_stream_writer_rejects_arrays_with_changing_shapes(tmp_h5_file: h5py.File) -> None:
+    writer = opser.StreamWriter(tmp_h5_file, StreamedFrame, buffer_size=1)
+    writer.append(_streamed_frame(0))
+
+    with pytest.raises(opser.core.SaveError):
+        writer.append(attrs.evolve(_streamed_frame(1), matrix=np.zeros((3, 3), dtype=complex)))
+
+
+def test_stream_writer_only_accepts_attrs_classes(tmp_h5_file: h5py.File) -> None:
+    with pytest.raises(TypeError):
+        opser.StreamWriter(tmp_h5_file, int)
+
+
+def test_serialize_keeps_the_list_layout_of_multi_dimensional_arrays(
+    tmp_h5_file: h5py.File,
+) -> None:
+    instance = RaggedParent([np.full((2, 2), i) for i in range(3)])
+
+    opser.serialize(instance, tmp_h5_file)
+    loaded = opser.deserialize(tmp_h5_file, RaggedParent)
+
+    # Stacked datasets are only written by StreamWriter, older versions can't read them
+    assert tmp_h5_file["arrays"].attrs["persistor"] == "ListPersistor"
+    for loaded_array, array in zip(loaded.arrays, instance.arrays):
+        np.testing.assert_array_equal(loaded_array, array)
@@ -0,0 +1,155 @@
+# Copyright (c) Acconeer AB, 2026
+# All rights reserved
+
+import numpy as np
+import pytest
+
+from acconeer.exptool import a111
+from acconeer.exptool.a111 import Mode
+from acconeer.exptool.a111._clients.json.client import JsonProtocolExplorationServer
+from acconeer.exptool.a111._clients.output_buffer import (
+    OutputBufferDecoder,
+    decode_output_buffer,
+    decode_raw_output_buffer,
+    raw_output_buffer,
+)
+
+
+SWEEPS_PER_FRAME = 4
+
+
+def reference_decode(buffer, mode, byteorder):
+    if mode == Mode.IQ:
+        data = np.frombuffer(buffer, dtype=byteorder + "i2").astype("float")
+        return data.reshape((-1, 2)).view(dtype="complex").flatten()
+
+    data = np.frombuffer(buffer, dtype=byteorder + "u2").astype("float")
+
+    if mode == Mode.SPARSE:
+        data = data.reshape((SWEEPS_PER_FRAME, -1))
+
+    return data
+
+
+@pytest.fixture
+def buffer():
+    rng = np.random.default_rng(0)
+    return bytearray(rng.integers(0, 2**16, SWEEPS_PER_FRAME * 20, dtype="u2").tobytes())
+
+
+@pytest.mark.parametrize("mode", Mode)
+@pytest.mark.parametrize("byteorder", ["<", ">"])
+def test_decode(buffer, mode, byteorder):
+    expected = reference_decode(buffer, mode, byteorder)
+    data = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, byteorder=byteorder)
+
+    assert data.dtype == expected.dtype
+    assert np.array_equal(data, expected)
+
+    data = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, num_sensors=2, byteorder=byteorder)
+    assert np.array_equal(data, expected.reshape((2, *data.shape[1:])))
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_decode_into_out(buffer, mode):
+    expected = reference_decode(buffer, mode, "<")
+
+    for dtype in [expected.dtype, np.complex64 if mode == Mode.IQ else np.float32]:
+        out = np.empty(expected.shape, dtype=dtype)
+
+        assert decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, out=out) is out
+        assert np.array_equal(out, expected)
+
+
+def test_decode_float32(buffer):
+    assert decode_output_buffer(buffer, Mode.ENVELOPE, dtype=np.float32).dtype == np.float32
+    assert decode_output_buffer(buffer, Mode.IQ, dtype=np.float32).dtype == np.complex64
+
+
+def test_decode_iq_into_non_contiguous_out(buffer):
+    out = np.empty((len(buffer) // 8, 2), dtype=complex).T
+
+    with pytest.raises(ValueError):
+        decode_output_buffer(buffer, Mode.IQ, num_sensors=2, out=out)
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_raw_is_a_view(buffer, mode):
+    raw = raw_output_buffer(buffer, mode, SWEEPS_PER_FRAME)
+
+    assert raw.dtype.kind == ("i" if mode == Mode.IQ else "u")
+    assert np.shares_memory(raw, np.frombuffer(buffer, dtype="u1"))
+    data = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME)
+    assert np.array_equal(raw.astype(float), data.view(float).reshape(raw.shape))
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_decode_into_wrongly_shaped_out(buffer, mode):
+    expected = reference_decode(buffer, mode, "<")
+
+    # Would be broadcast to if not checked
+    out = np.empty((2, *expected.shape), dtype=expected.dtype)
+
+    with pytest.raises(ValueError):
+        decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME, out=out)
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_decode_raw(buffer, mode):
+    raw = np.stack([raw_output_buffer(buffer, mode, SWEEPS_PER_FRAME)] * 3)
+    expected = decode_output_buffer(buffer, mode, SWEEPS_PER_FRAME)
+
+    assert np.array_equal(decode_raw_output_buffer(raw, mode), [expected] * 3)
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_decoder_reuses_output_buffers(buffer, mode):
+    decoder = OutputBufferDecoder(mode, SWEEPS_PER_FRAME, num_output_buffers=2)
+    expected = reference_decode(buffer, mode, "<")
+
+    first = decoder.decode(buffer)
+    second = decoder.decode(bytes(len(buffer)))
+    third = decoder.decode(buffer)
+
+    assert third is first
+    assert second is not first
+    assert np.array_equal(third, expected)
+    assert not np.any(second)
+    assert np.shares_memory(decoder.last_raw, np.frombuffer(buffer, dtype="u1"))
+
+    unsqueezed = decoder.decode(buffer, num_sensors=1)
+    assert np.array_equal(unsqueezed, [expected])
+
+
+@pytest.mark.parametrize("mode", Mode)
+def test_decoder_returns_new_arrays_by_default(buffer, mode):
+    decoder = OutputBufferDecoder(mode, SWEEPS_PER_FRAME)
+    expected = reference_decode(buffer, mode, "<")
+
+    kept = [decoder.decode(buffer) for _ in range(3)]
+    decoder.decode(bytes(len(buffer)))
+
+    for frame in kept:
+        assert np.array_equal(frame, expected)
+
+
+def test_json_protocol_returns_new_arrays_by_default(buffer):
+    protocol = JsonProtocolExplorationServer(link=None, squeeze=True, num_output_buffers=None)
+    protocol.setup_session(a111.EnvelopeServiceConfig())
+
+    kept = [protocol.decode_stream_payload(buffer) for _ in range(3)]
+    protocol.decode_stream_payload(bytes(len(buffer)))
+
+    for frame in kept:
+        assert np.array_equal(frame, reference_decode(buffer, Mode.ENVELOPE, "<"))
+
+
+def test_json_protocol_decodes_into_output_buffers(buffer):
+    protocol = JsonProtocolExplorationServer(link=None, squeeze=True, num_output_buffers=2)
+    protocol.setup_session(a111.EnvelopeServiceConfig())
+
+    frames = [protocol.decode_stream_payload(buffer) for _ in range(3)]
+
+    assert frames[2] is frames[0]
+    assert np.array_equal(frames[2], reference_decode(buffer, Mode.ENVELOPE, "<"))
+    assert np.array_equal(protocol.last_raw_data, np.frombuffer(buffer, dtype="<u2"))
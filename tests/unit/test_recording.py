@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022-2024
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import warnings
@@ -11,6 +11,7 @@ import pytest
 
 from acconeer.exptool import a111
 from acconeer.exptool.a111._clients.mock.client import MockClient
+from acconeer.exptool.a111._clients.output_buffer import OutputBufferDecoder
 from acconeer.exptool.a121._core.recording.h5_record import _H5PY_STR_DTYPE
 
 
@@ -62,6 +63,124 @@ def test_recording(tmp_path, mode, ext, give_pathlib_path, mocker):
     assert record.sensor_config.downsampling_factor == config.downsampling_factor
 
 
+def test_recorder_max_len(mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info, max_len=3)
+
+    frames = [mocker.get_next() for _ in range(200)]
+    for data_info, data in frames:
+        recorder.sample(data_info, data)
+
+    record = recorder.close()
+
+    assert len(recorder) == 3
+    assert record.data_info == [data_info for data_info, _ in frames[-3:]]
+    assert np.array_equal(record.data, [data for _, data in frames[-3:]])
+    assert len(record.sample_times) == 3
+    assert np.all(np.diff(record.sample_times) >= 0)
+
+
+def test_recorder_data_info_changing_keys(mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info)
+    data_infos = [[{"a": 1, "b": True}], [{"a": 2, "b": False}], [{"a": 3}], [{"a": "x"}]]
+
+    for data_info in data_infos:
+        recorder.sample(data_info, mocker.get_next()[1])
+
+    assert recorder.close().data_info == data_infos
+
+
+@pytest.mark.parametrize("num_frames", [0, 5, 70])
+def test_recorder_streaming(tmp_path, mocker, num_frames):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    streaming_recorder = a111.recording.Recorder(
+        sensor_config=config, session_info=session_info, path=tmp_path / "streamed.h5"
+    )
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info)
+
+    for _ in range(num_frames):
+        data_info, data = mocker.get_next()
+        streaming_recorder.sample(data_info, data)
+        recorder.sample(data_info, data)
+
+    assert len(streaming_recorder) == num_frames
+    assert streaming_recorder.close() is None
+
+    expected = recorder.close()
+    streamed = a111.recording.load(tmp_path / "streamed.h5")
+
+    with h5py.File(tmp_path / "streamed.h5") as f:
+        assert f["data"].dtype == np.dtype("u2")
+
+    for a in attr.fields(a111.recording.Record):
+        if a.name not in ["timestamp", "sample_times"]:
+            assert np.all(getattr(streamed, a.name) == getattr(expected, a.name))
+
+    assert len(streamed.sample_times) == num_frames
+
+
+def test_recorder_streaming_non_integer_data(tmp_path, mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+    recorder = a111.recording.Recorder(
+        sensor_config=config, session_info=session_info, path=tmp_path / "streamed"
+    )
+
+    data_info, data = mocker.get_next()
+    frames = [np.full_like(data, 1.0) for _ in range(40)] + [np.full_like(data, 0.5)]
+    for data in frames:
+        recorder.sample(data_info, data)
+
+    recorder.close()
+    streamed = a111.recording.load(tmp_path / "streamed.h5")
+
+    assert np.array_equal(streamed.data, frames)
+
+
+@pytest.mark.parametrize("mode", [a111.Mode.ENVELOPE, a111.Mode.IQ])
+@pytest.mark.parametrize("stream", [False, True])
+def test_recorder_raw_data(tmp_path, mocker, mode, stream):
+    config = a111._configs.MODE_TO_CONFIG_CLASS_MAP[mode]()
+    session_info = mocker.start_session(config)
+    path = tmp_path / "raw.h5" if stream else None
+    recorder = a111.recording.Recorder(sensor_config=config, session_info=session_info, path=path)
+    decoder = OutputBufferDecoder(mode, byteorder=">")
+    rng = np.random.default_rng(0)
+    frames = []
+
+    for _ in range(40):
+        data_info, _ = mocker.get_next()
+        data = decoder.decode(rng.integers(0, 2**16, 100, dtype="u2").tobytes(), num_sensors=1)
+        recorder.sample(data_info, data, raw_data=decoder.last_raw)
+        frames.append(data.copy())
+
+    if stream:
+        recorder.close()
+        record = a111.recording.load(path)
+    else:
+        record = recorder.close()
+
+    assert np.array_equal(record.data, frames)
+    assert record.data.dtype == frames[0].dtype
+
+    with pytest.raises(ValueError):
+        recorder.sample(data_info, data)
+
+
+def test_recorder_streaming_with_max_len(tmp_path, mocker):
+    config = a111.EnvelopeServiceConfig()
+    session_info = mocker.start_session(config)
+
+    with pytest.raises(ValueError):
+        a111.recording.Recorder(
+            sensor_config=config, session_info=session_info, path=tmp_path / "a.h5", max_len=10
+        )
+
+
 def test_unknown_mode(mocker):
     config = a111.EnvelopeServiceConfig()
     session_info = mocker.start_session(config)
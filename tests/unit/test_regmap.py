@@ -1,4 +1,4 @@
-# Copyright (c) Acconeer AB, 2022
+# Copyright (c) Acconeer AB, 2022-2026
 # All rights reserved
 
 import inspect
@@ -51,6 +51,43 @@ def test_get_reg():
     assert regmap.get_reg(reg.addr, reg.modes[0]) == reg
 
 
+@pytest.mark.parametrize("mode", [None, *Mode])
+def test_get_reg_matches_linear_search(mode):
+    for reg in regmap.REGISTERS:
+        for value in [reg.addr, reg.full_name, reg.stripped_name]:
+            expected = [
+                r
+                for r in regmap.REGISTERS
+                if value in (r.addr, r.full_name, r.stripped_name)
+                and (mode is None or r.modes is None or mode in r.modes)
+            ]
+
+            if len(expected) == 1:
+                assert regmap.get_reg(value, mode) == expected[0]
+            else:
+                with pytest.raises(ValueError):
+                    regmap.get_reg(value, mode)
+
+
+def test_result_info_decoder():
+    decoder = regmap.ResultInfoDecoder("iq")
+    data_saturated = regmap.get_reg("data_saturated", "iq")
+    output_buffer_length = regmap.get_reg("output_buffer_length", "iq")
+    stitch_count = regmap.get_reg("stitch_count", "iq")
+
+    assert ("data_saturated", data_saturated) in decoder.data_info_keys_and_regs
+    assert "output_buffer_length" not in dict(decoder.data_info_keys_and_regs)
+
+    result_info = [
+        (data_saturated.addr, data_saturated.encode(True)),
+        (output_buffer_length.addr, output_buffer_length.encode(100)),  # Ignored
+        (stitch_count.addr, stitch_count.encode(3)),  # Not a data info reg
+        (0xFF, bytes(4)),  # Unknown
+    ]
+
+    assert decoder.decode(result_info) == {"data_saturated": True, "stitch_count": 3}
+
+
 def test_config_to_reg_map_completeness():
     all_param_keys = set()
 